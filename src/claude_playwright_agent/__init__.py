@@ -8,9 +8,23 @@ __version__ = "0.1.0"
 __author__ = "Claude Playwright Agent Team"
 __email__ = "dev@claudeplaywright.ai"
 
-from claude_playwright_agent.agents import TestAgent, DebugAgent, ReportAgent
-from claude_playwright_agent.config import ConfigManager
-from claude_playwright_agent.state import StateManager
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from claude_playwright_agent.agents import TestAgent, DebugAgent, ReportAgent
+    from claude_playwright_agent.config import ConfigManager
+    from claude_playwright_agent.state import StateManager
+
+# Public names are resolved on first access so that importing a submodule
+# (e.g. the CLI) does not pull in every agent and the Claude SDK.
+_LAZY_IMPORTS = {
+    "ConfigManager": "claude_playwright_agent.config",
+    "StateManager": "claude_playwright_agent.state",
+    "TestAgent": "claude_playwright_agent.agents",
+    "DebugAgent": "claude_playwright_agent.agents",
+    "ReportAgent": "claude_playwright_agent.agents",
+}
 
 __all__ = [
     "__version__",
@@ -22,3 +36,17 @@ __all__ = [
     "DebugAgent",
     "ReportAgent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
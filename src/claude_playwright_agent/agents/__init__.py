@@ -2,107 +2,226 @@
 Agent implementations for Claude Playwright Agent.
 """
 
-from claude_playwright_agent.agents.base import BaseAgent, get_settings
-from claude_playwright_agent.agents.test_agent import TestAgent
-from claude_playwright_agent.agents.debug_agent import DebugAgent
-from claude_playwright_agent.agents.report_agent import ReportAgent
-from claude_playwright_agent.agents.ingest_agent import IngestionAgent
-from claude_playwright_agent.agents.bdd_agent import BDDConversionAgent
-from claude_playwright_agent.agents.dedup_agent import DeduplicationAgent
-from claude_playwright_agent.agents.exec_agent import ExecutionAgent
-from claude_playwright_agent.agents.recording_agent import RecordingAgent
-from claude_playwright_agent.agents.api_agent import APITestingAgent
-from claude_playwright_agent.agents.performance_agent import PerformanceAgent
-from claude_playwright_agent.agents.accessibility_agent import AccessibilityAgent
-from claude_playwright_agent.agents.visual_regression_agent import VisualRegressionAgent
-from claude_playwright_agent.agents.orchestrator import (
-    AgentMessage,
-    AgentLifecycleManager,
-    AgentTask,
-    MessageQueue,
-    MessageType,
-    get_orchestrator,
-    OrchestratorAgent,
-)
-from claude_playwright_agent.agents.playwright_parser import (
-    Action,
-    ActionType,
-    ParsedRecording,
-    PlaywrightRecordingParser,
-    SelectorInfo,
-    SelectorType,
-    FragilityLevel,
-    parse_recording,
-    parse_recording_content,
-)
-from claude_playwright_agent.agents.bdd_conversion import (
-    BDDConverter,
-    convert_to_gherkin,
-    save_feature_file,
-    GherkinFeature,
-    GherkinScenario,
-    GherkinStep,
-    StepDefinitionGenerator,
-    StepKeyword,
-)
-from claude_playwright_agent.agents.deduplication import (
-    PageElement,
-    PageObject,
-    analyze_patterns,
-    generate_page_objects,
-    PageObjectGenerator,
-    DeduplicationEngine,
-    DeduplicationResult,
-    SelectorPattern,
-    SimilarityMetric,
-)
-from claude_playwright_agent.agents.execution import (
-    TestExecutionEngine,
-    TestFramework,
-    TestStatus,
-    TestResult,
-    ExecutionResult,
-    RetryConfig,
-    execute_tests,
-)
-from claude_playwright_agent.agents.reporting import (
-    TestMetric,
-    ReportFormat,
-    ReportSection,
-    TestReport,
-    ReportGenerator,
-    create_report,
-)
-from claude_playwright_agent.agents.failure_analysis import (
-    FailureCategory,
-    Severity,
-    FixSuggestion,
-    Failure,
-    FailureCluster,
-    FlakyTest,
-    AnalysisResult,
-    FailureAnalyzer,
-    analyze_failures,
-)
-from claude_playwright_agent.agents.self_healing import (
-    HealingStatus,
-    HealingStrategy,
-    SelectorHealing,
-    HealingAttempt,
-    HealingConfig,
-    SelfHealingEngine,
-    analyze_selector_for_healing,
-    heal_selector,
-)
-from claude_playwright_agent.agents.health import (
-    HealthStatus,
-    HealthCheckResult,
-    AgentHealth,
-    HealthChecker,
-    AgentHealthMonitor,
-    HealthCheckCommand,
-    get_health_monitor,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from claude_playwright_agent.agents.base import BaseAgent, get_settings
+    from claude_playwright_agent.agents.test_agent import TestAgent
+    from claude_playwright_agent.agents.debug_agent import DebugAgent
+    from claude_playwright_agent.agents.report_agent import ReportAgent
+    from claude_playwright_agent.agents.ingest_agent import IngestionAgent
+    from claude_playwright_agent.agents.bdd_agent import BDDConversionAgent
+    from claude_playwright_agent.agents.dedup_agent import DeduplicationAgent
+    from claude_playwright_agent.agents.exec_agent import ExecutionAgent
+    from claude_playwright_agent.agents.recording_agent import RecordingAgent
+    from claude_playwright_agent.agents.api_agent import APITestingAgent
+    from claude_playwright_agent.agents.performance_agent import PerformanceAgent
+    from claude_playwright_agent.agents.accessibility_agent import AccessibilityAgent
+    from claude_playwright_agent.agents.visual_regression_agent import VisualRegressionAgent
+    from claude_playwright_agent.agents.orchestrator import (
+        AgentMessage,
+        AgentLifecycleManager,
+        AgentTask,
+        MessageQueue,
+        MessageType,
+        get_orchestrator,
+        OrchestratorAgent,
+    )
+    from claude_playwright_agent.agents.agent_pool import (
+        AgentPool,
+        PoolConfig,
+        PoolStats,
+    )
+    from claude_playwright_agent.agents.workflow_engine import (
+        Stage,
+        StageContext,
+        Workflow,
+        WorkflowEngine,
+        WorkflowResult,
+    )
+    from claude_playwright_agent.agents.playwright_parser import (
+        Action,
+        ActionType,
+        ParsedRecording,
+        PlaywrightRecordingParser,
+        SelectorInfo,
+        SelectorType,
+        FragilityLevel,
+        parse_recording,
+        parse_recording_content,
+    )
+    from claude_playwright_agent.agents.bdd_conversion import (
+        BDDConverter,
+        convert_to_gherkin,
+        save_feature_file,
+        GherkinFeature,
+        GherkinScenario,
+        GherkinStep,
+        StepDefinitionGenerator,
+        StepKeyword,
+    )
+    from claude_playwright_agent.agents.deduplication import (
+        PageElement,
+        PageObject,
+        analyze_patterns,
+        generate_page_objects,
+        PageObjectGenerator,
+        DeduplicationEngine,
+        DeduplicationResult,
+        SelectorPattern,
+        SimilarityMetric,
+    )
+    from claude_playwright_agent.agents.execution import (
+        TestExecutionEngine,
+        TestFramework,
+        TestStatus,
+        TestResult,
+        ExecutionResult,
+        RetryConfig,
+        execute_tests,
+    )
+    from claude_playwright_agent.agents.reporting import (
+        TestMetric,
+        ReportFormat,
+        ReportSection,
+        TestReport,
+        ReportGenerator,
+        create_report,
+    )
+    from claude_playwright_agent.agents.failure_analysis import (
+        FailureCategory,
+        Severity,
+        FixSuggestion,
+        Failure,
+        FailureCluster,
+        FlakyTest,
+        AnalysisResult,
+        FailureAnalyzer,
+        analyze_failures,
+    )
+    from claude_playwright_agent.agents.self_healing import (
+        HealingStatus,
+        HealingStrategy,
+        SelectorHealing,
+        HealingAttempt,
+        HealingConfig,
+        SelfHealingEngine,
+        analyze_selector_for_healing,
+        heal_selector,
+    )
+    from claude_playwright_agent.agents.health import (
+        HealthStatus,
+        HealthCheckResult,
+        AgentHealth,
+        HealthChecker,
+        AgentHealthMonitor,
+        HealthCheckCommand,
+        get_health_monitor,
+    )
+    from claude_playwright_agent.agents.health_registry import (
+        HealthRegistry,
+        HeartbeatRecord,
+    )
+
+# Agents pull in the Claude SDK, Playwright and httpx, so every export is
+# resolved on first access instead of at package import time.
+_LAZY_IMPORTS = {
+    "BaseAgent": "claude_playwright_agent.agents.base",
+    "get_settings": "claude_playwright_agent.agents.base",
+    "TestAgent": "claude_playwright_agent.agents.test_agent",
+    "DebugAgent": "claude_playwright_agent.agents.debug_agent",
+    "ReportAgent": "claude_playwright_agent.agents.report_agent",
+    "IngestionAgent": "claude_playwright_agent.agents.ingest_agent",
+    "BDDConversionAgent": "claude_playwright_agent.agents.bdd_agent",
+    "DeduplicationAgent": "claude_playwright_agent.agents.dedup_agent",
+    "ExecutionAgent": "claude_playwright_agent.agents.exec_agent",
+    "RecordingAgent": "claude_playwright_agent.agents.recording_agent",
+    "APITestingAgent": "claude_playwright_agent.agents.api_agent",
+    "PerformanceAgent": "claude_playwright_agent.agents.performance_agent",
+    "AccessibilityAgent": "claude_playwright_agent.agents.accessibility_agent",
+    "VisualRegressionAgent": "claude_playwright_agent.agents.visual_regression_agent",
+    "AgentMessage": "claude_playwright_agent.agents.orchestrator",
+    "AgentLifecycleManager": "claude_playwright_agent.agents.orchestrator",
+    "AgentTask": "claude_playwright_agent.agents.orchestrator",
+    "MessageQueue": "claude_playwright_agent.agents.orchestrator",
+    "MessageType": "claude_playwright_agent.agents.orchestrator",
+    "get_orchestrator": "claude_playwright_agent.agents.orchestrator",
+    "OrchestratorAgent": "claude_playwright_agent.agents.orchestrator",
+    "AgentPool": "claude_playwright_agent.agents.agent_pool",
+    "PoolConfig": "claude_playwright_agent.agents.agent_pool",
+    "PoolStats": "claude_playwright_agent.agents.agent_pool",
+    "Stage": "claude_playwright_agent.agents.workflow_engine",
+    "StageContext": "claude_playwright_agent.agents.workflow_engine",
+    "Workflow": "claude_playwright_agent.agents.workflow_engine",
+    "WorkflowEngine": "claude_playwright_agent.agents.workflow_engine",
+    "WorkflowResult": "claude_playwright_agent.agents.workflow_engine",
+    "Action": "claude_playwright_agent.agents.playwright_parser",
+    "ActionType": "claude_playwright_agent.agents.playwright_parser",
+    "ParsedRecording": "claude_playwright_agent.agents.playwright_parser",
+    "PlaywrightRecordingParser": "claude_playwright_agent.agents.playwright_parser",
+    "SelectorInfo": "claude_playwright_agent.agents.playwright_parser",
+    "SelectorType": "claude_playwright_agent.agents.playwright_parser",
+    "FragilityLevel": "claude_playwright_agent.agents.playwright_parser",
+    "parse_recording": "claude_playwright_agent.agents.playwright_parser",
+    "parse_recording_content": "claude_playwright_agent.agents.playwright_parser",
+    "BDDConverter": "claude_playwright_agent.agents.bdd_conversion",
+    "convert_to_gherkin": "claude_playwright_agent.agents.bdd_conversion",
+    "save_feature_file": "claude_playwright_agent.agents.bdd_conversion",
+    "GherkinFeature": "claude_playwright_agent.agents.bdd_conversion",
+    "GherkinScenario": "claude_playwright_agent.agents.bdd_conversion",
+    "GherkinStep": "claude_playwright_agent.agents.bdd_conversion",
+    "StepDefinitionGenerator": "claude_playwright_agent.agents.bdd_conversion",
+    "StepKeyword": "claude_playwright_agent.agents.bdd_conversion",
+    "PageElement": "claude_playwright_agent.agents.deduplication",
+    "PageObject": "claude_playwright_agent.agents.deduplication",
+    "analyze_patterns": "claude_playwright_agent.agents.deduplication",
+    "generate_page_objects": "claude_playwright_agent.agents.deduplication",
+    "PageObjectGenerator": "claude_playwright_agent.agents.deduplication",
+    "DeduplicationEngine": "claude_playwright_agent.agents.deduplication",
+    "DeduplicationResult": "claude_playwright_agent.agents.deduplication",
+    "SelectorPattern": "claude_playwright_agent.agents.deduplication",
+    "SimilarityMetric": "claude_playwright_agent.agents.deduplication",
+    "TestExecutionEngine": "claude_playwright_agent.agents.execution",
+    "TestFramework": "claude_playwright_agent.agents.execution",
+    "TestStatus": "claude_playwright_agent.agents.execution",
+    "TestResult": "claude_playwright_agent.agents.execution",
+    "ExecutionResult": "claude_playwright_agent.agents.execution",
+    "RetryConfig": "claude_playwright_agent.agents.execution",
+    "execute_tests": "claude_playwright_agent.agents.execution",
+    "TestMetric": "claude_playwright_agent.agents.reporting",
+    "ReportFormat": "claude_playwright_agent.agents.reporting",
+    "ReportSection": "claude_playwright_agent.agents.reporting",
+    "TestReport": "claude_playwright_agent.agents.reporting",
+    "ReportGenerator": "claude_playwright_agent.agents.reporting",
+    "create_report": "claude_playwright_agent.agents.reporting",
+    "FailureCategory": "claude_playwright_agent.agents.failure_analysis",
+    "Severity": "claude_playwright_agent.agents.failure_analysis",
+    "FixSuggestion": "claude_playwright_agent.agents.failure_analysis",
+    "Failure": "claude_playwright_agent.agents.failure_analysis",
+    "FailureCluster": "claude_playwright_agent.agents.failure_analysis",
+    "FlakyTest": "claude_playwright_agent.agents.failure_analysis",
+    "AnalysisResult": "claude_playwright_agent.agents.failure_analysis",
+    "FailureAnalyzer": "claude_playwright_agent.agents.failure_analysis",
+    "analyze_failures": "claude_playwright_agent.agents.failure_analysis",
+    "HealingStatus": "claude_playwright_agent.agents.self_healing",
+    "HealingStrategy": "claude_playwright_agent.agents.self_healing",
+    "SelectorHealing": "claude_playwright_agent.agents.self_healing",
+    "HealingAttempt": "claude_playwright_agent.agents.self_healing",
+    "HealingConfig": "claude_playwright_agent.agents.self_healing",
+    "SelfHealingEngine": "claude_playwright_agent.agents.self_healing",
+    "analyze_selector_for_healing": "claude_playwright_agent.agents.self_healing",
+    "heal_selector": "claude_playwright_agent.agents.self_healing",
+    "HealthStatus": "claude_playwright_agent.agents.health",
+    "HealthCheckResult": "claude_playwright_agent.agents.health",
+    "AgentHealth": "claude_playwright_agent.agents.health",
+    "HealthChecker": "claude_playwright_agent.agents.health",
+    "AgentHealthMonitor": "claude_playwright_agent.agents.health",
+    "HealthCheckCommand": "claude_playwright_agent.agents.health",
+    "get_health_monitor": "claude_playwright_agent.agents.health",
+    "HealthRegistry": "claude_playwright_agent.agents.health_registry",
+    "HeartbeatRecord": "claude_playwright_agent.agents.health_registry",
+}
 
 __all__ = [
     # Base
@@ -130,6 +249,15 @@ __all__ = [
     "MessageType",
     "MessageQueue",
     "AgentLifecycleManager",
+    "AgentPool",
+    "PoolConfig",
+    "PoolStats",
+    # Workflows
+    "Stage",
+    "StageContext",
+    "Workflow",
+    "WorkflowEngine",
+    "WorkflowResult",
     # Playwright Parser
     "Action",
     "ActionType",
@@ -199,4 +327,20 @@ __all__ = [
     "AgentHealthMonitor",
     "HealthCheckCommand",
     "get_health_monitor",
+    "HealthRegistry",
+    "HeartbeatRecord",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import agent classes lazily on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,329 @@
+"""
+Warm Agent Pools for Claude Playwright Agent.
+
+This module implements:
+- Pools of initialized agents per agent type, reused across tasks
+- Minimum warm and maximum total instances per pool
+- Checkout/checkin with a reset hook run before an agent is reused
+- Eviction of agents idle for longer than the idle timeout
+- Pool metrics (creations, warm hits, waits, evictions)
+
+Creating an agent initializes its LLM client and memory manager, so
+reusing warm agents removes that cost from every workflow stage.
+"""
+
+import asyncio
+import inspect
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Callable
+
+# =============================================================================
+# Pool Configuration
+# =============================================================================
+
+
+AgentFactory = Callable[[str], Any]
+ResetHook = Callable[[Any], Any]
+
+
+@dataclass
+class PoolConfig:
+    """
+    Agent pool configuration.
+
+    Attributes:
+        min_size: Agents kept warm even when idle
+        max_size: Maximum agents of this type (checked out plus idle)
+        idle_timeout: Seconds an idle agent above ``min_size`` is kept
+    """
+    min_size: int = 0
+    max_size: int = 4
+    idle_timeout: float = 300.0
+
+    def __post_init__(self) -> None:
+        """Validate the configuration."""
+        if self.max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if not 0 <= self.min_size <= self.max_size:
+            raise ValueError("min_size must be between 0 and max_size")
+
+
+@dataclass
+class PoolStats:
+    """
+    Agent pool metrics.
+
+    Attributes:
+        agent_type: Agent type of the pool
+        created: Agents created
+        checkouts: Agents checked out
+        warm_hits: Checkouts served by an idle agent
+        waits: Checkouts that waited for a free slot
+        wait_time_ms: Total time spent waiting for a free slot
+        resets: Agents reset on checkin
+        discarded: Agents discarded (failed task or reset)
+        evicted: Idle agents evicted
+        idle: Idle agents
+        in_use: Checked out agents
+        peak_in_use: Maximum agents checked out at once
+    """
+    agent_type: str
+    created: int = 0
+    checkouts: int = 0
+    warm_hits: int = 0
+    waits: int = 0
+    wait_time_ms: float = 0.0
+    resets: int = 0
+    discarded: int = 0
+    evicted: int = 0
+    idle: int = 0
+    in_use: int = 0
+    peak_in_use: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of checkouts served by a warm agent."""
+        return self.warm_hits / self.checkouts if self.checkouts else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "agent_type": self.agent_type,
+            "created": self.created,
+            "checkouts": self.checkouts,
+            "warm_hits": self.warm_hits,
+            "hit_rate": self.hit_rate,
+            "waits": self.waits,
+            "wait_time_ms": self.wait_time_ms,
+            "resets": self.resets,
+            "discarded": self.discarded,
+            "evicted": self.evicted,
+            "idle": self.idle,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+        }
+
+
+# =============================================================================
+# Agent Pool
+# =============================================================================
+
+
+async def _call_hook(hook: Callable[..., Any], *args: Any) -> None:
+    """Call a sync or async hook."""
+    result = hook(*args)
+    if inspect.isawaitable(result):
+        await result
+
+
+class AgentPool:
+    """
+    Warm pool of agents of one type.
+
+    Each checked out agent runs a single task at a time. Idle agents are
+    reused most-recently-used first, so the least recently used agents
+    are the ones that age out.
+    """
+
+    def __init__(
+        self,
+        agent_type: str,
+        factory: AgentFactory,
+        config: PoolConfig | None = None,
+        reset: ResetHook | None = None,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            agent_type: Agent type name passed to the factory
+            factory: Creates an agent (may return an awaitable)
+            config: Pool configuration
+            reset: Called with an agent on checkin (default: the agent's
+                own ``reset()`` method, if it has one)
+        """
+        self.agent_type = agent_type
+        self.config = config or PoolConfig()
+        self._factory = factory
+        self._reset = reset
+        self._semaphore = asyncio.Semaphore(self.config.max_size)
+        # (agent, idle since) pairs; the most recently used agent is last
+        self._idle: list[tuple[Any, float]] = []
+        self._in_use: set[int] = set()
+        self._stats = PoolStats(agent_type=agent_type)
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Number of agents in the pool (idle and checked out)."""
+        return len(self._idle) + len(self._in_use)
+
+    def get_stats(self) -> PoolStats:
+        """Get the pool metrics."""
+        self._stats.idle = len(self._idle)
+        self._stats.in_use = len(self._in_use)
+        return self._stats
+
+    async def _create(self) -> Any:
+        """Create and initialize an agent."""
+        agent = self._factory(self.agent_type)
+        if inspect.isawaitable(agent):
+            agent = await agent
+        if hasattr(agent, "initialize"):
+            await agent.initialize()
+        self._stats.created += 1
+        return agent
+
+    async def _discard(self, agent: Any) -> None:
+        """Clean up an agent that leaves the pool."""
+        if hasattr(agent, "cleanup"):
+            try:
+                await agent.cleanup()
+            except Exception:
+                pass
+
+    async def warm(self) -> int:
+        """
+        Create idle agents up to ``min_size``.
+
+        Returns:
+            Number of agents created
+        """
+        missing = self.config.min_size - self.size
+        if missing <= 0:
+            return 0
+        agents = await asyncio.gather(*(self._create() for _ in range(missing)))
+        now = time.monotonic()
+        self._idle[:0] = [(agent, now) for agent in agents]
+        return len(agents)
+
+    def ensure_capacity(self, max_size: int) -> None:
+        """
+        Raise ``max_size`` so at least that many agents can be checked out.
+
+        The pool never shrinks here; a smaller size is ignored.
+
+        Args:
+            max_size: Agents that must be available at once
+        """
+        extra = max_size - self.config.max_size
+        if extra <= 0:
+            return
+        self.config = replace(self.config, max_size=max_size)
+        for _ in range(extra):
+            self._semaphore.release()
+
+    async def checkout(self) -> Any:
+        """
+        Check out an agent, waiting while the pool is at ``max_size``.
+
+        Returns:
+            Initialized agent
+
+        Raises:
+            RuntimeError: If the pool is closed
+        """
+        if self._closed:
+            raise RuntimeError(f"Agent pool '{self.agent_type}' is closed")
+
+        if self._semaphore.locked():
+            self._stats.waits += 1
+            started = time.perf_counter()
+            await self._semaphore.acquire()
+            self._stats.wait_time_ms += (time.perf_counter() - started) * 1000
+        else:
+            await self._semaphore.acquire()
+
+        try:
+            if self._idle:
+                agent, _ = self._idle.pop()
+                self._stats.warm_hits += 1
+            else:
+                agent = await self._create()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        self._in_use.add(id(agent))
+        self._stats.checkouts += 1
+        self._stats.peak_in_use = max(self._stats.peak_in_use, len(self._in_use))
+        return agent
+
+    async def checkin(self, agent: Any, healthy: bool = True) -> None:
+        """
+        Return an agent to the pool.
+
+        The reset hook runs before the agent becomes available again; an
+        unhealthy agent, or one whose reset fails, is discarded instead.
+
+        Args:
+            agent: Agent from checkout()
+            healthy: Whether the agent can be reused
+        """
+        if id(agent) not in self._in_use:
+            raise ValueError(f"Agent was not checked out from pool '{self.agent_type}'")
+        try:
+            if healthy and not self._closed:
+                try:
+                    if self._reset is not None:
+                        await _call_hook(self._reset, agent)
+                        self._stats.resets += 1
+                    elif hasattr(agent, "reset"):
+                        await _call_hook(agent.reset)
+                        self._stats.resets += 1
+                except Exception:
+                    healthy = False
+
+            self._in_use.discard(id(agent))
+            if healthy and not self._closed:
+                self._idle.append((agent, time.monotonic()))
+            else:
+                self._stats.discarded += 1
+                await self._discard(agent)
+        finally:
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Check out an agent for the duration of a block."""
+        agent = await self.checkout()
+        try:
+            yield agent
+        except BaseException:
+            await self.checkin(agent, healthy=False)
+            raise
+        await self.checkin(agent)
+
+    async def evict_idle(self, now: float | None = None) -> int:
+        """
+        Evict agents idle for longer than ``idle_timeout``.
+
+        Agents are kept while the pool holds no more than ``min_size``.
+
+        Args:
+            now: Current ``time.monotonic()`` value
+
+        Returns:
+            Number of agents evicted
+        """
+        now = time.monotonic() if now is None else now
+        evictable = self.size - self.config.min_size
+        expired: list[Any] = []
+        # Oldest idle agents first
+        while evictable > 0 and self._idle and now - self._idle[0][1] > self.config.idle_timeout:
+            agent, _ = self._idle.pop(0)
+            expired.append(agent)
+            evictable -= 1
+        for agent in expired:
+            await self._discard(agent)
+        self._stats.evicted += len(expired)
+        return len(expired)
+
+    async def close(self) -> None:
+        """Clean up every idle agent and reject further checkouts."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for agent, _ in idle:
+            await self._discard(agent)
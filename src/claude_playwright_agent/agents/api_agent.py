@@ -8,11 +8,13 @@ Provides comprehensive API testing capabilities:
 - Authentication handling
 - GraphQL support (queries, mutations, subscriptions)
 - OpenAPI schema import
+- Concurrent endpoint batches over the shared HTTP transport
+- Open-loop load testing with corrected latency percentiles
 """
 
 import json
 import time
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -20,6 +22,15 @@ from pathlib import Path
 import httpx
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.loadgen import (
+    ArrivalPattern,
+    ArrivalSchedule,
+    HttpTarget,
+    LoadGenerator,
+    LoadReport,
+    LoadTestConfig,
+)
+from claude_playwright_agent.transport import TransportConfig, create_client, run_bounded
 
 
 class HTTPMethod(str, Enum):
@@ -99,6 +110,7 @@ class APITestingAgent(BaseAgent):
         base_url: str = "",
         auth_token: Optional[str] = None,
         project_path: Optional[Path] = None,
+        transport_config: Optional[TransportConfig] = None,
     ) -> None:
         """
         Initialize the API testing agent.
@@ -107,10 +119,12 @@ class APITestingAgent(BaseAgent):
             base_url: Base URL for API requests
             auth_token: Authentication token
             project_path: Path to project root
+            transport_config: Pool limits, timeouts and HTTP/2 settings
         """
         self._base_url = base_url
         self._auth_token = auth_token
         self._project_path = Path(project_path) if project_path else Path.cwd()
+        self._transport_config = transport_config or TransportConfig()
         self._client: Optional[httpx.AsyncClient] = None
 
         system_prompt = """You are the API Testing Agent for Claude Playwright Agent.
@@ -131,15 +145,12 @@ You provide:
         super().__init__(system_prompt=system_prompt)
 
     async def initialize(self) -> None:
-        """Initialize the HTTP client."""
+        """Initialize the HTTP client on the shared connection pool."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                follow_redirects=True,
-            )
+            self._client = create_client(self._transport_config)
 
     async def cleanup(self) -> None:
-        """Clean up the HTTP client."""
+        """Clean up the HTTP client (the shared pool stays open)."""
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -173,8 +184,6 @@ You provide:
 
         try:
             # Make request
-            import time
-
             start_time = time.time()
 
             response = await self._client.request(
@@ -260,6 +269,81 @@ You provide:
             }
         )
 
+    async def test_endpoints(
+        self,
+        endpoints: list[APIEndpoint | dict[str, Any]],
+        max_in_flight: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """
+        Test many endpoints concurrently.
+
+        Requests share the pooled connections of the HTTP transport and at
+        most ``max_in_flight`` are outstanding at once.
+
+        Args:
+            endpoints: Endpoint definitions, or process() input dicts
+            max_in_flight: Concurrency limit (default: transport max_in_flight)
+
+        Returns:
+            Per-endpoint results (in input order) and a summary
+        """
+        if self._client is None:
+            await self.initialize()
+
+        inputs = []
+        for endpoint in endpoints:
+            if isinstance(endpoint, APIEndpoint):
+                endpoint = {
+                    "method": endpoint.method.value,
+                    "path": endpoint.path,
+                    "body": endpoint.request_body,
+                }
+            inputs.append(dict(endpoint, headers=dict(endpoint.get("headers") or {})))
+
+        start_time = time.time()
+        results = await run_bounded(
+            [lambda data=data: self.process(data) for data in inputs],
+            max_in_flight or self._transport_config.max_in_flight,
+        )
+        duration = time.time() - start_time
+
+        passed = sum(1 for result in results if result.get("success"))
+        return {
+            "success": passed == len(results),
+            "results": results,
+            "summary": {
+                "total": len(results),
+                "passed": passed,
+                "failed": len(results) - passed,
+                "duration_seconds": round(duration, 3),
+            },
+        }
+
+    async def execute_graphql_batch(
+        self,
+        requests: list[GraphQLRequest],
+        graphql_url: Optional[str] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Execute many GraphQL requests concurrently.
+
+        Args:
+            requests: GraphQL requests
+            graphql_url: GraphQL endpoint URL (defaults to base_url/graphql)
+            max_in_flight: Concurrency limit (default: transport max_in_flight)
+
+        Returns:
+            GraphQL responses in input order
+        """
+        if self._client is None:
+            await self.initialize()
+
+        return await run_bounded(
+            [lambda r=request: self.execute_graphql(r, graphql_url) for request in requests],
+            max_in_flight or self._transport_config.max_in_flight,
+        )
+
     async def execute_graphql(
         self,
         request: GraphQLRequest,
@@ -482,89 +566,75 @@ You provide:
         concurrent_users: int = 10,
         requests_per_user: int = 100,
         body: Optional[dict] = None,
+        rate: Optional[float] = None,
+        duration_seconds: Optional[float] = None,
+        pattern: ArrivalPattern = ArrivalPattern.CONSTANT,
+        end_rate: Optional[float] = None,
+        workers: int = 1,
+        on_progress: Optional[Callable[[LoadReport], None]] = None,
     ) -> dict[str, Any]:
         """
         Run a load test on an endpoint.
 
+        Without ``rate`` the test is closed-loop: ``concurrent_users``
+        requests are kept in flight until ``concurrent_users *
+        requests_per_user`` requests are done. With ``rate`` requests
+        arrive open-loop on the given pattern, with at most
+        ``concurrent_users`` in flight per worker, and latency includes
+        time spent waiting for a late start.
+
         Args:
             endpoint: API endpoint path
             method: HTTP method
-            concurrent_users: Number of concurrent users
-            requests_per_user: Requests per user
+            concurrent_users: Number of concurrent users (in-flight limit)
+            requests_per_user: Requests per user (caps the total)
             body: Request body for POST/PUT
+            rate: Target requests per second (start rate for ramps)
+            duration_seconds: Test duration (default: until the request cap)
+            pattern: Arrival pattern (constant, ramp, poisson)
+            end_rate: Final rate of a ramp
+            workers: Worker processes generating load
+            on_progress: Called with live percentile reports
 
         Returns:
             Load test results with metrics
         """
-        if self._client is None:
-            await self.initialize()
-
-        url = f"{self._base_url}{endpoint}"
-        total_requests = concurrent_users * requests_per_user
-
         headers = {"Content-Type": "application/json"}
         if self._auth_token:
             headers["Authorization"] = f"Bearer {self._auth_token}"
 
-        async def make_request() -> tuple[int, float, bool]:
-            """Make a single request and return status, time, success."""
-            start = time.time()
-            try:
-                response = await self._client.request(
-                    method=method.value,
-                    url=url,
-                    json=body,
-                    headers=headers,
-                )
-                elapsed = (time.time() - start) * 1000
-                return response.status_code, elapsed, response.status_code < 400
-            except Exception:
-                elapsed = (time.time() - start) * 1000
-                return 0, elapsed, False
-
-        import asyncio
-
-        response_times = []
-        successes = 0
-        failures = 0
-
-        semaphore = asyncio.Semaphore(concurrent_users)
-
-        async def user_batch() -> None:
-            async with semaphore:
-                for _ in range(requests_per_user):
-                    status, time_ms, success = await make_request()
-                    response_times.append(time_ms)
-                    if success:
-                        successes += 1
-                    else:
-                        failures += 1
-
-        start_time = time.time()
-        await asyncio.gather(*[user_batch() for _ in range(concurrent_users)])
-        total_time = time.time() - start_time
-
-        response_times.sort()
-        n = len(response_times)
-
-        avg_time = sum(response_times) / n if n > 0 else 0
-        min_time = response_times[0] if n > 0 else 0
-        max_time = response_times[-1] if n > 0 else 0
-        p95_idx = int(n * 0.95)
-        p99_idx = int(n * 0.99)
+        max_requests = concurrent_users * requests_per_user
+        schedule = ArrivalSchedule(
+            pattern=pattern if rate else ArrivalPattern.SATURATE,
+            rate=rate or 0,
+            end_rate=end_rate,
+            duration_seconds=duration_seconds,
+            max_requests=None if rate and duration_seconds else max_requests,
+        )
+        target = HttpTarget(
+            url=f"{self._base_url}{endpoint}",
+            method=method.value,
+            headers=headers,
+            json_body=body,
+            timeout=self._transport_config.timeout,
+        )
+        config = LoadTestConfig(schedule=schedule, workers=workers, max_in_flight=concurrent_users)
+        summary = await LoadGenerator(target, config, on_progress).run()
 
+        latency = summary.latency
         result = LoadTestResult(
-            total_requests=total_requests,
-            successful_requests=successes,
-            failed_requests=failures,
-            average_response_time_ms=avg_time,
-            min_response_time_ms=min_time,
-            max_response_time_ms=max_time,
-            requests_per_second=total_requests / total_time if total_time > 0 else 0,
-            error_rate=(failures / total_requests * 100) if total_requests > 0 else 0,
-            percentile_95_ms=response_times[p95_idx] if n > p95_idx else avg_time,
-            percentile_99_ms=response_times[p99_idx] if n > p99_idx else avg_time,
+            total_requests=summary.sent,
+            successful_requests=summary.successful,
+            failed_requests=summary.failed,
+            average_response_time_ms=latency.mean / 1000,
+            min_response_time_ms=latency.min / 1000,
+            max_response_time_ms=latency.max / 1000,
+            requests_per_second=summary.requests_per_second,
+            error_rate=summary.error_rate,
+            percentile_95_ms=latency.value_at_percentile(95) / 1000,
+            percentile_99_ms=latency.value_at_percentile(99) / 1000,
         )
+        details = summary.to_dict()
 
         return {
             "success": result.error_rate < 10,
@@ -579,8 +649,15 @@ You provide:
                 "error_rate": round(result.error_rate, 2),
                 "percentile_95_ms": round(result.percentile_95_ms, 2),
                 "percentile_99_ms": round(result.percentile_99_ms, 2),
+                "target_rate": details["target_rate"],
+                "late_starts": details["late_starts"],
+                "latency_ms": details["latency_ms"],
+                "service_time_ms": details["service_time_ms"],
+                "status_codes": details["status_codes"],
+                "workers": details["workers"],
             },
-            "duration_seconds": round(total_time, 2),
+            "errors": details["errors"],
+            "duration_seconds": round(summary.duration_seconds, 2),
         }
 
     async def test_crud(
@@ -352,6 +352,14 @@ class BaseAgent(ABC):
         """
         ...
 
+    async def reset(self) -> None:
+        """
+        Reset per-task state before a pooled agent is reused.
+
+        Agents keep no per-task state by default; subclasses that do
+        should clear it here.
+        """
+
     async def __aenter__(self):
         """Async context manager entry."""
         await self.initialize()
@@ -8,8 +8,9 @@ This agent handles:
 - AI-enhanced scenario generation
 """
 
+import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -20,6 +21,7 @@ from claude_playwright_agent.agents.bdd_conversion import (
     convert_to_gherkin,
     save_feature_file,
     GherkinFeature,
+    IncrementalFeatureWriter,
 )
 
 
@@ -57,12 +59,17 @@ class BDDConversionAgent(BaseAgent):
     generation with templates and best practices.
     """
 
-    def __init__(self, project_path: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        project_path: Optional[Path] = None,
+        llm_provider: Optional[Any] = None,
+    ) -> None:
         """
         Initialize the BDD conversion agent.
 
         Args:
             project_path: Path to project root
+            llm_provider: Optional LLM provider used for streamed generation
         """
         self._project_path = Path(project_path) if project_path else Path.cwd()
         self._converter = BDDConverter()
@@ -91,7 +98,7 @@ Follow BDD best practices:
 - Use tags for organization
 - Keep scenarios focused and atomic
 """
-        super().__init__(system_prompt=system_prompt)
+        super().__init__(system_prompt=system_prompt, llm_provider=llm_provider)
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -175,6 +182,112 @@ Follow BDD best practices:
                 "error": f"BDD conversion failed: {e}",
             }
 
+    async def stream_feature(
+        self,
+        parsed_recording: dict[str, Any],
+        output_path: str | Path,
+        feature_name: str = "",
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Generate a feature file with the LLM, writing scenarios as they stream in.
+
+        The deterministic conversion is used as a draft that the model
+        refines. Each scenario is written to ``output_path`` as soon as it
+        is complete, so callers can show progress long before the whole
+        generation finishes.
+
+        Args:
+            parsed_recording: Parsed recording data
+            output_path: Path to save the feature file
+            feature_name: Optional feature name
+
+        Yields:
+            Progress events: ``first_token``, ``scenario`` and ``complete``
+        """
+        start = time.monotonic()
+        draft = self._converter.convert_recording(
+            parsed_recording,
+            feature_name or parsed_recording.get("test_name", "Feature"),
+        )
+        writer = IncrementalFeatureWriter(output_path, step_generator=self._step_gen)
+        provider = await self._get_stream_provider()
+
+        from claude_playwright_agent.llm import LLMMessage
+
+        messages = [
+            LLMMessage.system(self.system_prompt),
+            LLMMessage.user(
+                "Refine the following draft into a complete Gherkin feature file. "
+                "Respond with only the Gherkin text.\n\n"
+                f"{draft.to_gherkin()}"
+            ),
+        ]
+
+        first_token = True
+        try:
+            async for chunk in provider.query_stream(messages):
+                if not chunk.delta:
+                    continue
+                if first_token:
+                    first_token = False
+                    yield {"type": "first_token", "elapsed": time.monotonic() - start}
+                for scenario in writer.feed(chunk.delta):
+                    yield self._scenario_event(scenario, start)
+        finally:
+            # A provider created just for this stream is ours to close
+            if provider is not self.client:
+                await provider.cleanup()
+
+        for scenario in writer.close():
+            yield self._scenario_event(scenario, start)
+
+        yield {
+            "type": "complete",
+            "elapsed": time.monotonic() - start,
+            "feature_name": writer.feature_name or draft.name,
+            "scenario_count": len(writer.scenarios),
+            "step_count": sum(len(s.steps) for s in writer.scenarios),
+            "output_path": str(output_path),
+            "step_definitions": writer.get_step_definitions(),
+        }
+
+    async def _get_stream_provider(self) -> Any:
+        """
+        Get a provider that supports query_stream.
+
+        Returns:
+            The agent's client, or a new provider the caller must clean up
+        """
+        await self.initialize()
+        if hasattr(self.client, "query_stream"):
+            return self.client
+
+        # Legacy ClaudeSDKClient path has no unified streaming interface
+        from claude_playwright_agent.llm import LLMProviderFactory
+        from claude_playwright_agent.llm.models import ProviderConfig
+
+        provider = LLMProviderFactory.create_provider(
+            ProviderConfig(
+                provider=self.settings["provider"],
+                model=self.settings["model"],
+                api_key="",
+                max_tokens=self.settings["max_tokens"],
+                temperature=self.settings["temperature"],
+                timeout=self.settings["timeout"],
+            )
+        )
+        await provider.initialize()
+        return provider
+
+    def _scenario_event(self, scenario: Any, start: float) -> dict[str, Any]:
+        """Build a progress event for a completed scenario."""
+        return {
+            "type": "scenario",
+            "elapsed": time.monotonic() - start,
+            "name": scenario.name,
+            "step_count": len(scenario.steps),
+        }
+
     def _apply_template(
         self, feature: GherkinFeature, template: ScenarioTemplate
     ) -> GherkinFeature:
@@ -439,13 +439,21 @@ def fill_input(page: Page, text: str, element_desc: str) -> None:
 
         for scenario in feature.scenarios:
             for step in scenario.steps:
-                result.append(self._generate_step_definition(step))
+                result.append(self.generate_step_definition(step))
                 result.append("")
 
         return "\n".join(result)
 
-    def _generate_step_definition(self, step: GherkinStep) -> str:
-        """Generate a step definition for a single step."""
+    def generate_step_definition(self, step: GherkinStep) -> str:
+        """
+        Generate a step definition for a single step.
+
+        Args:
+            step: Gherkin step
+
+        Returns:
+            Python source of the step definition
+        """
         step_text = step.text
         # Convert step text to function name
         func_name = (step_text
@@ -468,6 +476,222 @@ def step_{func_name}(context) -> None:
 '''
 
 
+# =============================================================================
+# Incremental Feature Writer
+# =============================================================================
+
+
+class IncrementalFeatureWriter:
+    """
+    Parse streamed Gherkin text and write it to a feature file as it arrives.
+
+    Text is fed in arbitrary chunks (e.g. LLM stream deltas). Each scenario
+    is written to disk as soon as the next scenario starts or the stream
+    ends, so the file on disk always holds complete scenarios only.
+    Markdown code fences around the Gherkin are ignored.
+
+    Example:
+        writer = IncrementalFeatureWriter("features/login.feature")
+        async for chunk in provider.query_stream(messages):
+            for scenario in writer.feed(chunk.delta):
+                print(f"Wrote scenario: {scenario.name}")
+        writer.close()
+    """
+
+    SCENARIO_PREFIXES = ("Scenario:", "Scenario Outline:", "Scenario Template:", "Example:")
+    STEP_KEYWORDS = ("Given", "When", "Then", "And", "But", "*")
+
+    def __init__(
+        self,
+        output_path: str | Path | None = None,
+        step_generator: "StepDefinitionGenerator | None" = None,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            output_path: Feature file to write (None to only parse)
+            step_generator: Optional generator for incremental step definitions
+        """
+        self._output_path = Path(output_path) if output_path else None
+        self._file = None
+        self._step_gen = step_generator
+        self._buffer = ""
+        self._header: list[str] = []
+        self._pending_tags: list[str] = []
+        self._held: list[str] = []
+        self._current: list[str] | None = None
+        self._current_tags: list[str] = []
+        self._seen_steps: set[str] = set()
+        self.feature_name = ""
+        self.scenarios: list[GherkinScenario] = []
+        self.step_definitions: list[str] = []
+
+    def feed(self, text: str) -> list[GherkinScenario]:
+        """
+        Feed a chunk of streamed text.
+
+        Args:
+            text: Next chunk of Gherkin text
+
+        Returns:
+            Scenarios completed (and written) by this chunk
+        """
+        self._buffer += text
+        completed = []
+
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            scenario = self._process_line(line)
+            if scenario is not None:
+                completed.append(scenario)
+
+        return completed
+
+    def close(self) -> list[GherkinScenario]:
+        """
+        Flush the final partial line and scenario and close the file.
+
+        Returns:
+            Scenarios completed by closing the stream
+        """
+        completed = []
+        if self._buffer:
+            scenario = self._process_line(self._buffer)
+            self._buffer = ""
+            if scenario is not None:
+                completed.append(scenario)
+
+        # Tags at the very end have nothing left to tag
+        self._held = []
+        scenario = self._finish_scenario()
+        if scenario is not None:
+            completed.append(scenario)
+
+        if self._file is None and self._header:
+            self._write(self._header)
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        return completed
+
+    def get_step_definitions(self) -> str:
+        """Get step definitions generated for all completed scenarios."""
+        result = [
+            '"""',
+            f"Step definitions for {self.feature_name or 'streamed feature'}",
+            '"""',
+            "",
+            "from behave import given, when, then",
+            "from playwright.sync_api import Page, expect",
+            "",
+        ]
+        result.extend(self.step_definitions)
+        return "\n".join(result)
+
+    def _process_line(self, line: str) -> GherkinScenario | None:
+        """Handle one complete line, returning a scenario if one finished."""
+        line = line.rstrip("\r")
+        stripped = line.strip()
+
+        if stripped.startswith("```"):
+            return None
+
+        if stripped.startswith("@") and self._current is None:
+            self._pending_tags.append(stripped)
+            return None
+
+        if stripped.startswith("@") or (self._held and not stripped):
+            # Tags inside a scenario may start the next scenario or tag an
+            # Examples block; hold them until the next keyword decides
+            self._held.append(line)
+            return None
+
+        if stripped.startswith(self.SCENARIO_PREFIXES):
+            held_tags = [held.strip() for held in self._held if held.strip()]
+            self._held = []
+            finished = self._finish_scenario()
+            self._current = [line]
+            self._current_tags = self._pending_tags + held_tags
+            self._pending_tags = []
+            return finished
+
+        if self._current is not None:
+            self._current.extend(self._held)
+            self._held = []
+            self._current.append(line)
+            return None
+
+        if stripped.startswith("Feature:"):
+            self.feature_name = stripped[len("Feature:"):].strip()
+            # Tags seen so far belong to the feature itself
+            self._header.extend(self._pending_tags)
+            self._pending_tags = []
+
+        self._header.append(line)
+        return None
+
+    def _finish_scenario(self) -> GherkinScenario | None:
+        """Write and parse the scenario being collected, if any."""
+        if self._current is None:
+            return None
+
+        lines = self._current
+        tags = self._current_tags
+        self._current = None
+        self._current_tags = []
+
+        # Drop trailing blank lines; the writer controls spacing
+        while lines and not lines[-1].strip():
+            lines.pop()
+
+        if self._file is None:
+            self._write(self._header)
+
+        block = [f"  {tag}" for tag in tags] + lines + [""]
+        self._write(block)
+
+        scenario = self._parse_scenario(lines, tags)
+        self.scenarios.append(scenario)
+
+        if self._step_gen is not None:
+            for step in scenario.steps:
+                if step.text not in self._seen_steps:
+                    self._seen_steps.add(step.text)
+                    self.step_definitions.append(self._step_gen.generate_step_definition(step))
+
+        return scenario
+
+    def _parse_scenario(self, lines: list[str], tags: list[str]) -> GherkinScenario:
+        """Build a GherkinScenario from its raw lines."""
+        header = lines[0].strip()
+        name = header.split(":", 1)[1].strip()
+        steps = []
+
+        for line in lines[1:]:
+            stripped = line.strip()
+            keyword, _, text = stripped.partition(" ")
+            if keyword in self.STEP_KEYWORDS and text:
+                steps.append(GherkinStep(keyword, text))
+
+        return GherkinScenario(name=name, steps=steps, tags=tags)
+
+    def _write(self, lines: list[str]) -> None:
+        """Append lines to the output file and flush them to disk."""
+        if self._output_path is None:
+            return
+
+        if self._file is None:
+            self._output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self._output_path.open("w", encoding="utf-8")
+
+        for line in lines:
+            self._file.write(line + "\n")
+        self._file.flush()
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
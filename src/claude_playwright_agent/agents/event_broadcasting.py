@@ -45,6 +45,13 @@ class EventType(str, Enum):
     DATA_PROCESSED = "data_processed"
     DATA_ERROR = "data_error"
 
+    # Workflow events
+    WORKFLOW_STARTED = "workflow_started"
+    WORKFLOW_STAGE_STARTED = "workflow_stage_started"
+    WORKFLOW_STAGE_COMPLETED = "workflow_stage_completed"
+    WORKFLOW_STAGE_FAILED = "workflow_stage_failed"
+    WORKFLOW_COMPLETED = "workflow_completed"
+
     # System events
     SYSTEM_SHUTDOWN = "system_shutdown"
     SYSTEM_ERROR = "system_error"
@@ -16,6 +16,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from claude_playwright_agent.reporting.history_store import HistoryStore
+
 
 # =============================================================================
 # Failure Models
@@ -252,9 +254,23 @@ class FailureAnalyzer:
         ],
     }
 
-    def __init__(self) -> None:
-        """Initialize the failure analyzer."""
+    SOURCE = "failure_analyzer"
+
+    # Runs kept per test for flakiness detection
+    HISTORY_LIMIT = 20
+
+    def __init__(self, history_store: HistoryStore | None = None) -> None:
+        """
+        Initialize the failure analyzer.
+
+        Args:
+            history_store: Optional shared history store; when given, past
+                runs are loaded from it and new results are appended to it
+        """
+        self._history_store = history_store
         self._history: dict[str, list[dict[str, Any]]] = {}
+        if history_store is not None:
+            self._history = history_store.get_histories(limit_per_test=self.HISTORY_LIMIT)
 
     def analyze_execution_result(
         self,
@@ -655,6 +671,8 @@ class FailureAnalyzer:
             test_results: List of test result dictionaries
         """
         # Keep last 20 runs per test
+        timestamp = datetime.now().isoformat()
+        records = []
         for result in test_results:
             test_name = result.get("name", "")
             if not test_name:
@@ -671,17 +689,23 @@ class FailureAnalyzer:
                 len(result.get("previous_attempts", [])) > 0
             )
 
-            self._history[test_name].append({
+            record = {
                 "status": result.get("status", "unknown"),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "retry_count": retry_count,
                 "passed_on_retry": passed_on_retry,
                 "duration": result.get("duration", 0.0),
-            })
+            }
+            self._history[test_name].append(record)
+            records.append({"name": test_name, **record})
 
             # Trim history
-            if len(self._history[test_name]) > 20:
-                self._history[test_name] = self._history[test_name][-20:]
+            if len(self._history[test_name]) > self.HISTORY_LIMIT:
+                self._history[test_name] = self._history[test_name][-self.HISTORY_LIMIT:]
+
+        # Persist the whole batch as one run
+        if self._history_store is not None and records:
+            self._history_store.record_run(records, source=self.SOURCE, timestamp=timestamp)
 
     def detect_flaky_tests(
         self,
@@ -0,0 +1,398 @@
+"""
+Heartbeat Registry for Claude Playwright Agent.
+
+This module provides:
+- An in-memory table of agent heartbeats (O(1) per heartbeat)
+- Timeout detection with a single timer heap for all agents, instead of
+  one monitoring task per agent
+- Batched persistence of agent health to project state, every flush
+  interval or as soon as an agent's status changes
+
+Heartbeats never touch the state file directly: with many agents on a
+short heartbeat interval, state is still written at most once per flush
+interval.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from claude_playwright_agent.state import AgentStatus, StateManager
+
+# =============================================================================
+# Heartbeat Records
+# =============================================================================
+
+
+@dataclass
+class HeartbeatRecord:
+    """
+    Heartbeat tracking for one agent.
+
+    Attributes:
+        agent_id: Agent identifier
+        agent_type: Type of agent
+        task_id: Task the agent works on
+        status: Current status
+        registered_at: Registration time (epoch seconds)
+        last_heartbeat: Last heartbeat time (epoch seconds)
+        last_seen: Last heartbeat on the registry clock
+        heartbeat_count: Heartbeats received
+        error_message: Error of a failed or timed out agent
+        scheduled: Whether the agent has an entry in the timer heap
+    """
+    agent_id: str
+    agent_type: str
+    task_id: str = ""
+    status: AgentStatus = AgentStatus.RUNNING
+    registered_at: float = field(default_factory=time.time)
+    last_heartbeat: float = field(default_factory=time.time)
+    last_seen: float = 0.0
+    heartbeat_count: int = 0
+    error_message: str = ""
+    scheduled: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "agent_id": self.agent_id,
+            "agent_type": self.agent_type,
+            "task_id": self.task_id,
+            "status": self.status.value,
+            "registered_at": self.registered_at,
+            "last_heartbeat": self.last_heartbeat,
+            "heartbeat_count": self.heartbeat_count,
+            "error_message": self.error_message,
+        }
+
+
+TimeoutCallback = Callable[[HeartbeatRecord], Awaitable[None] | None]
+
+
+# =============================================================================
+# Health Registry
+# =============================================================================
+
+
+class HealthRegistry:
+    """
+    Registry of agent heartbeats with timer-heap timeout detection.
+
+    The timer heap holds one entry per running agent, ordered by the time
+    its timeout would expire if no heartbeat arrived. Heartbeats only
+    update the agent's record; when an entry comes due, the agent is
+    timed out if it has not been seen since, otherwise the entry is
+    pushed back to its new deadline.
+    """
+
+    def __init__(
+        self,
+        state: StateManager | None = None,
+        timeout: float = 300.0,
+        flush_interval: float = 5.0,
+        on_timeout: TimeoutCallback | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            state: State manager health is persisted to (None: memory only)
+            timeout: Seconds without a heartbeat before an agent times out
+            flush_interval: Seconds between batched state writes
+            on_timeout: Called with the record of each timed out agent
+            clock: Monotonic clock used for timeouts
+        """
+        self._state = state
+        self.timeout = timeout
+        self.flush_interval = flush_interval
+        self._on_timeout = on_timeout
+        self._clock = clock
+        self._records: dict[str, HeartbeatRecord] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        # Agents with unflushed changes; a status change forces a flush
+        self._dirty: set[str] = set()
+        self._status_changed = False
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._stats = {"heartbeats": 0, "timeouts": 0, "flushes": 0}
+
+    # =========================================================================
+    # Records
+    # =========================================================================
+
+    def register(
+        self,
+        agent_id: str,
+        agent_type: str,
+        task_id: str = "",
+        status: AgentStatus = AgentStatus.RUNNING,
+    ) -> HeartbeatRecord:
+        """
+        Register an agent.
+
+        Args:
+            agent_id: Agent identifier
+            agent_type: Type of agent
+            task_id: Task the agent works on
+            status: Initial status
+
+        Returns:
+            The agent's heartbeat record
+        """
+        record = HeartbeatRecord(
+            agent_id=agent_id,
+            agent_type=agent_type,
+            task_id=task_id,
+            status=status,
+            last_seen=self._clock(),
+        )
+        self._records[agent_id] = record
+        self._schedule(record)
+        self._mark(agent_id, status_changed=True)
+        return record
+
+    def unregister(self, agent_id: str) -> HeartbeatRecord | None:
+        """
+        Stop tracking an agent.
+
+        Its timer heap entry is dropped when it comes due.
+
+        Args:
+            agent_id: Agent identifier
+
+        Returns:
+            The agent's last record, or None if it was not registered
+        """
+        self._dirty.discard(agent_id)
+        return self._records.pop(agent_id, None)
+
+    def heartbeat(self, agent_id: str) -> bool:
+        """
+        Record a heartbeat.
+
+        A heartbeat from a timed out agent marks it running again.
+
+        Args:
+            agent_id: Agent identifier
+
+        Returns:
+            False if the agent is not registered
+        """
+        record = self._records.get(agent_id)
+        if record is None:
+            return False
+        record.last_seen = self._clock()
+        record.last_heartbeat = time.time()
+        record.heartbeat_count += 1
+        self._stats["heartbeats"] += 1
+        if record.status == AgentStatus.TIMEOUT:
+            self.set_status(agent_id, AgentStatus.RUNNING)
+        else:
+            self._dirty.add(agent_id)
+        return True
+
+    def set_status(self, agent_id: str, status: AgentStatus, error_message: str = "") -> None:
+        """
+        Change an agent's status; the change is flushed promptly.
+
+        Args:
+            agent_id: Agent identifier
+            status: New status
+            error_message: Error message for failed agents
+
+        Raises:
+            KeyError: If the agent is not registered
+        """
+        record = self._records[agent_id]
+        record.status = status
+        if error_message:
+            record.error_message = error_message
+        if status == AgentStatus.RUNNING:
+            record.last_seen = self._clock()
+            self._schedule(record)
+        self._mark(agent_id, status_changed=True)
+
+    def get(self, agent_id: str) -> HeartbeatRecord | None:
+        """Get an agent's heartbeat record."""
+        return self._records.get(agent_id)
+
+    def get_all(self) -> dict[str, HeartbeatRecord]:
+        """Get the heartbeat records of every agent."""
+        return dict(self._records)
+
+    def seconds_since_heartbeat(self, agent_id: str) -> float | None:
+        """Get the seconds since an agent's last heartbeat (None if unknown)."""
+        record = self._records.get(agent_id)
+        if record is None:
+            return None
+        return self._clock() - record.last_seen
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get registry statistics."""
+        return {
+            **self._stats,
+            "agents": len(self._records),
+            "timers": len(self._heap),
+            "pending_flush": len(self._dirty),
+        }
+
+    def _schedule(self, record: HeartbeatRecord) -> None:
+        """Add a timer heap entry for an agent that has none."""
+        if record.scheduled:
+            return
+        record.scheduled = True
+        deadline = record.last_seen + self.timeout
+        heapq.heappush(self._heap, (deadline, next(self._sequence), record.agent_id))
+        if self._heap[0][2] == record.agent_id:
+            self._wake()
+
+    def _mark(self, agent_id: str, status_changed: bool = False) -> None:
+        """Mark an agent's record as needing a flush."""
+        self._dirty.add(agent_id)
+        if status_changed:
+            self._status_changed = True
+            self._wake()
+
+    # =========================================================================
+    # Timeouts and Persistence
+    # =========================================================================
+
+    def check_timeouts(self, now: float | None = None) -> list[HeartbeatRecord]:
+        """
+        Time out agents whose timer heap entry is due.
+
+        Args:
+            now: Current registry clock value
+
+        Returns:
+            Records of the agents that timed out
+        """
+        now = self._clock() if now is None else now
+        timed_out: list[HeartbeatRecord] = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, agent_id = heapq.heappop(self._heap)
+            record = self._records.get(agent_id)
+            if record is None:
+                continue
+            record.scheduled = False
+            if record.status != AgentStatus.RUNNING:
+                continue
+            deadline = record.last_seen + self.timeout
+            if deadline > now:
+                # Seen since the entry was pushed: move it to the new deadline
+                record.scheduled = True
+                heapq.heappush(self._heap, (deadline, next(self._sequence), agent_id))
+                continue
+
+            record.status = AgentStatus.TIMEOUT
+            record.error_message = f"Agent timeout after {now - record.last_seen:.0f}s"
+            self._mark(agent_id, status_changed=True)
+            self._stats["timeouts"] += 1
+            timed_out.append(record)
+        return timed_out
+
+    def flush(self, force_backup: bool = False) -> int:
+        """
+        Write pending agent health to state in one save.
+
+        Args:
+            force_backup: Back up the state file even for heartbeat-only changes
+
+        Returns:
+            Number of agent tasks written
+        """
+        if not self._dirty:
+            return 0
+        dirty, self._dirty = self._dirty, set()
+        status_changed, self._status_changed = self._status_changed, False
+        if self._state is None:
+            return 0
+
+        updates = {
+            agent_id: {
+                "status": record.status,
+                "error_message": record.error_message,
+                "result": {
+                    "heartbeat_count": record.heartbeat_count,
+                    "last_heartbeat": record.last_heartbeat,
+                },
+            }
+            for agent_id in dirty
+            if (record := self._records.get(agent_id)) is not None
+        }
+        # Heartbeat-only flushes are frequent and lose nothing; skip their backups
+        written = self._state.update_agent_tasks(
+            updates, create_backup=status_changed or force_backup
+        )
+        self._stats["flushes"] += 1
+        return written
+
+    # =========================================================================
+    # Background Loop
+    # =========================================================================
+
+    def _wake(self) -> None:
+        """Wake the background loop to re-evaluate timers and flushes."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the background timer and flush loop (needs a running loop)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    @property
+    def running(self) -> bool:
+        """Whether the background loop is running."""
+        return self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        """Handle due timers and flushes, sleeping until the next one."""
+        next_flush = self._clock() + self.flush_interval
+        while True:
+            self._wakeup.clear()
+            for record in self.check_timeouts():
+                if self._on_timeout is not None:
+                    try:
+                        result = self._on_timeout(record)
+                        if asyncio.iscoroutine(result):
+                            await result
+                    except Exception:
+                        pass
+
+            now = self._clock()
+            if self._status_changed or now >= next_flush:
+                try:
+                    self.flush()
+                except Exception:
+                    pass
+                next_flush = now + self.flush_interval
+
+            wake_at = next_flush
+            if self._heap:
+                wake_at = min(wake_at, self._heap[0][0])
+            # asyncio.wait, unlike wait_for before Python 3.12, never
+            # swallows a cancellation that races with the wakeup
+            waiter = asyncio.ensure_future(self._wakeup.wait())
+            try:
+                await asyncio.wait((waiter,), timeout=max(wake_at - self._clock(), 0))
+            finally:
+                waiter.cancel()
+
+    async def stop(self) -> None:
+        """Stop the background loop and flush pending changes."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.flush()
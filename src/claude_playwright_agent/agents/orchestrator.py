@@ -9,7 +9,8 @@ This module implements:
 """
 
 import asyncio
-import time
+import functools
+import inspect
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -17,7 +18,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Awaitable, Optional
 
+from claude_playwright_agent.agents.agent_pool import AgentPool, PoolConfig, ResetHook
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.agents.health_registry import HealthRegistry
 from claude_playwright_agent.agents.priority_messaging import (
     PriorityMessageQueue,
     TaskPriority,
@@ -34,6 +37,13 @@ from claude_playwright_agent.agents.event_broadcasting import (
     AgentEvent,
     get_event_bus,
 )
+from claude_playwright_agent.agents.workflow_engine import (
+    Stage,
+    StageContext,
+    Workflow,
+    WorkflowEngine,
+)
+from claude_playwright_agent.agents.workflow_store import WORKFLOW_STORE_DIR, StageResultStore
 from claude_playwright_agent.state import StateManager, AgentStatus
 
 # =============================================================================
@@ -145,37 +155,6 @@ class AgentTask:
         }
 
 
-# =============================================================================
-# Workflow Definitions
-# =============================================================================
-
-
-@dataclass
-class Stage:
-    """
-    A single stage in a multi-agent workflow.
-
-    Attributes:
-        name: Stage name
-        agent_type: Type of agent to run for this stage
-        config: Configuration for the agent
-    """
-    name: str
-    agent_type: str
-    config: dict[str, Any] = field(default_factory=dict)
-
-
-@dataclass
-class Workflow:
-    """
-    A multi-agent workflow definition.
-
-    Attributes:
-        stages: List of stages to execute in sequence
-    """
-    stages: list[Stage] = field(default_factory=list)
-
-
 # =============================================================================
 # Message Queue (Priority-Enabled)
 # =============================================================================
@@ -361,12 +340,14 @@ class AgentLifecycleManager:
 
     Features:
     - Spawn agents with context tracking
-    - Monitor agent health with heartbeat
-    - Timeout detection and recovery
+    - Monitor agent health with heartbeats (in-memory, flushed to state
+      in batches) and timeout detection on a single timer heap; every
+      process() call of a managed agent heartbeats when it starts and ends
     - Context-aware health checks
     - Handle agent completion
     - Clean up terminated agents
     - Resource limit enforcement
+    - Warm agent pools per agent type with idle eviction
     """
 
     def __init__(
@@ -376,28 +357,33 @@ class AgentLifecycleManager:
         agent_timeout: float = 300.0,
         max_concurrent_agents: int = 10,
         enable_resource_limits: bool = True,
+        pool_eviction_interval: float = 60.0,
+        health_flush_interval: float = 5.0,
     ) -> None:
         """
         Initialize the lifecycle manager.
 
         Args:
             project_path: Path to project root
-            heartbeat_interval: Seconds between heartbeat checks
-            agent_timeout: Seconds before agent is considered timed out
+            heartbeat_interval: Seconds agents are expected to heartbeat at
+            agent_timeout: Seconds without a heartbeat before an agent times out
             max_concurrent_agents: Maximum number of concurrent agents
             enable_resource_limits: Whether to enable resource limit tracking
+            pool_eviction_interval: Seconds between idle agent eviction passes
+            health_flush_interval: Seconds between batched health writes to state
         """
         self._project_path = Path(project_path) if project_path else Path.cwd()
         self._state = StateManager(self._project_path)
         self._agents: dict[str, BaseAgent] = {}
-        self._tasks: dict[str, asyncio.Task] = {}
         self._lock = asyncio.Lock()
         self._heartbeat_interval = heartbeat_interval
         self._agent_timeout = agent_timeout
-        # Health tracking: agent_id -> last_heartbeat_time
-        self._last_heartbeat: dict[str, float] = {}
-        # Health metrics: agent_id -> heartbeat_count
-        self._heartbeat_count: dict[str, int] = {}
+        # Health tracking: heartbeats in memory, one timer heap for timeouts
+        self._health = HealthRegistry(
+            self._state,
+            timeout=agent_timeout,
+            flush_interval=health_flush_interval,
+        )
         # Context tracking
         self._agent_contexts: dict[str, str] = {}  # agent_id -> task_id
         # Resource limit management
@@ -407,6 +393,10 @@ class AgentLifecycleManager:
             self._resource_manager = ResourceLimitManager(
                 max_concurrent_agents=max_concurrent_agents,
             )
+        # Warm agent pools: agent_type -> pool
+        self._pools: dict[str, AgentPool] = {}
+        self._pool_eviction_interval = pool_eviction_interval
+        self._eviction_task: asyncio.Task | None = None
 
     async def spawn_agent(
         self,
@@ -431,11 +421,8 @@ class AgentLifecycleManager:
             # Check resource limits before spawning
             if self._resource_manager:
                 try:
-                    import psutil
-                    process = psutil.Process()
                     await self._resource_manager.register_agent(
                         agent_id,
-                        process=process,
                         context={"agent_type": agent_type, "task_id": task_id},
                     )
                 except ResourceLimitError as e:
@@ -446,33 +433,30 @@ class AgentLifecycleManager:
                     )
                     raise
 
-            # Store agent
+            # Store agent; its process() calls are attributed resource usage
             self._agents[agent_id] = agent
+            if self._resource_manager:
+                self._resource_manager.instrument(agent_id, agent)
+            self._instrument_heartbeats(agent_id, agent)
 
             # Initialize agent
             await agent.initialize()
 
-            # Record in state
+            # Record in state; the RUNNING status is flushed by the registry
             self._state.add_agent_task(
                 agent_id=agent_id,
                 agent_type=agent_type,
                 parent_task_id=task_id,
             )
-            self._state.update_agent_task(agent_id, AgentStatus.RUNNING)
 
             # Initialize health tracking
-            self._last_heartbeat[agent_id] = time.time()
-            self._heartbeat_count[agent_id] = 0
+            self._health.register(agent_id, agent_type, task_id)
+            self._health.start()
 
             # Store context mapping
             if task_id:
                 self._agent_contexts[agent_id] = task_id
 
-            # Start heartbeat task
-            self._tasks[agent_id] = asyncio.create_task(
-                self._monitor_agent(agent_id, agent)
-            )
-
     async def terminate_agent(self, agent_id: str) -> None:
         """
         Terminate an agent.
@@ -498,20 +482,8 @@ class AgentLifecycleManager:
                 await agent.cleanup()
                 del self._agents[agent_id]
 
-            # Cancel monitoring task
-            if agent_id in self._tasks:
-                task = self._tasks[agent_id]
-                if not task.done():
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-                del self._tasks[agent_id]
-
             # Clean up health tracking
-            self._last_heartbeat.pop(agent_id, None)
-            self._heartbeat_count.pop(agent_id, None)
+            self._health.unregister(agent_id)
 
             # Clean up context mapping
             task_id = self._agent_contexts.pop(agent_id, None)
@@ -522,58 +494,43 @@ class AgentLifecycleManager:
             # Update state
             self._state.update_agent_task(agent_id, AgentStatus.COMPLETED)
 
-    async def _monitor_agent(self, agent_id: str, agent: BaseAgent) -> None:
+    def _instrument_heartbeats(self, agent_id: str, agent: BaseAgent) -> None:
         """
-        Monitor agent health with heartbeat and timeout detection.
+        Wrap an agent's process() so every call heartbeats as it starts and ends.
+
+        A call that runs for longer than the agent timeout without
+        finishing is reported as timed out.
 
         Args:
             agent_id: Agent identifier
             agent: Agent instance
         """
-        try:
-            while True:
-                await asyncio.sleep(self._heartbeat_interval)
-
-                # Check if agent still exists
-                if agent_id not in self._agents:
-                    break
-
-                # Update heartbeat tracking
-                current_time = time.time()
-                self._last_heartbeat[agent_id] = current_time
-                self._heartbeat_count[agent_id] = self._heartbeat_count.get(agent_id, 0) + 1
-
-                # Check for timeout
-                time_since_heartbeat = current_time - self._last_heartbeat.get(agent_id, current_time)
-                if time_since_heartbeat > self._agent_timeout:
-                    # Agent timed out
-                    self._state.update_agent_task(
-                        agent_id,
-                        AgentStatus.TIMEOUT,
-                        error_message=f"Agent timeout after {time_since_heartbeat:.0f}s",
-                    )
-                    break
-
-                # Update state with health metrics
-                self._state.update_agent_task(
-                    agent_id,
-                    AgentStatus.RUNNING,
-                    result={
-                        "heartbeat_count": self._heartbeat_count.get(agent_id, 0),
-                        "last_heartbeat": current_time,
-                    },
-                )
-
-        except asyncio.CancelledError:
-            # Normal shutdown
-            raise
-        except Exception as e:
-            # Log error and mark as failed
-            self._state.update_agent_task(
-                agent_id,
-                AgentStatus.FAILED,
-                error_message=f"Health check failed: {e}",
-            )
+        process = agent.process
+
+        @functools.wraps(process)
+        async def heartbeat_process(*args: Any, **kwargs: Any) -> Any:
+            self._health.heartbeat(agent_id)
+            try:
+                return await process(*args, **kwargs)
+            finally:
+                self._health.heartbeat(agent_id)
+
+        agent.process = heartbeat_process
+
+    def heartbeat(self, agent_id: str) -> bool:
+        """
+        Record a heartbeat from an agent.
+
+        Heartbeats only update the in-memory health registry; state is
+        written in batches by the registry's flush loop.
+
+        Args:
+            agent_id: Agent identifier
+
+        Returns:
+            False if the agent is not tracked
+        """
+        return self._health.heartbeat(agent_id)
 
     def get_agent_health(self, agent_id: str) -> dict[str, Any] | None:
         """
@@ -585,15 +542,18 @@ class AgentLifecycleManager:
         Returns:
             Health metrics dict or None if agent not found
         """
-        if agent_id not in self._last_heartbeat:
+        record = self._health.get(agent_id)
+        if record is None:
             return None
 
+        time_since_heartbeat = self._health.seconds_since_heartbeat(agent_id) or 0.0
         health_info = {
             "agent_id": agent_id,
-            "last_heartbeat": self._last_heartbeat.get(agent_id, 0),
-            "heartbeat_count": self._heartbeat_count.get(agent_id, 0),
-            "status": "running" if agent_id in self._agents else "terminated",
-            "time_since_heartbeat": time.time() - self._last_heartbeat.get(agent_id, time.time()),
+            "last_heartbeat": record.last_heartbeat,
+            "heartbeat_count": record.heartbeat_count,
+            "status": record.status.value if agent_id in self._agents else "terminated",
+            "time_since_heartbeat": time_since_heartbeat,
+            "missed_heartbeats": int(time_since_heartbeat // self._heartbeat_interval),
             "task_id": self._agent_contexts.get(agent_id, ""),
         }
 
@@ -615,6 +575,9 @@ class AgentLifecycleManager:
         Returns:
             Agent status or None if agent not found
         """
+        record = self._health.get(agent_id)
+        if record is not None:
+            return record.status
         agent_task = self._state.get_agent_task(agent_id)
         if agent_task:
             return agent_task.status
@@ -635,6 +598,9 @@ class AgentLifecycleManager:
         for agent_id in agent_ids:
             await self.terminate_agent(agent_id)
 
+        await self._health.stop()
+        await self.close_pools()
+
         # Stop resource manager
         if self._resource_manager:
             await self._resource_manager.stop()
@@ -648,11 +614,17 @@ class AgentLifecycleManager:
         """
         Get resource usage summary.
 
+        Includes the registry memory of skill agents against their budgets.
+
         Returns:
             Resource summary or None if resource tracking disabled
         """
         if self._resource_manager:
-            return self._resource_manager.get_summary()
+            from claude_playwright_agent.skills.bounded import get_memory_report
+
+            summary = self._resource_manager.get_summary()
+            summary["skill_memory"] = get_memory_report()
+            return summary
         return None
 
     def get_resource_limits(self) -> dict[str, Any] | None:
@@ -669,6 +641,148 @@ class AgentLifecycleManager:
             }
         return None
 
+    # =========================================================================
+    # Agent Pools
+    # =========================================================================
+
+    def configure_pool(
+        self,
+        agent_type: str,
+        factory: Callable[[str], Any],
+        config: PoolConfig | None = None,
+        reset: ResetHook | None = None,
+    ) -> AgentPool:
+        """
+        Create the warm pool for an agent type.
+
+        Pooled agents are initialized once and reused; they are not
+        registered as spawned agents.
+
+        Args:
+            agent_type: Agent type name
+            factory: Creates an agent for the agent type name
+            config: Pool sizes and idle timeout
+            reset: Called with an agent before it is reused
+
+        Returns:
+            The agent pool
+
+        Raises:
+            ValueError: If a pool for the agent type already exists
+        """
+        if agent_type in self._pools:
+            raise ValueError(f"Agent pool already configured: {agent_type}")
+        pool = AgentPool(agent_type, factory, config, reset)
+        self._pools[agent_type] = pool
+        self._start_eviction()
+        return pool
+
+    def get_pool(self, agent_type: str) -> AgentPool | None:
+        """
+        Get the warm pool for an agent type.
+
+        Args:
+            agent_type: Agent type name
+
+        Returns:
+            Agent pool or None if not configured
+        """
+        return self._pools.get(agent_type)
+
+    def _require_pool(self, agent_type: str) -> AgentPool:
+        """Get a configured pool."""
+        pool = self._pools.get(agent_type)
+        if pool is None:
+            raise KeyError(f"No agent pool configured for: {agent_type}")
+        self._start_eviction()
+        return pool
+
+    def _start_eviction(self) -> None:
+        """Start idle eviction if it is not running and a loop is."""
+        if self._eviction_task is not None and not self._eviction_task.done():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._eviction_task = asyncio.create_task(self._evict_idle_loop())
+
+    async def checkout_agent(self, agent_type: str) -> Any:
+        """
+        Check out a warm agent, creating one if none is idle.
+
+        Args:
+            agent_type: Agent type name
+
+        Returns:
+            Initialized agent
+        """
+        return await self._require_pool(agent_type).checkout()
+
+    async def checkin_agent(self, agent_type: str, agent: Any, healthy: bool = True) -> None:
+        """
+        Return a checked out agent to its pool.
+
+        Args:
+            agent_type: Agent type name
+            agent: Agent from checkout_agent()
+            healthy: False to discard the agent instead of reusing it
+        """
+        await self._require_pool(agent_type).checkin(agent, healthy)
+
+    async def warm_pools(self) -> dict[str, int]:
+        """
+        Create idle agents up to each pool's minimum size.
+
+        Returns:
+            Agents created per agent type
+        """
+        return {agent_type: await pool.warm() for agent_type, pool in self._pools.items()}
+
+    async def evict_idle_agents(self) -> int:
+        """
+        Evict pooled agents idle for longer than their pool's idle timeout.
+
+        Returns:
+            Number of agents evicted
+        """
+        evicted = 0
+        for pool in list(self._pools.values()):
+            evicted += await pool.evict_idle()
+        return evicted
+
+    async def _evict_idle_loop(self) -> None:
+        """Periodically evict idle pooled agents."""
+        while True:
+            await asyncio.sleep(self._pool_eviction_interval)
+            await self.evict_idle_agents()
+
+    def get_pool_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get metrics of every agent pool.
+
+        Returns:
+            Pool metrics per agent type
+        """
+        return {
+            agent_type: pool.get_stats().to_dict()
+            for agent_type, pool in self._pools.items()
+        }
+
+    async def close_pools(self) -> None:
+        """Clean up every pooled agent and remove the pools."""
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            try:
+                await self._eviction_task
+            except asyncio.CancelledError:
+                pass
+            self._eviction_task = None
+
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            await pool.close()
+
 
 # =============================================================================
 # Orchestrator Agent
@@ -690,12 +804,15 @@ class OrchestratorAgent(BaseAgent):
     def __init__(
         self,
         project_path: Path | None = None,
+        agent_factory: Callable[[str], Any] | None = None,
     ) -> None:
         """
         Initialize the orchestrator.
 
         Args:
             project_path: Path to project root
+            agent_factory: Creates the agent for a workflow stage from its
+                agent type name (default: the agent class of that name)
         """
         system_prompt = """You are the Orchestrator Agent for Claude Playwright Agent.
 
@@ -722,6 +839,7 @@ Always track the status of each task and agent, and provide clear status updates
         self._lifecycle = AgentLifecycleManager(self._project_path)
         self._event_bus = get_event_bus()
         self._current_tasks: dict[str, AgentTask] = {}
+        self._agent_factory = agent_factory or self._create_stage_agent
 
         super().__init__(
             system_prompt=system_prompt,
@@ -1082,20 +1200,110 @@ Always track the status of each task and agent, and provide clear status updates
             })
         return agents
 
-    async def run_workflow(self, workflow_type: str, input_data: dict) -> dict:
+    def _create_stage_agent(self, agent_type: str) -> Any:
         """
-        Execute a multi-agent workflow with coordinated stages.
+        Create the agent for a workflow stage.
 
         Args:
-            workflow_type: Type of workflow to run (ingestion, execution, etc.)
+            agent_type: Agent class name exported by the agents package
+
+        Returns:
+            Agent instance
+
+        Raises:
+            ValueError: If no agent of that type exists
+        """
+        from claude_playwright_agent import agents
+
+        try:
+            agent_class = getattr(agents, agent_type)
+        except AttributeError:
+            raise ValueError(f"Unknown agent type: {agent_type}") from None
+
+        if "project_path" in inspect.signature(agent_class).parameters:
+            return agent_class(project_path=self._project_path)
+        return agent_class()
+
+    def configure_agent_pool(
+        self,
+        agent_type: str,
+        config: PoolConfig | None = None,
+        reset: ResetHook | None = None,
+    ) -> AgentPool:
+        """
+        Configure the warm pool workflows use for an agent type.
+
+        Args:
+            agent_type: Agent type name
+            config: Pool sizes and idle timeout
+            reset: Called with an agent before it is reused
+
+        Returns:
+            The agent pool
+        """
+        return self._lifecycle.configure_pool(agent_type, self._agent_factory, config, reset)
+
+    def get_pool_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get metrics of the warm agent pools.
+
+        Returns:
+            Pool metrics per agent type
+        """
+        return self._lifecycle.get_pool_stats()
+
+    def _workflow_pool(self, agent_type: str) -> AgentPool:
+        """Get the warm pool for a workflow stage, creating it on first use."""
+        pool = self._lifecycle.get_pool(agent_type)
+        if pool is None:
+            pool = self.configure_agent_pool(
+                agent_type,
+                PoolConfig(max_size=WORKFLOW_CONCURRENCY.get(agent_type, 4)),
+            )
+        return pool
+
+    async def _publish_workflow_event(self, event_type: EventType, data: dict[str, Any]) -> None:
+        """Publish a workflow progress event."""
+        await self._event_bus.publish(AgentEvent(type=event_type, source="orchestrator", data=data))
+
+    async def run_workflow(
+        self,
+        workflow_type: str,
+        input_data: dict,
+        max_concurrency: dict[str, int] | None = None,
+        resume: bool = False,
+        checkpoint: bool = True,
+    ) -> dict:
+        """
+        Execute a multi-agent workflow.
+
+        Stages run as soon as the stages they depend on are done, so
+        independent branches overlap and each recording moves through the
+        per-recording stages on its own. Agents come from warm pools and
+        are reused across recordings and workflow runs, with a cap on
+        concurrent runs per agent type.
+
+        Stage results are checkpointed in the project's workflow store;
+        with ``resume`` every stage whose input is unchanged since it last
+        succeeded is restored instead of run again, and the files it
+        writes are written again. Test execution and its analysis always
+        run, since their outcome depends on more than their input.
+
+        Args:
+            workflow_type: Type of workflow to run (ingestion, execution, full)
             input_data: Input data for the workflow
+            max_concurrency: Concurrent runs per agent type, overriding
+                the workflow defaults
+            resume: Skip stages with a checkpoint for the same input
+            checkpoint: Store stage results and the run's input
 
         Returns:
             Workflow results
 
         Example:
             >>> result = await orchestrator.run_workflow("ingestion", {
-            ...     "recording_path": "recordings/test.spec.js"
+            ...     "recordings": ["recordings/login.spec.js", "recordings/cart.spec.js"],
+            ...     "features_dir": "features",
             ... })
         """
         workflow = self._get_workflow(workflow_type)
@@ -1103,120 +1311,148 @@ Always track the status of each task and agent, and provide clear status updates
         if not workflow:
             return {"error": f"Unknown workflow type: {workflow_type}"}
 
-        logger.info(f"Starting workflow: {workflow_type} with {len(workflow.stages)} stages")
+        if max_concurrency:
+            workflow.max_concurrency.update(max_concurrency)
 
-        results = {}
-        current_data = input_data
+        input_data = dict(input_data)
+        if workflow.items_key not in input_data and workflow.item_key in input_data:
+            input_data[workflow.items_key] = [input_data[workflow.item_key]]
 
+        store = self.get_workflow_store() if checkpoint or resume else None
+        engine = WorkflowEngine(
+            on_event=self._publish_workflow_event,
+            pool_provider=self._workflow_pool,
+            store=store,
+            agent_version=self._agent_version,
+        )
         try:
-            for stage in workflow.stages:
-                logger.info(f"Executing stage: {stage.name}")
-
-                # Spawn agent for this stage
-                agent_instance = await self._lifecycle.spawn_agent(
-                    agent_type=stage.agent_type,
-                    config=stage.config or {}
-                )
-
-                # Publish stage start event
-                await self._event_bus.publish(AgentEvent(
-                    type=EventType.WORKFLOW_STAGE_START,
-                    agent_id=self.agent_id,
-                    data={
-                        "workflow": workflow_type,
-                        "stage": stage.name,
-                        "agent": agent_instance.agent_id
-                    }
-                ))
-
-                # Execute stage using the agent
-                try:
-                    if hasattr(agent_instance.agent, 'process'):
-                        stage_result = await agent_instance.agent.process(current_data)
-                    elif hasattr(agent_instance.agent, 'run'):
-                        stage_result = await agent_instance.agent.run(current_data)
-                    else:
-                        raise AttributeError(f"Agent {stage.agent_type} has no process or run method")
-
-                    results[stage.name] = stage_result
-
-                    # Pass result to next stage
-                    current_data = stage_result
-
-                    logger.info(f"Stage {stage.name} completed successfully")
-
-                except Exception as e:
-                    logger.error(f"Stage {stage.name} failed: {e}")
-                    await self._event_bus.publish(AgentEvent(
-                        type=EventType.WORKFLOW_STAGE_ERROR,
-                        agent_id=self.agent_id,
-                        data={
-                            "workflow": workflow_type,
-                            "stage": stage.name,
-                            "error": str(e)
-                        }
-                    ))
-                    raise
-
-                # Cleanup agent after stage completes
-                await self._lifecycle.stop_agent(agent_instance.agent_id)
-
-            # Publish workflow completion event
-            await self._event_bus.publish(AgentEvent(
-                type=EventType.WORKFLOW_COMPLETE,
-                agent_id=self.agent_id,
-                data={
-                    "workflow": workflow_type,
-                    "results": results
-                }
-            ))
-
-            return {
-                "workflow": workflow_type,
-                "status": "completed",
-                "results": results,
-                "final_data": current_data
-            }
-
-        except Exception as e:
-            logger.error(f"Workflow {workflow_type} failed: {e}")
+            result = await engine.run(workflow, input_data, name=workflow_type, resume=resume)
+        except ValueError as e:
             return {
                 "workflow": workflow_type,
                 "status": "failed",
                 "error": str(e),
-                "results": results
+                "results": {},
             }
 
+        if store is not None:
+            store.save_run(workflow_type, input_data, result.status.value, result.errors)
+
+        output = result.to_dict()
+        output["workflow"] = workflow_type
+        output["final_data"] = result.results.get(workflow.stages[-1].name)
+        if result.errors:
+            output["error"] = "; ".join(f"{key}: {error}" for key, error in result.errors.items())
+        return output
+
+    async def resume_workflow(self, workflow_type: str | None = None, **kwargs: Any) -> dict:
+        """
+        Re-run the last run of a workflow, skipping unchanged stages.
+
+        Args:
+            workflow_type: Workflow to resume (None: the most recent run)
+            **kwargs: Extra run_workflow() arguments
+
+        Returns:
+            Workflow results
+        """
+        run = self.get_workflow_store().load_run(workflow_type)
+        if run is None:
+            return {"error": f"No workflow run to resume: {workflow_type or 'any'}"}
+        return await self.run_workflow(run["workflow"], run["input_data"], resume=True, **kwargs)
+
+    def get_workflow_store(self) -> StageResultStore:
+        """
+        Get the project's workflow checkpoint store.
+
+        Returns:
+            Stage result store
+        """
+        return StageResultStore(self._project_path / WORKFLOW_STORE_DIR)
+
+    @staticmethod
+    def _agent_version(agent_type: str) -> str:
+        """Get the version checkpoints of an agent type are valid for."""
+        from claude_playwright_agent import __version__, agents
+
+        agent_class = getattr(agents, agent_type, None)
+        return f"{__version__}/{getattr(agent_class, 'VERSION', '')}"
+
     def _get_workflow(self, workflow_type: str) -> Optional["Workflow"]:
         """
         Get workflow definition by type.
 
+        Recordings are ingested and converted to BDD per recording;
+        deduplication fans in over every ingested recording and runs
+        alongside the BDD conversions.
+
         Args:
             workflow_type: Type of workflow
 
         Returns:
             Workflow definition or None
         """
+        def ingestion_stages() -> list[Stage]:
+            return [
+                Stage(
+                    "ingestion",
+                    "IngestionAgent",
+                    depends_on=[],
+                    per_item=True,
+                    input_files=("recording_path",),
+                ),
+                Stage(
+                    "bdd_conversion",
+                    "BDDConversionAgent",
+                    depends_on=["ingestion"],
+                    per_item=True,
+                    build_input=_bdd_conversion_input,
+                    restore=_restore_feature_file,
+                ),
+                Stage(
+                    "deduplication",
+                    "DeduplicationAgent",
+                    depends_on=["ingestion"],
+                    allow_partial=True,
+                    build_input=_deduplication_input,
+                    restore=_restore_page_objects,
+                ),
+            ]
+
+        def execution_stages(depends_on: list[str]) -> list[Stage]:
+            return [
+                Stage(
+                    "execution",
+                    "ExecutionAgent",
+                    depends_on=depends_on,
+                    allow_partial=True,
+                    build_input=_execution_input,
+                    checkpoint=False,
+                ),
+                Stage(
+                    "analysis",
+                    "ReportAgent",
+                    depends_on=["execution"],
+                    build_input=_analysis_input,
+                    checkpoint=False,
+                ),
+            ]
+
         workflows = {
-            "ingestion": Workflow([
-                Stage("ingestion", "IngestionAgent", {}),
-                Stage("deduplication", "DeduplicationAgent", {}),
-                Stage("bdd_conversion", "BDDConversionAgent", {}),
-            ]),
-            "execution": Workflow([
-                Stage("execution", "ExecutionAgent", {}),
-                Stage("analysis", "AnalysisAgent", {}),
-            ]),
-            "full": Workflow([
-                Stage("ingestion", "IngestionAgent", {}),
-                Stage("deduplication", "DeduplicationAgent", {}),
-                Stage("bdd_conversion", "BDDConversionAgent", {}),
-                Stage("execution", "ExecutionAgent", {}),
-                Stage("analysis", "AnalysisAgent", {}),
-            ]),
+            "ingestion": ingestion_stages(),
+            "execution": execution_stages([]),
+            "full": ingestion_stages() + execution_stages(["bdd_conversion", "deduplication"]),
         }
 
-        return workflows.get(workflow_type)
+        stages = workflows.get(workflow_type)
+        if stages is None:
+            return None
+        return Workflow(
+            stages,
+            items_key="recordings",
+            item_key="recording_path",
+            max_concurrency=dict(WORKFLOW_CONCURRENCY),
+        )
 
     async def shutdown(self) -> None:
         """Shutdown the orchestrator and all agents."""
@@ -1224,6 +1460,89 @@ Always track the status of each task and agent, and provide clear status updates
         await self.cleanup()
 
 
+# =============================================================================
+# Workflow Stage Inputs
+# =============================================================================
+
+
+# Default concurrent runs per agent type in the built-in workflows
+WORKFLOW_CONCURRENCY = {
+    "IngestionAgent": 4,
+    "BDDConversionAgent": 4,
+    "DeduplicationAgent": 1,
+    "ExecutionAgent": 1,
+    "ReportAgent": 1,
+}
+
+
+def _feature_path(features_dir: str, recording_path: str) -> str:
+    """Get the feature file written for a recording (``login.spec.js`` -> ``login.feature``)."""
+    return str(Path(features_dir) / f"{Path(recording_path).name.split('.')[0]}.feature")
+
+
+def _bdd_conversion_input(context: StageContext) -> dict[str, Any]:
+    """Convert one ingested recording."""
+    data: dict[str, Any] = {"parsed_recording": context.results["ingestion"]}
+    features_dir = context.input_data.get("features_dir")
+    if features_dir:
+        data["output_path"] = _feature_path(features_dir, str(context.item))
+    return data
+
+
+def _deduplication_input(context: StageContext) -> dict[str, Any]:
+    """Deduplicate across every ingested recording."""
+    return {
+        "recordings": [r for r in context.results["ingestion"] if r is not None],
+        "output_dir": context.input_data.get("output_dir", ""),
+    }
+
+
+def _execution_input(context: StageContext) -> dict[str, Any]:
+    """Run the given feature files, or those written by the BDD stage."""
+    data = {
+        key: context.input_data[key]
+        for key in ("framework", "feature_files", "tags", "parallel", "workers")
+        if key in context.input_data
+    }
+    features_dir = context.input_data.get("features_dir")
+    if "bdd_conversion" in context.results and features_dir and "feature_files" not in data:
+        recordings = context.input_data.get("recordings", [])
+        data["feature_files"] = [
+            _feature_path(features_dir, str(recording))
+            for recording, converted in zip(recordings, context.results["bdd_conversion"])
+            if converted is not None
+        ]
+    return data
+
+
+def _restore_feature_file(stage_input: dict[str, Any], result: Any) -> None:
+    """Write the feature file of a restored BDD conversion again."""
+    from claude_playwright_agent.agents.bdd_conversion import save_feature_file
+
+    output_path = stage_input.get("output_path")
+    if output_path:
+        save_feature_file(
+            stage_input["parsed_recording"], output_path, stage_input.get("feature_name", "")
+        )
+
+
+def _restore_page_objects(stage_input: dict[str, Any], result: Any) -> None:
+    """Write the page objects of a restored deduplication again."""
+    from claude_playwright_agent.agents.deduplication import generate_page_objects
+
+    output_dir = stage_input.get("output_dir")
+    if output_dir:
+        generate_page_objects(stage_input["recordings"], output_dir)
+
+
+def _analysis_input(context: StageContext) -> dict[str, Any]:
+    """Cluster the failures of the execution stage."""
+    return {
+        "action": "cluster_failures",
+        "test_results": context.results["execution"].get("result", {}),
+    }
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
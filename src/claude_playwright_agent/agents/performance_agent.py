@@ -6,19 +6,110 @@ Provides performance testing capabilities:
 - Resource monitoring
 - Performance profiling
 - Bottleneck identification
-- Load testing with multiple virtual users
+- Open-loop load testing with multiple virtual users and worker processes
 - Network request analysis
 - Resource profiling
+- Single-load browser metrics collection (navigation, paint, LCP, CLS,
+  long tasks, resources)
 """
 
-import asyncio
 import time
-from typing import Any, Optional
+import weakref
+from typing import Any, Callable, Optional
 from dataclasses import dataclass, field
 from pathlib import Path
-from playwright.async_api import Page, Browser, BrowserContext
+from urllib.parse import urlsplit
+from playwright.async_api import Page, Browser
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.loadgen import (
+    ArrivalPattern,
+    ArrivalSchedule,
+    BrowserTarget,
+    LoadGenerator,
+    LoadReport,
+    LoadTestConfig,
+)
+
+
+# Installed before navigation: buffers paint, LCP, CLS, long task and
+# resource entries on window.__cpaPerf as they are observed
+_COLLECTOR_SCRIPT = """(() => {
+    if (window.__cpaPerf) return;
+    const state = window.__cpaPerf = {paint: {}, lcp: 0, cls: 0, longTasks: [], resources: []};
+    const supported = (PerformanceObserver && PerformanceObserver.supportedEntryTypes) || [];
+    const observe = (type, callback) => {
+        if (!supported.includes(type)) return;
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback))
+                .observe({type, buffered: true});
+        } catch (e) {}
+    };
+
+    observe('paint', e => { state.paint[e.name] = e.startTime; });
+    observe('largest-contentful-paint', e => {
+        state.lcp = e.renderTime || e.loadTime || e.startTime;
+    });
+
+    // CLS: largest session window (gap < 1s, window < 5s)
+    let sessionValue = 0, sessionStart = 0, lastShift = -Infinity;
+    observe('layout-shift', e => {
+        if (e.hadRecentInput) return;
+        if (e.startTime - lastShift < 1000 && e.startTime - sessionStart < 5000) {
+            sessionValue += e.value;
+        } else {
+            sessionValue = e.value;
+            sessionStart = e.startTime;
+        }
+        lastShift = e.startTime;
+        state.cls = Math.max(state.cls, sessionValue);
+    });
+
+    observe('longtask', e => { state.longTasks.push([e.startTime, e.duration]); });
+    observe('resource', e => {
+        state.resources.push({
+            name: e.name,
+            type: e.initiatorType,
+            start: e.startTime,
+            duration: e.duration,
+            size: e.transferSize || 0,
+            request_start: e.requestStart,
+            response_start: e.responseStart,
+            response_end: e.responseEnd,
+        });
+    });
+})();"""
+
+# Returns the buffered metrics; falls back to the performance timeline for
+# pages loaded without the collector
+_SNAPSHOT_SCRIPT = """() => {
+    const state = window.__cpaPerf;
+    const nav = performance.getEntriesByType('navigation')[0];
+    const snapshot = {
+        navigation: nav ? nav.toJSON() : null,
+        paint: {}, lcp: 0, cls: 0, long_tasks: [], resources: [],
+        collector: !!state,
+    };
+    if (state) {
+        Object.assign(snapshot, {
+            paint: state.paint, lcp: state.lcp, cls: state.cls,
+            long_tasks: state.longTasks, resources: state.resources,
+        });
+        return snapshot;
+    }
+    performance.getEntriesByType('paint').forEach(e => { snapshot.paint[e.name] = e.startTime; });
+    snapshot.resources = performance.getEntriesByType('resource').map(e => ({
+        name: e.name,
+        type: e.initiatorType,
+        start: e.startTime,
+        duration: e.duration,
+        size: e.transferSize || 0,
+        request_start: e.requestStart,
+        response_start: e.responseStart,
+        response_end: e.responseEnd,
+    }));
+    return snapshot;
+}"""
 
 
 @dataclass
@@ -30,6 +121,9 @@ class PerformanceMetrics:
     first_contentful_paint_ms: float = 0
     largest_contentful_paint_ms: float = 0
     time_to_interactive_ms: float = 0
+    cumulative_layout_shift: float = 0
+    total_blocking_time_ms: float = 0
+    long_task_count: int = 0
     total_bytes: int = 0
     resource_count: int = 0
     js_heap_size: int = 0
@@ -109,6 +203,71 @@ You provide:
 - Performance trend analysis
 """
         super().__init__(system_prompt=system_prompt)
+        # Pages with the metrics collector installed
+        self._instrumented_pages: weakref.WeakSet = weakref.WeakSet()
+
+    # =========================================================================
+    # In-Page Metrics Collection
+    # =========================================================================
+
+    async def collect_page_metrics(
+        self,
+        page: Page,
+        url: Optional[str] = None,
+        wait_until: str = "load",
+    ) -> dict[str, Any]:
+        """
+        Collect all browser performance metrics in one round trip.
+
+        The collector script is installed as an init script, so its
+        PerformanceObserver is registered before the page's own scripts
+        run. When ``url`` is given, the page is loaded once; the buffered
+        metrics are then fetched with a single ``evaluate`` call.
+
+        Args:
+            page: Playwright page object
+            url: URL to load (None to read the current page)
+            wait_until: Load state to wait for when navigating
+
+        Returns:
+            Snapshot with navigation, paint, lcp, cls, long_tasks and
+            resources (times in ms relative to navigation start)
+        """
+        if page not in self._instrumented_pages:
+            await page.add_init_script(_COLLECTOR_SCRIPT)
+            self._instrumented_pages.add(page)
+
+        if url is not None:
+            await page.goto(url, wait_until=wait_until)
+
+        return await page.evaluate(_SNAPSHOT_SCRIPT)
+
+    async def analyze_page(self, page: Page, url: str) -> dict[str, Any]:
+        """
+        Measure performance, resources and waterfall from a single page load.
+
+        Args:
+            page: Playwright page object
+            url: URL to analyze
+
+        Returns:
+            Combined performance, resource profile and waterfall results
+        """
+        try:
+            snapshot = await self.collect_page_metrics(page, url)
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Performance measurement failed: {e}",
+            }
+
+        return {
+            "success": True,
+            "url": url,
+            "performance": self._performance_from_snapshot(url, snapshot),
+            "resources": self._profile_from_snapshot(snapshot),
+            "waterfall": self._waterfall_from_snapshot(url, snapshot),
+        }
 
     async def measure_page_performance(
         self,
@@ -125,116 +284,72 @@ You provide:
         Returns:
             Performance metrics
         """
-        metrics = PerformanceMetrics()
-
         try:
-            # Navigate and measure
-            start_time = time.time()
-
-            await page.goto(url, wait_until="domcontentloaded")
-
-            metrics.dom_content_loaded_ms = (time.time() - start_time) * 1000
-
-            # Get performance timing
-            timing = await page.evaluate("() => performance.timing.toJSON()")
-
-            if timing:
-                if timing.get("loadEventEnd") and timing.get("navigationStart"):
-                    metrics.page_load_time_ms = timing["loadEventEnd"] - timing["navigationStart"]
-
-                if timing.get("domContentLoadedEventEnd") and timing.get("navigationStart"):
-                    metrics.dom_content_loaded_ms = (
-                        timing["domContentLoadedEventEnd"] - timing["navigationStart"]
-                    )
-
-            # Get Paint timing
-            paint_timing = await page.evaluate("""() => {
-                const timing = performance.getEntriesByType('paint');
-                const result = {};
-                timing.forEach(entry => {
-                    result[entry.name] = entry.startTime;
-                });
-                return result;
-            }""")
-
-            if paint_timing:
-                metrics.first_contentful_paint_ms = paint_timing.get("first-contentful-paint", 0)
-
-            # Get resource information
-            resources = await page.evaluate("""() => {
-                const entries = performance.getEntriesByType('resource');
-                let totalBytes = 0;
-                const types = {js: 0, css: 0, img: 0, other: 0};
-
-                entries.forEach(entry => {
-                    totalBytes += entry.transferSize || 0;
-
-                    if (entry.name.includes('.js')) types.js += entry.transferSize || 0;
-                    else if (entry.name.includes('.css')) types.css += entry.transferSize || 0;
-                    else if (entry.name.match(/\\.(jpg|jpeg|png|gif|svg|webp)/)) types.img += entry.transferSize || 0;
-                    else types.other += entry.transferSize || 0;
-                });
-
-                return {
-                    count: entries.length,
-                    totalBytes,
-                    types
-                };
-            }""")
-
-            if resources:
-                metrics.resource_count = resources["count"]
-                metrics.total_bytes = resources["totalBytes"]
-                metrics.js_heap_size = resources["types"]["js"]
-                metrics.css_heap_size = resources["types"]["css"]
-
-            # Calculate Time to Interactive
-            metrics.time_to_interactive_ms = await self._measure_tti(page)
-
-            return {
-                "success": True,
-                "url": url,
-                "metrics": {
-                    "page_load_time_ms": metrics.page_load_time_ms,
-                    "dom_content_loaded_ms": metrics.dom_content_loaded_ms,
-                    "first_contentful_paint_ms": metrics.first_contentful_paint_ms,
-                    "largest_contentful_paint_ms": metrics.largest_contentful_paint_ms,
-                    "time_to_interactive_ms": metrics.time_to_interactive_ms,
-                    "total_bytes": metrics.total_bytes,
-                    "resource_count": metrics.resource_count,
-                    "js_heap_size": metrics.js_heap_size,
-                    "css_heap_size": metrics.css_heap_size,
-                },
-                "score": self._calculate_performance_score(metrics),
-                "recommendations": self._get_optimization_recommendations(metrics),
-            }
-
+            snapshot = await self.collect_page_metrics(page, url)
         except Exception as e:
             return {
                 "success": False,
                 "error": f"Performance measurement failed: {e}",
             }
 
-    async def _measure_tti(self, page: Page) -> float:
-        """Measure Time to Interactive."""
-        try:
-            start_measure = time.time()
-
-            await page.wait_for_function(
-                """
-                () => {
-                    return window.performance.getEntriesByType('resource').length > 0 &&
-                           document.readyState === 'complete' &&
-                           typeof window.__tti === 'object';
-                }
-            """,
-                timeout=10000,
-            )
+        return self._performance_from_snapshot(url, snapshot)
+
+    def _performance_from_snapshot(self, url: str, snapshot: dict[str, Any]) -> dict[str, Any]:
+        """Build page performance results from a collector snapshot."""
+        metrics = PerformanceMetrics()
 
-            return (time.time() - start_measure) * 1000
+        navigation = snapshot.get("navigation") or {}
+        metrics.page_load_time_ms = navigation.get("loadEventEnd", 0)
+        metrics.dom_content_loaded_ms = navigation.get("domContentLoadedEventEnd", 0)
+
+        paint = snapshot.get("paint") or {}
+        metrics.first_contentful_paint_ms = paint.get("first-contentful-paint", 0)
+        metrics.largest_contentful_paint_ms = snapshot.get("lcp", 0)
+        metrics.cumulative_layout_shift = snapshot.get("cls", 0)
+
+        # Time to Interactive: DOM ready and no long task after first paint
+        long_tasks = [
+            (start, duration) for start, duration in snapshot.get("long_tasks", [])
+            if start >= metrics.first_contentful_paint_ms
+        ]
+        metrics.long_task_count = len(long_tasks)
+        metrics.total_blocking_time_ms = sum(max(0, duration - 50) for _, duration in long_tasks)
+        metrics.time_to_interactive_ms = max(
+            [metrics.first_contentful_paint_ms, navigation.get("domInteractive", 0)]
+            + [start + duration for start, duration in long_tasks]
+        )
+
+        resources = snapshot.get("resources", [])
+        metrics.resource_count = len(resources)
+        for resource in resources:
+            size = resource.get("size", 0)
+            name = resource["name"]
+            metrics.total_bytes += size
+            if ".js" in name:
+                metrics.js_heap_size += size
+            elif ".css" in name:
+                metrics.css_heap_size += size
 
-        except Exception:
-            return 0
+        return {
+            "success": True,
+            "url": url,
+            "metrics": {
+                "page_load_time_ms": metrics.page_load_time_ms,
+                "dom_content_loaded_ms": metrics.dom_content_loaded_ms,
+                "first_contentful_paint_ms": metrics.first_contentful_paint_ms,
+                "largest_contentful_paint_ms": metrics.largest_contentful_paint_ms,
+                "cumulative_layout_shift": round(metrics.cumulative_layout_shift, 4),
+                "time_to_interactive_ms": metrics.time_to_interactive_ms,
+                "total_blocking_time_ms": metrics.total_blocking_time_ms,
+                "long_task_count": metrics.long_task_count,
+                "total_bytes": metrics.total_bytes,
+                "resource_count": metrics.resource_count,
+                "js_heap_size": metrics.js_heap_size,
+                "css_heap_size": metrics.css_heap_size,
+            },
+            "score": self._calculate_performance_score(metrics),
+            "recommendations": self._get_optimization_recommendations(metrics),
+        }
 
     def _calculate_performance_score(self, metrics: PerformanceMetrics) -> dict[str, Any]:
         """Calculate overall performance score."""
@@ -420,21 +535,37 @@ You provide:
 
     async def run_load_test(
         self,
-        browser: Browser,
+        browser: Optional[Browser],
         url: str,
         virtual_users: int = 10,
         duration_seconds: int = 60,
-        spawn_rate: int = 2,
+        spawn_rate: float = 2,
+        pattern: ArrivalPattern = ArrivalPattern.CONSTANT,
+        end_rate: Optional[float] = None,
+        workers: int = 1,
+        on_progress: Optional[Callable[[LoadReport], None]] = None,
     ) -> dict[str, Any]:
         """
-        Run a load test with multiple virtual users.
+        Run an open-loop page load test.
+
+        Page loads start at ``spawn_rate`` per second (or on a ramp or
+        Poisson pattern) for ``duration_seconds``, each in a fresh browser
+        context, with at most ``virtual_users`` loads in flight per
+        worker. Response times are measured from each load's scheduled
+        start, so loads delayed by a saturated browser count against
+        latency.
 
         Args:
-            browser: Playwright browser instance
+            browser: Playwright browser instance (used when workers == 1;
+                None launches one)
             url: URL to test
-            virtual_users: Number of virtual users
+            virtual_users: Maximum concurrent page loads per worker
             duration_seconds: Test duration in seconds
-            spawn_rate: Users spawned per second
+            spawn_rate: Page loads started per second (start rate for ramps)
+            pattern: Arrival pattern (constant, ramp, poisson)
+            end_rate: Final rate of a ramp
+            workers: Worker processes, each with its own browser
+            on_progress: Called with live percentile reports
 
         Returns:
             Load test results
@@ -445,87 +576,42 @@ You provide:
             "url": url,
         }
 
-        response_times: list[float] = []
-        errors: list[str] = []
-        requests_count = 0
-        successful_requests = 0
-
-        async def user_session(context: BrowserContext) -> None:
-            """Run a single user session."""
-            page = await context.new_page()
-            try:
-                start = time.time()
-                response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                elapsed = (time.time() - start) * 1000
-
-                nonlocal requests_count, successful_requests
-                requests_count += 1
-                response_times.append(elapsed)
-
-                if response and response.status < 400:
-                    successful_requests += 1
-                else:
-                    errors.append(f"Status: {response.status if response else 'No response'}")
-
-            except Exception as e:
-                errors.append(str(e))
-                response_times.append(30000)
-            finally:
-                await page.close()
-
-        async def run_test() -> None:
-            """Execute the load test."""
-            nonlocal requests_count, successful_requests
-
-            contexts: list[BrowserContext] = []
-            users_started = 0
-
-            while users_started < virtual_users:
-                context = await browser.new_context()
-                contexts.append(context)
-                asyncio.create_task(user_session(context))
-                users_started += 1
-                await asyncio.sleep(1 / spawn_rate)
-
-            await asyncio.sleep(duration_seconds)
-
-            for context in contexts:
-                await context.close()
-
-        start_time = time.time()
-        await run_test()
-        total_time = time.time() - start_time
-
-        response_times.sort()
-        n = len(response_times)
-
-        if n == 0:
+        schedule = ArrivalSchedule(
+            pattern=pattern,
+            rate=spawn_rate,
+            end_rate=end_rate,
+            duration_seconds=duration_seconds,
+        )
+        target = BrowserTarget(url=url, browser=browser if workers <= 1 else None)
+        config = LoadTestConfig(schedule=schedule, workers=workers, max_in_flight=virtual_users)
+        summary = await LoadGenerator(target, config, on_progress).run()
+
+        if summary.completed == 0:
             return {
                 "success": False,
                 "error": "No requests completed",
                 **results,
             }
 
-        avg_time = sum(response_times) / n
-        min_time = response_times[0]
-        max_time = response_times[-1]
-        p95_idx = int(n * 0.95)
-        p99_idx = int(n * 0.99)
-
+        latency = summary.latency
         result = LoadTestResult(
             virtual_users=virtual_users,
-            requests_per_second=requests_count / total_time if total_time > 0 else 0,
-            average_response_time_ms=avg_time,
-            p95_response_time_ms=response_times[p95_idx] if n > p95_idx else avg_time,
-            p99_response_time_ms=response_times[p99_idx] if n > p99_idx else avg_time,
-            error_rate=(len(errors) / requests_count * 100) if requests_count > 0 else 0,
-            throughput=successful_requests / total_time if total_time > 0 else 0,
-            total_requests=requests_count,
-            successful_requests=successful_requests,
-            failed_requests=len(errors),
-            min_response_time_ms=min_time,
-            max_response_time_ms=max_time,
+            requests_per_second=summary.requests_per_second,
+            average_response_time_ms=latency.mean / 1000,
+            p95_response_time_ms=latency.value_at_percentile(95) / 1000,
+            p99_response_time_ms=latency.value_at_percentile(99) / 1000,
+            error_rate=summary.error_rate,
+            throughput=summary.successful / summary.duration_seconds,
+            total_requests=summary.completed,
+            successful_requests=summary.successful,
+            failed_requests=summary.failed,
+            min_response_time_ms=latency.min / 1000,
+            max_response_time_ms=latency.max / 1000,
         )
+        details = summary.to_dict()
+        errors = details["errors"] or [
+            f"Status: {status}" for status in details["status_codes"] if not 0 < status < 400
+        ]
 
         return {
             "success": result.error_rate < 5,
@@ -542,82 +628,69 @@ You provide:
                 "p99_response_time_ms": round(result.p99_response_time_ms, 2),
                 "error_rate": round(result.error_rate, 2),
                 "throughput": round(result.throughput, 2),
-                "duration_seconds": round(total_time, 2),
+                "duration_seconds": round(summary.duration_seconds, 2),
+                "target_rate": details["target_rate"],
+                "late_starts": details["late_starts"],
+                "latency_ms": details["latency_ms"],
+                "service_time_ms": details["service_time_ms"],
+                "workers": details["workers"],
             },
             "status": "passed" if result.error_rate < 5 else "failed",
             "errors": errors[:10],
             **results,
         }
 
-    async def profile_resources(self, page: Page) -> dict[str, Any]:
+    async def profile_resources(self, page: Page, url: Optional[str] = None) -> dict[str, Any]:
         """
         Profile page resources in detail.
 
         Args:
             page: Playwright page object
+            url: URL to load first (None to profile the current page)
 
         Returns:
             Detailed resource profile
         """
+        snapshot = await self.collect_page_metrics(page, url)
+        return self._profile_from_snapshot(snapshot)
+
+    def _profile_from_snapshot(self, snapshot: dict[str, Any]) -> dict[str, Any]:
+        """Build a resource profile from a collector snapshot."""
         profile = ResourceProfile()
+        resources = snapshot.get("resources", [])
 
-        resource_data = await page.evaluate("""() => {
-            const entries = performance.getEntriesByType('resource');
-            const byType = {};
-            const byDomain = {};
-            const largeResources = [];
-            const slowRequests = [];
-
-            entries.forEach(entry => {
-                const size = entry.transferSize || 0;
-                const duration = entry.duration || 0;
-
-                const type = entry.name.split('.').pop().split('?')[0].toLowerCase() || 'other';
-                byType[type] = (byType[type] || 0) + size;
-
-                try {
-                    const domain = new URL(entry.name).hostname;
-                    byDomain[domain] = (byDomain[domain] || 0) + size;
-                } catch (e) {
-                    byDomain['local'] = (byDomain['local'] || 0) + size;
-                }
-
-                if (size > 500 * 1024) {
-                    largeResources.push({
-                        url: entry.name.substring(0, 100),
-                        size_kb: (size / 1024).toFixed(2),
-                        type: type,
-                    });
-                }
-
-                if (duration > 1000) {
-                    slowRequests.push({
-                        url: entry.name.substring(0, 100),
-                        duration_ms: duration.toFixed(2),
-                        type: type,
-                    });
-                }
-            });
+        for resource in resources:
+            name = resource["name"]
+            size = resource.get("size", 0)
+            duration = resource.get("duration", 0)
 
-            return {
-                totalSize: entries.reduce((sum, e) => sum + (e.transferSize || 0), 0),
-                byType,
-                byDomain,
-                largeResources: largeResources.slice(0, 10),
-                slowRequests: slowRequests.slice(0, 10),
-                count: entries.length,
-            };
-        }""")
-
-        profile.total_size_bytes = resource_data.get("totalSize", 0)
-        profile.by_type = resource_data.get("byType", {})
-        profile.by_domain = resource_data.get("byDomain", {})
-        profile.large_resources = resource_data.get("largeResources", [])
-        profile.slow_requests = resource_data.get("slowRequests", [])
+            resource_type = name.split(".")[-1].split("?")[0].lower() or "other"
+            profile.by_type[resource_type] = profile.by_type.get(resource_type, 0) + size
+
+            domain = urlsplit(name).hostname or "local"
+            profile.by_domain[domain] = profile.by_domain.get(domain, 0) + size
+            profile.total_size_bytes += size
+
+            if size > 500 * 1024:
+                profile.large_resources.append({
+                    "url": name[:100],
+                    "size_kb": f"{size / 1024:.2f}",
+                    "type": resource_type,
+                })
+
+            if duration > 1000:
+                profile.slow_requests.append({
+                    "url": name[:100],
+                    "duration_ms": f"{duration:.2f}",
+                    "type": resource_type,
+                })
+
+        profile.large_resources = profile.large_resources[:10]
+        profile.slow_requests = profile.slow_requests[:10]
 
         return {
             "total_size_mb": round(profile.total_size_bytes / (1024 * 1024), 2),
-            "resource_count": resource_data.get("count", 0),
+            "resource_count": len(resources),
             "by_type": {k: round(v / 1024, 2) for k, v in profile.by_type.items()},
             "by_domain": {k: round(v / 1024, 2) for k, v in profile.by_domain.items()},
             "large_resources": profile.large_resources,
@@ -668,57 +741,45 @@ You provide:
         Returns:
             Waterfall analysis with timing breakdown
         """
-        await page.goto(url, wait_until="networkidle")
-
-        waterfall_data = await page.evaluate("""() => {
-            const entries = performance.getEntriesByType('resource')
-                .sort((a, b) => a.startTime - b.startTime);
-
-            const firstPaint = performance.getEntriesByType('paint')
-                .find(e => e.name === 'first-contentful-paint')?.startTime || 0;
-
-            let totalBlockingTime = 0;
-            let lastEndTime = 0;
-
-            const requests = entries.map(entry => {
-                const start = entry.startTime;
-                const duration = entry.duration;
-                const end = start + duration;
-
-                const ttfb = entry.responseStart - entry.requestStart;
-                const download = entry.responseEnd - entry.responseStart;
-
-                if (start < lastEndTime) {
-                    totalBlockingTime += lastEndTime - start;
-                }
-                lastEndTime = end;
-
-                return {
-                    url: entry.name.substring(0, 80),
-                    start_ms: start.toFixed(2),
-                    duration_ms: duration.toFixed(2),
-                    ttfb_ms: ttfb.toFixed(2),
-                    download_ms: download.toFixed(2),
-                    size_kb: ((entry.transferSize || 0) / 1024).toFixed(2),
-                };
-            });
-
-            return {
-                requests: requests,
-                first_paint_ms: firstPaint.toFixed(2),
-                total_requests: entries.length,
-                total_duration_ms: (lastEndTime - entries[0]?.startTime || 0).toFixed(2),
-                total_blocking_time_ms: totalBlockingTime.toFixed(2),
-            };
-        }""")
+        snapshot = await self.collect_page_metrics(page, url, wait_until="networkidle")
+        return self._waterfall_from_snapshot(url, snapshot)
+
+    def _waterfall_from_snapshot(self, url: str, snapshot: dict[str, Any]) -> dict[str, Any]:
+        """Build a network waterfall from a collector snapshot."""
+        entries = sorted(snapshot.get("resources", []), key=lambda r: r["start"])
+        first_paint = (snapshot.get("paint") or {}).get("first-contentful-paint", 0)
+
+        total_blocking_time = 0.0
+        last_end_time = 0.0
+        requests = []
+        for entry in entries:
+            start = entry["start"]
+            duration = entry["duration"]
+            end = start + duration
+
+            if start < last_end_time:
+                total_blocking_time += last_end_time - start
+            last_end_time = end
+
+            requests.append({
+                "url": entry["name"][:80],
+                "start_ms": f"{start:.2f}",
+                "duration_ms": f"{duration:.2f}",
+                "ttfb_ms": f"{entry['response_start'] - entry['request_start']:.2f}",
+                "download_ms": f"{entry['response_end'] - entry['response_start']:.2f}",
+                "size_kb": f"{entry.get('size', 0) / 1024:.2f}",
+            })
+
+        waterfall_data = {"requests": requests}
+        total_duration = last_end_time - entries[0]["start"] if entries else 0
 
         return {
             "url": url,
-            "waterfall": waterfall_data["requests"],
-            "first_paint_ms": waterfall_data["first_paint_ms"],
-            "total_requests": waterfall_data["total_requests"],
-            "total_duration_ms": waterfall_data["total_duration_ms"],
-            "total_blocking_time_ms": waterfall_data["total_blocking_time_ms"],
+            "waterfall": requests,
+            "first_paint_ms": f"{first_paint:.2f}",
+            "total_requests": len(entries),
+            "total_duration_ms": f"{total_duration:.2f}",
+            "total_blocking_time_ms": f"{total_blocking_time:.2f}",
             "bottlenecks": self._identify_waterfall_bottlenecks(waterfall_data),
         }
 
@@ -754,3 +815,46 @@ You provide:
                 )
 
         return bottlenecks[:5]
+
+    async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Process input data."""
+        action = input_data.get("action", "measure_page_performance")
+
+        if action == "measure_page_performance":
+            return await self.measure_page_performance(
+                page=input_data["page"],
+                url=input_data["url"],
+            )
+        elif action == "analyze_page":
+            return await self.analyze_page(
+                page=input_data["page"],
+                url=input_data["url"],
+            )
+        elif action == "profile_resources":
+            return await self.profile_resources(
+                page=input_data["page"],
+                url=input_data.get("url"),
+            )
+        elif action == "analyze_network_waterfall":
+            return await self.analyze_network_waterfall(
+                page=input_data["page"],
+                url=input_data["url"],
+            )
+        elif action == "run_load_test":
+            return await self.run_load_test(
+                browser=input_data.get("browser"),
+                url=input_data["url"],
+                virtual_users=input_data.get("virtual_users", 10),
+                duration_seconds=input_data.get("duration_seconds", 60),
+                spawn_rate=input_data.get("spawn_rate", 2),
+                pattern=input_data.get("pattern", ArrivalPattern.CONSTANT),
+                end_rate=input_data.get("end_rate"),
+                workers=input_data.get("workers", 1),
+            )
+        elif action == "analyze_test_performance":
+            return await self.analyze_test_performance(
+                test_name=input_data["test_name"],
+                execution_time_ms=input_data["execution_time_ms"],
+            )
+        else:
+            return {"success": False, "error": f"Unknown action: {action}"}
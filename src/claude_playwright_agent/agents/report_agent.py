@@ -6,9 +6,11 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.reporting.history_store import HistoryStore, get_history_store
+from claude_playwright_agent.reporting.streaming import CHUNK_SIZE
 
 
 class ReportAgent(BaseAgent):
@@ -24,6 +26,8 @@ class ReportAgent(BaseAgent):
     - Flakiness detection
     """
 
+    SOURCE = "report_agent"
+
     def __init__(
         self,
         mcp_servers: dict | None = None,
@@ -79,7 +83,24 @@ For trend analysis:
             allowed_tools=allowed_tools or default_tools,
         )
         self.history_dir = Path(".test_history")
-        self.history_dir.mkdir(exist_ok=True)
+        self._project_path = Path.cwd()
+        self._history_store: Optional[HistoryStore] = None
+
+    @property
+    def history_store(self) -> HistoryStore:
+        """
+        Get the shared history store, opening it on first use.
+
+        Opening the store creates .cpa/history.db and imports any legacy
+        JSON history, so it is deferred until history is actually needed.
+        """
+        if self._history_store is None:
+            store = get_history_store(self._project_path)
+            store.import_legacy_json(
+                self.history_dir / "test_history.json", self._import_legacy_history
+            )
+            self._history_store = store
+        return self._history_store
 
     async def analyze_results(
         self,
@@ -313,14 +334,16 @@ The summary should:
             Flaky test analysis with confidence scores
         """
         flaky_tests = []
-        test_runs = self._load_history(history_depth)
 
         current_runs = test_results.get("runs", [])
         test_names = {r.get("name") for r in current_runs}
+        histories = self.history_store.get_histories(
+            test_names=[name for name in test_names if name],
+            limit_per_test=history_depth,
+        )
 
         for test_name in test_names:
-            history = [r for r in test_runs if r.get("name") == test_name]
-            current_run = [r for r in current_runs if r.get("name") == test_name]
+            history = histories.get(test_name, [])
 
             if len(history) < 2:
                 continue
@@ -358,37 +381,48 @@ The summary should:
 
     def _load_history(self, depth: int) -> list[dict[str, Any]]:
         """Load historical test runs."""
-        history_file = self.history_dir / "test_history.json"
-        if not history_file.exists():
-            return []
-
-        with open(history_file, "r") as f:
-            data = json.load(f)
-            return data[-depth:] if len(data) > depth else data
+        runs = self.history_store.get_runs(limit=depth, source=self.SOURCE, include_payload=True)
+        return [
+            {
+                "timestamp": run["timestamp"],
+                "metrics": run["metrics"],
+                "results": run["payload"],
+            }
+            for run in runs
+        ]
 
     def _save_to_history(self, test_results: dict[str, Any]) -> None:
-        """Save current test results to history."""
-        history_file = self.history_dir / "test_history.json"
-
-        existing = []
-        if history_file.exists():
-            with open(history_file, "r") as f:
-                existing = json.load(f)
-
-        run_data = {
-            "timestamp": datetime.now().isoformat(),
-            "metrics": self._calculate_metrics(test_results),
-            "results": test_results,
-        }
-
-        existing.append(run_data)
-
-        max_history = 30
-        if len(existing) > max_history:
-            existing = existing[-max_history:]
+        """Append current test results to the history store."""
+        metrics = self._calculate_metrics(test_results)
+        self.history_store.record_run(
+            test_results.get("runs", []),
+            source=self.SOURCE,
+            total=metrics["total"],
+            passed=metrics["passed"],
+            failed=metrics["failed"],
+            skipped=metrics["skipped"],
+            duration=metrics["duration"],
+            metrics=metrics,
+            payload=test_results,
+        )
 
-        with open(history_file, "w") as f:
-            json.dump(existing, f, indent=2)
+    def _import_legacy_history(self, store: HistoryStore, data: list[dict[str, Any]]) -> None:
+        """Import runs from a legacy .test_history/test_history.json file."""
+        for run in data:
+            results = run.get("results", {})
+            metrics = run.get("metrics", {})
+            store.record_run(
+                results.get("runs", []),
+                source=self.SOURCE,
+                timestamp=run.get("timestamp"),
+                total=metrics.get("total", 0),
+                passed=metrics.get("passed", 0),
+                failed=metrics.get("failed", 0),
+                skipped=metrics.get("skipped", 0),
+                duration=metrics.get("duration", 0),
+                metrics=metrics,
+                payload=results,
+            )
 
     async def analyze_trends(
         self, test_results: dict[str, Any], metric: str = "pass_rate"
@@ -483,16 +517,7 @@ The summary should:
         failures = test_results.get("failures", [])
         passed = test_results.get("passed", [])
 
-        failure_rows = ""
-        for failure in failures[:20]:
-            failure_rows += f"""
-            <tr>
-                <td>{failure.get("name", "Unknown")}</td>
-                <td>{failure.get("error", "Unknown error")[:100]}</td>
-                <td>{failure.get("file", "Unknown")}</td>
-            </tr>"""
-
-        html = f"""<!DOCTYPE html>
+        head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -569,7 +594,9 @@ The summary should:
         <div class="card">
             <div class="section">
                 <h2>Failed Tests ({len(failures)})</h2>
-                {f"<table><tr><th>Test Name</th><th>Error</th><th>File</th></tr>{failure_rows}</table>" if failure_rows else "<p>No failures!</p>"}
+"""
+
+        tail = """
             </div>
         </div>
 
@@ -582,12 +609,26 @@ The summary should:
 
         output = output_path or f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
 
-        with open(output, "w", encoding="utf-8") as f:
-            f.write(html)
+        # Write in chunks instead of assembling the whole document
+        with open(output, "w", encoding="utf-8", buffering=CHUNK_SIZE) as f:
+            size = f.write(head)
+            if failures:
+                size += f.write("<table><tr><th>Test Name</th><th>Error</th><th>File</th></tr>")
+                for failure in failures[:20]:
+                    size += f.write(f"""
+            <tr>
+                <td>{failure.get("name", "Unknown")}</td>
+                <td>{failure.get("error", "Unknown error")[:100]}</td>
+                <td>{failure.get("file", "Unknown")}</td>
+            </tr>""")
+                size += f.write("</table>")
+            else:
+                size += f.write("<p>No failures!</p>")
+            size += f.write(tail)
 
         return {
             "report_path": output,
-            "report_size": len(html),
+            "report_size": size,
             "timestamp": datetime.now().isoformat(),
         }
 
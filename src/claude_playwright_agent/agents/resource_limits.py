@@ -2,7 +2,8 @@
 Agent resource limit management for Claude Playwright Agent.
 
 This module implements:
-- Resource tracking per agent (memory, CPU, time)
+- Resource tracking per agent (memory, CPU, time), sampled once per
+  interval and attributed to agents by their time inside process()
 - Resource limit enforcement
 - Concurrent agent limiting
 - Resource quota management
@@ -10,15 +11,19 @@ This module implements:
 """
 
 import asyncio
+import functools
 import os
 import psutil
 import time
+import tracemalloc
 import uuid
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 # =============================================================================
 # Resource Types and Limits
@@ -102,22 +107,79 @@ DEFAULT_LIMITS = {
 # Resource Usage Tracking
 # =============================================================================
 
+# Usage of the agent whose process() call the current task is running in
+_current_usage: ContextVar["ResourceUsage | None"] = ContextVar("resource_usage", default=None)
+
+
+@dataclass
+class ProcessSample:
+    """
+    One reading of process-level counters, shared by all agents.
+
+    Attributes:
+        timestamp: When the sample was taken
+        memory_rss: Resident memory in bytes
+        cpu_time: User plus system CPU time in seconds
+        disk_io: Bytes read and written
+    """
+
+    timestamp: float = field(default_factory=time.time)
+    memory_rss: int = 0
+    cpu_time: float = 0.0
+    disk_io: int = 0
+
+    @classmethod
+    def take(cls, process: Any) -> "ProcessSample":
+        """
+        Read the counters of a process, querying each counter once.
+
+        Args:
+            process: psutil Process to sample
+
+        Returns:
+            The sample
+        """
+        sample = cls()
+        try:
+            with process.oneshot():
+                sample.memory_rss = process.memory_info().rss
+                cpu_times = process.cpu_times()
+                sample.cpu_time = cpu_times.user + cpu_times.system
+
+                # I/O counters (may not be available on all platforms)
+                try:
+                    io_counters = process.io_counters()
+                    sample.disk_io = io_counters.read_bytes + io_counters.write_bytes
+                except (AttributeError, psutil.AccessDenied):
+                    pass
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+        return sample
+
 
 @dataclass
 class ResourceUsage:
     """
     Current resource usage for an agent.
 
+    Agents are asyncio tasks in one process, so process counters cannot
+    be read per agent. Instead each sampling interval's CPU time and disk
+    I/O are split between agents in proportion to the time each spent
+    inside ``process()`` during the interval.
+
     Attributes:
         agent_id: Agent being tracked
         start_time: When tracking started
-        memory_usage: Current memory usage in bytes
-        cpu_time: CPU time consumed in seconds
+        memory_usage: Memory usage in bytes (the agent's traced allocations
+            when memory tracing is enabled, otherwise process RSS)
+        cpu_time: CPU time attributed to the agent in seconds
         wall_time: Wall clock time elapsed in seconds
+        active_time: Time spent inside process() in seconds
         operations: Number of operations performed
         network_io: Network I/O in bytes
-        disk_io: Disk I/O in bytes
-        process: psutil Process for tracking
+        disk_io: Disk I/O attributed to the agent in bytes
+        traced_memory: Net traced allocations of process() calls in bytes
+        last_update: When the usage was last updated
     """
 
     agent_id: str
@@ -125,39 +187,36 @@ class ResourceUsage:
     memory_usage: int = 0
     cpu_time: float = 0.0
     wall_time: float = 0.0
+    active_time: float = 0.0
     operations: int = 0
     network_io: int = 0
     disk_io: int = 0
-    process: Any = field(default=None)
+    traced_memory: int = 0
     last_update: float = field(default_factory=time.time)
+    # Running process() calls, since when, and active time at the last sample
+    _active_calls: int = field(default=0, init=False, repr=False)
+    _active_since: float = field(default=0.0, init=False, repr=False)
+    _sampled_active_time: float = field(default=0.0, init=False, repr=False)
 
     def update(self) -> None:
-        """Update resource usage from system metrics."""
-        self.wall_time = time.time() - self.start_time
+        """Update wall clock time (process counters are applied by sampling)."""
         self.last_update = time.time()
+        self.wall_time = self.last_update - self.start_time
 
-        if self.process:
-            try:
-                self.memory_usage = self.process.memory_info().rss
-                self.cpu_time = self.process.cpu_times().user + self.process.cpu_times().system
-
-                # I/O counters (may not be available on all platforms)
-                try:
-                    io_counters = self.process.io_counters()
-                    self.disk_io = io_counters.read_bytes + io_counters.write_bytes
-                except (AttributeError, psutil.AccessDenied):
-                    pass
+    def current_active_time(self, now: float | None = None) -> float:
+        """
+        Get the time spent inside process(), including running calls.
 
-                # Network I/O is tracked separately
-                try:
-                    net_io = self.process.io_counters()
-                    if hasattr(net_io, 'read_count') and hasattr(net_io, 'write_count'):
-                        self.network_io = getattr(net_io, 'read_bytes', 0) + getattr(net_io, 'write_bytes', 0)
-                except (AttributeError, psutil.AccessDenied):
-                    pass
+        Args:
+            now: Current ``time.perf_counter()`` value
 
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        Returns:
+            Active time in seconds
+        """
+        if not self._active_calls:
+            return self.active_time
+        now = time.perf_counter() if now is None else now
+        return self.active_time + now - self._active_since
 
     def get_usage(self, resource_type: ResourceType) -> int | float:
         """
@@ -195,12 +254,18 @@ class ResourceUsage:
             "memory_usage_mb": round(self.memory_usage / (1024 * 1024), 2),
             "cpu_time_seconds": round(self.cpu_time, 2),
             "wall_time_seconds": round(self.wall_time, 2),
+            "active_time_seconds": round(self.current_active_time(), 2),
             "operations": self.operations,
             "network_io_mb": round(self.network_io / (1024 * 1024), 2),
             "disk_io_mb": round(self.disk_io / (1024 * 1024), 2),
         }
 
 
+def current_usage() -> ResourceUsage | None:
+    """Get the usage of the agent whose process() call is running, if any."""
+    return _current_usage.get()
+
+
 # =============================================================================
 # Resource Limit Manager
 # =============================================================================
@@ -216,6 +281,10 @@ class ResourceLimitManager:
     - Automatic cleanup on limit exceed
     - Global and per-agent limits
     - Resource quota management
+
+    Process counters are sampled once per check interval into a shared
+    snapshot, attributed to agents, and every limit of every agent is
+    evaluated in the same pass. Reading usage between samples is free.
     """
 
     def __init__(
@@ -223,6 +292,7 @@ class ResourceLimitManager:
         max_concurrent_agents: int = 10,
         limits: dict[ResourceType, ResourceLimit] | None = None,
         check_interval: float = 5.0,
+        trace_memory: bool = False,
     ) -> None:
         """
         Initialize the resource limit manager.
@@ -230,17 +300,23 @@ class ResourceLimitManager:
         Args:
             max_concurrent_agents: Maximum number of concurrent agents
             limits: Custom resource limits (uses defaults if None)
-            check_interval: Seconds between resource checks
+            check_interval: Seconds between resource samples
+            trace_memory: Attribute memory to agents with tracemalloc
+                (adds allocation overhead while monitoring runs)
         """
         self._max_concurrent_agents = max_concurrent_agents
         self._limits = limits or DEFAULT_LIMITS.copy()
         self._check_interval = check_interval
+        self._trace_memory = trace_memory
+        self._started_tracing = False
 
         # Resource tracking per agent
         self._usage: dict[str, ResourceUsage] = {}
         self._context: dict[str, dict[str, Any]] = {}
 
-        # Global resource tracking
+        # Shared process sample and global usage derived from it
+        self._process: Any = None
+        self._last_sample: ProcessSample | None = None
         self._global_usage: dict[ResourceType, int | float] = {
             rt: 0 for rt in ResourceType
         }
@@ -254,6 +330,9 @@ class ResourceLimitManager:
         if self._enforcement_active:
             return
 
+        if self._trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
         self._enforcement_active = True
         self._monitor_task = asyncio.create_task(self._monitor_loop())
 
@@ -268,6 +347,10 @@ class ResourceLimitManager:
             except asyncio.CancelledError:
                 pass
 
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
     async def register_agent(
         self,
         agent_id: str,
@@ -279,7 +362,7 @@ class ResourceLimitManager:
 
         Args:
             agent_id: Agent identifier
-            process: psutil Process object for tracking
+            process: psutil Process to sample (default: the current process)
             context: Optional context information
 
         Raises:
@@ -291,20 +374,17 @@ class ResourceLimitManager:
                 f"Maximum concurrent agents ({self._max_concurrent_agents}) reached"
             )
 
+        if process is not None and self._process is None:
+            self._process = process
+
         # Create resource usage tracker
-        usage = ResourceUsage(
-            agent_id=agent_id,
-            process=process,
-        )
-        usage.update()
+        usage = ResourceUsage(agent_id=agent_id)
+        if self._last_sample and not self._trace_memory:
+            usage.memory_usage = self._last_sample.memory_rss
 
         self._usage[agent_id] = usage
         self._context[agent_id] = context or {}
 
-        # Update global usage
-        for resource_type in ResourceType:
-            self._global_usage[resource_type] += usage.get_usage(resource_type)
-
     async def unregister_agent(self, agent_id: str) -> ResourceUsage | None:
         """
         Unregister an agent from tracking.
@@ -317,10 +397,6 @@ class ResourceLimitManager:
         """
         usage = self._usage.pop(agent_id, None)
         if usage:
-            # Update global usage
-            for resource_type in ResourceType:
-                self._global_usage[resource_type] -= usage.get_usage(resource_type)
-
             self._context.pop(agent_id, None)
             usage.update()
             return usage
@@ -343,17 +419,148 @@ class ResourceLimitManager:
         return usage
 
     def get_global_usage(self) -> dict[ResourceType, int | float]:
-        """Get global resource usage across all agents."""
+        """Get global resource usage across all agents (as of the last sample)."""
         return self._global_usage.copy()
 
     def get_agent_count(self) -> int:
         """Get current number of tracked agents."""
         return len(self._usage)
 
+    # =========================================================================
+    # Task-Level Instrumentation
+    # =========================================================================
+
+    @asynccontextmanager
+    async def track(self, agent_id: str) -> AsyncIterator[ResourceUsage | None]:
+        """
+        Attribute the enclosed work to an agent.
+
+        Times the block as the agent's active time, counts it as one
+        operation and, with memory tracing, records its net allocations.
+        Nested blocks of the same agent are counted once.
+
+        Args:
+            agent_id: Agent identifier
+
+        Yields:
+            The agent's usage, or None if the agent is not registered
+        """
+        usage = self._usage.get(agent_id)
+        if usage is None or _current_usage.get() is usage:
+            yield usage
+            return
+
+        token = _current_usage.set(usage)
+        tracing = self._trace_memory and tracemalloc.is_tracing()
+        traced_before = tracemalloc.get_traced_memory()[0] if tracing else 0
+        if not usage._active_calls:
+            usage._active_since = time.perf_counter()
+        usage._active_calls += 1
+        try:
+            yield usage
+        finally:
+            usage._active_calls -= 1
+            if not usage._active_calls:
+                usage.active_time += time.perf_counter() - usage._active_since
+            usage.operations += 1
+            if tracing and tracemalloc.is_tracing():
+                traced_after = tracemalloc.get_traced_memory()[0]
+                usage.traced_memory = max(usage.traced_memory + traced_after - traced_before, 0)
+            _current_usage.reset(token)
+
+    def instrument(self, agent_id: str, agent: Any) -> None:
+        """
+        Wrap an agent's process() so every call is tracked.
+
+        Args:
+            agent_id: Agent identifier
+            agent: Agent instance
+        """
+        process = agent.process
+
+        @functools.wraps(process)
+        async def tracked_process(*args: Any, **kwargs: Any) -> Any:
+            async with self.track(agent_id):
+                return await process(*args, **kwargs)
+
+        agent.process = tracked_process
+
+    # =========================================================================
+    # Sampling and Limits
+    # =========================================================================
+
+    def sample(self) -> dict[str, list[str]]:
+        """
+        Sample process counters once, attribute them, and check all limits.
+
+        Returns:
+            Exceeded limit descriptions per agent (agents within limits omitted)
+        """
+        if self._process is None:
+            self._process = psutil.Process()
+        sample = ProcessSample.take(self._process)
+        previous, self._last_sample = self._last_sample, sample
+
+        cpu_delta = 0.0
+        disk_delta = 0
+        if previous is not None:
+            cpu_delta = max(sample.cpu_time - previous.cpu_time, 0.0)
+            disk_delta = max(sample.disk_io - previous.disk_io, 0)
+
+        # Active time of each agent since the previous sample
+        now = time.perf_counter()
+        active: dict[str, float] = {}
+        for agent_id, usage in self._usage.items():
+            current = usage.current_active_time(now)
+            active[agent_id] = current - usage._sampled_active_time
+            usage._sampled_active_time = current
+        total_active = sum(active.values())
+
+        exceeded_by_agent: dict[str, list[str]] = {}
+        for agent_id, usage in self._usage.items():
+            share = active[agent_id] / total_active if total_active else 0.0
+            usage.cpu_time += cpu_delta * share
+            usage.disk_io += int(disk_delta * share)
+            usage.memory_usage = usage.traced_memory if self._trace_memory else sample.memory_rss
+            usage.update()
+            exceeded = self._exceeded_limits(usage)
+            if exceeded:
+                exceeded_by_agent[agent_id] = exceeded
+
+        self._global_usage = {
+            ResourceType.MEMORY: sample.memory_rss,
+            ResourceType.CPU_TIME: sample.cpu_time,
+            ResourceType.WALL_TIME: sum(u.wall_time for u in self._usage.values()),
+            ResourceType.OPERATIONS: sum(u.operations for u in self._usage.values()),
+            ResourceType.NETWORK: sum(u.network_io for u in self._usage.values()),
+            ResourceType.DISK: sample.disk_io,
+        }
+        return exceeded_by_agent
+
+    def _exceeded_limits(self, usage: ResourceUsage) -> list[str]:
+        """Check an agent's current usage against every per-agent limit."""
+        exceeded = []
+        for resource_type, limit in self._limits.items():
+            if not limit.per_agent:
+                continue
+
+            # Check grace period
+            if usage.wall_time < limit.grace_period:
+                continue
+
+            current = usage.get_usage(resource_type)
+            if current > limit.max_value:
+                exceeded.append(
+                    f"{resource_type.value}: {current} > {limit.max_value}"
+                )
+        return exceeded
+
     async def check_limits(self, agent_id: str) -> list[str]:
         """
         Check if an agent has exceeded any limits.
 
+        Uses the usage from the last sample (sampling first if none exists).
+
         Args:
             agent_id: Agent identifier
 
@@ -364,45 +571,33 @@ class ResourceLimitManager:
         if not usage:
             return []
 
-        exceeded = []
-
-        for resource_type, limit in self._limits.items():
-            if limit.per_agent:
-                # Check per-agent limit
-                current = usage.get_usage(resource_type)
-
-                # Check grace period
-                if usage.wall_time < limit.grace_period:
-                    continue
-
-                if current > limit.max_value:
-                    exceeded.append(
-                        f"{resource_type.value}: {current} > {limit.max_value}"
-                    )
-
-        return exceeded
+        if self._last_sample is None:
+            self.sample()
+        return self._exceeded_limits(usage)
 
     async def _monitor_loop(self) -> None:
-        """Periodically check resource limits and enforce them."""
+        """Periodically sample usage and enforce limits."""
         while self._enforcement_active:
             await asyncio.sleep(self._check_interval)
 
-            # Check each agent
-            for agent_id in list(self._usage.keys()):
-                try:
-                    exceeded = await self.check_limits(agent_id)
+            try:
+                exceeded_by_agent = self.sample()
+            except Exception:
+                # Sampling errors must not stop monitoring
+                continue
 
-                    if exceeded:
-                        # Get limit for first exceeded resource
-                        resource_name = exceeded[0].split(":")[0]
-                        resource_type = ResourceType(resource_name)
-                        limit = self._limits.get(resource_type)
+            for agent_id, exceeded in exceeded_by_agent.items():
+                try:
+                    # Get limit for first exceeded resource
+                    resource_name = exceeded[0].split(":")[0]
+                    resource_type = ResourceType(resource_name)
+                    limit = self._limits.get(resource_type)
 
-                        if limit and limit.action_on_exceed == "terminate":
-                            # Emit warning for termination
-                            await self._handle_limit_exceeded(
-                                agent_id, resource_type, limit
-                            )
+                    if limit and limit.action_on_exceed == "terminate":
+                        # Emit warning for termination
+                        await self._handle_limit_exceeded(
+                            agent_id, resource_type, limit
+                        )
 
                 except Exception as e:
                     # Log error but continue monitoring
@@ -465,6 +660,7 @@ class ResourceLimitManager:
         return {
             "active_agents": len(self._usage),
             "max_concurrent_agents": self._max_concurrent_agents,
+            "sampled_at": self._last_sample.timestamp if self._last_sample else None,
             "global_usage": {
                 rt.value: self._format_usage(rt, val)
                 for rt, val in self._global_usage.items()
@@ -16,8 +16,16 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
-from collections import defaultdict
+from typing import Any, Iterable
+
+from claude_playwright_agent.reporting.analytics import (
+    FAILED_STATUSES,
+    TestStatistics,
+    analytics_available,
+    get_analytics,
+)
+from claude_playwright_agent.reporting.history_store import HistoryStore, get_history_store
+from claude_playwright_agent.reporting.streaming import ReportSummary, get_report_writer
 
 
 # =============================================================================
@@ -31,6 +39,7 @@ class ReportFormat(str, Enum):
     HTML = "html"
     JSON = "json"
     JUNIT = "junit"
+    JSONL = "jsonl"
     MARKDOWN = "markdown"
 
 
@@ -228,19 +237,28 @@ class TestReportGenerator:
         self._project_path = Path(project_path) if project_path else Path.cwd()
         self._report_dir = self._project_path / ".cpa" / "reports"
 
+    # Formats written incrementally by the streaming report writers
+    STREAMING_FORMATS = (ReportFormat.HTML, ReportFormat.JUNIT, ReportFormat.JSONL)
+
     def generate_report(
         self,
-        execution_results: list[dict[str, Any]],
+        execution_results: Iterable[dict[str, Any]],
         format: ReportFormat = ReportFormat.HTML,
         output_path: Path | None = None,
+        keep_results: bool = True,
     ) -> TestReport:
         """
         Generate a test report.
 
+        HTML, JUnit and JSON Lines reports are streamed to disk one page of
+        results at a time, so ``execution_results`` may be a generator.
+
         Args:
             execution_results: Test execution results
             format: Report format
             output_path: Optional output path
+            keep_results: Keep results in ``report.test_results``; pass
+                False for very large runs to keep memory flat
 
         Returns:
             Generated TestReport
@@ -252,200 +270,85 @@ class TestReportGenerator:
             report_id=f"report_{uuid.uuid4().hex[:8]}",
         )
 
-        # Aggregate results
-        for result in execution_results:
-            report.total_tests += 1
-            status = result.get("status", "unknown")
-
-            if status == "passed":
-                report.passed += 1
-            elif status == "failed":
-                report.failed += 1
-            elif status == "skipped":
-                report.skipped += 1
-
-            report.duration += result.get("duration", 0.0)
-            report.test_results.append(result)
-
-        # Calculate pass rate
-        if report.total_tests > 0:
-            report.pass_rate = (report.passed / report.total_tests) * 100
-
-        # Add metrics
-        self._add_metrics(report, execution_results)
-
         # Generate output
         if output_path is None:
             output_path = self._report_dir / f"{report.report_id}.{format.value}"
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if format == ReportFormat.HTML:
-            self._write_html_report(report, output_path)
-        elif format == ReportFormat.JSON:
+        if format in self.STREAMING_FORMATS:
+            with get_report_writer(format.value, output_path, timestamp=report.timestamp) as writer:
+                for result in execution_results:
+                    writer.write(result)
+                    if keep_results:
+                        report.test_results.append(result)
+                # Metrics depend on the totals, so they are rendered at close
+                self._apply_summary(report, writer.summary)
+                writer.metrics = [m.to_dict() for m in report.metrics]
+            return report
+
+        summary = ReportSummary()
+        for result in execution_results:
+            summary.add(result.get("status", "unknown"), result.get("duration", 0.0))
+            report.test_results.append(result)
+        self._apply_summary(report, summary)
+
+        if format == ReportFormat.JSON:
             self._write_json_report(report, output_path)
-        elif format == ReportFormat.JUNIT:
-            self._write_junit_report(report, output_path)
         elif format == ReportFormat.MARKDOWN:
             self._write_markdown_report(report, output_path)
 
+        if not keep_results:
+            report.test_results = []
+
         return report
 
+    def _apply_summary(self, report: TestReport, summary: ReportSummary) -> None:
+        """Copy aggregated totals and metrics onto the report."""
+        report.total_tests = summary.total
+        report.passed = summary.passed
+        report.failed = summary.failed
+        report.skipped = summary.skipped
+        report.duration = summary.duration
+        report.pass_rate = summary.pass_rate
+        self._add_metrics(report, summary)
+
     def _add_metrics(
         self,
         report: TestReport,
-        execution_results: list[dict[str, Any]],
+        summary: ReportSummary,
     ) -> None:
         """Add performance metrics to report."""
-        durations = [r.get("duration", 0.0) for r in execution_results]
-
-        if durations:
+        if summary.total:
             report.metrics.append(TestMetric(
                 name="avg_duration",
-                value=statistics.mean(durations),
+                value=summary.duration_mean,
                 unit="seconds",
             ))
             report.metrics.append(TestMetric(
                 name="max_duration",
-                value=max(durations),
+                value=summary.duration_max,
                 unit="seconds",
             ))
             report.metrics.append(TestMetric(
                 name="min_duration",
-                value=min(durations),
+                value=summary.duration_min,
                 unit="seconds",
             ))
 
-            if len(durations) > 1:
+            if summary.total > 1:
                 report.metrics.append(TestMetric(
                     name="duration_stddev",
-                    value=statistics.stdev(durations),
+                    value=summary.duration_stddev,
                     unit="seconds",
                 ))
 
         report.metrics.append(TestMetric(
             name="throughput",
-            value=len(execution_results) / report.duration if report.duration > 0 else 0,
+            value=summary.total / report.duration if report.duration > 0 else 0,
             unit="tests/second",
         ))
 
-    def _write_html_report(self, report: TestReport, output_path: Path) -> None:
-        """Write HTML report."""
-        html = self._generate_html_template(report)
-        output_path.write_text(html, encoding="utf-8")
-
-    def _generate_html_template(self, report: TestReport) -> str:
-        """Generate HTML report template."""
-        status_color = "#10b981" if report.pass_rate >= 80 else "#f59e0b" if report.pass_rate >= 50 else "#ef4444"
-
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Test Report - {report.timestamp}</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }}
-        .container {{ max-width: 1200px; margin: 0 auto; padding: 20px; }}
-        .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 30px; }}
-        .header h1 {{ font-size: 28px; margin-bottom: 10px; }}
-        .header p {{ opacity: 0.9; }}
-        .summary {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-bottom: 30px; }}
-        .summary-card {{ background: white; border-radius: 8px; padding: 20px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        .summary-card h3 {{ font-size: 14px; color: #6b7280; margin-bottom: 5px; }}
-        .summary-card .value {{ font-size: 32px; font-weight: bold; }}
-        .summary-card.passed .value {{ color: #10b981; }}
-        .summary-card.failed .value {{ color: #ef4444; }}
-        .summary-card.skipped .value {{ color: #f59e0b; }}
-        .summary-card.rate .value {{ color: {status_color}; }}
-        .test-results {{ background: white; border-radius: 8px; padding: 20px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        .test-results h2 {{ margin-bottom: 20px; }}
-        .test-item {{ padding: 15px; border-bottom: 1px solid #e5e7eb; }}
-        .test-item:last-child {{ border-bottom: none; }}
-        .test-item.passed {{ border-left: 4px solid #10b981; }}
-        .test-item.failed {{ border-left: 4px solid #ef4444; }}
-        .test-item.skipped {{ border-left: 4px solid #f59e0b; }}
-        .test-name {{ font-weight: 600; margin-bottom: 5px; }}
-        .test-meta {{ font-size: 14px; color: #6b7280; }}
-        .metrics {{ background: white; border-radius: 8px; padding: 20px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); margin-top: 30px; }}
-        .metrics h2 {{ margin-bottom: 20px; }}
-        .metric-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; }}
-        .metric {{ background: #f9fafb; padding: 15px; border-radius: 6px; }}
-        .metric-name {{ font-size: 12px; color: #6b7280; }}
-        .metric-value {{ font-size: 20px; font-weight: 600; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Test Execution Report</h1>
-            <p>{report.timestamp}</p>
-        </div>
-
-        <div class="summary">
-            <div class="summary-card passed">
-                <h3>Passed</h3>
-                <div class="value">{report.passed}</div>
-            </div>
-            <div class="summary-card failed">
-                <h3>Failed</h3>
-                <div class="value">{report.failed}</div>
-            </div>
-            <div class="summary-card skipped">
-                <h3>Skipped</h3>
-                <div class="value">{report.skipped}</div>
-            </div>
-            <div class="summary-card rate">
-                <h3>Pass Rate</h3>
-                <div class="value">{report.pass_rate:.1f}%</div>
-            </div>
-        </div>
-
-        <div class="test-results">
-            <h2>Test Results</h2>
-        """
-
-        for test in report.test_results:
-            status = test.get("status", "unknown")
-            html += f"""
-            <div class="test-item {status}">
-                <div class="test-name">{test.get('name', 'Unknown')}</div>
-                <div class="test-meta">
-                    Status: {status} | Duration: {test.get('duration', 0):.2f}s
-                </div>
-            </div>
-            """
-
-        html += """
-        </div>
-        """
-
-        if report.metrics:
-            html += """
-        <div class="metrics">
-            <h2>Performance Metrics</h2>
-            <div class="metric-grid">
-            """
-            for metric in report.metrics:
-                html += f"""
-                <div class="metric">
-                    <div class="metric-name">{metric.name.replace('_', ' ').title()}</div>
-                    <div class="metric-value">{metric.value:.2f} {metric.unit}</div>
-                </div>
-                """
-            html += """
-            </div>
-        </div>
-        """
-
-        html += """
-    </div>
-</body>
-</html>
-        """
-        return html
-
     def _write_json_report(self, report: TestReport, output_path: Path) -> None:
         """Write JSON report."""
         output_path.write_text(
@@ -453,29 +356,6 @@ class TestReportGenerator:
             encoding="utf-8"
         )
 
-    def _write_junit_report(self, report: TestReport, output_path: Path) -> None:
-        """Write JUnit XML report."""
-        xml = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        xml += f'<testsuites name="{report.framework}" tests="{report.total_tests}" '
-        xml += f'failures="{report.failed}" skipped="{report.skipped}" '
-        xml += f'time="{report.duration:.3f}">\n'
-
-        for test in report.test_results:
-            xml += f'  <testcase name="{test.get("name", "unknown")}" '
-            xml += f'time="{test.get("duration", 0):.3f}">\n'
-
-            status = test.get("status", "")
-            if status == "failed":
-                error_msg = test.get("error_message", "Test failed")
-                xml += f'    <failure message="{error_msg}"/>\n'
-            elif status == "skipped":
-                xml += '    <skipped/>\n'
-
-            xml += '  </testcase>\n'
-
-        xml += '</testsuites>'
-        output_path.write_text(xml, encoding="utf-8")
-
     def _write_markdown_report(self, report: TestReport, output_path: Path) -> None:
         """Write Markdown report."""
         md = f"""# Test Execution Report
@@ -520,39 +400,46 @@ class TestHistoryTracker:
     Track test execution history over time.
 
     Features:
-    - Store historical test results
+    - Store historical test results in the shared history store
+    - Bulk-record whole runs in one append
     - Query historical data
     - Calculate trends
     """
 
-    def __init__(self, project_path: Path | None = None) -> None:
+    SOURCE = "history_tracker"
+
+    def __init__(
+        self,
+        project_path: Path | None = None,
+        store: HistoryStore | None = None,
+    ) -> None:
         """
         Initialize the history tracker.
 
         Args:
             project_path: Path to project root
+            store: History store to use instead of the project's shared one
         """
         self._project_path = Path(project_path) if project_path else Path.cwd()
         self._history_file = self._project_path / ".cpa" / "test_history.json"
-        self._history: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._store = store or get_history_store(self._project_path)
         self._load_history()
 
     def _load_history(self) -> None:
-        """Load history from disk."""
-        if self._history_file.exists():
-            try:
-                data = json.loads(self._history_file.read_text(encoding="utf-8"))
-                self._history = defaultdict(list, data)
-            except Exception:
-                pass
-
-    def _save_history(self) -> None:
-        """Save history to disk."""
-        self._history_file.parent.mkdir(parents=True, exist_ok=True)
-        self._history_file.write_text(
-            json.dumps(dict(self._history), indent=2),
-            encoding="utf-8"
-        )
+        """Import a legacy test_history.json into the history store."""
+        def load(store: HistoryStore, data: dict[str, list[dict[str, Any]]]) -> None:
+            store.record_results(
+                {"name": test_name, **execution}
+                for test_name, executions in data.items()
+                for execution in executions
+            )
+
+        self._store.import_legacy_json(self._history_file, load)
+
+    @property
+    def store(self) -> HistoryStore:
+        """History store backing this tracker."""
+        return self._store
 
     def record_execution(
         self,
@@ -570,36 +457,49 @@ class TestHistoryTracker:
             duration: Execution duration
             timestamp: Optional timestamp
         """
-        if timestamp is None:
-            timestamp = datetime.now().isoformat()
+        self._store.record_result(test_name, status, duration, timestamp)
+
+    def record_run(
+        self,
+        executions: list[dict[str, Any]],
+        timestamp: str | None = None,
+    ) -> int:
+        """
+        Record every test execution of a run in one append.
 
-        self._history[test_name].append({
-            "status": status,
-            "duration": duration,
-            "timestamp": timestamp,
-        })
-        self._save_history()
+        Args:
+            executions: Dictionaries with name, status and duration
+            timestamp: Optional run timestamp
+
+        Returns:
+            ID of the recorded run
+        """
+        return self._store.record_run(executions, source=self.SOURCE, timestamp=timestamp)
 
     def get_history(
         self,
         test_name: str,
-        limit: int = 100,
+        limit: int | None = 100,
     ) -> list[dict[str, Any]]:
         """
         Get execution history for a test.
 
         Args:
             test_name: Name of the test
-            limit: Maximum number of records
+            limit: Maximum number of records (None for all)
 
         Returns:
             List of historical executions
         """
-        return self._history[test_name][-limit:]
+        return self._store.get_test_history(test_name, limit=limit)
 
     def get_all_history(self) -> dict[str, list[dict[str, Any]]]:
         """Get all test history."""
-        return dict(self._history)
+        return self._store.get_histories()
+
+    def get_test_names(self) -> list[str]:
+        """Get the names of all tests with recorded history."""
+        return self._store.get_test_names()
 
     def get_pass_rate(
         self,
@@ -660,6 +560,9 @@ class FlakinessDetector:
         """
         Analyze a test for flakiness.
 
+        Uses the test's full history and counts failed and errored runs
+        as failures, like the vectorized path of analyze_all().
+
         Args:
             test_name: Name of the test
             min_runs: Minimum runs required for analysis
@@ -667,7 +570,7 @@ class FlakinessDetector:
         Returns:
             FlakyTestResult with analysis
         """
-        history = self._history_tracker.get_history(test_name)
+        history = self._history_tracker.get_history(test_name, limit=None)
 
         if len(history) < min_runs:
             return FlakyTestResult(
@@ -680,7 +583,20 @@ class FlakinessDetector:
             )
 
         total_runs = len(history)
-        failed_runs = sum(1 for h in history if h["status"] == "failed")
+        failed_runs = sum(1 for h in history if h["status"] in FAILED_STATUSES)
+
+        return self._build_result(
+            test_name, total_runs, failed_runs, self._detect_patterns(history)
+        )
+
+    def _build_result(
+        self,
+        test_name: str,
+        total_runs: int,
+        failed_runs: int,
+        patterns: list[str],
+    ) -> FlakyTestResult:
+        """Score a test and pick a recommendation from its run counts."""
         pass_rate = ((total_runs - failed_runs) / total_runs) * 100
 
         # Calculate flakiness score based on:
@@ -698,9 +614,6 @@ class FlakinessDetector:
             # Intermittent failures = flaky
             flaky_score = min(1.0, (failed_runs / total_runs) * 2)
 
-        # Detect patterns
-        patterns = self._detect_patterns(history)
-
         # Generate recommendation
         if flaky_score >= 0.5:
             recommendation = "Test is highly flaky. Review test for timing issues, race conditions, or external dependencies."
@@ -728,24 +641,54 @@ class FlakinessDetector:
         """
         Analyze all tests for flakiness.
 
+        When NumPy is installed the whole history is analyzed in one
+        vectorized pass; otherwise each test is analyzed in turn.
+
         Args:
             min_runs: Minimum runs required for analysis
 
         Returns:
             List of FlakyTestResults
         """
-        results = []
-        all_history = self._history_tracker.get_all_history()
-
-        for test_name in all_history:
-            result = self.analyze_test(test_name, min_runs)
-            results.append(result)
+        if analytics_available():
+            stats = get_analytics(self._history_tracker.store).analyze()
+            results = [self._result_from_statistics(s, min_runs) for s in stats]
+        else:
+            results = [
+                self.analyze_test(test_name, min_runs)
+                for test_name in self._history_tracker.get_test_names()
+            ]
 
         # Sort by flakiness score (descending)
         results.sort(key=lambda r: r.flaky_score, reverse=True)
 
         return results
 
+    def _result_from_statistics(
+        self,
+        stats: TestStatistics,
+        min_runs: int,
+    ) -> FlakyTestResult:
+        """Build a FlakyTestResult from precomputed test statistics."""
+        if stats.runs < min_runs:
+            return FlakyTestResult(
+                test_name=stats.test_name,
+                flaky_score=0.0,
+                total_runs=stats.runs,
+                failed_runs=0,
+                pass_rate=100.0,
+                recommendation="Not enough data to analyze",
+            )
+
+        # Same rules as _detect_patterns, from the aggregated columns
+        patterns = []
+        if stats.duration_max > stats.duration_min * 3:
+            patterns.append("High duration variance (possible timing issue)")
+        if stats.failures >= 2 and stats.mean_failure_gap < 3:
+            patterns.append("Frequent intermittent failures")
+
+        return self._build_result(stats.test_name, stats.runs, stats.failures, patterns)
+
     def _detect_patterns(
         self,
         history: list[dict[str, Any]],
@@ -762,7 +705,7 @@ class FlakinessDetector:
             patterns.append("High duration variance (possible timing issue)")
 
         # Check for alternating failures
-        failures = [i for i, h in enumerate(history) if h["status"] == "failed"]
+        failures = [i for i, h in enumerate(history) if h["status"] in FAILED_STATUSES]
         if len(failures) >= 2:
             gaps = [failures[i+1] - failures[i] for i in range(len(failures)-1)]
             if statistics.mean(gaps) < 3:
@@ -831,13 +774,15 @@ class TrendAnalyzer:
         if metric_name == "duration":
             values = [h.get("duration", 0) for h in history]
         elif metric_name == "pass_rate":
-            # Calculate rolling pass rate
-            window_size = min(5, len(values))
-            values = []
-            for i in range(len(history) - window_size + 1):
-                window_data = history[i:i+window_size]
-                passed = sum(1 for h in window_data if h["status"] == "passed")
-                values.append((passed / len(window_data)) * 100)
+            # Calculate rolling pass rate from prefix sums
+            window_size = min(5, len(history))
+            passed = [0]
+            for h in history:
+                passed.append(passed[-1] + (h["status"] == "passed"))
+            values = [
+                ((passed[i + window_size] - passed[i]) / window_size) * 100
+                for i in range(len(history) - window_size + 1)
+            ]
         else:
             values = []
 
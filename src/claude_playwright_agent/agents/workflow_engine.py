@@ -0,0 +1,567 @@
+"""
+DAG Workflow Engine for multi-agent workflows.
+
+This module implements:
+- Workflow stages declared with explicit dependencies
+- Concurrent execution of independent branches
+- Per-item pipelining: ``per_item`` stages fan out over the workflow's
+  items and each item advances as soon as its own upstream stage is done,
+  so item B can be parsed while item A is already being converted
+- Fan-in: a shared stage that depends on a per-item stage waits for every
+  item and receives all of their results
+- Checkpointing: stage results are stored by input fingerprint, so a
+  resumed run skips every checkpointed stage whose input is unchanged
+- A concurrency cap per agent type; agents come from agent pools and are
+  reused across stages and items instead of one agent per stage
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Optional
+
+from claude_playwright_agent.agents.agent_pool import AgentFactory, AgentPool, PoolConfig
+from claude_playwright_agent.agents.event_broadcasting import EventType
+from claude_playwright_agent.agents.workflow_store import StageResultStore
+
+# =============================================================================
+# Workflow Definitions
+# =============================================================================
+
+
+@dataclass
+class StageContext:
+    """
+    Inputs available to a stage when it runs.
+
+    Attributes:
+        input_data: Workflow input data
+        results: Results of the stage's dependencies by stage name; a
+            per-item dependency of a shared stage maps to the list of its
+            results in item order
+        item: Item the stage runs for (per-item stages only)
+        index: Index of the item (per-item stages only)
+    """
+    input_data: dict[str, Any]
+    results: dict[str, Any] = field(default_factory=dict)
+    item: Any = None
+    index: int | None = None
+
+
+@dataclass
+class Stage:
+    """
+    A single stage in a multi-agent workflow.
+
+    Attributes:
+        name: Stage name
+        agent_type: Type of agent to run for this stage
+        config: Configuration for the agent, merged into its input
+        depends_on: Names of the stages this stage waits for (None: the
+            previous stage in the workflow, [] for no dependencies)
+        per_item: Run once per workflow item instead of once per workflow
+        allow_partial: When fanning in, run with the items that succeeded
+            (failed items are None) instead of being skipped
+        build_input: Builds the agent input from the stage context
+            (default: the dependency result, or the workflow input)
+        input_files: Input keys naming files whose content is part of the
+            stage input when checkpointing (e.g. ``recording_path``)
+        checkpoint: Store and restore results of this stage; disable for
+            stages whose outcome depends on more than their input (test runs)
+        restore: Called with the stage input and a restored result to
+            write the files the stage would have written
+    """
+    name: str
+    agent_type: str
+    config: dict[str, Any] = field(default_factory=dict)
+    depends_on: list[str] | None = None
+    per_item: bool = False
+    allow_partial: bool = False
+    build_input: Optional[Callable[[StageContext], dict[str, Any]]] = None
+    input_files: tuple[str, ...] = ()
+    checkpoint: bool = True
+    restore: Optional[Callable[[dict[str, Any], Any], None]] = None
+
+    def make_input(self, context: StageContext, item_key: str) -> dict[str, Any]:
+        """
+        Build the agent input for one run of this stage.
+
+        Args:
+            context: Stage context
+            item_key: Key the item is passed under when there are no dependencies
+
+        Returns:
+            Agent input data
+        """
+        if self.build_input is not None:
+            data = dict(self.build_input(context))
+        elif not context.results:
+            data = dict(context.input_data)
+            if self.per_item:
+                data[item_key] = context.item
+        elif len(context.results) == 1:
+            (result,) = context.results.values()
+            data = dict(result) if isinstance(result, dict) else {"results": result}
+        else:
+            data = dict(context.results)
+        data.update(self.config)
+        return data
+
+
+@dataclass
+class Workflow:
+    """
+    A multi-agent workflow definition.
+
+    Stages form a directed acyclic graph through ``depends_on``; stages
+    listed without dependencies run after the previous stage, so a plain
+    list of stages still executes in sequence.
+
+    Attributes:
+        stages: Stages of the workflow
+        items_key: Input key holding the items per-item stages fan out over
+        item_key: Key an item is passed under to per-item stages
+        max_concurrency: Maximum concurrent runs per agent type
+        default_concurrency: Maximum concurrent runs of other agent types
+    """
+    stages: list[Stage] = field(default_factory=list)
+    items_key: str = "items"
+    item_key: str = "item"
+    max_concurrency: dict[str, int] = field(default_factory=dict)
+    default_concurrency: int = 4
+
+    def dependencies(self) -> dict[str, list[str]]:
+        """
+        Get the resolved dependencies of every stage.
+
+        Returns:
+            Dependency names by stage name
+        """
+        deps: dict[str, list[str]] = {}
+        previous: str | None = None
+        for stage in self.stages:
+            if stage.depends_on is None:
+                deps[stage.name] = [previous] if previous else []
+            else:
+                deps[stage.name] = list(dict.fromkeys(stage.depends_on))
+            previous = stage.name
+        return deps
+
+    def validate(self) -> list[str]:
+        """
+        Validate the stage graph.
+
+        Returns:
+            Stage names in dependency order
+
+        Raises:
+            ValueError: If stage names repeat, a dependency is unknown or
+                the dependencies form a cycle
+        """
+        names = [stage.name for stage in self.stages]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate stage names: {', '.join(duplicates)}")
+
+        deps = self.dependencies()
+        for name, stage_deps in deps.items():
+            unknown = [dep for dep in stage_deps if dep not in deps]
+            if unknown:
+                raise ValueError(f"Stage '{name}' depends on unknown stages: {', '.join(unknown)}")
+
+        # Kahn's algorithm, keeping declaration order among ready stages
+        remaining = {name: len(stage_deps) for name, stage_deps in deps.items()}
+        dependents: dict[str, list[str]] = defaultdict(list)
+        for name, stage_deps in deps.items():
+            for dep in stage_deps:
+                dependents[dep].append(name)
+
+        order: list[str] = []
+        ready = [name for name in names if remaining[name] == 0]
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(names):
+            cycle = [name for name in names if name not in order]
+            raise ValueError(f"Workflow stages form a dependency cycle: {', '.join(cycle)}")
+        return order
+
+    def get_stage(self, name: str) -> Stage:
+        """Get a stage by name."""
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+        raise KeyError(name)
+
+
+# =============================================================================
+# Workflow Results
+# =============================================================================
+
+
+class WorkflowStatus(str, Enum):
+    """Workflow run status."""
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class StageRun:
+    """
+    Outcome of one run of a stage (one item for per-item stages).
+
+    Attributes:
+        stage: Stage name
+        index: Item index (per-item stages only)
+        success: Whether the stage ran and succeeded
+        skipped: Whether the stage was skipped because a dependency failed
+        cached: Whether the result was restored from a checkpoint
+        started_at: Start time, relative to the workflow start (seconds)
+        duration_ms: Run time in milliseconds
+        error: Error message if the stage failed
+    """
+    stage: str
+    index: int | None = None
+    success: bool = False
+    skipped: bool = False
+    cached: bool = False
+    started_at: float = 0.0
+    duration_ms: float = 0.0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "stage": self.stage,
+            "index": self.index,
+            "success": self.success,
+            "skipped": self.skipped,
+            "cached": self.cached,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
+
+
+@dataclass
+class WorkflowResult:
+    """
+    Result of a workflow run.
+
+    Attributes:
+        status: Overall status
+        results: Result per stage; per-item stages hold a list in item
+            order with None for items that failed or were skipped
+        runs: Outcome of every stage run
+        duration_ms: Wall time of the workflow in milliseconds
+    """
+    status: WorkflowStatus
+    results: dict[str, Any] = field(default_factory=dict)
+    runs: list[StageRun] = field(default_factory=list)
+    duration_ms: float = 0.0
+
+    @property
+    def errors(self) -> dict[str, str]:
+        """Errors of failed stage runs, keyed ``stage`` or ``stage[index]``."""
+        return {
+            run.stage if run.index is None else f"{run.stage}[{run.index}]": run.error
+            for run in self.runs
+            if run.error and not run.skipped
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "status": self.status.value,
+            "results": self.results,
+            "errors": self.errors,
+            "runs": [run.to_dict() for run in self.runs],
+            "duration_ms": self.duration_ms,
+        }
+
+
+class StageFailedError(Exception):
+    """Raised when a stage run fails or reports ``success: False``."""
+
+
+# =============================================================================
+# Workflow Engine
+# =============================================================================
+
+
+EventCallback = Callable[[EventType, dict[str, Any]], Awaitable[None]]
+PoolProvider = Callable[[str], AgentPool]
+VersionProvider = Callable[[str], str]
+
+
+class WorkflowEngine:
+    """
+    Executes workflows as a graph of stage runs.
+
+    Every stage run is scheduled as soon as the runs it depends on have
+    finished: a per-item stage depends on the same item of an upstream
+    per-item stage, a shared stage on every item of it. A failed run skips
+    the runs that depend on it; independent branches and other items keep
+    going.
+
+    Agents come from long-lived pools when a pool provider is given, so
+    back-to-back workflows reuse warm agents; otherwise each run creates
+    its own pools and cleans them up when it finishes.
+
+    With a stage-result store every successful stage run is checkpointed,
+    and a resumed run restores any stage run whose input is unchanged
+    instead of running its agent.
+    """
+
+    def __init__(
+        self,
+        agent_factory: AgentFactory | None = None,
+        on_event: EventCallback | None = None,
+        pool_provider: PoolProvider | None = None,
+        store: StageResultStore | None = None,
+        agent_version: VersionProvider | None = None,
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            agent_factory: Creates an agent for an agent type name
+            on_event: Awaited with workflow progress events
+            pool_provider: Returns the shared pool for an agent type
+            store: Checkpoints stage results
+            agent_version: Returns the version of an agent type; stored
+                results of other versions are not reused
+
+        Raises:
+            ValueError: If neither an agent factory nor a pool provider is given
+        """
+        if agent_factory is None and pool_provider is None:
+            raise ValueError("WorkflowEngine needs an agent_factory or a pool_provider")
+        self._agent_factory = agent_factory
+        self._on_event = on_event
+        self._pool_provider = pool_provider
+        self._store = store
+        self._agent_version = agent_version or (lambda agent_type: "")
+
+    async def _emit(self, event_type: EventType, data: dict[str, Any]) -> None:
+        """Report a progress event."""
+        if self._on_event is not None:
+            await self._on_event(event_type, data)
+
+    async def run(
+        self,
+        workflow: Workflow,
+        input_data: dict[str, Any],
+        name: str = "workflow",
+        resume: bool = False,
+    ) -> WorkflowResult:
+        """
+        Run a workflow.
+
+        Args:
+            workflow: Workflow definition
+            input_data: Workflow input data; per-item stages fan out over
+                ``input_data[workflow.items_key]``
+            name: Workflow name reported in events
+            resume: Restore checkpointed results of unchanged stage runs
+
+        Returns:
+            Workflow result
+
+        Raises:
+            ValueError: If the workflow graph is invalid
+        """
+        order = workflow.validate()
+        deps = workflow.dependencies()
+        items = list(input_data.get(workflow.items_key) or [])
+        if any(stage.per_item for stage in workflow.stages) and not items:
+            items = [None]
+
+        # Shared pools are capped per workflow run by a semaphore
+        pools: dict[str, AgentPool] = {}
+        owned: list[AgentPool] = []
+        caps: dict[str, asyncio.Semaphore] = {}
+        for stage in workflow.stages:
+            agent_type = stage.agent_type
+            if agent_type in pools:
+                continue
+            size = max(workflow.max_concurrency.get(agent_type, workflow.default_concurrency), 1)
+            caps[agent_type] = asyncio.Semaphore(size)
+            if self._pool_provider is not None:
+                pools[agent_type] = self._pool_provider(agent_type)
+                # A shared pool must not hold the run below its cap
+                pools[agent_type].ensure_capacity(size)
+            else:
+                pools[agent_type] = AgentPool(agent_type, self._agent_factory, PoolConfig(max_size=size))
+                owned.append(pools[agent_type])
+
+        # One future per stage run: (stage, item index) or (stage, None)
+        loop = asyncio.get_running_loop()
+        futures: dict[tuple[str, int | None], asyncio.Future] = {}
+        for stage_name in order:
+            stage = workflow.get_stage(stage_name)
+            for index in (range(len(items)) if stage.per_item else [None]):
+                futures[(stage_name, index)] = loop.create_future()
+
+        runs: list[StageRun] = []
+        started = time.perf_counter()
+
+        def upstream(stage: Stage, index: int | None) -> dict[str, list[asyncio.Future]]:
+            """Get the futures a stage run waits for, by dependency name."""
+            waits: dict[str, list[asyncio.Future]] = {}
+            for dep_name in deps[stage.name]:
+                dep = workflow.get_stage(dep_name)
+                if not dep.per_item:
+                    waits[dep_name] = [futures[(dep_name, None)]]
+                elif stage.per_item:
+                    waits[dep_name] = [futures[(dep_name, index)]]
+                else:
+                    waits[dep_name] = [futures[(dep_name, i)] for i in range(len(items))]
+            return waits
+
+        async def run_stage(stage: Stage, index: int | None) -> None:
+            """Run one stage run once its dependencies are done."""
+            future = futures[(stage.name, index)]
+            run = StageRun(stage=stage.name, index=index)
+            runs.append(run)
+            try:
+                waits = upstream(stage, index)
+                dep_results: dict[str, Any] = {}
+                for dep_name, dep_futures in waits.items():
+                    dep = workflow.get_stage(dep_name)
+                    fan_in = dep.per_item and not stage.per_item
+                    if fan_in and stage.allow_partial:
+                        await asyncio.wait(dep_futures)
+                        values = [_future_value(f) for f in dep_futures]
+                        if dep_futures and all(f.exception() for f in dep_futures):
+                            raise _Skipped(dep_name)
+                    else:
+                        values = [await f for f in dep_futures]
+                    dep_results[dep_name] = values if fan_in else values[0]
+
+                context = StageContext(
+                    input_data=input_data,
+                    results=dep_results,
+                    item=items[index] if index is not None else None,
+                    index=index,
+                )
+                stage_input = stage.make_input(context, workflow.item_key)
+                event_data = {"workflow": name, "stage": stage.name, "index": index}
+
+                key = None
+                if self._store is not None and stage.checkpoint:
+                    key = await asyncio.to_thread(
+                        self._store.key,
+                        stage.name,
+                        self._agent_version(stage.agent_type),
+                        stage_input,
+                        stage.input_files,
+                    )
+                    if resume:
+                        hit, cached = await asyncio.to_thread(self._store.get, key)
+                        if hit:
+                            if stage.restore is not None:
+                                await asyncio.to_thread(stage.restore, stage_input, cached)
+                            run.success = run.cached = True
+                            await self._emit(
+                                EventType.WORKFLOW_STAGE_COMPLETED, {**event_data, "cached": True}
+                            )
+                            future.set_result(cached)
+                            return
+
+                async with caps[stage.agent_type], pools[stage.agent_type].acquire() as agent:
+                    run.started_at = time.perf_counter() - started
+                    await self._emit(EventType.WORKFLOW_STAGE_STARTED, event_data)
+                    result = await self._execute(agent, stage, stage_input)
+                    run.duration_ms = (time.perf_counter() - started - run.started_at) * 1000
+
+                # A reported failure leaves the agent reusable, so check after checkin
+                if isinstance(result, dict) and result.get("success") is False:
+                    raise StageFailedError(result.get("error") or f"Stage {stage.name} failed")
+
+                if key is not None:
+                    await asyncio.to_thread(self._store.put, key, stage.name, result)
+                run.success = True
+                await self._emit(EventType.WORKFLOW_STAGE_COMPLETED, event_data)
+                future.set_result(result)
+            except _Skipped as e:
+                run.skipped = True
+                run.error = str(e)
+                future.set_exception(_Skipped(stage.name))
+            except Exception as e:
+                run.error = str(e)
+                await self._emit(
+                    EventType.WORKFLOW_STAGE_FAILED,
+                    {"workflow": name, "stage": stage.name, "index": index, "error": str(e)},
+                )
+                future.set_exception(_Skipped(stage.name))
+
+        await self._emit(
+            EventType.WORKFLOW_STARTED,
+            {"workflow": name, "stages": order, "items": len(items)},
+        )
+        try:
+            await asyncio.gather(*(
+                run_stage(workflow.get_stage(stage_name), index)
+                for stage_name, index in futures
+            ))
+        finally:
+            for pool in owned:
+                await pool.close()
+
+        results: dict[str, Any] = {}
+        for stage_name in order:
+            stage = workflow.get_stage(stage_name)
+            values = [
+                _future_value(futures[(stage_name, index)])
+                for index in (range(len(items)) if stage.per_item else [None])
+            ]
+            results[stage_name] = values if stage.per_item else values[0]
+
+        runs.sort(key=lambda r: (order.index(r.stage), -1 if r.index is None else r.index))
+        status = (
+            WorkflowStatus.COMPLETED if all(run.success for run in runs) else WorkflowStatus.FAILED
+        )
+        result = WorkflowResult(
+            status=status,
+            results=results,
+            runs=runs,
+            duration_ms=(time.perf_counter() - started) * 1000,
+        )
+        await self._emit(
+            EventType.WORKFLOW_COMPLETED,
+            {"workflow": name, "status": status.value, "errors": result.errors},
+        )
+        return result
+
+    @staticmethod
+    async def _execute(agent: Any, stage: Stage, stage_input: dict[str, Any]) -> Any:
+        """Run a stage's agent on its input."""
+        if hasattr(agent, "process"):
+            result = await agent.process(stage_input)
+        elif hasattr(agent, "run"):
+            result = await agent.run(stage_input)
+        else:
+            raise AttributeError(f"Agent {stage.agent_type} has no process or run method")
+        return result
+
+
+class _Skipped(Exception):
+    """Marks a stage run skipped because an upstream run failed."""
+
+    def __init__(self, stage: str) -> None:
+        super().__init__(f"Skipped: dependency '{stage}' failed")
+
+
+def _future_value(future: asyncio.Future) -> Any:
+    """Get a finished stage run's result, or None if it failed."""
+    if future.exception() is not None:
+        return None
+    return future.result()
@@ -0,0 +1,221 @@
+"""
+Workflow Checkpoint Store - Persist stage results between workflow runs.
+
+This module provides:
+- A content-addressed store of stage results, keyed on the stage, the
+  agent version and a fingerprint of the stage input (including the
+  content of input files such as recordings)
+- The input of the last run of each workflow, so a failed run can be
+  resumed without repeating its arguments
+
+A resumed or repeated workflow skips every stage whose key is already in
+the store: unchanged recordings are not parsed, deduplicated or converted
+again, and a run that failed at execution picks up where it stopped.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Default store directory (relative to project root)
+WORKFLOW_STORE_DIR = ".cpa/workflows"
+
+# Bump when the key derivation or entry layout changes
+STORE_VERSION = 1
+
+
+# =============================================================================
+# Stage Result Store
+# =============================================================================
+
+
+class StageResultStore:
+    """
+    Content-addressed store of workflow stage results.
+
+    Results are stored as one JSON file per key under ``results/``; runs
+    as one JSON file per workflow under ``runs/``. Writes are atomic, so
+    a crash never leaves a partial entry behind.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            root: Store directory
+        """
+        self.root = Path(root)
+        # Content hashes of input files: path -> (mtime_ns, size, sha256)
+        self._file_hashes: dict[str, tuple[int, int, str]] = {}
+
+    # =========================================================================
+    # Keys
+    # =========================================================================
+
+    def _hash_file(self, path: Path) -> str | None:
+        """Hash a file's content, reusing the hash while it is unchanged."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        cached = self._file_hashes.get(str(path))
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        file_hash = digest.hexdigest()
+        self._file_hashes[str(path)] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        return file_hash
+
+    def key(
+        self,
+        stage: str,
+        agent_version: str,
+        stage_input: dict[str, Any],
+        file_keys: Iterable[str] = (),
+    ) -> str:
+        """
+        Compute the key of a stage run.
+
+        Args:
+            stage: Stage name
+            agent_version: Version of the agent running the stage
+            stage_input: Agent input of the stage
+            file_keys: Input keys naming files whose content is part of the input
+
+        Returns:
+            Hex key that changes whenever the stage input changes
+        """
+        files = {
+            name: self._hash_file(Path(stage_input[name]))
+            for name in file_keys
+            if stage_input.get(name)
+        }
+        payload = json.dumps(
+            [STORE_VERSION, stage, agent_version, stage_input, files],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    # =========================================================================
+    # Stage Results
+    # =========================================================================
+
+    def _result_path(self, key: str) -> Path:
+        """Get the file of a result entry."""
+        return self.root / "results" / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """
+        Look up a stored stage result.
+
+        Args:
+            key: Key from key()
+
+        Returns:
+            ``(True, result)`` on a hit, ``(False, None)`` on a miss
+        """
+        try:
+            entry = json.loads(self._result_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False, None
+        return True, entry["result"]
+
+    def put(self, key: str, stage: str, result: Any) -> bool:
+        """
+        Store a stage result.
+
+        Args:
+            key: Key from key()
+            stage: Stage name
+            result: Stage result
+
+        Returns:
+            True if stored, False if the result is not JSON serializable
+        """
+        try:
+            data = json.dumps({"stage": stage, "stored_at": time.time(), "result": result})
+        except (TypeError, ValueError):
+            return False
+        self._write(self._result_path(key), data)
+        return True
+
+    # =========================================================================
+    # Workflow Runs
+    # =========================================================================
+
+    def _run_path(self, workflow: str) -> Path:
+        """Get the file of a workflow's last run."""
+        return self.root / "runs" / f"{workflow}.json"
+
+    def save_run(
+        self,
+        workflow: str,
+        input_data: dict[str, Any],
+        status: str,
+        errors: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Record the last run of a workflow.
+
+        Args:
+            workflow: Workflow type
+            input_data: Workflow input data
+            status: Run status
+            errors: Errors of failed stage runs
+        """
+        data = json.dumps(
+            {
+                "workflow": workflow,
+                "input_data": input_data,
+                "status": status,
+                "errors": errors or {},
+                "finished_at": time.time(),
+            },
+            default=str,
+        )
+        self._write(self._run_path(workflow), data)
+
+    def load_run(self, workflow: str | None = None) -> dict[str, Any] | None:
+        """
+        Get the last run of a workflow.
+
+        Args:
+            workflow: Workflow type (None: the most recently finished workflow)
+
+        Returns:
+            Run record, or None if the workflow has not run
+        """
+        if workflow is None:
+            runs = sorted(
+                (self.root / "runs").glob("*.json"),
+                key=lambda p: p.stat().st_mtime_ns,
+            ) if (self.root / "runs").is_dir() else []
+            if not runs:
+                return None
+            path = runs[-1]
+        else:
+            path = self._run_path(workflow)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path: Path, data: str) -> None:
+        """Write a file atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(data, encoding="utf-8")
+        os.replace(tmp_path, path)
@@ -49,6 +49,8 @@ class ScenarioAnalyzer:
         """Initialize the scenario analyzer."""
         self.scenarios: Dict[str, Dict[str, Any]] = {}
         self.patterns: List[ScenarioPattern] = []
+        self._similarity_index: Any = None
+        self._scenario_order: Dict[str, int] = {}
 
     def add_scenario(self, scenario_id: str, scenario_data: Dict[str, Any]) -> None:
         """
@@ -59,6 +61,7 @@ class ScenarioAnalyzer:
             scenario_data: Scenario data including name, steps, tags
         """
         self.scenarios[scenario_id] = scenario_data
+        self._similarity_index = None
 
     def analyze_scenario(self, scenario_id: str) -> ScenarioAnalysis:
         """
@@ -188,22 +191,33 @@ class ScenarioAnalyzer:
         if scenario_id not in self.scenarios:
             return []
 
-        current = self.scenarios[scenario_id]
-        current_steps = set(current.get("steps", []))
-        duplicates = []
-
-        for sid, scenario in self.scenarios.items():
-            if sid == scenario_id:
-                continue
+        # Imported here to keep the bdd package off the ai import path
+        from claude_playwright_agent.bdd.step_index import jaccard
 
-            other_steps = set(scenario.get("steps", []))
-            similarity = len(current_steps & other_steps) / len(current_steps | other_steps)
+        current_steps = set(self.scenarios[scenario_id].get("steps", []))
+        index = self._get_similarity_index()
+        duplicates = []
 
-            if similarity > 0.8:
+        # Only LSH candidates are compared instead of every other scenario
+        for sid in sorted(index.query(scenario_id), key=self._scenario_order.get):
+            other_steps = set(self.scenarios[sid].get("steps", []))
+            if jaccard(current_steps, other_steps) > 0.8:
                 duplicates.append(sid)
 
         return duplicates
 
+    def _get_similarity_index(self) -> Any:
+        """Build (once per change) the MinHash/LSH index over step sets."""
+        from claude_playwright_agent.bdd.step_index import MinHashLSH
+
+        if self._similarity_index is None:
+            index = MinHashLSH()
+            for sid, scenario in self.scenarios.items():
+                index.add(sid, set(scenario.get("steps", [])))
+            self._similarity_index = index
+            self._scenario_order = {sid: i for i, sid in enumerate(self.scenarios)}
+        return self._similarity_index
+
     def _generate_suggestions(self, scenario: Dict[str, Any]) -> List[str]:
         """
         Generate optimization suggestions for a scenario.
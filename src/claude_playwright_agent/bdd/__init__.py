@@ -5,6 +5,7 @@ This module provides:
 - BDD Conversion Agent with dedup data loading
 - Gherkin scenario generation
 - Step definition creation
+- Compiled step-definition registry
 - Scenario optimization
 - Feature file management
 """
@@ -21,6 +22,7 @@ from claude_playwright_agent.bdd.gherkin import (
     ScenarioOutline,
 )
 from claude_playwright_agent.bdd.steps import StepDefinitionGenerator
+from claude_playwright_agent.bdd.step_registry import StepRegistry
 from claude_playwright_agent.bdd.optimization import ScenarioOptimizer
 from claude_playwright_agent.bdd.features import FeatureFileManager
 
@@ -33,6 +35,7 @@ __all__ = [
     "GherkinStep",
     "ScenarioOutline",
     "StepDefinitionGenerator",
+    "StepRegistry",
     "ScenarioOptimizer",
     "FeatureFileManager",
 ]
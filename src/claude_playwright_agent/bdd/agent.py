@@ -20,6 +20,7 @@ from claude_playwright_agent.bdd.gherkin import (
     GherkinStep,
     ActionStepMapper,
 )
+from claude_playwright_agent.bdd.step_registry import StepRegistry
 from claude_playwright_agent.bdd.steps import StepDefinitionGenerator, StepGenConfig
 from claude_playwright_agent.bdd.optimization import ScenarioOptimizer
 from claude_playwright_agent.bdd.features import FeatureFileManager
@@ -653,13 +654,14 @@ class BDDConversionAgent:
                 feature_groups[feature_key] = []
             feature_groups[feature_key].append(scenario)
 
+        # Reuse definitions from other step files instead of duplicating them
+        steps_dir = self.project_path / self.config.steps_output_dir
+        output_files = {steps_dir / f"{key}_steps.py" for key in feature_groups}
+        self.step_gen.registry = StepRegistry.from_paths([steps_dir], exclude=output_files)
+
         # Generate step file for each feature
         for feature_key, feature_scenarios in feature_groups.items():
-            output_file = (
-                self.project_path /
-                self.config.steps_output_dir /
-                f"{feature_key}_steps.py"
-            )
+            output_file = steps_dir / f"{feature_key}_steps.py"
 
             for scenario in feature_scenarios:
                 self.step_gen.generate_from_scenario(scenario, output_file)
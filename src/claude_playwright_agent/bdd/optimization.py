@@ -4,7 +4,7 @@ Scenario optimization for BDD tests.
 This module provides:
 - Background step extraction
 - Automatic tag generation
-- Scenario deduplication
+- Scenario deduplication (exact and near-duplicate)
 - Step pattern analysis
 """
 
@@ -20,6 +20,7 @@ from claude_playwright_agent.bdd.gherkin import (
     GherkinStep,
     StepKeyword,
 )
+from claude_playwright_agent.bdd.step_index import StepTrie, group_similar, normalize_step
 
 
 # =============================================================================
@@ -145,50 +146,48 @@ class ScenarioOptimizer:
         Returns:
             List of background dictionaries
         """
-        # Collect all step sequences
-        sequences: dict[str, list[tuple[int, GherkinScenario]]] = {}
+        # Index the leading steps of every scenario in one pass
+        trie = StepTrie(max_depth=max_steps)
+        for i, scenario in enumerate(scenarios):
+            trie.insert([step.text for step in scenario.steps], i)
 
-        for scenario in scenarios:
-            # Get first N steps as potential background
-            for n in range(1, min(max_steps + 1, len(scenario.steps) + 1)):
-                sequence = tuple(scenario.steps[:n])
-                sequence_hash = self._hash_sequence(sequence)
-
-                if sequence_hash not in sequences:
-                    sequences[sequence_hash] = []
-                sequences[sequence_hash].append((n, scenario))
-
-        # Find common sequences
+        # Every trie node shared by enough scenarios is a candidate,
+        # visited in the order the prefixes were first seen
         backgrounds = []
-
-        for seq_hash, occurrences in sequences.items():
-            if len(occurrences) >= min_occurrence:
-                # Get the sequence from first occurrence
-                first_scenario = occurrences[0][1]
-                n_steps = occurrences[0][0]
-                steps = list(first_scenario.steps[:n_steps])
-
-                # Determine feature key
-                feature_keys = {s.feature_file for _, s in occurrences}
-                feature_key = feature_keys.pop() if len(feature_keys) == 1 else "common"
-
-                background = BackgroundSteps(
-                    steps=steps,
-                    usage_count=len(occurrences),
-                    feature_key=feature_key,
-                    contexts=[s.recording_id for _, s in occurrences],
-                )
-
-                # Cache for later use
-                self._backgrounds[seq_hash] = background
-
-                backgrounds.append({
-                    "hash": seq_hash,
-                    "steps": steps,
-                    "usage_count": len(occurrences),
-                    "feature_key": feature_key,
-                    "step_count": n_steps,
-                })
+        nodes = sorted(
+            (node for node, _ in trie.iter_prefixes(min_occurrence)),
+            key=lambda node: node.order,
+        )
+
+        for node in nodes:
+            occurrences = [scenarios[i] for i in node.items]
+            n_steps = node.depth
+
+            # Get the sequence from first occurrence
+            steps = list(occurrences[0].steps[:n_steps])
+            seq_hash = self._hash_sequence(tuple(steps))
+
+            # Determine feature key
+            feature_keys = {s.feature_file for s in occurrences}
+            feature_key = feature_keys.pop() if len(feature_keys) == 1 else "common"
+
+            background = BackgroundSteps(
+                steps=steps,
+                usage_count=len(occurrences),
+                feature_key=feature_key,
+                contexts=[s.recording_id for s in occurrences],
+            )
+
+            # Cache for later use
+            self._backgrounds[seq_hash] = background
+
+            backgrounds.append({
+                "hash": seq_hash,
+                "steps": steps,
+                "usage_count": len(occurrences),
+                "feature_key": feature_key,
+                "step_count": n_steps,
+            })
 
         # Sort by usage (most common first)
         backgrounds.sort(key=lambda b: b["usage_count"], reverse=True)
@@ -427,6 +426,61 @@ class ScenarioOptimizer:
 
         return duplicates
 
+    def find_similar_scenarios(
+        self,
+        scenarios: list[GherkinScenario],
+        threshold: float = 0.8,
+    ) -> list[list[GherkinScenario]]:
+        """
+        Find groups of near-duplicate scenarios.
+
+        Scenarios are compared by the Jaccard similarity of their
+        normalized step pairs. Candidates come from MinHash/LSH, so the
+        search is near-linear in the number of scenarios.
+
+        Args:
+            scenarios: Scenarios to analyze
+            threshold: Minimum similarity (0.0 to 1.0)
+
+        Returns:
+            List of similar scenario groups
+        """
+        sequences = [
+            [normalize_step(step.text) for step in scenario.steps]
+            for scenario in scenarios
+        ]
+        groups = group_similar(sequences, threshold=threshold, shingle_size=2)
+        return [[scenarios[i] for i in group] for group in groups]
+
+    def find_outline_candidates(
+        self,
+        scenarios: list[GherkinScenario],
+        threshold: float = 0.8,
+    ) -> list[dict[str, Any]]:
+        """
+        Find groups of scenarios that could become scenario outlines.
+
+        Args:
+            scenarios: Scenarios to analyze
+            threshold: Minimum similarity of the grouped scenarios
+
+        Returns:
+            Outline suggestions (see suggest_scenario_outline)
+        """
+        suggestions = []
+        for group in self.find_similar_scenarios(scenarios, threshold):
+            # Outlines need the same shape; split groups by step count
+            by_length: dict[int, list[GherkinScenario]] = {}
+            for scenario in group:
+                by_length.setdefault(len(scenario.steps), []).append(scenario)
+
+            for candidates in by_length.values():
+                suggestion = self.suggest_scenario_outline(candidates)
+                if suggestion is not None:
+                    suggestions.append(suggestion)
+
+        return suggestions
+
     def suggest_scenario_outline(
         self,
         scenarios: list[GherkinScenario],
@@ -480,16 +534,8 @@ class ScenarioOptimizer:
         Returns:
             Scenario signature
         """
-        # Normalize steps for comparison
-        normalized = []
-        for step in scenario.steps:
-            # Remove quoted values (parameters)
-            import re
-            normalized_text = re.sub(r'"[^"]*"', '""', step.text)
-            normalized_text = re.sub(r"'[^']*'", "''", normalized_text)
-            normalized.append(normalized_text)
-
-        return "|".join(normalized)
+        # Normalize steps for comparison (quoted parameters removed)
+        return "|".join(normalize_step(step.text) for step in scenario.steps)
 
     def _find_parameter_positions(
         self,
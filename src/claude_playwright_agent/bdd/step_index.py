@@ -0,0 +1,348 @@
+"""
+Step-sequence indexes for scenario optimization.
+
+This module provides:
+- Step normalization (quoted parameters stripped)
+- A prefix trie over step sequences for one-pass common-prefix mining
+- MinHash signatures with LSH banding for near-duplicate detection
+
+Both indexes do work proportional to the number of steps inserted, so
+background mining and similarity search stay near-linear in the number
+of scenarios instead of comparing every scenario with every other one.
+"""
+
+import hashlib
+import re
+import struct
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Iterable, Iterator, Sequence
+
+
+_DOUBLE_QUOTED = re.compile(r'"[^"]*"')
+_SINGLE_QUOTED = re.compile(r"'[^']*'")
+
+# Signature value of an empty shingle set (above every 32-bit hash)
+_EMPTY = 1 << 32
+
+
+def normalize_step(text: str) -> str:
+    """
+    Normalize step text for comparison.
+
+    Quoted values are treated as parameters and blanked out, so
+    ``I search for "shoes"`` and ``I search for "hats"`` normalize alike.
+
+    Args:
+        text: Step text
+
+    Returns:
+        Normalized step text
+    """
+    text = _DOUBLE_QUOTED.sub('""', text)
+    return _SINGLE_QUOTED.sub("''", text)
+
+
+# =============================================================================
+# Prefix Trie
+# =============================================================================
+
+
+@dataclass
+class TrieNode:
+    """
+    A node in the step prefix trie.
+
+    Attributes:
+        key: Step key on the edge into this node
+        depth: Number of steps in the prefix
+        order: Creation order (order in which prefixes were first seen)
+        items: Inserted item ids that share this prefix, in insertion order
+        children: Child nodes keyed by step key
+    """
+
+    key: Hashable = None
+    depth: int = 0
+    order: int = 0
+    items: list[int] = field(default_factory=list)
+    children: dict[Hashable, "TrieNode"] = field(default_factory=dict)
+
+    @property
+    def count(self) -> int:
+        """Number of items sharing this prefix."""
+        return len(self.items)
+
+
+class StepTrie:
+    """
+    Prefix trie over step sequences.
+
+    Inserting a sequence of length n touches n nodes, so indexing the first
+    ``max_depth`` steps of every scenario costs O(scenarios x max_depth)
+    instead of re-hashing every prefix from scratch.
+    """
+
+    def __init__(self, max_depth: int | None = None) -> None:
+        """
+        Initialize the trie.
+
+        Args:
+            max_depth: Only index this many leading steps of each sequence
+        """
+        self.max_depth = max_depth
+        self.root = TrieNode()
+        self._nodes = 0
+
+    def insert(self, keys: Sequence[Hashable], item: int) -> None:
+        """
+        Insert a step sequence.
+
+        Args:
+            keys: Step keys (e.g. step texts) in order
+            item: Id of the item (e.g. scenario index) owning the sequence
+        """
+        node = self.root
+        limit = len(keys) if self.max_depth is None else min(len(keys), self.max_depth)
+        for depth in range(limit):
+            key = keys[depth]
+            child = node.children.get(key)
+            if child is None:
+                self._nodes += 1
+                child = TrieNode(key=key, depth=depth + 1, order=self._nodes)
+                node.children[key] = child
+            child.items.append(item)
+            node = child
+
+    def iter_prefixes(self, min_count: int = 2) -> Iterator[tuple[TrieNode, list[Hashable]]]:
+        """
+        Yield every prefix shared by at least ``min_count`` items.
+
+        Args:
+            min_count: Minimum number of items sharing the prefix
+
+        Yields:
+            Tuples of (node, prefix keys); counts only shrink with depth, so
+            subtrees below ``min_count`` are pruned
+        """
+        stack: list[tuple[TrieNode, list[Hashable]]] = [
+            (child, [child.key]) for child in self.root.children.values()
+        ]
+        while stack:
+            node, prefix = stack.pop()
+            if node.count < min_count:
+                continue
+            yield node, prefix
+            stack.extend(
+                (child, prefix + [child.key]) for child in node.children.values()
+            )
+
+    def common_prefix(self) -> list[Hashable]:
+        """
+        Get the prefix shared by every inserted sequence.
+
+        Returns:
+            Longest common prefix of all sequences
+        """
+        total = sum(child.count for child in self.root.children.values())
+        prefix: list[Hashable] = []
+        node = self.root
+        while len(node.children) == 1:
+            [child] = node.children.values()
+            if child.count != total:
+                break
+            prefix.append(child.key)
+            node = child
+        return prefix
+
+
+# =============================================================================
+# MinHash / LSH
+# =============================================================================
+
+
+def shingles(keys: Sequence[str], size: int = 1) -> set[str]:
+    """
+    Build the shingle set of a step sequence.
+
+    Args:
+        keys: Step keys in order
+        size: Steps per shingle (1 = set of steps, 2 = consecutive pairs, ...)
+
+    Returns:
+        Set of shingles
+    """
+    if size <= 1 or len(keys) < size:
+        return set(keys)
+    return {"\x1f".join(keys[i:i + size]) for i in range(len(keys) - size + 1)}
+
+
+def jaccard(a: set[Any], b: set[Any]) -> float:
+    """Jaccard similarity of two sets (0.0 when both are empty)."""
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+class MinHashLSH:
+    """
+    MinHash signatures indexed with LSH banding.
+
+    Items whose shingle sets have Jaccard similarity ``s`` become candidates
+    with probability ``1 - (1 - s**rows)**bands``; candidates should be
+    verified with the exact similarity. The defaults (16 bands x 4 rows)
+    catch pairs at 0.8 similarity with probability > 0.999.
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 4) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            bands: Number of LSH bands
+            rows: Signature rows per band
+        """
+        self.bands = bands
+        self.rows = rows
+        self._format = f"<{bands * rows}I"
+        self._digest_size = 4 * bands * rows
+        self._buckets: list[dict[tuple[int, ...], list[Hashable]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+        self.signatures: dict[Hashable, tuple[int, ...]] = {}
+        # Steps repeat heavily across scenarios, so each distinct shingle
+        # is permuted once and signatures are element-wise minimums
+        self._cache: dict[str, tuple[int, ...]] = {}
+
+    def signature(self, shingle_set: Iterable[str]) -> tuple[int, ...]:
+        """
+        Compute the MinHash signature of a shingle set.
+
+        Args:
+            shingle_set: Shingles of one item
+
+        Returns:
+            Signature with ``bands * rows`` values
+        """
+        vectors = [self._permuted(shingle) for shingle in shingle_set]
+        if not vectors:
+            return tuple([_EMPTY] * (self.bands * self.rows))
+        if len(vectors) == 1:
+            return vectors[0]
+        return tuple(map(min, *vectors))
+
+    def _permuted(self, shingle: str) -> tuple[int, ...]:
+        """
+        Get the hash values of one shingle under every permutation.
+
+        One SHAKE-128 digest supplies an independent 32-bit hash per
+        signature row, which is stable across processes and much cheaper
+        than evaluating ``bands * rows`` hash functions in Python.
+        """
+        vector = self._cache.get(shingle)
+        if vector is None:
+            digest = hashlib.shake_128(shingle.encode("utf-8")).digest(self._digest_size)
+            vector = struct.unpack(self._format, digest)
+            self._cache[shingle] = vector
+        return vector
+
+    def add(self, item: Hashable, shingle_set: Iterable[str]) -> None:
+        """
+        Add an item to the index.
+
+        Args:
+            item: Item id
+            shingle_set: Shingles of the item
+        """
+        signature = self.signature(shingle_set)
+        self.signatures[item] = signature
+        rows = self.rows
+        for band, buckets in enumerate(self._buckets):
+            buckets[signature[band * rows:(band + 1) * rows]].append(item)
+
+    def query(self, item: Hashable) -> set[Hashable]:
+        """
+        Get the candidate near-duplicates of an indexed item.
+
+        Args:
+            item: Item id previously added
+
+        Returns:
+            Candidate item ids (excluding the item itself)
+        """
+        signature = self.signatures[item]
+        rows = self.rows
+        candidates: set[Hashable] = set()
+        for band, buckets in enumerate(self._buckets):
+            candidates.update(buckets.get(signature[band * rows:(band + 1) * rows], ()))
+        candidates.discard(item)
+        return candidates
+
+    def candidate_pairs(self) -> set[tuple[Hashable, Hashable]]:
+        """
+        Get every pair of items sharing at least one band bucket.
+
+        Returns:
+            Set of (item, item) pairs ordered by insertion
+        """
+        position = {item: i for i, item in enumerate(self.signatures)}
+        pairs: set[tuple[Hashable, Hashable]] = set()
+        for buckets in self._buckets:
+            for members in buckets.values():
+                if len(members) < 2:
+                    continue
+                for i, first in enumerate(members):
+                    for second in members[i + 1:]:
+                        if first != second:
+                            pair = (first, second) if position[first] < position[second] else (second, first)
+                            pairs.add(pair)
+        return pairs
+
+
+def group_similar(
+    items: Sequence[Sequence[str]],
+    threshold: float = 0.8,
+    shingle_size: int = 1,
+) -> list[list[int]]:
+    """
+    Group step sequences whose shingle sets are at least ``threshold`` similar.
+
+    Candidate pairs come from MinHash/LSH and are verified with the exact
+    Jaccard similarity; groups are the connected components of the
+    verified pairs.
+
+    Args:
+        items: Step key sequences
+        threshold: Minimum Jaccard similarity
+        shingle_size: Steps per shingle
+
+    Returns:
+        Groups of item indexes (each with at least two members), in order
+    """
+    shingle_sets = [shingles(keys, shingle_size) for keys in items]
+    parent = list(range(len(items)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Identical shingle sets are merged up front so large groups of exact
+    # copies never produce a quadratic number of candidate pairs
+    index = MinHashLSH()
+    representatives: dict[frozenset[str], int] = {}
+    for i, shingle_set in enumerate(shingle_sets):
+        key = frozenset(shingle_set)
+        first = representatives.setdefault(key, i)
+        if first != i:
+            parent[i] = first
+        else:
+            index.add(i, shingle_set)
+
+    for first, second in index.candidate_pairs():
+        if jaccard(shingle_sets[first], shingle_sets[second]) >= threshold:
+            parent[find(second)] = find(first)
+
+    groups: dict[int, list[int]] = defaultdict(list)
+    for i in range(len(items)):
+        groups[find(i)].append(i)
+    return [members for members in groups.values() if len(members) > 1]
@@ -0,0 +1,861 @@
+"""
+Compiled step-definition registry for BDD projects.
+
+This module provides:
+- Scanning of behave and pytest-bdd step definition files
+- Conversion of parse, cfparse, regex and plain-string patterns to regexes
+- A combined matcher (literal-prefix trie plus combined fallback regexes)
+- Feature file validation for undefined and ambiguous steps
+
+Step text is resolved by walking a trie keyed on the literal words each
+pattern starts with; at each node only the definitions ending in the
+step's last word are tried, folded into one alternation regex that
+rejects non-matching text in a single call. Patterns that start with a
+parameter sit at the trie root. Results are memoized per step text.
+"""
+
+import ast
+import re
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+
+STEP_KEYWORDS = ("given", "when", "then", "step")
+
+# Resolved step texts kept before the memo is reset
+CACHE_SIZE = 65_536
+
+# Regexes for the built-in ``parse`` format types
+_PARSE_TYPES = {
+    "d": r"[-+]?\d+",
+    "n": r"\d{1,3}(?:[,.]\d{3})*",
+    "f": r"[-+]?\d*\.\d+",
+    "F": r"[-+]?\d*\.\d+",
+    "e": r"[-+]?\d*\.\d+[eE][-+]?\d+",
+    "g": r"[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?",
+    "w": r"\w+",
+    "W": r"\W+",
+    "s": r"\s+",
+    "S": r"\S+",
+    "l": r"[a-zA-Z]+",
+}
+
+_PARSE_FIELD = re.compile(r"\{\{|\}\}|\{([^{}]*)\}")
+_TRAILING_TYPE = re.compile(r"([A-Za-z]+)$")
+_GROUP_NAME = re.compile(r"\(\?P<[^>]+>")
+_BACKREFERENCE = re.compile(r"\(\?P=|\\[1-9]")
+_REGEX_META = frozenset(".^$*+?{}[]|()")
+_QUANTIFIERS = frozenset("*+?{")
+
+
+class StepMatcher(str, Enum):
+    """How a step pattern is interpreted."""
+
+    PARSE = "parse"
+    CFPARSE = "cfparse"
+    RE = "re"
+    STRING = "string"
+
+
+# =============================================================================
+# Pattern Compilation
+# =============================================================================
+
+
+def _parse_to_regex(pattern: str) -> tuple[str, str, str]:
+    """
+    Convert a ``parse``/``cfparse`` format to a regex.
+
+    Args:
+        pattern: Format string such as ``I have {count:d} items``
+
+    Returns:
+        Tuple of (regex source, literal prefix, literal suffix); the prefix
+        and suffix are the whole text when the format has no fields
+    """
+    regex: list[str] = []
+    prefix: list[str] = []
+    in_prefix = True
+    pos = 0
+
+    for match in _PARSE_FIELD.finditer(pattern):
+        literal = pattern[pos:match.start()]
+        if match.group(1) is None:  # escaped brace
+            literal += match.group(0)[0]
+        regex.append(re.escape(literal))
+        if in_prefix:
+            prefix.append(literal)
+
+        if match.group(1) is not None:
+            in_prefix = False
+            # Strip cfparse cardinality; custom types fall back to ".+?"
+            spec = match.group(1).partition(":")[2].rstrip("+*?")
+            type_match = _TRAILING_TYPE.search(spec)
+            type_name = type_match.group(1) if type_match else ""
+            regex.append(f"({_PARSE_TYPES.get(type_name, '.+?')})")
+        pos = match.end()
+
+    tail = pattern[pos:]
+    regex.append(re.escape(tail))
+    if in_prefix:
+        prefix.append(tail)
+        return "".join(regex), "".join(prefix), "".join(prefix)
+    return "".join(regex), "".join(prefix), tail
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """Check whether a regex has a ``|`` outside any group or class."""
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _regex_prefix(pattern: str) -> str:
+    """
+    Get the literal text every match of a regex must start with.
+
+    Args:
+        pattern: Regex source
+
+    Returns:
+        Literal prefix (empty when the regex starts with a metacharacter)
+    """
+    if pattern.startswith("(?") or _has_top_level_alternation(pattern):
+        return ""
+
+    i = 1 if pattern.startswith("^") else 2 if pattern.startswith("\\A") else 0
+    chars: list[str] = []
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1:i + 2]
+            if not escaped or escaped.isalnum():
+                break
+            chars.append(escaped)
+            i += 2
+        elif char in _REGEX_META:
+            break
+        else:
+            chars.append(char)
+            i += 1
+
+    # "abc?" only guarantees "ab"
+    if i < len(pattern) and pattern[i] in _QUANTIFIERS and chars:
+        chars.pop()
+    return "".join(chars)
+
+
+def _regex_suffix(pattern: str) -> str:
+    """
+    Get the literal text every match of a regex must end with.
+
+    Args:
+        pattern: Regex source
+
+    Returns:
+        Literal suffix (empty when the regex ends with a metacharacter)
+    """
+    if pattern.startswith("(?") or _has_top_level_alternation(pattern):
+        return ""
+
+    end = len(pattern)
+    if pattern.endswith("\\Z"):
+        end -= 2
+    elif pattern.endswith("$") and not pattern.endswith("\\$"):
+        end -= 1
+    start = end
+    while start > 0 and pattern[start - 1] not in _REGEX_META and pattern[start - 1] != "\\":
+        start -= 1
+    # A run right after a backslash starts with an escape such as \d
+    if start > 0 and pattern[start - 1] == "\\":
+        start += 1
+    return pattern[start:end]
+
+
+@dataclass
+class RegisteredStep:
+    """
+    A step definition known to the registry.
+
+    Attributes:
+        pattern: Pattern as written in the decorator
+        matcher: How the pattern is interpreted
+        keyword: Step type (given, when, then or step for any)
+        function_name: Name of the decorated function
+        file_path: Source file
+        line_number: Line of the decorated function
+        regex: Compiled full-match regex
+        prefix: Literal text every matching step starts with
+        last_word: Complete last word every matching step ends with, if known
+    """
+
+    pattern: str
+    matcher: StepMatcher = StepMatcher.PARSE
+    keyword: str = "step"
+    function_name: str = ""
+    file_path: str = ""
+    line_number: int = 0
+    regex: re.Pattern[str] | None = field(default=None, repr=False, compare=False)
+    prefix: str = ""
+    last_word: str | None = None
+    source: str = field(default="", repr=False, compare=False)
+    ignore_case: bool = field(default=False, repr=False, compare=False)
+
+    def compile(self) -> None:
+        """
+        Compile the pattern to a full-match regex.
+
+        Raises:
+            re.error: If the pattern is not a valid regex
+        """
+        literal = False
+        if self.matcher in (StepMatcher.PARSE, StepMatcher.CFPARSE):
+            # parse formats match case-insensitively by default
+            self.source, self.prefix, suffix = _parse_to_regex(self.pattern)
+            self.ignore_case = True
+            literal = self.source == re.escape(self.prefix)
+        elif self.matcher == StepMatcher.STRING:
+            self.source, self.prefix, suffix = re.escape(self.pattern), self.pattern, self.pattern
+            literal = True
+        else:
+            self.source, self.prefix = self.pattern, _regex_prefix(self.pattern)
+            suffix = _regex_suffix(self.pattern)
+
+        # The suffix's last word is only complete if a space precedes it
+        words = suffix.lower().split(" ")
+        self.last_word = words[-1] if literal or len(words) > 1 else None
+        self.regex = re.compile(self.source, re.IGNORECASE if self.ignore_case else 0)
+
+    @property
+    def location(self) -> str:
+        """Source location as ``file:line``."""
+        return f"{self.file_path}:{self.line_number}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "pattern": self.pattern,
+            "matcher": self.matcher.value,
+            "keyword": self.keyword,
+            "function_name": self.function_name,
+            "file_path": self.file_path,
+            "line_number": self.line_number,
+        }
+
+
+# =============================================================================
+# Step Definition Scanning
+# =============================================================================
+
+
+def _call_name(node: ast.AST) -> str:
+    """Get the name of a called function (``given``, ``parsers.re`` -> ``re``)."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return ""
+
+
+def _string_argument(call: ast.Call) -> str | None:
+    """Get the first positional argument of a call if it is a string literal."""
+    if call.args and isinstance(call.args[0], ast.Constant) and isinstance(call.args[0].value, str):
+        return call.args[0].value
+    return None
+
+
+def scan_step_file(path: Path | str) -> list[RegisteredStep]:
+    """
+    Extract step definitions from a Python file without importing it.
+
+    Recognizes behave (``@given("...")`` with ``use_step_matcher``) and
+    pytest-bdd (``@given(parsers.parse("..."))``) decorators. behave's
+    default matcher is ``parse``; patterns anchored with ``^...$`` (as the
+    step generator writes them) are treated as regexes.
+
+    Args:
+        path: Step definition file
+
+    Returns:
+        Step definitions in source order
+    """
+    path = Path(path)
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+    is_pytest_bdd = any(
+        (isinstance(node, ast.ImportFrom) and (node.module or "").startswith("pytest_bdd"))
+        or (isinstance(node, ast.Import) and any(a.name.startswith("pytest_bdd") for a in node.names))
+        for node in ast.walk(tree)
+    )
+    default = StepMatcher.STRING if is_pytest_bdd else StepMatcher.PARSE
+
+    events: list[ast.AST] = [
+        node for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        or (isinstance(node, ast.Call) and _call_name(node.func) in ("use_step_matcher", "step_matcher"))
+    ]
+    events.sort(key=lambda node: (node.lineno, node.col_offset))
+
+    steps: list[RegisteredStep] = []
+    for node in events:
+        if isinstance(node, ast.Call):
+            matcher = _string_argument(node)
+            if matcher in StepMatcher._value2member_map_:
+                default = StepMatcher(matcher)
+            continue
+
+        for decorator in node.decorator_list:
+            if not isinstance(decorator, ast.Call):
+                continue
+            keyword = _call_name(decorator.func).lower()
+            if keyword not in STEP_KEYWORDS or not decorator.args:
+                continue
+
+            argument = decorator.args[0]
+            matcher = default
+            if isinstance(argument, ast.Call):
+                parser = _call_name(argument.func)
+                if parser not in StepMatcher._value2member_map_:
+                    continue
+                matcher = StepMatcher(parser)
+                pattern = _string_argument(argument)
+            else:
+                pattern = _string_argument(decorator)
+                anchored = pattern is not None and pattern.startswith("^") and pattern.endswith("$")
+                if anchored and matcher == StepMatcher.PARSE:
+                    matcher = StepMatcher.RE
+            if pattern is None:
+                continue
+
+            steps.append(RegisteredStep(
+                pattern=pattern,
+                matcher=matcher,
+                keyword=keyword,
+                function_name=node.name,
+                file_path=str(path),
+                line_number=node.lineno,
+            ))
+    return steps
+
+
+# =============================================================================
+# Step Registry
+# =============================================================================
+
+
+class _Alternation:
+    """
+    Combined regex over a group of definitions.
+
+    Groups larger than ``LEAF_SIZE`` are split in halves, each with its own
+    combined regex, so finding every match descends only into halves whose
+    alternation matches: about ``2 * log2(n)`` regex calls per matching
+    definition instead of ``n``.
+    """
+
+    LEAF_SIZE = 8
+
+    __slots__ = ("items", "regex", "halves")
+
+    def __init__(self, items: list[tuple[int, str]]) -> None:
+        """
+        Build the alternation.
+
+        Args:
+            items: (definition index, regex source) pairs in registration order
+        """
+        self.items = [index for index, _ in items]
+        self.regex = re.compile("|".join(source for _, source in items)) if len(items) > 1 else None
+        self.halves: tuple[_Alternation, ...] = ()
+        if len(items) > self.LEAF_SIZE:
+            middle = len(items) // 2
+            self.halves = (_Alternation(items[:middle]), _Alternation(items[middle:]))
+
+    def search(self, text: str, definitions: list[RegisteredStep], found: list[int]) -> None:
+        """Append the indexes of every definition matching the text."""
+        if self.regex is not None and self.regex.fullmatch(text) is None:
+            return
+        if self.halves:
+            for half in self.halves:
+                half.search(text, definitions, found)
+        else:
+            found.extend(i for i in self.items if definitions[i].regex.fullmatch(text))
+
+
+class _PrefixNode:
+    """Word trie node holding definitions whose literal prefix ends here."""
+
+    __slots__ = ("children", "items", "buckets")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PrefixNode] = {}
+        self.items: list[int] = []
+        # last word (None = unknown) -> (alternation, standalone indexes)
+        self.buckets: dict[str | None, tuple[_Alternation | None, list[int]]] = {}
+
+    def compile(self, definitions: list[RegisteredStep]) -> None:
+        """
+        Combine this node's definitions into alternations by last word.
+
+        Patterns that cannot share a regex with others (inline flags,
+        backreferences) are kept for individual matching.
+        """
+        combinable: dict[str | None, list[tuple[int, str]]] = {}
+        standalone: dict[str | None, list[int]] = {}
+        for index in self.items:
+            step = definitions[index]
+            source = _GROUP_NAME.sub("(?:", step.source)
+            alternative = f"(?i:{source})" if step.ignore_case else f"(?:{source})"
+            try:
+                if _BACKREFERENCE.search(step.source):
+                    raise re.error("backreference")
+                re.compile(alternative)
+            except re.error:
+                standalone.setdefault(step.last_word, []).append(index)
+                continue
+            combinable.setdefault(step.last_word, []).append((index, alternative))
+
+        self.buckets = {
+            key: (
+                _Alternation(combinable[key]) if key in combinable else None,
+                standalone.get(key, []),
+            )
+            for key in combinable.keys() | standalone.keys()
+        }
+
+    def search(
+        self,
+        text: str,
+        last_word: str,
+        definitions: list[RegisteredStep],
+        found: list[int],
+    ) -> None:
+        """Append the indexes of this node's definitions matching the text."""
+        for key in (last_word, None):
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                continue
+            alternation, standalone = bucket
+            if alternation is not None:
+                alternation.search(text, definitions, found)
+            found.extend(i for i in standalone if definitions[i].regex.fullmatch(text))
+
+
+class StepRegistry:
+    """
+    Registry of step definitions compiled into one matcher.
+
+    Definitions are indexed in a word trie by the complete words their
+    literal prefix starts with; definitions that start with a parameter
+    sit at the root. The definitions at each node are combined into one
+    alternation regex that rejects non-matching text in a single call.
+
+    Example:
+        >>> registry = StepRegistry.from_paths(["features/steps"])
+        >>> registry.find("the user clicks the login button", "when")
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self.definitions: list[RegisteredStep] = []
+        self.errors: list[tuple[RegisteredStep, str]] = []
+        self._root = _PrefixNode()
+        self._cache: dict[str, tuple[RegisteredStep, ...]] = {}
+        self._dirty = False
+
+    @classmethod
+    def from_paths(
+        cls,
+        paths: Iterable[Path | str],
+        exclude: Iterable[Path | str] = (),
+    ) -> "StepRegistry":
+        """
+        Build a registry from step definition files and directories.
+
+        Args:
+            paths: Files or directories (searched recursively for ``*.py``)
+            exclude: Files to skip
+
+        Returns:
+            Compiled registry
+        """
+        registry = cls()
+        skipped = {Path(p).resolve() for p in exclude}
+        for path in paths:
+            path = Path(path)
+            files = sorted(path.rglob("*.py")) if path.is_dir() else [path] if path.is_file() else []
+            for file in files:
+                if "__pycache__" not in file.parts and file.resolve() not in skipped:
+                    registry.load_file(file)
+        registry.compile()
+        return registry
+
+    def __len__(self) -> int:
+        return len(self.definitions)
+
+    def load_file(self, path: Path | str) -> int:
+        """
+        Register every step definition in a Python file.
+
+        Args:
+            path: Step definition file
+
+        Returns:
+            Number of definitions registered (0 if the file does not parse)
+        """
+        try:
+            steps = scan_step_file(path)
+        except (SyntaxError, UnicodeDecodeError, OSError) as e:
+            self.errors.append((RegisteredStep(pattern="", file_path=str(path)), str(e)))
+            return 0
+        return sum(self._register(step) for step in steps)
+
+    def add(
+        self,
+        pattern: str,
+        keyword: str = "step",
+        matcher: StepMatcher | str = StepMatcher.PARSE,
+        function_name: str = "",
+        file_path: str = "",
+        line_number: int = 0,
+    ) -> RegisteredStep | None:
+        """
+        Register a single step definition.
+
+        Args:
+            pattern: Step pattern
+            keyword: Step type (given, when, then or step)
+            matcher: How the pattern is interpreted
+            function_name: Implementing function
+            file_path: Source file
+            line_number: Source line
+
+        Returns:
+            The registered step, or None if the pattern does not compile
+        """
+        step = RegisteredStep(
+            pattern=pattern,
+            matcher=StepMatcher(matcher),
+            keyword=keyword.lower(),
+            function_name=function_name,
+            file_path=file_path,
+            line_number=line_number,
+        )
+        return step if self._register(step) else None
+
+    def _register(self, step: RegisteredStep) -> bool:
+        """Compile and append a definition; record it in errors if invalid."""
+        try:
+            step.compile()
+        except re.error as e:
+            self.errors.append((step, f"Invalid pattern: {e}"))
+            return False
+        self.definitions.append(step)
+        self._dirty = True
+        self._cache.clear()
+        return True
+
+    def compile(self) -> None:
+        """Build the prefix trie and the combined regexes."""
+        self._root = _PrefixNode()
+        nodes = [self._root]
+        for index, step in enumerate(self.definitions):
+            node = self._root
+            # Only complete words are indexed; the partial tail is left to the regex
+            for word in step.prefix.lower().split(" ")[:-1]:
+                child = node.children.get(word)
+                if child is None:
+                    child = node.children[word] = _PrefixNode()
+                    nodes.append(child)
+                node = child
+            node.items.append(index)
+
+        for node in nodes:
+            node.compile(self.definitions)
+        self._cache.clear()
+        self._dirty = False
+
+    def _match(self, text: str) -> tuple[RegisteredStep, ...]:
+        """Find every definition matching the text, in registration order."""
+        definitions = self.definitions
+        found: list[int] = []
+
+        words = text.lower().split(" ")
+        last_word = words[-1]
+
+        # The root holds patterns with no literal leading word
+        node = self._root
+        node.search(text, last_word, definitions, found)
+        for word in words:
+            node = node.children.get(word)
+            if node is None:
+                break
+            node.search(text, last_word, definitions, found)
+
+        found.sort()
+        return tuple(definitions[i] for i in found)
+
+    def find_all(self, text: str, keyword: str | None = None) -> list[RegisteredStep]:
+        """
+        Find every definition matching a step.
+
+        Args:
+            text: Step text without the keyword
+            keyword: Step type to match (given, when, then); None matches any
+
+        Returns:
+            Matching definitions in registration order
+        """
+        if self._dirty:
+            self.compile()
+        matches = self._cache.get(text)
+        if matches is None:
+            matches = self._match(text)
+            if len(self._cache) >= CACHE_SIZE:
+                self._cache.clear()
+            self._cache[text] = matches
+
+        keyword = keyword.lower() if keyword else None
+        if keyword not in STEP_KEYWORDS or keyword == "step":
+            return list(matches)
+        return [step for step in matches if step.keyword in (keyword, "step")]
+
+    def find(self, text: str, keyword: str | None = None) -> RegisteredStep | None:
+        """
+        Find the first definition matching a step.
+
+        Args:
+            text: Step text without the keyword
+            keyword: Step type to match; None matches any
+
+        Returns:
+            Matching definition or None
+        """
+        matches = self.find_all(text, keyword)
+        return matches[0] if matches else None
+
+
+# =============================================================================
+# Feature Validation
+# =============================================================================
+
+
+_STEP_WORDS = {"Given": "given", "When": "when", "Then": "then", "And": None, "But": None, "*": None}
+_SCENARIO_SECTIONS = frozenset({
+    "Feature", "Rule", "Background", "Scenario", "Example",
+    "Scenario Outline", "Scenario Template",
+})
+_OUTLINE_PARAMETER = re.compile(r"<([^<>]+)>")
+
+
+def iter_feature_steps(path: Path | str) -> Iterator[tuple[int, str, str]]:
+    """
+    Yield the steps of a feature file.
+
+    ``And``/``But``/``*`` steps take the type of the previous step, and
+    Scenario Outline steps are expanded once per Examples row.
+
+    Args:
+        path: Feature file
+
+    Yields:
+        Tuples of (line number, step type, step text)
+    """
+    outline: list[tuple[int, str, str]] | None = None
+    header: list[str] | None = None
+    in_examples = False
+    expanded = False
+    previous = "given"
+    docstring = ""
+
+    def close_outline() -> list[tuple[int, str, str]]:
+        return list(outline) if outline and not expanded else []
+
+    for number, line in enumerate(Path(path).read_text(encoding="utf-8").splitlines(), 1):
+        stripped = line.strip()
+        if docstring:
+            if stripped.startswith(docstring):
+                docstring = ""
+            continue
+        if stripped.startswith(('"""', "```")):
+            docstring = stripped[:3]
+            continue
+        if not stripped or stripped.startswith(("#", "@")):
+            continue
+
+        if stripped.startswith("|"):
+            if in_examples and outline is not None:
+                cells = [cell.strip() for cell in stripped.strip("|").split("|")]
+                if header is None:
+                    header = cells
+                else:
+                    values = dict(zip(header, cells))
+                    for step_line, step_type, text in outline:
+                        yield step_line, step_type, _OUTLINE_PARAMETER.sub(
+                            lambda m: values.get(m.group(1), m.group(0)), text
+                        )
+                    expanded = True
+            continue
+
+        section = stripped.split(":", 1)[0] if ":" in stripped else ""
+        if section in ("Examples", "Scenarios"):
+            in_examples, header = True, None
+            continue
+        if section in _SCENARIO_SECTIONS:
+            yield from close_outline()
+            outline = [] if section in ("Scenario Outline", "Scenario Template") else None
+            in_examples, header, expanded, previous = False, None, False, "given"
+            continue
+
+        word, _, text = stripped.partition(" ")
+        if word in _STEP_WORDS:
+            step_type = _STEP_WORDS[word] or previous
+            previous = step_type
+            if outline is not None:
+                outline.append((number, step_type, text.strip()))
+            else:
+                yield number, step_type, text.strip()
+
+    yield from close_outline()
+
+
+@dataclass
+class StepIssue:
+    """An undefined or ambiguous step in a feature file."""
+
+    kind: str
+    file_path: str
+    line_number: int
+    keyword: str
+    text: str
+    matches: list[RegisteredStep] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "kind": self.kind,
+            "file_path": self.file_path,
+            "line_number": self.line_number,
+            "keyword": self.keyword,
+            "text": self.text,
+            "matches": [step.to_dict() for step in self.matches],
+        }
+
+
+@dataclass
+class StepValidationReport:
+    """Result of checking feature files against a step registry."""
+
+    definitions: int = 0
+    files_checked: int = 0
+    steps_checked: int = 0
+    issues: list[StepIssue] = field(default_factory=list)
+    invalid_definitions: list[dict[str, str]] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @property
+    def undefined(self) -> list[StepIssue]:
+        """Steps with no matching definition."""
+        return [issue for issue in self.issues if issue.kind == "undefined"]
+
+    @property
+    def ambiguous(self) -> list[StepIssue]:
+        """Steps matched by more than one definition."""
+        return [issue for issue in self.issues if issue.kind == "ambiguous"]
+
+    @property
+    def valid(self) -> bool:
+        """Whether every step resolves to exactly one definition."""
+        return not self.issues and not self.invalid_definitions
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "valid": self.valid,
+            "definitions": self.definitions,
+            "files_checked": self.files_checked,
+            "steps_checked": self.steps_checked,
+            "undefined": len(self.undefined),
+            "ambiguous": len(self.ambiguous),
+            "issues": [issue.to_dict() for issue in self.issues],
+            "invalid_definitions": self.invalid_definitions,
+            "elapsed_ms": round(self.elapsed_ms, 3),
+        }
+
+
+def validate_features(
+    features: Iterable[Path | str],
+    registry: StepRegistry,
+    match_keywords: bool = True,
+) -> StepValidationReport:
+    """
+    Check feature files for undefined and ambiguous steps.
+
+    Args:
+        features: Feature files or directories (searched for ``*.feature``)
+        registry: Compiled step registry
+        match_keywords: Require Given/When/Then to match the decorator type
+
+    Returns:
+        Validation report
+    """
+    started = time.perf_counter()
+    report = StepValidationReport(
+        definitions=len(registry),
+        invalid_definitions=[
+            {"location": step.location, "pattern": step.pattern, "error": error}
+            for step, error in registry.errors
+        ],
+    )
+
+    for path in features:
+        path = Path(path)
+        files = sorted(path.rglob("*.feature")) if path.is_dir() else [path]
+        for file in files:
+            report.files_checked += 1
+            seen: set[tuple[int, str]] = set()
+            for line_number, step_type, text in iter_feature_steps(file):
+                report.steps_checked += 1
+                if (line_number, text) in seen:
+                    continue
+                seen.add((line_number, text))
+
+                matches = registry.find_all(text, step_type if match_keywords else None)
+                if len(matches) != 1:
+                    report.issues.append(StepIssue(
+                        kind="undefined" if not matches else "ambiguous",
+                        file_path=str(file),
+                        line_number=line_number,
+                        keyword=step_type,
+                        text=text,
+                        matches=matches,
+                    ))
+
+    report.elapsed_ms = (time.perf_counter() - started) * 1000
+    return report
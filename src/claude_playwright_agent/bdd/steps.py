@@ -15,6 +15,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from claude_playwright_agent.bdd.gherkin import GherkinScenario, GherkinStep, StepKeyword
+from claude_playwright_agent.bdd.step_registry import RegisteredStep, StepRegistry
 
 
 # =============================================================================
@@ -69,6 +70,7 @@ class StepDefinitionGenerator:
     - Parameter extraction from step text
     - Page object integration
     - Reusable step detection
+    - Reuse of existing definitions from a StepRegistry
     """
 
     # Common step templates
@@ -86,16 +88,23 @@ class StepDefinitionGenerator:
         "screenshot": "the user takes a screenshot",
     }
 
-    def __init__(self, config: StepGenConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: StepGenConfig | None = None,
+        registry: StepRegistry | None = None,
+    ) -> None:
         """
         Initialize the generator.
 
         Args:
             config: Generation configuration
+            registry: Existing step definitions; steps they match are not regenerated
         """
         self.config = config or StepGenConfig()
+        self.registry = registry
         self._generated_steps: dict[str, StepDefinition] = {}
         self._reusable_steps: list[str] = []
+        self._reused_steps: dict[str, RegisteredStep] = {}
 
     # =========================================================================
     # Step Pattern Generation
@@ -446,6 +455,13 @@ class StepDefinitionGenerator:
         step_defs = []
 
         for step in scenario.steps:
+            # Skip steps an existing definition already implements
+            if self.registry is not None:
+                existing = self.registry.find(step.text)
+                if existing is not None:
+                    self._reused_steps[step.text] = existing
+                    continue
+
             # Generate function name
             function_name = self._generate_function_name(step)
 
@@ -535,6 +551,15 @@ class StepDefinitionGenerator:
     # Reusable Step Detection
     # =========================================================================
 
+    def get_reused_steps(self) -> dict[str, RegisteredStep]:
+        """
+        Get steps that were matched to existing definitions.
+
+        Returns:
+            Dictionary mapping step text to the definition it reuses
+        """
+        return dict(self._reused_steps)
+
     def find_reusable_steps(
         self,
         scenarios: list[GherkinScenario],
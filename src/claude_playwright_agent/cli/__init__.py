@@ -16,32 +16,31 @@ from typing import Optional
 
 import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from claude_playwright_agent.config import ConfigManager, PROFILES
-from claude_playwright_agent.scaffold import ScaffoldOptions, TemplateManager
-from claude_playwright_agent.skills import load_skills
-from claude_playwright_agent.state import StateManager, NotInitializedError
-
-# Import skill commands
-from claude_playwright_agent.cli.commands.skill_commands import (
-    register_skills_commands,
-)
-
-# Import workflow commands
-from claude_playwright_agent.cli.commands.ingest import ingest
-from claude_playwright_agent.cli.commands.run import run
-from claude_playwright_agent.cli.commands.report import report
-from claude_playwright_agent.cli.commands.deps import deps
-from claude_playwright_agent.cli.commands.cicd import cicd_command
-from claude_playwright_agent.cli.commands.profile import profile
-from claude_playwright_agent.cli.commands.provider import provider
-from claude_playwright_agent.cli.commands.state_cmd import state
-from claude_playwright_agent.cli.commands.flaky import flaky
-from claude_playwright_agent.cli.commands.template import template
-from claude_playwright_agent.cli.commands.environment import environment
-from claude_playwright_agent.cli.commands.validation import validate
+from claude_playwright_agent.cli.lazy_group import LazyGroup
+from claude_playwright_agent.config.constants import PROFILES
+
+# Workflow and skill commands are imported on first use: name -> (target, short help)
+_COMMANDS = "claude_playwright_agent.cli.commands"
+LAZY_COMMANDS = {
+    "ingest": (f"{_COMMANDS}.ingest:ingest", "Ingest a Playwright recording with full pipeline."),
+    "run": (f"{_COMMANDS}.run:run", "Run BDD tests or workflows."),
+    "report": (f"{_COMMANDS}.report:report", "View test reports and project statistics."),
+    "deps": (f"{_COMMANDS}.deps:deps", "Manage project dependencies."),
+    "cicd": (f"{_COMMANDS}.cicd:cicd_command", "Generate CI/CD pipeline configurations."),
+    "profile": (f"{_COMMANDS}.profile:profile", "Advanced profile management commands."),
+    "provider": (f"{_COMMANDS}.provider:provider", "LLM provider management commands."),
+    "state": (f"{_COMMANDS}.state_cmd:state", "State management commands."),
+    "flaky": (f"{_COMMANDS}.flaky:flaky", "Flaky test detection and management commands."),
+    "template": (f"{_COMMANDS}.template:template", "Project template management commands."),
+    "environment": (f"{_COMMANDS}.environment:environment", "Environment configuration management commands."),
+    "validate": (f"{_COMMANDS}.validation:validate", "Configuration and step definition validation commands."),
+    "workflow": (f"{_COMMANDS}.workflow:workflow", "Run and resume checkpointed multi-agent workflows."),
+    "skills": (f"{_COMMANDS}.skill_commands:skills", "Manage skills for the agent framework."),
+    "list-skills": (f"{_COMMANDS}.skill_commands:list_skills_command", "List all available skills."),
+    "enable-skill": (f"{_COMMANDS}.skill_commands:enable_skill_command", "Enable a skill."),
+    "disable-skill": (f"{_COMMANDS}.skill_commands:disable_skill_command", "Disable a skill."),
+}
 
 # =============================================================================
 # Constants
@@ -96,7 +95,7 @@ def print_warning(message: str) -> None:
 # =============================================================================
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_COMMANDS, invoke_without_command=True)
 @click.option("--version", is_flag=True, help="Show version information.")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output.")
 @click.pass_context
@@ -167,6 +166,8 @@ def cli(ctx: click.Context, version: bool, verbose: bool) -> None:
         sys.exit(0)
 
     if ctx.invoked_subcommand is None:
+        from rich.panel import Panel
+
         print_banner()
         console.print(Panel.fit(
             "Use --help to see available commands",
@@ -267,6 +268,10 @@ def init(name: str, framework: str, template: str, profile: str, force: bool) ->
         3. cpa ingest recordings/recording.js
         4. cpa run
     """
+    from claude_playwright_agent.config import ConfigManager
+    from claude_playwright_agent.scaffold import ScaffoldOptions, TemplateManager
+    from claude_playwright_agent.state import StateManager
+
     project_path = Path.cwd()
 
     # Check if already initialized
@@ -370,6 +375,11 @@ def status(project_path: str) -> None:
         - Which skills are available and enabled
         - Overall project health
     """
+    from rich.table import Table
+
+    from claude_playwright_agent.config import ConfigManager
+    from claude_playwright_agent.state import StateManager
+
     project_path = Path(project_path)
 
     # Check if project is initialized
@@ -386,6 +396,7 @@ def status(project_path: str) -> None:
 
     # Auto-load skills
     from claude_playwright_agent.skills import get_registry
+
     skill_count = load_project_skills(project_path)
     skills = get_registry().list_skills(include_disabled=False)
 
@@ -450,6 +461,8 @@ def config() -> None:
 )
 def config_show(project_path: str) -> None:
     """Show current configuration."""
+    from claude_playwright_agent.config import ConfigManager
+
     project_path = Path(project_path)
 
     try:
@@ -501,6 +514,8 @@ def config_set(key_value: tuple, project_path: str) -> None:
         cpa config set execution.parallel_workers=4
         cpa config set logging.level=DEBUG
     """
+    from claude_playwright_agent.config import ConfigManager
+
     project_path = Path(project_path)
 
     try:
@@ -535,6 +550,8 @@ def config_set(key_value: tuple, project_path: str) -> None:
 )
 def config_validate(project_path: str) -> None:
     """Validate configuration file."""
+    from claude_playwright_agent.config import ConfigManager
+
     project_path = Path(project_path)
 
     try:
@@ -554,6 +571,8 @@ def config_validate(project_path: str) -> None:
 )
 def config_profile(profile: str, project_path: str) -> None:
     """Switch configuration profile."""
+    from claude_playwright_agent.config import ConfigManager
+
     project_path = Path(project_path)
 
     try:
@@ -580,6 +599,8 @@ def load_project_skills(project_path: Path) -> int:
     Returns:
         Number of skills loaded
     """
+    from claude_playwright_agent.skills import load_skills
+
     try:
         skills = load_skills(project_path=project_path, include_builtins=True)
         return len(skills)
@@ -602,6 +623,9 @@ def refresh_skills(project_path: str) -> None:
     - Built-in skills directory
     - Project skills directory (.cpa/skills or skills)
     """
+    from claude_playwright_agent.skills import load_skills
+    from claude_playwright_agent.state import StateManager
+
     project_path = Path(project_path)
 
     # Check if project is initialized
@@ -623,23 +647,6 @@ def refresh_skills(project_path: str) -> None:
 # =============================================================================
 
 
-# Register commands at module import time
-# This ensures commands are available when using CliRunner or importing the module
-register_skills_commands(cli)
-cli.add_command(ingest)
-cli.add_command(run)
-cli.add_command(report)
-cli.add_command(deps)
-cli.add_command(cicd_command)
-cli.add_command(profile)
-cli.add_command(provider)  # NEW: Provider management commands
-cli.add_command(state)
-cli.add_command(flaky)
-cli.add_command(template)
-cli.add_command(environment)
-cli.add_command(validate)
-
-
 def main() -> None:
     """Main entry point for the CLI."""
     cli(obj={})
@@ -10,6 +10,7 @@ This command:
 Full pipeline: parse → deduplicate → BDD conversion
 """
 
+import asyncio
 import hashlib
 import sys
 from datetime import datetime
@@ -56,6 +57,11 @@ def print_timestamp(message: str, style: str = "") -> None:
     is_flag=True,
     help="Skip BDD conversion step",
 )
+@click.option(
+    "--ai-stream",
+    is_flag=True,
+    help="Generate the feature file with the LLM, writing scenarios as they stream in",
+)
 @click.option(
     "--verbose", "-v",
     is_flag=True,
@@ -66,6 +72,7 @@ def ingest(
     project_path: str,
     no_dedup: bool,
     no_bdd: bool,
+    ai_stream: bool,
     verbose: bool,
 ) -> None:
     """
@@ -81,6 +88,7 @@ def ingest(
         cpa ingest recordings/login.js --verbose
         cpa ingest recordings/login.js --no-dedup  # Skip deduplication
         cpa ingest recordings/login.js --no-bdd     # Skip BDD conversion
+        cpa ingest recordings/login.js --ai-stream  # Stream LLM-generated scenarios
     """
     project_path = Path(project_path)
     recording_file = Path(recording_path)
@@ -184,7 +192,28 @@ def ingest(
     # ========================================================================
 
     bdd_result = None
-    if not no_bdd:
+    stream_summary = None
+    if not no_bdd and ai_stream:
+        print_timestamp("📦 Step 3: Streaming BDD scenarios from the LLM...", "bold yellow")
+
+        try:
+            stream_summary = asyncio.run(
+                _stream_ai_conversion(
+                    project_path,
+                    recording_file,
+                    {
+                        "test_name": recording_file.stem,
+                        "actions": actions,
+                        "urls_visited": urls,
+                    },
+                )
+            )
+            console.print("")
+
+        except Exception as e:
+            print_timestamp(f"   ❌ Streaming BDD conversion failed: {e}", "red")
+            sys.exit(1)
+    elif not no_bdd:
         print_timestamp("📦 Step 3: Generating BDD scenarios...", "bold yellow")
 
         try:
@@ -235,7 +264,7 @@ def ingest(
         f"Recording ID: {recording_id}\n"
         f"Actions: {len(actions)}\n"
         f"Element Groups: {dedup_result.total_groups if dedup_result else 0}\n"
-        f"Scenarios: {bdd_result.total_scenarios if bdd_result else 0}",
+        f"Scenarios: {_scenario_total(bdd_result, stream_summary)}",
         title="Pipeline Summary",
         border_style="green"
     ))
@@ -247,6 +276,62 @@ def ingest(
     console.print("  3. Run tests: cpa run")
 
 
+def _scenario_total(bdd_result: Any, stream_summary: dict[str, Any] | None) -> int:
+    """Get the scenario count from whichever BDD step ran."""
+    if stream_summary:
+        return stream_summary["scenario_count"]
+    return bdd_result.total_scenarios if bdd_result else 0
+
+
+async def _stream_ai_conversion(
+    project_path: Path,
+    recording_file: Path,
+    parsed_recording: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Stream an LLM-generated feature file, printing each scenario as it lands.
+
+    Args:
+        project_path: Project root
+        recording_file: Recording being ingested
+        parsed_recording: Parsed recording data
+
+    Returns:
+        The final ``complete`` event from the agent
+    """
+    from claude_playwright_agent.agents.bdd_agent import BDDConversionAgent as StreamingBDDAgent
+
+    features_dir = project_path / "features"
+    feature_path = features_dir / f"{recording_file.stem}.feature"
+    steps_path = features_dir / "steps" / f"{recording_file.stem}_steps.py"
+
+    summary: dict[str, Any] = {"scenario_count": 0}
+    agent = StreamingBDDAgent(project_path)
+    try:
+        async for event in agent.stream_feature(parsed_recording, feature_path):
+            if event["type"] == "first_token":
+                print_timestamp(f"   ⚡ First output after {event['elapsed']:.2f}s", "cyan")
+            elif event["type"] == "scenario":
+                print_timestamp(
+                    f"   ✅ {event['name']} ({event['step_count']} steps, {event['elapsed']:.1f}s)",
+                    "green",
+                )
+            elif event["type"] == "complete":
+                summary = event
+    finally:
+        await agent.cleanup()
+
+    if not summary["scenario_count"]:
+        print_timestamp(f"   ⚠️  The LLM produced no scenarios for {feature_path}", "yellow")
+        return summary
+
+    steps_path.parent.mkdir(parents=True, exist_ok=True)
+    steps_path.write_text(summary.get("step_definitions", ""), encoding="utf-8")
+
+    print_timestamp(f"   ✅ Wrote {summary['scenario_count']} scenarios to {feature_path}", "green")
+    return summary
+
+
 # =============================================================================
 # Recording Parser (Simplified - will be enhanced in E3)
 # =============================================================================
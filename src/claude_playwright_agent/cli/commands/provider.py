@@ -210,7 +210,17 @@ def provider_list(project_path: str, output_json: bool, verbose: bool) -> None:
     "--model", "-m",
     help="Specific model to test (uses default if not specified)",
 )
-def provider_test(provider_name: str, project_path: str, model: str | None) -> None:
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Stream the response and report time to first token",
+)
+def provider_test(
+    provider_name: str,
+    project_path: str,
+    model: str | None,
+    stream: bool,
+) -> None:
     """
     Test connectivity to an LLM provider.
 
@@ -223,6 +233,7 @@ def provider_test(provider_name: str, project_path: str, model: str | None) -> N
         cpa provider test anthropic
         cpa provider test openai --model gpt-4-turbo-preview
         cpa provider test glm
+        cpa provider test anthropic --stream
     """
     from claude_playwright_agent.llm import LLMProviderFactory, LLMProviderType, LLMMessage
     from claude_playwright_agent.llm.models.config import ProviderConfig
@@ -275,6 +286,11 @@ def provider_test(provider_name: str, project_path: str, model: str | None) -> N
             ]
 
             console.print("[dim]Sending test query...[/dim]")
+            if stream:
+                await _stream_test_query(llm_provider, messages)
+                await llm_provider.cleanup()
+                return
+
             response = await llm_provider.query(messages)
 
             await llm_provider.cleanup()
@@ -295,6 +311,29 @@ def provider_test(provider_name: str, project_path: str, model: str | None) -> N
     asyncio.run(run_test())
 
 
+async def _stream_test_query(llm_provider: Any, messages: list) -> None:
+    """Stream a test query, echoing tokens as they arrive."""
+    import time
+
+    start = time.monotonic()
+    first_token_at = None
+    parts = []
+
+    async for chunk in llm_provider.query_stream(messages):
+        if chunk.delta:
+            if first_token_at is None:
+                first_token_at = time.monotonic() - start
+            parts.append(chunk.delta)
+            console.print(chunk.delta, end="", markup=False, highlight=False)
+
+    console.print("")
+    console.print("[success]Streaming test successful![/success]")
+    if first_token_at is not None:
+        console.print(f"[dim]Time to first token: {first_token_at * 1000:.0f} ms[/dim]")
+    console.print(f"[dim]Total time: {(time.monotonic() - start) * 1000:.0f} ms[/dim]")
+    console.print(f"[dim]Characters received: {len(''.join(parts))}[/dim]")
+
+
 @provider.command(name="set")
 @click.argument("provider_name", type=click.Choice(["anthropic", "openai", "glm"]))
 @click.option(
@@ -49,11 +49,17 @@ def print_timestamp(message: str, style: str = "") -> None:
     is_flag=True,
     help="Enable detailed output",
 )
+@click.option(
+    "--watch", "-w",
+    is_flag=True,
+    help="Re-run tests when feature, recording or test files change",
+)
 def run(
     workflow: str,
     project_path: str,
     tags: tuple,
     verbose: bool,
+    watch: bool,
 ) -> None:
     """
     Run BDD tests or workflows.
@@ -67,6 +73,7 @@ def run(
     Examples:
         cpa run test                    # Run all tests
         cpa run test --tags @smoke     # Run smoke tests
+        cpa run test --watch           # Re-run on file changes
         cpa run convert                 # Convert to BDD
         cpa run full                    # Run full pipeline
     """
@@ -81,6 +88,8 @@ def run(
 
     if workflow == "test":
         _run_tests(project_path, tags, verbose)
+        if watch:
+            _watch_tests(project_path, tags, verbose)
     elif workflow == "convert":
         _run_conversion(project_path, verbose)
     elif workflow == "ingest":
@@ -89,6 +98,47 @@ def run(
         _run_full_pipeline(project_path, verbose)
 
 
+def _watch_tests(project_path: Path, tags: tuple, verbose: bool) -> None:
+    """Keep the discovery index live and re-run tests on changes."""
+    import queue
+
+    from claude_playwright_agent.execution import TestDiscovery
+
+    discovery = TestDiscovery(str(project_path))
+    changes: "queue.Queue[list[str]]" = queue.Queue()
+
+    try:
+        observer = discovery.watch(changes.put)
+    except ImportError as e:
+        console.print(f"[ERROR] {e}", style="bold red")
+        sys.exit(1)
+
+    stats = discovery.get_test_statistics()
+    print_timestamp(
+        f"👀 Watching {stats['total_tests']} test(s) for changes (Ctrl+C to stop)",
+        "bold blue",
+    )
+
+    try:
+        while True:
+            changed = changes.get()
+            # Coalesce bursts of events (editors often write several times)
+            try:
+                while True:
+                    changed.extend(changes.get(timeout=0.3))
+            except queue.Empty:
+                pass
+
+            for rel in sorted(set(changed)):
+                print_timestamp(f"   Changed: {rel}", "cyan")
+            _run_tests(project_path, tags, verbose)
+    except KeyboardInterrupt:
+        print_timestamp("Stopped watching", "yellow")
+    finally:
+        observer.stop()
+        observer.join()
+
+
 def _run_tests(project_path: Path, tags: tuple, verbose: bool) -> None:
     """Run BDD test scenarios."""
     print_timestamp("📊 Executing BDD scenarios...", "bold yellow")
@@ -221,22 +271,10 @@ def _display_test_results(result, verbose: bool) -> None:
 def _check_and_display_flaky_tests(project_path: Path, result, verbose: bool) -> None:
     """Check for and display flaky tests."""
     from claude_playwright_agent.agents.failure_analysis import FailureAnalyzer
+    from claude_playwright_agent.reporting.history_store import get_history_store
 
-    # Get historical test runs from state
-    state = StateManager(project_path)
-    test_runs = state.get_test_runs(limit=50)
-
-    if not test_runs:
-        return  # Not enough history yet
-
-    # Build history for failure analyzer
-    analyzer = FailureAnalyzer()
-    for run in test_runs:
-        # Convert execution run to test results format
-        for _ in range(run.total):
-            # Simplified: we'd need detailed per-test results here
-            # For now, just use aggregate data
-            pass
+    # Per-test history from previous runs comes from the shared history store
+    analyzer = FailureAnalyzer(history_store=get_history_store(project_path))
 
     # Update analyzer with current test results
     test_results_for_history = []
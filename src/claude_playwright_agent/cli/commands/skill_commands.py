@@ -557,7 +557,13 @@ def execute_skill(skill_name: str, task: str | None, context: str, workflow_id:
         except SkillLoadError:
             continue
 
-    if not skill or not skill.agent_class:
+    try:
+        agent_class = skill.agent_class if skill else None
+    except SkillLoadError as e:
+        click.echo(f"✗ Failed to load skill '{skill_name}': {e}", err=True)
+        return
+
+    if not agent_class:
         click.echo(f"✗ Skill '{skill_name}' not found or has no agent class.", err=True)
         return
 
@@ -580,7 +586,7 @@ def execute_skill(skill_name: str, task: str | None, context: str, workflow_id:
     # Execute the skill
     try:
         click.echo(f"Executing skill '{skill_name}' with task '{task}'...")
-        agent = skill.agent_class()
+        agent = agent_class()
 
         # Run async
         result = asyncio.run(agent.run(task, exec_context))
@@ -625,6 +631,12 @@ def describe_skill(skill_name: str, project_path: str, format: str) -> None:
         click.echo(f"✗ Skill '{skill_name}' not found.", err=True)
         return
 
+    try:
+        agent_class = skill.agent_class
+    except SkillLoadError as e:
+        click.echo(f"✗ Failed to load skill '{skill_name}': {e}", err=True)
+        return
+
     # Get manifest for additional details
     manifest_details = {}
     manifest_path = None
@@ -674,11 +686,11 @@ def describe_skill(skill_name: str, project_path: str, format: str) -> None:
                 tags = ", ".join(manifest_details["tags"])
                 click.echo(f"\n**Tags:** {tags}")
 
-        if skill.agent_class:
+        if agent_class:
             click.echo(f"\n## Agent Class\n")
-            click.echo(f"`{skill.agent_class.__name__}`")
+            click.echo(f"`{agent_class.__name__}`")
             click.echo(f"\n**Methods:**")
-            for method_name in dir(skill.agent_class):
+            for method_name in dir(agent_class):
                 if not method_name.startswith("_"):
                     click.echo(f"- `{method_name}()`")
 
@@ -698,9 +710,9 @@ def describe_skill(skill_name: str, project_path: str, format: str) -> None:
                 for dep in manifest_details["dependencies"]:
                     click.echo(f"  - {dep}")
 
-        if skill.agent_class:
-            click.echo(f"\nAgent Class: {skill.agent_class.__name__}")
-            click.echo(f"Module:      {skill.agent_class.__module__}")
+        if agent_class:
+            click.echo(f"\nAgent Class: {agent_class.__name__}")
+            click.echo(f"Module:      {agent_class.__module__}")
 
         click.echo()
 
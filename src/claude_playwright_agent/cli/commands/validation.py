@@ -6,6 +6,7 @@ This module provides commands to:
 - Check configuration for issues
 - Fix common configuration problems
 - Validate profiles and environments
+- Check feature steps against step definitions
 - Export validation reports
 """
 
@@ -517,7 +518,7 @@ class ConfigurationValidator:
 
 @click.group()
 def validate() -> None:
-    """Configuration validation commands."""
+    """Configuration and step definition validation commands."""
     pass
 
 
@@ -729,6 +730,115 @@ def validate_state(project_path: str, fix: bool) -> None:
         sys.exit(1)
 
 
+@validate.command(name="steps")
+@click.option(
+    "--project-path", "-p",
+    default=".",
+    help="Path to project directory",
+)
+@click.option(
+    "--features",
+    "features_dir",
+    default="features",
+    help="Feature files directory (relative to the project)",
+)
+@click.option(
+    "--steps-dir", "-s",
+    multiple=True,
+    help="Step definition directory (repeatable; default: <features>/steps and steps)",
+)
+@click.option(
+    "--any-keyword",
+    is_flag=True,
+    help="Match steps regardless of Given/When/Then decorator type",
+)
+@click.option(
+    "--export", "-e",
+    type=click.Path(),
+    help="Export validation results to a JSON file",
+)
+def validate_steps(
+    project_path: str,
+    features_dir: str,
+    steps_dir: tuple[str, ...],
+    any_keyword: bool,
+    export: str | None,
+) -> None:
+    """
+    Check feature files for undefined and ambiguous steps.
+
+    Step definitions are read from the source files without importing
+    them, so no tests are run and no browser is needed.
+
+    Examples:
+        cpa validate steps
+        cpa validate steps --steps-dir tests/steps --any-keyword
+        cpa validate steps --export steps.json
+    """
+    from claude_playwright_agent.bdd.step_registry import StepRegistry, validate_features
+
+    project_path = Path(project_path)
+    features_path = project_path / features_dir
+    if not features_path.exists():
+        console.print(f"[ERROR] Features directory not found: {features_path}", style="bold red")
+        sys.exit(1)
+
+    if steps_dir:
+        step_paths = [project_path / d for d in steps_dir]
+    else:
+        step_paths = [p for p in (features_path / "steps", project_path / "steps") if p.exists()]
+
+    registry = StepRegistry.from_paths(step_paths)
+    report = validate_features([features_path], registry, match_keywords=not any_keyword)
+
+    console.print(
+        f"Checked {report.steps_checked} steps in {report.files_checked} feature files "
+        f"against {report.definitions} step definitions ({report.elapsed_ms:.1f}ms)"
+    )
+    console.print("")
+
+    if report.issues:
+        table = Table(title="Step Issues", show_header=True)
+        table.add_column("Location", style="cyan")
+        table.add_column("Step", style="yellow")
+        table.add_column("Problem", style="red")
+        for issue in report.issues:
+            if issue.kind == "undefined":
+                problem = "undefined"
+            else:
+                problem = "ambiguous: " + ", ".join(
+                    f"{m.function_name} ({m.location})" for m in issue.matches
+                )
+            table.add_row(
+                f"{issue.file_path}:{issue.line_number}",
+                f"{issue.keyword.capitalize()} {issue.text}",
+                problem,
+            )
+        console.print(table)
+        console.print("")
+
+    for invalid in report.invalid_definitions:
+        console.print(
+            f"[ERROR] Invalid step definition at {invalid['location']}: {invalid['error']}",
+            style="bold red",
+        )
+
+    if export:
+        output_path = Path(export)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+        console.print(f"[OK] Results exported to {output_path}", style="bold green")
+
+    if report.valid:
+        console.print("[OK] All steps have exactly one definition", style="bold green")
+    else:
+        console.print(
+            f"[ERROR] {len(report.undefined)} undefined, {len(report.ambiguous)} ambiguous steps",
+            style="bold red",
+        )
+        sys.exit(1)
+
+
 def _display_validation_result(result: ValidationResult) -> None:
     """Display validation results in a formatted table."""
     console.print("")
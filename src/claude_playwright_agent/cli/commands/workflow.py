@@ -0,0 +1,143 @@
+"""
+Workflow commands for Claude Playwright Agent.
+
+This module provides commands to:
+- Run multi-agent workflows through the orchestrator
+- Resume the last run of a workflow from its checkpoints
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+WORKFLOW_TYPES = ["ingestion", "execution", "full"]
+
+
+def _print_result(result: dict[str, Any]) -> None:
+    """Print a workflow result and exit non-zero if it failed."""
+    if "status" not in result:
+        console.print(f"[ERROR] {result.get('error', 'Workflow failed')}", style="bold red")
+        sys.exit(1)
+
+    table = Table(title=f"Workflow: {result['workflow']}")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Item", justify="right")
+    table.add_column("Status")
+    table.add_column("Time", justify="right")
+
+    for run in result.get("runs", []):
+        if run["cached"]:
+            status = "[blue]cached[/blue]"
+        elif run["success"]:
+            status = "[green]done[/green]"
+        elif run["skipped"]:
+            status = "[yellow]skipped[/yellow]"
+        else:
+            status = f"[red]failed[/red] {run['error']}"
+        item = "" if run["index"] is None else str(run["index"])
+        table.add_row(run["stage"], item, status, f"{run['duration_ms']:.0f}ms")
+
+    console.print(table)
+    cached = sum(1 for run in result.get("runs", []) if run["cached"])
+    console.print(
+        f"Status: {result['status']} in {result.get('duration_ms', 0) / 1000:.1f}s "
+        f"({cached} stage runs restored from checkpoints)"
+    )
+    if result["status"] != "completed":
+        sys.exit(1)
+
+
+async def _run(project_path: Path, call: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+    """Call an orchestrator workflow method and clean up its agents."""
+    from claude_playwright_agent.agents.orchestrator import OrchestratorAgent
+
+    orchestrator = OrchestratorAgent(project_path)
+    try:
+        return await getattr(orchestrator, call)(*args, **kwargs)
+    finally:
+        await orchestrator.cleanup()
+
+
+@click.group()
+def workflow() -> None:
+    """Run and resume checkpointed multi-agent workflows."""
+    pass
+
+
+@workflow.command(name="run")
+@click.argument("workflow_type", type=click.Choice(WORKFLOW_TYPES))
+@click.argument("recordings", nargs=-1, type=click.Path(exists=True))
+@click.option(
+    "--features-dir", "-f",
+    default=None,
+    help="Directory to write feature files to",
+)
+@click.option(
+    "--output-dir", "-o",
+    default=None,
+    help="Directory to write page objects to",
+)
+@click.option(
+    "--resume/--no-resume",
+    default=False,
+    help="Skip stages whose input is unchanged since they last succeeded",
+)
+@click.option(
+    "--project-path", "-p",
+    default=".",
+    help="Path to project directory",
+)
+def run_workflow(
+    workflow_type: str,
+    recordings: tuple[str, ...],
+    features_dir: str | None,
+    output_dir: str | None,
+    resume: bool,
+    project_path: str,
+) -> None:
+    """
+    Run a workflow over recordings.
+
+    Examples:
+        cpa workflow run ingestion recordings/*.spec.js -f features
+        cpa workflow run full recordings/*.spec.js -f features --resume
+    """
+    input_data: dict[str, Any] = {"recordings": list(recordings)}
+    if features_dir:
+        input_data["features_dir"] = features_dir
+    if output_dir:
+        input_data["output_dir"] = output_dir
+
+    result = asyncio.run(
+        _run(Path(project_path), "run_workflow", workflow_type, input_data, resume=resume)
+    )
+    _print_result(result)
+
+
+@workflow.command(name="resume")
+@click.argument("workflow_type", required=False, type=click.Choice(WORKFLOW_TYPES))
+@click.option(
+    "--project-path", "-p",
+    default=".",
+    help="Path to project directory",
+)
+def resume_workflow(workflow_type: str | None, project_path: str) -> None:
+    """
+    Resume the last run of a workflow.
+
+    Stages that already succeeded with the same input are restored from
+    checkpoints; only failed, skipped and changed stages run again.
+
+    Examples:
+        cpa workflow resume
+        cpa workflow resume full
+    """
+    result = asyncio.run(_run(Path(project_path), "resume_workflow", workflow_type))
+    _print_result(result)
@@ -0,0 +1,68 @@
+"""
+Lazy click group - resolve subcommands only when they are invoked.
+
+Each command module imports its own agents and SDKs, so importing all of
+them up front made even ``cpa --help`` pay for the whole framework.
+"""
+
+from importlib import import_module
+from typing import Any, Optional
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are imported on first use.
+
+    Subcommands are declared as ``{"name": ("package.module:attribute",
+    "short help")}``. Listing commands (``--help``) only needs the names and
+    short help; the module is imported when a command is actually resolved.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[dict[str, tuple[str, str]]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager and lazy command names."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a command, importing it if it is lazy."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_subcommands:
+            command = self._load(cmd_name)
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Write the command list without importing lazy commands."""
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(formatter.width)))
+            else:
+                rows.append((name, self.lazy_subcommands[name][1]))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """Import a lazy command and cache it on the group."""
+        module_name, attr = self.lazy_subcommands[cmd_name][0].split(":")
+        command = getattr(import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise click.ClickException(
+                f"Lazy command '{cmd_name}' did not resolve to a click command"
+            )
+        self.add_command(command, cmd_name)
+        return command
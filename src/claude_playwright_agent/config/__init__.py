@@ -10,34 +10,68 @@ This module provides configuration management for the framework including:
 - Environment-specific configuration support
 """
 
-from claude_playwright_agent.config.manager import (
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from claude_playwright_agent.config.constants import (
     CONFIG_DIR_NAME,
     CONFIG_FILE_NAME,
     CONFIG_PROFILES_DIR,
-    ConfigError,
-    ConfigManager,
-    ConfigNotFoundError,
-    ConfigValidationError,
     DEFAULT_PROFILE,
-    ProfileConfig,
     PROFILES,
 )
-from claude_playwright_agent.config.models import (
-    AIConfig,
-    AgentConfig,
-    BrowserConfig,
-    BrowserType,
-    EnvironmentConfig,
-    EnvironmentType,
-    ExecutionConfig,
-    FrameworkConfig,
-    FrameworkType,
-    LoggingConfig,
-    RecordingConfig,
-    ReportingConfig,
-    ReportingFormat,
-    SkillConfig,
-)
+
+if TYPE_CHECKING:
+    from claude_playwright_agent.config.manager import (
+        ConfigError,
+        ConfigManager,
+        ConfigNotFoundError,
+        ConfigSnapshot,
+        ConfigValidationError,
+        ProfileConfig,
+        clear_config_cache,
+    )
+    from claude_playwright_agent.config.models import (
+        AIConfig,
+        AgentConfig,
+        BrowserConfig,
+        BrowserType,
+        EnvironmentConfig,
+        EnvironmentType,
+        ExecutionConfig,
+        FrameworkConfig,
+        FrameworkType,
+        LoggingConfig,
+        RecordingConfig,
+        ReportingConfig,
+        ReportingFormat,
+        SkillConfig,
+    )
+
+# The Pydantic models are slow to import; resolve them on first access.
+_LAZY_IMPORTS = {
+    "ConfigError": "claude_playwright_agent.config.manager",
+    "ConfigManager": "claude_playwright_agent.config.manager",
+    "ConfigNotFoundError": "claude_playwright_agent.config.manager",
+    "ConfigSnapshot": "claude_playwright_agent.config.manager",
+    "ConfigValidationError": "claude_playwright_agent.config.manager",
+    "ProfileConfig": "claude_playwright_agent.config.manager",
+    "clear_config_cache": "claude_playwright_agent.config.manager",
+    "AIConfig": "claude_playwright_agent.config.models",
+    "AgentConfig": "claude_playwright_agent.config.models",
+    "BrowserConfig": "claude_playwright_agent.config.models",
+    "BrowserType": "claude_playwright_agent.config.models",
+    "EnvironmentConfig": "claude_playwright_agent.config.models",
+    "EnvironmentType": "claude_playwright_agent.config.models",
+    "ExecutionConfig": "claude_playwright_agent.config.models",
+    "FrameworkConfig": "claude_playwright_agent.config.models",
+    "FrameworkType": "claude_playwright_agent.config.models",
+    "LoggingConfig": "claude_playwright_agent.config.models",
+    "RecordingConfig": "claude_playwright_agent.config.models",
+    "ReportingConfig": "claude_playwright_agent.config.models",
+    "ReportingFormat": "claude_playwright_agent.config.models",
+    "SkillConfig": "claude_playwright_agent.config.models",
+}
 
 __all__ = [
     # Manager
@@ -46,6 +80,8 @@ __all__ = [
     "ConfigNotFoundError",
     "ConfigValidationError",
     "ProfileConfig",
+    "ConfigSnapshot",
+    "clear_config_cache",
     # Constants
     "CONFIG_DIR_NAME",
     "CONFIG_FILE_NAME",
@@ -69,3 +105,17 @@ __all__ = [
     "ReportingFormat",
     "EnvironmentType",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import configuration classes lazily on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
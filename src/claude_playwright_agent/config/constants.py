@@ -0,0 +1,16 @@
+"""
+Configuration constants for Claude Playwright Agent.
+
+Kept free of heavy imports so the CLI can build its option choices
+without loading the Pydantic models.
+"""
+
+from typing import Final
+
+CONFIG_DIR_NAME: Final = ".cpa"
+CONFIG_FILE_NAME: Final = "config.yaml"
+CONFIG_PROFILES_DIR: Final = "profiles"
+DEFAULT_PROFILE: Final = "default"
+
+# Available profiles
+PROFILES: Final = ["default", "dev", "test", "prod", "ci"]
@@ -8,11 +8,15 @@ This module implements the ConfigManager class which handles:
 - Configuration merging and overrides
 - Environment variable overrides
 - Configuration inheritance
+- A process-wide cache of validated configuration snapshots
 """
 
 import os
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Final
+from typing import Any, Callable
 
 from pydantic import ValidationError
 
@@ -28,17 +32,14 @@ from claude_playwright_agent.config.models import (
     SkillConfig,
 )
 
-# =============================================================================
-# Constants
-# =============================================================================
-
-CONFIG_DIR_NAME: Final = ".cpa"
-CONFIG_FILE_NAME: Final = "config.yaml"
-CONFIG_PROFILES_DIR: Final = "profiles"
-DEFAULT_PROFILE: Final = "default"
-
-# Available profiles
-PROFILES: Final = ["default", "dev", "test", "prod", "ci"]
+# The CONFIG_* names are re-exported for code importing them from here
+from claude_playwright_agent.config.constants import (
+    CONFIG_DIR_NAME,  # noqa: F401
+    CONFIG_FILE_NAME,  # noqa: F401
+    CONFIG_PROFILES_DIR,  # noqa: F401
+    DEFAULT_PROFILE,
+    PROFILES,
+)
 
 
 # =============================================================================
@@ -64,6 +65,59 @@ class ConfigValidationError(ConfigError):
     pass
 
 
+# =============================================================================
+# Configuration Snapshots
+# =============================================================================
+
+
+# Snapshots kept (one per project, profile and env prefix)
+MAX_SNAPSHOTS = 64
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    A validated effective configuration shared by ConfigManager instances.
+
+    The config object is shared and never handed out directly: each
+    ConfigManager works on its own copy from copy_config(), so changes
+    made through one manager do not leak into others.
+
+    Attributes:
+        fingerprint: Config file stat, custom profile files and env hash
+        config: Validated configuration
+        loaded_at: Time the snapshot was built (time.time())
+    """
+
+    fingerprint: tuple[Any, ...]
+    config: AgentConfig
+    loaded_at: float
+
+    def copy_config(self) -> AgentConfig:
+        """Get a private deep copy of the configuration."""
+        return self.config.model_copy(deep=True)
+
+
+_snapshots: dict[tuple[str, str, str], ConfigSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def clear_config_cache(project_path: str | Path | None = None) -> None:
+    """
+    Drop cached configuration snapshots.
+
+    Args:
+        project_path: Only drop snapshots of this project (default: all)
+    """
+    with _snapshots_lock:
+        if project_path is None:
+            _snapshots.clear()
+            return
+        project = os.path.abspath(project_path)
+        for key in [key for key in _snapshots if key[0] == project]:
+            del _snapshots[key]
+
+
 # =============================================================================
 # Configuration Profiles
 # =============================================================================
@@ -219,6 +273,13 @@ class ConfigManager:
     - Configuration validation
     - Configuration merging
     - Configuration inheritance
+    - Validated configuration cached per process
+
+    The effective configuration is loaded once per process for each
+    (project, profile, env prefix) and shared by every ConfigManager that
+    asks for it. A cached snapshot is reused while the config file, the
+    custom profile files and the prefixed environment variables are
+    unchanged, so constructing a ConfigManager costs a few stat calls.
     """
 
     def __init__(
@@ -226,6 +287,7 @@ class ConfigManager:
         project_path: str | Path | None = None,
         profile: str = DEFAULT_PROFILE,
         env_prefix: str = "CPA_",
+        use_cache: bool = True,
     ) -> None:
         """
         Initialize the ConfigManager.
@@ -234,6 +296,7 @@ class ConfigManager:
             project_path: Path to project root. Defaults to current directory.
             profile: Configuration profile to use.
             env_prefix: Prefix for environment variable overrides.
+            use_cache: Reuse the process-wide configuration snapshot.
 
         Raises:
             ConfigError: If profile is not valid
@@ -242,9 +305,12 @@ class ConfigManager:
         self._config_dir = self._project_path / "config" / "default"
         self._config_file = self._config_dir / "config.yaml"
         self._profiles_dir = self._project_path / "config" / "profiles"
+        self._env_prefix = env_prefix
+        self._use_cache = use_cache
 
         # Validate profile (allow custom profiles)
-        custom_profiles = self._get_custom_profiles()
+        fingerprint = self._fingerprint()
+        custom_profiles = sorted(name for name, _, _ in fingerprint[1])
         valid_profiles = PROFILES + custom_profiles
 
         if profile not in valid_profiles:
@@ -254,10 +320,121 @@ class ConfigManager:
             )
 
         self._profile = profile
-        self._env_prefix = env_prefix
 
-        # Load configuration
-        self._config: AgentConfig = self._load_config()
+        # Load configuration (or reuse the cached snapshot)
+        self._config: AgentConfig = self._load_snapshot(fingerprint).copy_config()
+
+    # =========================================================================
+    # Snapshot Cache
+    # =========================================================================
+
+    def _fingerprint(self) -> tuple[Any, ...]:
+        """
+        Describe every input of the effective configuration.
+
+        Returns:
+            Tuple of (config file stat, custom profile files, env hash)
+        """
+        try:
+            stat = self._config_file.stat()
+            config_stat: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            config_stat = None
+
+        profiles = []
+        try:
+            with os.scandir(self._profiles_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".yaml"):
+                        stat = entry.stat()
+                        profiles.append((entry.name[:-5], stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            pass
+
+        env = sorted(
+            (name, value) for name, value in os.environ.items()
+            if name.startswith(self._env_prefix)
+        )
+        return (config_stat, tuple(sorted(profiles)), hash(tuple(env)))
+
+    def _load_snapshot(
+        self,
+        fingerprint: tuple[Any, ...] | None = None,
+        force: bool = False,
+    ) -> ConfigSnapshot:
+        """
+        Get the configuration snapshot, loading it on a cache miss.
+
+        Args:
+            fingerprint: Precomputed result of _fingerprint()
+            force: Rebuild the snapshot even if the cached one is current
+
+        Returns:
+            Validated configuration snapshot
+        """
+        if fingerprint is None:
+            fingerprint = self._fingerprint()
+        key = (os.path.abspath(self._project_path), self._profile, self._env_prefix)
+
+        if self._use_cache and not force:
+            snapshot = _snapshots.get(key)
+            if snapshot is not None and snapshot.fingerprint == fingerprint:
+                return snapshot
+
+        snapshot = ConfigSnapshot(
+            fingerprint=fingerprint,
+            config=self._load_config(),
+            loaded_at=time.time(),
+        )
+        if self._use_cache:
+            with _snapshots_lock:
+                _snapshots.pop(key, None)
+                _snapshots[key] = snapshot
+                for stale in list(_snapshots)[:-MAX_SNAPSHOTS]:
+                    del _snapshots[stale]
+        return snapshot
+
+    def watch(self, on_change: Callable[[AgentConfig], None] | None = None) -> Any:
+        """
+        Keep this manager's configuration fresh by watching config files.
+
+        Requires the optional ``watchdog`` package. Local changes made with
+        update() or add_environment() are replaced on reload.
+
+        Args:
+            on_change: Called with the reloaded configuration
+
+        Returns:
+            Running watchdog observer (call ``stop()`` and ``join()`` to end)
+        """
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            raise ImportError(
+                "Watch mode requires the 'watchdog' package. "
+                "Install it with: pip install watchdog>=3.0.0"
+            )
+
+        manager = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event: Any) -> None:
+                if event.is_directory or not str(event.src_path).endswith(".yaml"):
+                    return
+                try:
+                    manager.reload()
+                except ConfigError:
+                    return  # Keep the last valid configuration
+                if on_change:
+                    on_change(manager.config)
+
+        observer = Observer()
+        config_root = self._project_path / "config"
+        config_root.mkdir(parents=True, exist_ok=True)
+        observer.schedule(_Handler(), str(config_root), recursive=True)
+        observer.start()
+        return observer
 
     def _load_config(self) -> AgentConfig:
         """
@@ -526,8 +703,8 @@ class ConfigManager:
             f.write(self._config.model_dump_yaml())
 
     def reload(self) -> None:
-        """Reload configuration from file."""
-        self._config = self._load_config()
+        """Reload configuration from file (bypassing the cache)."""
+        self._config = self._load_snapshot(force=True).copy_config()
 
     def update(self, **kwargs: Any) -> None:
         """
@@ -582,7 +759,7 @@ class ConfigManager:
             )
 
         self._profile = profile
-        self.reload()
+        self._config = self._load_snapshot().copy_config()
 
     def list_profiles(self) -> dict[str, list[str]]:
         """
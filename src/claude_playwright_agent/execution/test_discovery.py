@@ -9,14 +9,22 @@ Discovers and catalogs tests from multiple sources:
 """
 
 import ast
+import json
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import defaultdict
 
 
+# Bump when the parsers change so stale cached results are discarded
+INDEX_VERSION = 1
+
+
 class TestType(str, Enum):
     """Types of tests that can be discovered."""
     BDD_FEATURE = "bdd_feature"
@@ -66,6 +74,24 @@ class DiscoveredTest:
             "dependencies": self.dependencies,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DiscoveredTest":
+        """Create from dictionary."""
+        return cls(
+            test_id=data["test_id"],
+            name=data["name"],
+            test_type=TestType(data["test_type"]),
+            framework=TestFramework(data["framework"]),
+            file_path=data["file_path"],
+            line_number=data.get("line_number", 0),
+            tags=data.get("tags", []),
+            description=data.get("description", ""),
+            scenarios=data.get("scenarios", []),
+            steps_count=data.get("steps_count", 0),
+            parameters=data.get("parameters", {}),
+            dependencies=data.get("dependencies", []),
+        )
+
 
 class TestDiscovery:
     """
@@ -77,6 +103,9 @@ class TestDiscovery:
     - Parse Playwright recordings
     - Parse Python test files
     - Extract metadata (tags, descriptions, etc.)
+    - Persistent index keyed by path, mtime and size so only changed
+      files are re-parsed (changed files are parsed in parallel)
+    - Optional watch mode that keeps the index live
     """
 
     def __init__(
@@ -85,6 +114,9 @@ class TestDiscovery:
         features_dir: str = "features",
         recordings_dir: str = "recordings",
         tests_dir: str = "tests",
+        use_cache: bool = True,
+        cache_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize the test discovery system.
@@ -94,31 +126,269 @@ class TestDiscovery:
             features_dir: BDD features directory
             recordings_dir: Playwright recordings directory
             tests_dir: Python tests directory
+            use_cache: Persist the discovery index between runs
+            cache_path: Index file (default: .cpa/discovery_index.json)
+            max_workers: Threads used to parse changed files
         """
         self.project_path = Path(project_path)
         self.features_dir = self.project_path / features_dir
         self.recordings_dir = self.project_path / recordings_dir
         self.tests_dir = self.project_path / tests_dir
+        self.use_cache = use_cache
+        self.cache_path = (
+            Path(cache_path) if cache_path
+            else self.project_path / ".cpa" / "discovery_index.json"
+        )
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) + 4)
 
         self.discovered_tests: dict[str, DiscoveredTest] = {}
         self.tests_by_type: dict[TestType, list[DiscoveredTest]] = defaultdict(list)
         self.tests_by_tag: dict[str, list[DiscoveredTest]] = defaultdict(list)
 
+        # Relative path -> {"kind", "mtime_ns", "size", "tests"}
+        self._index: dict[str, dict[str, Any]] = {}
+        self._index_loaded = False
+        self._lock = threading.RLock()
+        self.last_scan_stats: dict[str, int] = {}
+
     def discover_all(self) -> list[DiscoveredTest]:
         """
         Discover all tests in the project.
 
+        Files whose mtime and size match the persisted index are not
+        re-read; only new or changed files are parsed.
+
         Returns:
             List of all discovered tests
         """
+        with self._lock:
+            if self.use_cache and not self._index_loaded:
+                self._load_index()
+            self._index_loaded = True
+
+            files = self._scan_files()
+            changed = [
+                (rel, kind, path)
+                for rel, (kind, path, stat) in files.items()
+                if not self._is_fresh(rel, stat)
+            ]
+            removed = [rel for rel in self._index if rel not in files]
+
+            parsed = self._parse_files([(kind, path) for _, kind, path in changed])
+            for (rel, kind, path), tests in zip(changed, parsed):
+                stat = files[rel][2]
+                self._index[rel] = {
+                    "kind": kind,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "tests": [t.to_dict() for t in tests],
+                }
+            for rel in removed:
+                del self._index[rel]
+
+            self.last_scan_stats = {
+                "files": len(files),
+                "parsed": len(changed),
+                "removed": len(removed),
+            }
+
+            if self.use_cache and (changed or removed):
+                self._save_index()
+
+            self._rebuild()
+            return list(self.discovered_tests.values())
+
+    def refresh_paths(self, paths: list[str | Path]) -> list[str]:
+        """
+        Re-index specific files (used by watch mode).
+
+        Args:
+            paths: Absolute or project-relative paths that changed
+
+        Returns:
+            Relative paths whose index entry changed
+        """
+        updated = []
+        with self._lock:
+            for raw in paths:
+                path = Path(raw)
+                if not path.is_absolute():
+                    path = self.project_path / path
+                kind = self._classify(path)
+                if kind is None:
+                    continue
+
+                rel = self._relative(path)
+                if path.is_file():
+                    stat = path.stat()
+                    if self._is_fresh(rel, stat):
+                        continue
+                    tests = self._parse_file(kind, path)
+                    self._index[rel] = {
+                        "kind": kind,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "tests": [t.to_dict() for t in tests],
+                    }
+                    updated.append(rel)
+                elif self._index.pop(rel, None) is not None:
+                    updated.append(rel)
+
+            if updated:
+                if self.use_cache:
+                    self._save_index()
+                self._rebuild()
+
+        return updated
+
+    def watch(self, on_change: Optional[Callable[[list[str]], None]] = None) -> Any:
+        """
+        Keep the index live by watching the project for file changes.
+
+        Requires the optional ``watchdog`` package.
+
+        Args:
+            on_change: Called with the changed relative paths after re-indexing
+
+        Returns:
+            Running watchdog observer (call ``stop()`` and ``join()`` to end)
+        """
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            raise ImportError(
+                "Watch mode requires the 'watchdog' package. "
+                "Install it with: pip install watchdog>=3.0.0"
+            )
+
+        if not self._index_loaded:
+            self.discover_all()
+
+        discovery = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event: Any) -> None:
+                if event.is_directory:
+                    return
+                paths = [event.src_path]
+                if getattr(event, "dest_path", None):
+                    paths.append(event.dest_path)
+                updated = discovery.refresh_paths(paths)
+                if updated and on_change:
+                    on_change(updated)
+
+        observer = Observer()
+        handler = _Handler()
+        # Python tests are indexed anywhere in the project, so watch it
+        # recursively; other directories only when they lie outside it
+        watched: list[Path] = []
+        for directory in (self.project_path, self.features_dir, self.recordings_dir, self.tests_dir):
+            if directory.exists() and not any(_is_within(directory, root) for root in watched):
+                observer.schedule(handler, str(directory), recursive=True)
+                watched.append(directory)
+        observer.start()
+        return observer
+
+    def _scan_files(self) -> dict[str, tuple[str, Path, os.stat_result]]:
+        """Find candidate test files with their stat results."""
+        files: dict[str, tuple[str, Path, os.stat_result]] = {}
+
+        def add(root: Path, kind: str, match: Callable[[str], bool]) -> None:
+            for path, stat in self._walk(root, match):
+                files.setdefault(self._relative(path), (kind, path, stat))
+
+        if self.features_dir.exists():
+            add(self.features_dir, "feature", lambda n: n.endswith(".feature"))
+        if self.recordings_dir.exists():
+            add(self.recordings_dir, "recording", lambda n: n.endswith(".spec.js"))
+        if self.tests_dir.exists():
+            # Also check project root for test_*.py files
+            for test_dir in (self.tests_dir, self.project_path):
+                add(test_dir, "python", _is_python_test)
+
+        return files
+
+    @staticmethod
+    def _walk(root: Path, match: Callable[[str], bool]) -> list[tuple[Path, os.stat_result]]:
+        """Recursively list matching files using scandir (stat comes cheap)."""
+        found = []
+        stack = [str(root)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif match(entry.name) and entry.is_file():
+                            found.append((Path(entry.path), entry.stat()))
+                    except OSError:
+                        continue
+        found.sort(key=lambda item: item[0])
+        return found
+
+    def _classify(self, path: Path) -> Optional[str]:
+        """Get the file kind for a path, or None if it is not a test file."""
+        name = path.name
+        if name.endswith(".feature") and _is_within(path, self.features_dir):
+            return "feature"
+        if name.endswith(".spec.js") and _is_within(path, self.recordings_dir):
+            return "recording"
+        if _is_python_test(name) and self.tests_dir.exists() and _is_within(path, self.project_path):
+            return "python"
+        return None
+
+    def _relative(self, path: Path) -> str:
+        """Get a path relative to the project root."""
+        try:
+            return str(path.relative_to(self.project_path))
+        except ValueError:
+            return str(path)
+
+    def _is_fresh(self, rel: str, stat: os.stat_result) -> bool:
+        """Check whether the indexed entry matches the file on disk."""
+        entry = self._index.get(rel)
+        return (
+            entry is not None
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        )
+
+    def _parse_file(self, kind: str, path: Path) -> list[DiscoveredTest]:
+        """Parse one file with the parser for its kind."""
+        if kind == "feature":
+            return self._parse_feature_file(path)
+        if kind == "recording":
+            return self._parse_playwright_recording(path)
+        return self._parse_python_test(path)
+
+    def _parse_files(self, items: list[tuple[str, Path]]) -> list[list[DiscoveredTest]]:
+        """Parse changed files, in parallel when there is more than one."""
+        if len(items) <= 1 or self.max_workers <= 1:
+            return [self._parse_file(kind, path) for kind, path in items]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda item: self._parse_file(*item), items))
+
+    def _rebuild(self) -> None:
+        """Rebuild the in-memory lookups from the index."""
         self.discovered_tests.clear()
         self.tests_by_type.clear()
         self.tests_by_tag.clear()
 
-        # Discover different test types
-        self._discover_bdd_features()
-        self._discover_playwright_recordings()
-        self._discover_python_tests()
+        # Keep the historic ordering: features, recordings, then Python tests
+        for kind in ("feature", "recording", "python"):
+            for rel in sorted(self._index):
+                entry = self._index[rel]
+                if entry["kind"] != kind:
+                    continue
+                for data in entry["tests"]:
+                    test = DiscoveredTest.from_dict(data)
+                    self.discovered_tests[test.test_id] = test
 
         # Index tests
         for test in self.discovered_tests.values():
@@ -126,17 +396,27 @@ class TestDiscovery:
             for tag in test.tags:
                 self.tests_by_tag[tag].append(test)
 
-        return list(self.discovered_tests.values())
-
-    def _discover_bdd_features(self) -> None:
-        """Discover BDD feature files."""
-        if not self.features_dir.exists():
+    def _load_index(self) -> None:
+        """Load the persisted index, ignoring missing or stale files."""
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
             return
+        if data.get("version") == INDEX_VERSION:
+            self._index = data.get("files", {})
 
-        for feature_file in self.features_dir.rglob("*.feature"):
-            tests = self._parse_feature_file(feature_file)
-            for test in tests:
-                self.discovered_tests[test.test_id] = test
+    def _save_index(self) -> None:
+        """Persist the index atomically."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({"version": INDEX_VERSION, "files": self._index}),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: Failed to save discovery index: {e}")
 
     def _parse_feature_file(self, filepath: Path) -> list[DiscoveredTest]:
         """
@@ -221,16 +501,6 @@ class TestDiscovery:
 
         return tests
 
-    def _discover_playwright_recordings(self) -> None:
-        """Discover Playwright test recordings."""
-        if not self.recordings_dir.exists():
-            return
-
-        for recording_file in self.recordings_dir.rglob("*.spec.js"):
-            tests = self._parse_playwright_recording(recording_file)
-            for test in tests:
-                self.discovered_tests[test.test_id] = test
-
     def _parse_playwright_recording(self, filepath: Path) -> list[DiscoveredTest]:
         """
         Parse a Playwright recording file.
@@ -265,23 +535,6 @@ class TestDiscovery:
 
         return tests
 
-    def _discover_python_tests(self) -> None:
-        """Discover Python test files."""
-        if not self.tests_dir.exists():
-            return
-
-        # Also check project root for test_*.py files
-        test_dirs = [self.tests_dir, self.project_path]
-
-        for test_dir in test_dirs:
-            if not test_dir.exists():
-                continue
-
-            for test_file in test_dir.rglob("test_*.py"):
-                tests = self._parse_python_test(test_file)
-                for test in tests:
-                    self.discovered_tests[test.test_id] = test
-
     def _parse_python_test(self, filepath: Path) -> list[DiscoveredTest]:
         """
         Parse a Python test file.
@@ -404,3 +657,17 @@ class TestDiscovery:
         tag_counts = [(tag, len(tests)) for tag, tests in self.tests_by_tag.items()]
         tag_counts.sort(key=lambda x: x[1], reverse=True)
         return tag_counts[:limit]
+
+
+def _is_python_test(name: str) -> bool:
+    """Check whether a file name is a Python test module."""
+    return name.startswith("test_") and name.endswith(".py")
+
+
+def _is_within(path: Path, directory: Path) -> bool:
+    """Check whether a path is inside a directory."""
+    try:
+        path.resolve().relative_to(directory.resolve())
+        return True
+    except ValueError:
+        return False
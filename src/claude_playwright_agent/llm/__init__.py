@@ -36,7 +36,14 @@ from .base import (
 )
 
 # Factory
-from .factory import FallbackProvider, LLMProviderFactory
+from .factory import (
+    CoalescingProvider,
+    FallbackProvider,
+    LLMProviderFactory,
+    MicroBatcher,
+    ProviderHealth,
+    RoutingMode,
+)
 
 # Exceptions
 from .exceptions import (
@@ -74,6 +81,10 @@ __all__ = [
     # Factory
     "LLMProviderFactory",
     "FallbackProvider",
+    "CoalescingProvider",
+    "MicroBatcher",
+    "ProviderHealth",
+    "RoutingMode",
     # Exceptions
     "LLMError",
     "ProviderNotFoundError",
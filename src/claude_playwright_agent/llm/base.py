@@ -183,11 +183,13 @@ class StreamChunk:
         content: Text content chunk
         delta: New content since last chunk
         finish_reason: Finish reason if this is the final chunk
+        extra: Provider-specific metadata (usage, fallback info, etc.)
     """
 
     content: str
     delta: str = None  # type: ignore[assignment]
     finish_reason: Optional[str] = None
+    extra: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Initialize delta to content if not provided."""
@@ -5,6 +5,14 @@ Handles provider instantiation, configuration loading, and fallback chains.
 """
 
 import asyncio
+import dataclasses
+import hashlib
+import json
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
 from typing import Any, AsyncIterator, List, Optional
 
 from claude_playwright_agent.llm.base import (
@@ -175,15 +183,19 @@ class LLMProviderFactory:
     @staticmethod
     def create_with_fallback(
         providers: List[ProviderConfig],
+        routing: "RoutingMode | str" = "sequential",
+        **router_options: Any,
     ) -> "FallbackProvider":
         """
         Create a provider with fallback chain.
 
         Args:
             providers: List of provider configs in priority order
+            routing: Routing mode ("sequential" or "latency")
+            **router_options: Options for latency routing (see FallbackProvider)
 
         Returns:
-            FallbackProvider that tries each in sequence
+            FallbackProvider that tries each in sequence or routes by latency
 
         Raises:
             ValueError: If providers list is empty
@@ -196,39 +208,150 @@ class LLMProviderFactory:
             provider = LLMProviderFactory.create_provider(config)
             provider_instances.append(provider)
 
-        return FallbackProvider(provider_instances)
+        return FallbackProvider(provider_instances, routing=routing, **router_options)
 
     @staticmethod
-    async def test_provider(provider: BaseLLMProvider) -> dict[str, Any]:
+    def create_coalescing(
+        provider: BaseLLMProvider | ProviderConfig,
+    ) -> "CoalescingProvider":
+        """
+        Wrap a provider so identical in-flight queries share one request.
+
+        Args:
+            provider: Provider instance or configuration to wrap
+
+        Returns:
+            CoalescingProvider wrapping the given provider
+        """
+        if not isinstance(provider, BaseLLMProvider):
+            provider = LLMProviderFactory.create_provider(provider)
+        return CoalescingProvider(provider)
+
+    @staticmethod
+    async def test_provider(provider: BaseLLMProvider, keep_open: bool = False) -> dict[str, Any]:
         """
         Test a provider by making a simple query.
 
         Args:
             provider: Provider to test
+            keep_open: Leave the provider initialized after the test instead
+                of cleaning it up (for providers owned by a live chain)
 
         Returns:
             Test results with success status and metadata
         """
+        start = time.monotonic()
         try:
-            async with provider:
-                messages = [LLMMessage.user("Hello")]
-                response = await provider.query(messages)
-
-                return {
-                    "success": True,
-                    "provider": provider.config.provider.value,
-                    "model": response.model,
-                    "response_length": len(response.content),
-                    "tokens": response.total_tokens,
-                }
+            if keep_open:
+                if not provider.is_initialized():
+                    await provider.initialize()
+                response = await provider.query([LLMMessage.user("Hello")])
+            else:
+                async with provider:
+                    response = await provider.query([LLMMessage.user("Hello")])
+
+            return {
+                "success": True,
+                "provider": provider.config.provider.value,
+                "model": response.model,
+                "response_length": len(response.content),
+                "tokens": response.total_tokens,
+                "latency_ms": (time.monotonic() - start) * 1000,
+            }
         except Exception as e:
             return {
                 "success": False,
                 "provider": provider.config.provider.value,
                 "error": str(e),
+                "latency_ms": (time.monotonic() - start) * 1000,
             }
 
 
+# Errors that mean "try another provider" rather than "the request is bad"
+RETRYABLE_ERRORS = (ProviderAPIError, ProviderTimeoutError, RateLimitError, ProviderConnectionError)
+
+
+class RoutingMode(str, Enum):
+    """Routing strategies for FallbackProvider."""
+
+    SEQUENTIAL = "sequential"  # Try providers strictly in priority order
+    LATENCY = "latency"  # Route to the fastest healthy provider, hedge slow requests
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass
+class ProviderHealth:
+    """
+    Live latency and error statistics for one provider.
+
+    Attributes:
+        ewma_latency: Exponentially weighted moving average latency (seconds)
+        error_rate: Exponentially weighted moving average error rate (0-1)
+        latencies: Recent successful latencies used for percentile estimates
+        consecutive_failures: Failures since the last success
+        opened_at: Monotonic time the circuit breaker opened, if open
+        successes: Total successful requests
+        failures: Total failed requests
+    """
+
+    ewma_latency: Optional[float] = None
+    error_rate: float = 0.0
+    latencies: deque = field(default_factory=lambda: deque(maxlen=100))
+    consecutive_failures: int = 0
+    opened_at: Optional[float] = None
+    successes: int = 0
+    failures: int = 0
+
+    def record_success(self, latency: float, alpha: float) -> None:
+        """Record a successful request and close the circuit."""
+        self.successes += 1
+        self.latencies.append(latency)
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency = alpha * latency + (1 - alpha) * self.ewma_latency
+        self.error_rate = (1 - alpha) * self.error_rate
+        self.consecutive_failures = 0
+        self.opened_at = None
+
+    def record_failure(self, alpha: float, failure_threshold: int) -> None:
+        """Record a failed request, opening the circuit past the threshold."""
+        self.failures += 1
+        self.error_rate = alpha + (1 - alpha) * self.error_rate
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= failure_threshold:
+            self.opened_at = time.monotonic()
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Get a latency percentile from recent samples."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def is_available(self, cooldown: float) -> bool:
+        """Check if the circuit is closed or due for a half-open trial."""
+        if self.opened_at is None:
+            return True
+        return time.monotonic() - self.opened_at >= cooldown
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation."""
+        p95 = self.percentile(95)
+        return {
+            "ewma_latency_ms": self.ewma_latency * 1000 if self.ewma_latency is not None else None,
+            "p95_latency_ms": p95 * 1000 if p95 is not None else None,
+            "error_rate": self.error_rate,
+            "consecutive_failures": self.consecutive_failures,
+            "circuit_open": self.opened_at is not None,
+            "successes": self.successes,
+            "failures": self.failures,
+        }
+
+
 class FallbackProvider(BaseLLMProvider):
     """
     Provider with automatic fallback to alternate providers.
@@ -236,21 +359,48 @@ class FallbackProvider(BaseLLMProvider):
     Attempts queries in order through the fallback chain until
     one succeeds. Useful for high-availability scenarios.
 
+    In latency routing mode, the provider with the lowest moving-average
+    latency among those whose circuit breaker is closed is tried first. If
+    it has not answered by its p95 latency, a hedged duplicate is sent to
+    the next provider and whichever answers first wins; the other request
+    is cancelled. Providers that fail repeatedly are skipped until their
+    cooldown expires.
+
     Example:
         fallback = FallbackProvider([primary, backup1, backup2])
         response = await fallback.query(messages)
         # If primary fails, automatically tries backup1, then backup2
+
+        router = FallbackProvider([primary, backup], routing="latency")
+        response = await router.query(messages)
+        # Goes to whichever provider is currently fastest
     """
 
     def __init__(
         self,
         providers: List[BaseLLMProvider],
+        routing: RoutingMode | str = RoutingMode.SEQUENTIAL,
+        hedge_percentile: float = 95.0,
+        hedge_delay: float = 5.0,
+        max_hedges: int = 1,
+        ewma_alpha: float = 0.2,
+        failure_threshold: int = 3,
+        circuit_cooldown: float = 30.0,
+        min_samples: int = 5,
     ) -> None:
         """
         Initialize fallback provider.
 
         Args:
             providers: List of providers in fallback priority order
+            routing: Routing mode ("sequential" or "latency")
+            hedge_percentile: Latency percentile after which a request is hedged
+            hedge_delay: Hedge deadline (seconds) used until enough samples exist
+            max_hedges: Maximum extra concurrent requests per query
+            ewma_alpha: Smoothing factor for latency and error-rate averages
+            failure_threshold: Consecutive failures that open a provider's circuit
+            circuit_cooldown: Seconds before an open circuit is retried
+            min_samples: Samples required before the percentile deadline is used
 
         Raises:
             ValueError: If providers list is empty
@@ -261,6 +411,17 @@ class FallbackProvider(BaseLLMProvider):
         # Use first provider's config as the "primary" config
         super().__init__(providers[0].config)
         self._providers = providers
+        self._routing = RoutingMode(routing)
+        self._hedge_percentile = hedge_percentile
+        self._hedge_delay = hedge_delay
+        self._max_hedges = max_hedges
+        self._ewma_alpha = ewma_alpha
+        self._failure_threshold = failure_threshold
+        self._circuit_cooldown = circuit_cooldown
+        self._min_samples = min_samples
+        self._health: dict[int, ProviderHealth] = {
+            i: ProviderHealth() for i in range(len(providers))
+        }
 
     async def initialize(self) -> None:
         """Initialize all providers in the fallback chain."""
@@ -296,17 +457,23 @@ class FallbackProvider(BaseLLMProvider):
         Raises:
             LLMError: If all providers fail
         """
+        if self._routing == RoutingMode.LATENCY:
+            return await self._query_routed(messages, tools, **kwargs)
+
         last_error = None
 
         for i, provider in enumerate(self._providers):
+            start = time.monotonic()
             try:
                 response = await provider.query(messages, tools, **kwargs)
+                self._record_success(i, time.monotonic() - start)
                 # Add fallback metadata to response
                 response.extra["fallback_used"] = i > 0
                 response.extra["fallback_provider"] = provider.config.provider.value
                 response.extra["attempted_providers"] = i
                 return response
-            except (ProviderAPIError, ProviderTimeoutError, RateLimitError, ProviderConnectionError) as e:
+            except RETRYABLE_ERRORS as e:
+                self._record_failure(i)
                 last_error = e
                 continue  # Try next provider
             except Exception as e:
@@ -320,6 +487,176 @@ class FallbackProvider(BaseLLMProvider):
             details={"last_error": str(last_error)} if last_error else {},
         )
 
+    def _candidate_order(self) -> list[int]:
+        """
+        Order providers for latency routing.
+
+        Providers with an open circuit are skipped. Providers without
+        latency data sort first (in priority order) so they get sampled.
+        If every circuit is open, all providers are tried in priority order.
+        """
+        available = [
+            i for i in range(len(self._providers))
+            if self._health[i].is_available(self._circuit_cooldown)
+        ]
+        if not available:
+            return list(range(len(self._providers)))
+
+        def score(i: int) -> float:
+            health = self._health[i]
+            if health.ewma_latency is None:
+                return 0.0
+            # Penalize flaky providers: expected cost including a retry
+            return health.ewma_latency * (1 + health.error_rate)
+
+        return sorted(available, key=score)
+
+    def _hedge_deadline(self, index: int) -> float:
+        """Get the time after which a request to a provider is hedged."""
+        health = self._health[index]
+        if len(health.latencies) < self._min_samples:
+            return self._hedge_delay
+        return health.percentile(self._hedge_percentile) or self._hedge_delay
+
+    def _record_success(self, index: int, latency: float) -> None:
+        """Feed a successful request into the router statistics."""
+        self._health[index].record_success(latency, self._ewma_alpha)
+
+    def _record_failure(self, index: int) -> None:
+        """Feed a failed request into the router statistics."""
+        self._health[index].record_failure(self._ewma_alpha, self._failure_threshold)
+
+    async def _timed_query(
+        self,
+        index: int,
+        messages: List[LLMMessage],
+        tools: Optional[List[dict]],
+        kwargs: dict[str, Any],
+    ) -> LLMResponse:
+        """Query one provider and record its latency or failure."""
+        start = time.monotonic()
+        try:
+            response = await self._providers[index].query(messages, tools, **kwargs)
+        except asyncio.CancelledError:
+            raise  # Lost a hedge race; says nothing about provider health
+        except Exception:
+            self._record_failure(index)
+            raise
+        self._record_success(index, time.monotonic() - start)
+        return response
+
+    async def _query_routed(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[dict]] = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Send query to the fastest healthy provider, hedging slow requests."""
+        order = self._candidate_order()
+        pending: dict[asyncio.Task, int] = {}
+        next_candidate = 0
+        hedges = 0
+        last_error: Optional[BaseException] = None
+
+        def launch() -> int:
+            nonlocal next_candidate
+            index = order[next_candidate]
+            next_candidate += 1
+            task = asyncio.ensure_future(self._timed_query(index, messages, tools, kwargs))
+            pending[task] = index
+            return index
+
+        deadline = self._hedge_deadline(launch())
+
+        try:
+            while pending:
+                can_hedge = hedges < self._max_hedges and next_candidate < len(order)
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=deadline if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if not done:
+                    # Deadline passed with no answer: hedge to the next provider
+                    hedges += 1
+                    deadline = self._hedge_deadline(launch())
+                    continue
+
+                for task in done:
+                    index = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        response = task.result()
+                        response.extra["fallback_used"] = index != 0
+                        response.extra["fallback_provider"] = (
+                            self._providers[index].config.provider.value
+                        )
+                        response.extra["attempted_providers"] = next_candidate - 1
+                        response.extra["hedged"] = hedges > 0
+                        return response
+                    if not isinstance(error, RETRYABLE_ERRORS):
+                        raise LLMError(
+                            "Provider failed with a non-retryable error",
+                            provider=self._providers[index].config.provider.value,
+                            details={"last_error": str(error)},
+                        )
+                    last_error = error
+
+                if not pending and next_candidate < len(order):
+                    deadline = self._hedge_deadline(launch())
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise LLMError(
+            f"All {len(self._providers)} providers in fallback chain failed",
+            provider=self.config.provider.value,
+            details={"last_error": str(last_error)} if last_error else {},
+        )
+
+    async def probe(self) -> list[dict[str, Any]]:
+        """
+        Test every provider and feed the results into the router.
+
+        Providers stay initialized: the chain owns them, so probing must
+        not close their clients.
+
+        Returns:
+            List of test_provider results in provider order
+        """
+        results = await asyncio.gather(
+            *(LLMProviderFactory.test_provider(p, keep_open=True) for p in self._providers)
+        )
+        for i, result in enumerate(results):
+            self.record_probe(i, result)
+        return list(results)
+
+    def record_probe(self, index: int, result: dict[str, Any]) -> None:
+        """
+        Feed a test_provider result into the router statistics.
+
+        Args:
+            index: Provider position in the chain
+            result: Result dictionary from LLMProviderFactory.test_provider
+        """
+        if result.get("success"):
+            self._record_success(index, result.get("latency_ms", 0.0) / 1000)
+        else:
+            self._record_failure(index)
+
+    def get_health(self) -> list[dict[str, Any]]:
+        """
+        Get live router statistics for every provider.
+
+        Returns:
+            List of per-provider health dictionaries in provider order
+        """
+        return [
+            {"provider": p.config.provider.value, **self._health[i].to_dict()}
+            for i, p in enumerate(self._providers)
+        ]
+
     async def query_stream(
         self,
         messages: List[LLMMessage],
@@ -375,10 +712,331 @@ class FallbackProvider(BaseLLMProvider):
         """Get info about all providers in fallback chain."""
         return {
             "type": "fallback",
+            "routing": self._routing.value,
             "primary": self._providers[0].config.provider.value,
             "providers": [p.get_provider_info() for p in self._providers],
+            "health": self.get_health(),
         }
 
     def get_providers(self) -> List[BaseLLMProvider]:
         """Get all providers in the fallback chain."""
         return self._providers.copy()
+
+
+def _query_key(
+    messages: List[LLMMessage],
+    tools: Optional[List[dict]],
+    kwargs: dict[str, Any],
+) -> str:
+    """Build a stable fingerprint for a query."""
+    payload = {
+        "messages": [m.to_dict() for m in messages],
+        "tools": tools or [],
+        "kwargs": kwargs,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CoalescingProvider(BaseLLMProvider):
+    """
+    Provider wrapper that coalesces identical in-flight queries.
+
+    When several callers send the same query while an earlier identical
+    query is still running, they all await the same underlying request
+    (single-flight) instead of each hitting the provider.
+
+    Example:
+        provider = CoalescingProvider(LLMProviderFactory.create_provider(config))
+        r1, r2 = await asyncio.gather(
+            provider.query(messages),
+            provider.query(messages),
+        )
+        # Only one request was sent to the underlying provider
+    """
+
+    def __init__(self, provider: BaseLLMProvider) -> None:
+        """
+        Initialize coalescing provider.
+
+        Args:
+            provider: Provider to wrap
+        """
+        super().__init__(provider.config)
+        self._provider = provider
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._stats = {"requests": 0, "coalesced": 0}
+
+    async def initialize(self) -> None:
+        """Initialize the wrapped provider."""
+        if not self._provider.is_initialized():
+            await self._provider.initialize()
+        self._initialized = True
+
+    async def cleanup(self) -> None:
+        """Clean up the wrapped provider."""
+        await self._provider.cleanup()
+
+    async def query(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[dict]] = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """
+        Send query, sharing the result with identical in-flight queries.
+
+        Args:
+            messages: List of conversation messages
+            tools: Optional list of tool definitions
+            **kwargs: Provider-specific options
+
+        Returns:
+            LLMResponse (a private copy per caller)
+        """
+        key = _query_key(messages, tools, kwargs)
+        shared = self._in_flight.get(key)
+        coalesced = shared is not None
+
+        if shared is None:
+            self._stats["requests"] += 1
+            shared = asyncio.ensure_future(self._provider.query(messages, tools, **kwargs))
+            self._in_flight[key] = shared
+            shared.add_done_callback(lambda _f: self._in_flight.pop(key, None))
+        else:
+            self._stats["coalesced"] += 1
+
+        # Shield so one cancelled caller does not cancel the shared request
+        response = await asyncio.shield(shared)
+
+        # Each caller gets its own copy so metadata edits don't leak across callers
+        result = dataclasses.replace(
+            response,
+            usage=dict(response.usage),
+            extra=dict(response.extra),
+        )
+        result.extra["coalesced"] = coalesced
+        return result
+
+    async def query_stream(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[dict]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Stream from the wrapped provider.
+
+        Streams are not coalesced; each caller gets its own stream.
+        """
+        async for chunk in self._provider.query_stream(messages, tools, **kwargs):
+            yield chunk
+
+    def supports_tool_calling(self) -> bool:
+        """Check if wrapped provider supports tool calling."""
+        return self._provider.supports_tool_calling()
+
+    def supports_streaming(self) -> bool:
+        """Check if wrapped provider supports streaming."""
+        return self._provider.supports_streaming()
+
+    def get_provider_info(self) -> dict[str, Any]:
+        """Get info about the wrapped provider."""
+        return {
+            "type": "coalescing",
+            "provider": self._provider.get_provider_info(),
+        }
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dictionary with request, coalesced and in-flight counts
+        """
+        return {**self._stats, "in_flight": len(self._in_flight)}
+
+    @property
+    def provider(self) -> BaseLLMProvider:
+        """Get the wrapped provider."""
+        return self._provider
+
+
+class MicroBatcher:
+    """
+    Packs many small prompts into a single LLM request.
+
+    Intended for short classification-style prompts (e.g. categorizing
+    test failures). Prompts submitted within ``max_wait`` seconds of each
+    other, up to ``max_batch_size``, are sent as one numbered request and
+    the model is asked to reply with a JSON array of answers which is then
+    split back out to the individual callers. If the batched response
+    cannot be parsed, each prompt in the batch is retried on its own.
+
+    Example:
+        batcher = MicroBatcher(provider, system_prompt="Categorize the failure.")
+        categories = await asyncio.gather(
+            *(batcher.submit(error) for error in errors)
+        )
+    """
+
+    BATCH_INSTRUCTIONS = (
+        "Answer each of the {count} numbered items below independently.\n"
+        "Respond with ONLY a JSON array of {count} strings, where element i "
+        "is the answer to item i. Do not include any other text.\n\n"
+    )
+
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        system_prompt: Optional[str] = None,
+        max_batch_size: int = 20,
+        max_wait: float = 0.05,
+        **query_kwargs: Any,
+    ) -> None:
+        """
+        Initialize the micro-batcher.
+
+        Args:
+            provider: Provider used to send batched requests
+            system_prompt: Optional system prompt applied to every item
+            max_batch_size: Maximum prompts per request
+            max_wait: Seconds to wait for more prompts before flushing
+
+        Raises:
+            ValueError: If max_batch_size is less than 1
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self._provider = provider
+        self._system_prompt = system_prompt
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._query_kwargs = query_kwargs
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._stats = {"prompts": 0, "batches": 0, "fallbacks": 0}
+
+    async def submit(self, prompt: str) -> str:
+        """
+        Submit a prompt and wait for its individual answer.
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            Answer text for this prompt
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((prompt, future))
+        self._stats["prompts"] += 1
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._max_wait, self._flush)
+
+        return await future
+
+    async def flush(self) -> None:
+        """Send any pending prompts now and wait for them to complete."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get batching statistics.
+
+        Returns:
+            Dictionary with prompt, batch and fallback counts
+        """
+        return dict(self._stats)
+
+    def _flush(self) -> None:
+        """Detach the pending batch and send it in the background."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        batch = self._pending
+        self._pending = []
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _build_messages(self, prompts: list[str]) -> list[LLMMessage]:
+        """Build the messages for a batched request."""
+        messages = []
+        if self._system_prompt:
+            messages.append(LLMMessage.system(self._system_prompt))
+
+        body = self.BATCH_INSTRUCTIONS.format(count=len(prompts))
+        body += "\n\n".join(f"[{i + 1}] {prompt}" for i, prompt in enumerate(prompts))
+        messages.append(LLMMessage.user(body))
+        return messages
+
+    @staticmethod
+    def _parse_answers(content: str, expected: int) -> Optional[list[str]]:
+        """Extract a JSON array of ``expected`` answers from the response."""
+        match = re.search(r"\[.*\]", content, re.DOTALL)
+        if not match:
+            return None
+        try:
+            answers = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(answers, list) or len(answers) != expected:
+            return None
+        return [a if isinstance(a, str) else json.dumps(a) for a in answers]
+
+    async def _query_single(self, prompt: str) -> str:
+        """Send one prompt on its own."""
+        messages = []
+        if self._system_prompt:
+            messages.append(LLMMessage.system(self._system_prompt))
+        messages.append(LLMMessage.user(prompt))
+        response = await self._provider.query(messages, **self._query_kwargs)
+        return response.content
+
+    async def _run_batch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        """Send a batch and resolve every caller's future."""
+        prompts = [prompt for prompt, _ in batch]
+        try:
+            if len(prompts) == 1:
+                answers: Optional[list[str]] = [await self._query_single(prompts[0])]
+            else:
+                self._stats["batches"] += 1
+                response = await self._provider.query(
+                    self._build_messages(prompts), **self._query_kwargs
+                )
+                answers = self._parse_answers(response.content, len(prompts))
+
+            if answers is None:
+                # Model did not honour the batch format; answer items one by one
+                self._stats["fallbacks"] += 1
+                results = await asyncio.gather(
+                    *(self._query_single(p) for p in prompts), return_exceptions=True
+                )
+                for (_, future), result in zip(batch, results):
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+                return
+
+            for (_, future), answer in zip(batch, answers):
+                if not future.done():
+                    future.set_result(answer)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
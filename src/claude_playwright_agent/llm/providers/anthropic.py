@@ -165,26 +165,122 @@ class AnthropicProvider(BaseLLMProvider):
         """
         Send a streaming query to Claude.
 
+        Uses the SDK's partial message events so text deltas are yielded
+        as soon as the model produces them.
+
         Args:
             messages: List of conversation messages
-            tools: Optional list of tool definitions
-            **kwargs: Additional options
+            tools: Tool definitions (not supported when streaming)
+            **kwargs: ClaudeAgentOptions fields (model, max_turns,
+                max_thinking_tokens, ...) applied to this request
 
         Yields:
             StreamChunk objects as they arrive
 
-        TODO: Implement streaming using ClaudeSDKClient
+        Raises:
+            ValueError: If tools or unsupported options are given
+            ProviderAPIError: If the API returns an error
+            ProviderTimeoutError: If the request times out
+        """
+        if tools:
+            raise ValueError("AnthropicProvider.query_stream does not support tool definitions")
+
+        from dataclasses import fields
+
+        from claude_agent_sdk import ClaudeAgentOptions
+
+        supported = {f.name for f in fields(ClaudeAgentOptions)}
+        unsupported = sorted(set(kwargs) - supported)
+        if unsupported:
+            raise ValueError(
+                f"Unsupported streaming options for {self.config.provider.value}: "
+                f"{', '.join(unsupported)}"
+            )
+
+        system_prompt, prompt = self._split_messages(messages)
+
+        try:
+            async for chunk in self._stream_claude_request(system_prompt, prompt, kwargs):
+                yield chunk
+        except asyncio.TimeoutError as e:
+            raise ProviderTimeoutError(
+                f"Request to {self.config.provider} timed out",
+                provider=self.config.provider.value,
+                timeout=self.config.timeout,
+            ) from e
+        except Exception as e:
+            raise ProviderAPIError(
+                f"Streaming error from {self.config.provider}: {str(e)}",
+                provider=self.config.provider.value,
+            ) from e
+
+    def _split_messages(self, messages: List[LLMMessage]) -> tuple[str, str]:
         """
-        response = await self.query(messages, tools, **kwargs)
-
-        # Yield the full response as a single chunk for now
-        # In production, we'd stream actual chunks
-        yield StreamChunk(
-            content=response.content,
-            delta=response.content,
-            finish_reason=response.finish_reason,
+        Split messages into a system prompt and a single prompt string.
+
+        The SDK takes one prompt per query, so earlier turns are folded
+        into the prompt as a transcript.
+        """
+        system_prompt = ""
+        turns = []
+
+        for msg in messages:
+            if msg.role == "system":
+                system_prompt = msg.content
+            else:
+                turns.append(msg)
+
+        if len(turns) == 1:
+            return system_prompt, turns[0].content
+
+        prompt = "\n\n".join(f"{msg.role.capitalize()}: {msg.content}" for msg in turns)
+        return system_prompt, prompt
+
+    async def _stream_claude_request(
+        self,
+        system_prompt: str,
+        prompt: str,
+        overrides: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a request through ClaudeSDKClient partial message events."""
+        from claude_agent_sdk import (
+            ClaudeAgentOptions,
+            ClaudeSDKClient,
+            ResultMessage,
+            StreamEvent,
         )
 
+        settings: dict[str, Any] = {
+            "system_prompt": system_prompt,
+            "model": self.config.model,
+            "max_turns": 1,
+            **(overrides or {}),
+            "include_partial_messages": True,
+        }
+        options = ClaudeAgentOptions(**settings)
+
+        async with ClaudeSDKClient(options=options) as client:
+            await client.query(prompt)
+
+            async for message in client.receive_response():
+                if isinstance(message, StreamEvent):
+                    text = _text_delta(message.event)
+                    if text:
+                        yield StreamChunk(content=text, delta=text)
+                elif isinstance(message, ResultMessage):
+                    usage = message.usage or {}
+                    yield StreamChunk(
+                        content="",
+                        delta="",
+                        finish_reason=getattr(message, "stop_reason", None) or "stop",
+                        extra={
+                            "usage": {
+                                "prompt_tokens": usage.get("input_tokens", 0),
+                                "completion_tokens": usage.get("output_tokens", 0),
+                            },
+                        },
+                    )
+
     def supports_tool_calling(self) -> bool:
         """Check if Claude supports tool calling (yes, it does)."""
         return True
@@ -207,3 +303,13 @@ class AnthropicProvider(BaseLLMProvider):
             "max_tokens": 200000,
             "website": "https://www.anthropic.com",
         }
+
+
+def _text_delta(event: dict[str, Any]) -> str:
+    """Extract the text delta from a raw Anthropic stream event, if any."""
+    if event.get("type") != "content_block_delta":
+        return ""
+    delta = event.get("delta", {})
+    if delta.get("type") != "text_delta":
+        return ""
+    return delta.get("text", "")
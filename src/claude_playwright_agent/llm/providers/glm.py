@@ -7,13 +7,53 @@ GLM-4.7 uses the new endpoint: https://api.z.ai/api/paas/v4/
 
 import asyncio
 import json
+import threading
 from typing import Any, AsyncIterator, List, Optional
 
+from ...transport import TransportConfig, create_client
 from ..base import BaseLLMProvider, LLMConfig, LLMMessage, LLMProviderType, StreamChunk
 from ..exceptions import ProviderAPIError, ProviderTimeoutError, RateLimitError
 from ..models.config import GLMConfig
 
 
+_STREAM_END = object()
+
+
+async def _iterate_in_thread(iterable: Any) -> AsyncIterator[Any]:
+    """
+    Iterate a blocking iterator in a worker thread.
+
+    Items are handed to the event loop through a queue as soon as they are
+    produced, so other tasks keep running while the stream is open.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stopped = threading.Event()
+
+    def drain() -> None:
+        try:
+            for item in iterable:
+                if stopped.is_set():
+                    break  # Consumer went away
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+
+    loop.run_in_executor(None, drain)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+
+
 class GLMProvider(BaseLLMProvider):
     """
     Zhipu AI/GLM provider implementation.
@@ -75,6 +115,7 @@ class GLMProvider(BaseLLMProvider):
         self._openai_client = AsyncOpenAI(
             api_key=self.config.api_key,
             base_url=self.config.base_url,
+            http_client=create_client(TransportConfig(timeout=float(self.config.timeout))),
         )
 
     async def _init_zhipu_client(self) -> None:
@@ -93,6 +134,9 @@ class GLMProvider(BaseLLMProvider):
 
     async def cleanup(self) -> None:
         """Clean up the client."""
+        if self._openai_client:
+            # Closes this client only; the shared connection pool stays open
+            await self._openai_client.close()
         self._openai_client = None
         self._zhipu_client = None
         self._initialized = False
@@ -300,7 +344,8 @@ class GLMProvider(BaseLLMProvider):
                 **request_params,
             )
 
-            for chunk in response:
+            # The zhipuai iterator blocks on the network, so drain it off the event loop
+            async for chunk in _iterate_in_thread(response):
                 if hasattr(chunk, "choices") and chunk.choices:
                     choice = chunk.choices[0]
                     if hasattr(choice, "delta") and hasattr(choice.delta, "content"):
@@ -7,6 +7,7 @@ Uses the openai package to provide GPT-4 and other OpenAI models.
 import asyncio
 from typing import Any, AsyncIterator, List, Optional
 
+from ...transport import TransportConfig, create_client
 from ..base import BaseLLMProvider, LLMConfig, LLMMessage, LLMProviderType, StreamChunk
 from ..exceptions import ProviderAPIError, ProviderTimeoutError, RateLimitError, TokenLimitError
 from ..models.config import OpenAIConfig
@@ -42,7 +43,8 @@ class OpenAIProvider(BaseLLMProvider):
         """
         Initialize the OpenAI client.
 
-        Creates an openai.AsyncOpenAI client instance.
+        Creates an openai.AsyncOpenAI client instance on the shared HTTP
+        connection pool.
         """
         try:
             import openai
@@ -55,6 +57,7 @@ class OpenAIProvider(BaseLLMProvider):
         client_kwargs = {
             "api_key": self.config.api_key,
             "timeout": self.config.timeout,
+            "http_client": create_client(TransportConfig(timeout=float(self.config.timeout))),
         }
 
         if self.config.base_url:
@@ -198,11 +201,14 @@ class OpenAIProvider(BaseLLMProvider):
             )
 
             async for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
+                if not chunk.choices:
+                    continue  # Usage-only chunks carry no choices
+
+                if chunk.choices[0].delta.content:
                     yield StreamChunk(
                         content=chunk.choices[0].delta.content,
                         delta=chunk.choices[0].delta.content,
-                        finish_reason=chunk.choices[0].finish_reason,
+                        finish_reason=None,
                     )
 
                 if chunk.choices[0].finish_reason:
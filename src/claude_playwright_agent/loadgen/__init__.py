@@ -0,0 +1,34 @@
+"""
+Load generation for Claude Playwright Agent.
+
+This package provides:
+- Open-loop arrival scheduling (constant, ramp, Poisson) and a
+  saturating closed-loop mode
+- Worker processes with merged HDR latency histograms
+- Coordinated-omission corrected latency and live percentile reports
+- HTTP and browser page load targets
+"""
+
+from claude_playwright_agent.loadgen.engine import (
+    LoadGenerator,
+    LoadReport,
+    LoadTarget,
+    LoadTestConfig,
+    LoadTestSummary,
+)
+from claude_playwright_agent.loadgen.histogram import LatencyHistogram
+from claude_playwright_agent.loadgen.schedule import ArrivalPattern, ArrivalSchedule
+from claude_playwright_agent.loadgen.targets import BrowserTarget, HttpTarget
+
+__all__ = [
+    "ArrivalPattern",
+    "ArrivalSchedule",
+    "BrowserTarget",
+    "HttpTarget",
+    "LatencyHistogram",
+    "LoadGenerator",
+    "LoadReport",
+    "LoadTarget",
+    "LoadTestConfig",
+    "LoadTestSummary",
+]
@@ -0,0 +1,535 @@
+"""
+Open-loop load generation engine.
+
+Requests are started on an arrival schedule rather than when earlier
+requests complete, so a slow system under test cannot slow the load
+down. Latency is measured from each request's *intended* start time:
+a request that could not start on time (because the worker was busy or
+at its in-flight limit) is charged for the wait, which corrects for
+coordinated omission. The time from actual send to completion is
+recorded separately as service time.
+
+With more than one worker, each worker is a separate process with its
+own event loop and connection pool, taking an equal share of the
+arrival rate. Workers stream interval histograms to the parent, which
+merges them and reports live percentiles.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import queue as queue_module
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Protocol
+
+from claude_playwright_agent.loadgen.histogram import LatencyHistogram
+from claude_playwright_agent.loadgen.schedule import ArrivalSchedule
+
+logger = logging.getLogger(__name__)
+
+# A request starting later than this after its intended time counts as late
+LATE_START_SECONDS = 0.01
+
+# Reported latency percentiles
+PERCENTILES = (50, 90, 95, 99, 99.9)
+
+
+class LoadTarget(Protocol):
+    """A picklable request target (see loadgen.targets)."""
+
+    async def setup(self, max_in_flight: int) -> None: ...
+
+    async def send(self) -> int: ...
+
+    async def teardown(self) -> None: ...
+
+
+# =============================================================================
+# Configuration and Results
+# =============================================================================
+
+
+@dataclass
+class LoadTestConfig:
+    """
+    Load test configuration.
+
+    Attributes:
+        schedule: Arrival schedule
+        workers: Worker processes (1 runs in the current event loop)
+        max_in_flight: Maximum concurrent requests per worker
+        report_interval: Seconds between live reports
+        drain_timeout: Seconds to wait for in-flight requests after the
+            schedule ends (remaining requests fail)
+        significant_figures: Histogram precision
+    """
+
+    schedule: ArrivalSchedule = field(default_factory=ArrivalSchedule)
+    workers: int = 1
+    max_in_flight: int = 100
+    report_interval: float = 1.0
+    drain_timeout: float = 30.0
+    significant_figures: int = 3
+
+
+def _latency_ms(hist: LatencyHistogram) -> dict[str, float]:
+    """Summarize a microsecond histogram in milliseconds."""
+    summary = {
+        "min": hist.min / 1000,
+        "mean": round(hist.mean / 1000, 3),
+        "max": hist.max / 1000,
+    }
+    for name, value in hist.percentiles(PERCENTILES).items():
+        summary[name] = value / 1000
+    return summary
+
+
+@dataclass
+class LoadReport:
+    """
+    Live progress of a running load test.
+
+    Attributes:
+        elapsed_seconds: Time since the test started
+        sent: Requests started
+        completed: Requests finished
+        failed: Requests failed
+        current_rate: Completions per second over the last interval
+        latency_ms: Percentiles of latency so far (coordinated-omission
+            corrected)
+    """
+
+    elapsed_seconds: float
+    sent: int
+    completed: int
+    failed: int
+    current_rate: float
+    latency_ms: dict[str, float]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "sent": self.sent,
+            "completed": self.completed,
+            "failed": self.failed,
+            "current_rate": round(self.current_rate, 2),
+            "latency_ms": self.latency_ms,
+        }
+
+
+@dataclass
+class LoadTestSummary:
+    """
+    Final load test results.
+
+    Attributes:
+        duration_seconds: Wall time of the test
+        workers: Worker processes used
+        target_rate: Scheduled average rate (None when saturating)
+        sent: Requests started
+        successful: Requests with a status below 400
+        failed: Failed requests
+        late_starts: Requests started late (worker busy or at its limit)
+        status_codes: Count per HTTP status (0: no response)
+        errors: Sample of error messages
+        latency: Latency from intended start (microseconds)
+        service_time: Latency from actual send (microseconds)
+    """
+
+    duration_seconds: float
+    workers: int
+    target_rate: Optional[float]
+    sent: int = 0
+    successful: int = 0
+    failed: int = 0
+    late_starts: int = 0
+    status_codes: dict[int, int] = field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    service_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def completed(self) -> int:
+        """Requests finished (successfully or not)."""
+        return self.successful + self.failed
+
+    @property
+    def requests_per_second(self) -> float:
+        """Achieved completion rate."""
+        return self.completed / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Failed requests in percent."""
+        return self.failed / self.completed * 100 if self.completed else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "duration_seconds": round(self.duration_seconds, 2),
+            "workers": self.workers,
+            "target_rate": self.target_rate,
+            "requests_per_second": round(self.requests_per_second, 2),
+            "sent": self.sent,
+            "completed": self.completed,
+            "successful": self.successful,
+            "failed": self.failed,
+            "error_rate": round(self.error_rate, 2),
+            "late_starts": self.late_starts,
+            "status_codes": dict(self.status_codes),
+            "latency_ms": _latency_ms(self.latency),
+            "service_time_ms": _latency_ms(self.service_time),
+            "errors": self.errors,
+        }
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+
+class _Worker:
+    """Runs one worker's share of the schedule in the current event loop."""
+
+    def __init__(
+        self,
+        target: LoadTarget,
+        config: LoadTestConfig,
+        index: int,
+        emit: Callable[[dict[str, Any]], None],
+    ) -> None:
+        self.target = target
+        self.config = config
+        self.index = index
+        self.emit = emit
+        figures = config.significant_figures
+        # Interval histograms, shipped and reset on every report
+        self.latency = LatencyHistogram(figures)
+        self.service = LatencyHistogram(figures)
+        self.sent = 0
+        self.successful = 0
+        self.failed = 0
+        self.late_starts = 0
+        self.status_codes: dict[int, int] = {}
+        self.errors: list[str] = []
+        self._slots = asyncio.Semaphore(config.max_in_flight)
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def run(self, wait_for_start: Optional[Callable[[], Any]] = None) -> None:
+        """Set up the target, run the schedule and drain."""
+        await self.target.setup(self.config.max_in_flight)
+        reporter = None
+        try:
+            if wait_for_start is not None:
+                self.emit({"type": "ready", "worker": self.index})
+                await asyncio.get_running_loop().run_in_executor(None, wait_for_start)
+            reporter = asyncio.create_task(self._report_loop())
+            await self._schedule()
+            await self._drain()
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+            await self.target.teardown()
+            self.emit(self._message("done"))
+
+    async def _schedule(self) -> None:
+        """Start requests at their intended times."""
+        loop = asyncio.get_running_loop()
+        schedule = self.config.schedule
+        duration = schedule.duration_seconds
+        start = loop.time()
+
+        for offset in schedule.offsets(self.index, self.config.workers):
+            if offset is None:
+                # Saturating: start as soon as a slot is free
+                if duration is not None and loop.time() - start >= duration:
+                    break
+                await self._slots.acquire()
+                intended = loop.time()
+            else:
+                intended = start + offset
+                delay = intended - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await self._slots.acquire()
+
+            self.sent += 1
+            task = asyncio.create_task(self._send(intended))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, intended: float) -> None:
+        """Send one request and record its latency."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        if started - intended > LATE_START_SECONDS:
+            self.late_starts += 1
+        try:
+            status = await self.target.send()
+        except Exception as e:
+            status = 0
+            if len(self.errors) < 10:
+                self.errors.append(f"{type(e).__name__}: {e}")
+        finally:
+            self._slots.release()
+
+        finished = loop.time()
+        self.latency.record((finished - intended) * 1_000_000)
+        self.service.record((finished - started) * 1_000_000)
+        self.status_codes[status] = self.status_codes.get(status, 0) + 1
+        if 0 < status < 400:
+            self.successful += 1
+        else:
+            self.failed += 1
+
+    async def _drain(self) -> None:
+        """Wait for in-flight requests, failing those that time out."""
+        if not self._in_flight:
+            return
+        done, pending = await asyncio.wait(set(self._in_flight), timeout=self.config.drain_timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            self.failed += len(pending)
+            self.errors.append(f"{len(pending)} request(s) still in flight after drain timeout")
+
+    async def _report_loop(self) -> None:
+        """Ship interval histograms and counters."""
+        while True:
+            await asyncio.sleep(self.config.report_interval)
+            self.emit(self._message("progress"))
+
+    def _message(self, kind: str) -> dict[str, Any]:
+        """Build a progress message and reset the interval histograms."""
+        message = {
+            "type": kind,
+            "worker": self.index,
+            "sent": self.sent,
+            "successful": self.successful,
+            "failed": self.failed,
+            "late_starts": self.late_starts,
+            "status_codes": dict(self.status_codes),
+            "errors": list(self.errors),
+            "latency": self.latency.to_dict(),
+            "service": self.service.to_dict(),
+        }
+        self.latency.reset()
+        self.service.reset()
+        return message
+
+
+def _worker_main(
+    target: LoadTarget,
+    config: LoadTestConfig,
+    index: int,
+    messages: Any,
+    start_event: Any,
+) -> None:
+    """Entry point of a worker process."""
+    worker = _Worker(target, config, index, messages.put)
+    asyncio.run(worker.run(start_event.wait))
+
+
+# =============================================================================
+# Load Generator
+# =============================================================================
+
+
+class LoadGenerator:
+    """
+    Open-loop load generator.
+
+    Example:
+        >>> schedule = ArrivalSchedule(ArrivalPattern.POISSON, rate=200, duration_seconds=30)
+        >>> generator = LoadGenerator(HttpTarget("http://localhost:8000/health"),
+        ...                           LoadTestConfig(schedule, workers=4))
+        >>> summary = await generator.run()
+        >>> summary.to_dict()["latency_ms"]["p99"]
+    """
+
+    def __init__(
+        self,
+        target: LoadTarget,
+        config: Optional[LoadTestConfig] = None,
+        on_progress: Optional[Callable[[LoadReport], None]] = None,
+    ) -> None:
+        """
+        Initialize the generator.
+
+        Args:
+            target: Request target (picklable when workers > 1)
+            config: Load test configuration
+            on_progress: Called with a live report every report_interval
+        """
+        self.target = target
+        self.config = config or LoadTestConfig()
+        self.on_progress = on_progress
+        figures = self.config.significant_figures
+        self.latency = LatencyHistogram(figures)
+        self.service_time = LatencyHistogram(figures)
+        # worker -> latest cumulative counters
+        self._counters: dict[int, dict[str, Any]] = {}
+        self._done: set[int] = set()
+        self._started = 0.0
+        self._last_completed = 0
+
+    # =========================================================================
+    # Aggregation
+    # =========================================================================
+
+    def _receive(self, message: dict[str, Any]) -> None:
+        """Merge a worker message."""
+        if message["type"] == "ready":
+            return
+        self.latency.merge(LatencyHistogram.from_dict(message["latency"]))
+        self.service_time.merge(LatencyHistogram.from_dict(message["service"]))
+        self._counters[message["worker"]] = message
+        if message["type"] == "done":
+            self._done.add(message["worker"])
+
+    def _total(self, key: str) -> int:
+        """Sum a counter over workers."""
+        return sum(counters[key] for counters in self._counters.values())
+
+    def report(self) -> LoadReport:
+        """
+        Get live progress.
+
+        Returns:
+            Report with counts and latency percentiles so far
+        """
+        completed = self._total("successful") + self._total("failed")
+        interval = self.config.report_interval
+        rate = (completed - self._last_completed) / interval if interval > 0 else 0.0
+        self._last_completed = completed
+        return LoadReport(
+            elapsed_seconds=time.monotonic() - self._started,
+            sent=self._total("sent"),
+            completed=completed,
+            failed=self._total("failed"),
+            current_rate=rate,
+            latency_ms=_latency_ms(self.latency),
+        )
+
+    async def _report_loop(self) -> None:
+        """Emit live reports."""
+        while True:
+            await asyncio.sleep(self.config.report_interval)
+            report = self.report()
+            if self.on_progress is not None:
+                self.on_progress(report)
+            else:
+                latency = report.latency_ms
+                logger.info(
+                    f"Load: {report.completed}/{report.sent} done, "
+                    f"{report.current_rate:.1f} req/s, p50={latency['p50']}ms "
+                    f"p99={latency['p99']}ms max={latency['max']}ms"
+                )
+
+    # =========================================================================
+    # Execution
+    # =========================================================================
+
+    async def run(self) -> LoadTestSummary:
+        """
+        Run the load test.
+
+        Returns:
+            Merged results of all workers
+        """
+        self._started = time.monotonic()
+        reporter = asyncio.create_task(self._report_loop())
+        errors: list[str] = []
+        try:
+            if self.config.workers <= 1:
+                await _Worker(self.target, self.config, 0, self._receive).run(self._start_clock)
+            else:
+                errors = await self._run_processes()
+        finally:
+            reporter.cancel()
+        duration = time.monotonic() - self._started
+
+        summary = LoadTestSummary(
+            duration_seconds=duration,
+            workers=max(self.config.workers, 1),
+            target_rate=self.config.schedule.target_rate,
+            sent=self._total("sent"),
+            successful=self._total("successful"),
+            failed=self._total("failed"),
+            late_starts=self._total("late_starts"),
+            latency=self.latency,
+            service_time=self.service_time,
+        )
+        for counters in self._counters.values():
+            for status, count in counters["status_codes"].items():
+                summary.status_codes[status] = summary.status_codes.get(status, 0) + count
+            summary.errors.extend(counters["errors"])
+        summary.errors = (errors + summary.errors)[:10]
+        return summary
+
+    def _start_clock(self) -> None:
+        """Measure the run from when the target is set up, not before."""
+        self._started = time.monotonic()
+
+    async def _run_processes(self) -> list[str]:
+        """Run workers as processes and pump their messages."""
+        loop = asyncio.get_running_loop()
+        # Spawned workers do not inherit the parent's event loop or threads
+        context = multiprocessing.get_context("spawn")
+        messages = context.Queue()
+        start_event = context.Event()
+        processes = [
+            context.Process(
+                target=_worker_main,
+                args=(self.target, self.config, index, messages, start_event),
+                daemon=True,
+            )
+            for index in range(self.config.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        def get_message() -> Optional[dict[str, Any]]:
+            try:
+                return messages.get(timeout=0.2)
+            except queue_module.Empty:
+                return None
+
+        errors: list[str] = []
+        ready: set[int] = set()
+        try:
+            while len(self._done) < len(processes):
+                message = await loop.run_in_executor(None, get_message)
+                if message is not None:
+                    if message["type"] == "ready":
+                        ready.add(message["worker"])
+                        if len(ready) == len(processes):
+                            # Start every worker's schedule together
+                            self._start_clock()
+                            start_event.set()
+                    self._receive(message)
+                    continue
+
+                dead = [
+                    index for index, process in enumerate(processes)
+                    if index not in self._done and not process.is_alive()
+                ]
+                if dead:
+                    # Its last messages may have arrived after the timeout
+                    while (message := get_message()) is not None:
+                        self._receive(message)
+                    for index in dead:
+                        if index not in self._done:
+                            errors.append(f"Worker {index} exited with code {processes[index].exitcode}")
+                            self._done.add(index)
+                            start_event.set()
+        finally:
+            start_event.set()
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+        return errors
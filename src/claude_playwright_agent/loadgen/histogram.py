@@ -0,0 +1,227 @@
+"""
+HDR latency histogram.
+
+A high dynamic range histogram records values with a fixed number of
+significant digits over any range using log-linear buckets: values below
+``sub_bucket_count`` are recorded exactly, and every power of two above
+that is split into ``sub_bucket_count / 2`` equal buckets. Recording is
+O(1), memory depends on the number of distinct buckets hit, and
+histograms from different workers merge by adding bucket counts.
+
+Values are integers in a caller-chosen unit (the load generator records
+microseconds).
+"""
+
+import math
+from typing import Any, Iterator
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram with a fixed relative precision.
+
+    Example:
+        >>> hist = LatencyHistogram()
+        >>> hist.record(1500)
+        >>> hist.value_at_percentile(99)
+        1500
+    """
+
+    def __init__(self, significant_figures: int = 3) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            significant_figures: Decimal digits of precision (1-5)
+        """
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+        self.significant_figures = significant_figures
+        # Smallest power of two with 2 * 10**figures distinct values
+        self._sub_bits = math.ceil(math.log2(2 * 10 ** significant_figures))
+        self._sub_count = 1 << self._sub_bits
+        self._half = self._sub_count >> 1
+        self.counts: dict[int, int] = {}
+        self.total_count = 0
+        self.min = 0
+        self.max = 0
+        self._sum = 0
+
+    # =========================================================================
+    # Bucket Mapping
+    # =========================================================================
+
+    def _index(self, value: int) -> int:
+        """Get the bucket index of a value."""
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self._sub_bits
+        return self._sub_count + (shift - 1) * self._half + (value >> shift) - self._half
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        """Get the lowest and highest value of a bucket."""
+        if index < self._sub_count:
+            return index, index
+        shift = (index - self._sub_count) // self._half + 1
+        lowest = ((index - self._sub_count) % self._half + self._half) << shift
+        return lowest, lowest + (1 << shift) - 1
+
+    # =========================================================================
+    # Recording
+    # =========================================================================
+
+    def record(self, value: int | float, count: int = 1) -> None:
+        """
+        Record a value.
+
+        Args:
+            value: Value (negative values are recorded as 0)
+            count: Number of occurrences
+        """
+        value = max(int(value), 0)
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        if not self.total_count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.total_count += count
+        self._sum += value * count
+
+    def record_corrected(self, value: int | float, expected_interval: int | float) -> None:
+        """
+        Record a value, correcting for coordinated omission.
+
+        For a closed-loop caller that issues a request every
+        ``expected_interval``, a response taking longer than the interval
+        hides the requests that should have been sent meanwhile. Those
+        are back-filled with the latencies they would have seen
+        (``value - interval``, ``value - 2 * interval``, ...).
+
+        Args:
+            value: Observed value
+            expected_interval: Expected interval between requests
+        """
+        self.record(value)
+        if expected_interval <= 0:
+            return
+        missing = value - expected_interval
+        while missing >= expected_interval:
+            self.record(missing)
+            missing -= expected_interval
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add another histogram's counts to this one.
+
+        Args:
+            other: Histogram with the same precision
+        """
+        if other.significant_figures != self.significant_figures:
+            raise ValueError("Cannot merge histograms with different precision")
+        if not other.total_count:
+            return
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.min = min(self.min, other.min) if self.total_count else other.min
+        self.max = max(self.max, other.max)
+        self.total_count += other.total_count
+        self._sum += other._sum
+
+    def reset(self) -> None:
+        """Clear all recorded values."""
+        self.counts.clear()
+        self.total_count = 0
+        self.min = 0
+        self.max = 0
+        self._sum = 0
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    @property
+    def mean(self) -> float:
+        """Mean of recorded values."""
+        return self._sum / self.total_count if self.total_count else 0.0
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """
+        Get the value at a percentile.
+
+        Returns the highest value equivalent to the bucket holding the
+        percentile (capped at the recorded maximum), so results are
+        never optimistic by more than the histogram's precision.
+
+        Args:
+            percentile: Percentile (0-100)
+
+        Returns:
+            Value at the percentile (0 if empty)
+        """
+        if not self.total_count:
+            return 0
+        target = max(1, math.ceil(self.total_count * min(max(percentile, 0), 100) / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._bounds(index)[1], self.max)
+        return self.max
+
+    def percentiles(self, percentiles: tuple[float, ...] = (50, 90, 99, 99.9)) -> dict[str, int]:
+        """
+        Get several percentiles in one pass.
+
+        Args:
+            percentiles: Percentiles to compute
+
+        Returns:
+            Mapping like {"p50": ..., "p99.9": ...}
+        """
+        result: dict[str, int] = {}
+        if not self.total_count:
+            return {f"p{p:g}": 0 for p in percentiles}
+        wanted = sorted(percentiles)
+        targets = [max(1, math.ceil(self.total_count * p / 100)) for p in wanted]
+        seen = 0
+        position = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            while position < len(wanted) and seen >= targets[position]:
+                result[f"p{wanted[position]:g}"] = min(self._bounds(index)[1], self.max)
+                position += 1
+            if position == len(wanted):
+                break
+        return result
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Iterate over (bucket highest value, count) in value order."""
+        for index in sorted(self.counts):
+            yield self._bounds(index)[1], self.counts[index]
+
+    # =========================================================================
+    # Serialization
+    # =========================================================================
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON/pickle friendly dictionary (sparse counts)."""
+        return {
+            "significant_figures": self.significant_figures,
+            "counts": dict(self.counts),
+            "total_count": self.total_count,
+            "min": self.min,
+            "max": self.max,
+            "sum": self._sum,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LatencyHistogram":
+        """Create a histogram from to_dict() output."""
+        hist = cls(data["significant_figures"])
+        hist.counts = {int(k): v for k, v in data["counts"].items()}
+        hist.total_count = data["total_count"]
+        hist.min = data["min"]
+        hist.max = data["max"]
+        hist._sum = data["sum"]
+        return hist
@@ -0,0 +1,136 @@
+"""
+Open-loop arrival schedules.
+
+A schedule fixes when each request should start, independently of how
+long earlier requests take. Each worker process gets an equal share of
+the arrival rate, phase-shifted so that the combined arrivals are evenly
+spread.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Iterator, Optional
+
+
+class ArrivalPattern(str, Enum):
+    """Request arrival patterns."""
+
+    CONSTANT = "constant"  # Fixed rate
+    RAMP = "ramp"  # Rate changes linearly from rate to end_rate
+    POISSON = "poisson"  # Exponential inter-arrival times at rate
+    SATURATE = "saturate"  # Closed loop: next request as soon as a slot is free
+
+
+@dataclass
+class ArrivalSchedule:
+    """
+    Arrival schedule of a load test.
+
+    Attributes:
+        pattern: Arrival pattern
+        rate: Requests per second (start rate for ramps)
+        end_rate: Requests per second at the end of a ramp
+        duration_seconds: Schedule length (None: until max_requests)
+        max_requests: Maximum number of requests (None: until duration)
+        seed: Seed for Poisson arrivals
+    """
+
+    pattern: ArrivalPattern = ArrivalPattern.CONSTANT
+    rate: float = 10.0
+    end_rate: Optional[float] = None
+    duration_seconds: Optional[float] = 10.0
+    max_requests: Optional[int] = None
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if isinstance(self.pattern, str):
+            self.pattern = ArrivalPattern(self.pattern)
+        if self.duration_seconds is None and self.max_requests is None:
+            raise ValueError("A schedule needs duration_seconds or max_requests")
+        if self.pattern != ArrivalPattern.SATURATE and self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.pattern == ArrivalPattern.RAMP and self.duration_seconds is None:
+            raise ValueError("A ramp needs duration_seconds")
+
+    @property
+    def target_rate(self) -> Optional[float]:
+        """Average scheduled rate (None when saturating)."""
+        if self.pattern == ArrivalPattern.SATURATE:
+            return None
+        if self.pattern == ArrivalPattern.RAMP:
+            return (self.rate + (self.end_rate if self.end_rate is not None else self.rate)) / 2
+        return self.rate
+
+    def worker_requests(self, worker: int, workers: int) -> Optional[int]:
+        """Get a worker's share of max_requests."""
+        if self.max_requests is None:
+            return None
+        share, remainder = divmod(self.max_requests, workers)
+        return share + (1 if worker < remainder else 0)
+
+    def offsets(self, worker: int = 0, workers: int = 1) -> Iterator[Optional[float]]:
+        """
+        Generate a worker's intended start offsets.
+
+        Args:
+            worker: Worker index
+            workers: Number of workers
+
+        Yields:
+            Seconds from the start of the test, or None for saturating
+            schedules (start when a slot is free)
+        """
+        limit = self.worker_requests(worker, workers)
+        count = 0
+        for offset in self._offsets(worker, workers):
+            if limit is not None and count >= limit:
+                return
+            if offset is not None and self.duration_seconds is not None and offset >= self.duration_seconds:
+                return
+            count += 1
+            yield offset
+
+    def _offsets(self, worker: int, workers: int) -> Iterator[Optional[float]]:
+        """Unbounded offsets of a worker."""
+        if self.pattern == ArrivalPattern.SATURATE:
+            while True:
+                yield None
+
+        if self.pattern == ArrivalPattern.POISSON:
+            rng = random.Random(None if self.seed is None else self.seed * 1_000_003 + worker)
+            rate = self.rate / workers
+            t = 0.0
+            while True:
+                t += rng.expovariate(rate)
+                yield t
+
+        # Arrival n (global) is due when the integrated rate reaches n;
+        # worker k takes arrivals k, k + workers, ...
+        start = self.rate
+        end = self.end_rate if self.pattern == ArrivalPattern.RAMP and self.end_rate is not None else start
+        slope = (end - start) / self.duration_seconds if self.duration_seconds else 0.0
+        n = worker
+        while True:
+            if slope == 0:
+                t = n / start
+            else:
+                # start * t + slope * t^2 / 2 = n
+                discriminant = start * start + 2 * slope * n
+                if discriminant < 0:
+                    return
+                t = (math.sqrt(discriminant) - start) / slope
+            yield t
+            n += workers
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "pattern": self.pattern.value,
+            "rate": self.rate,
+            "end_rate": self.end_rate,
+            "duration_seconds": self.duration_seconds,
+            "max_requests": self.max_requests,
+            "seed": self.seed,
+        }
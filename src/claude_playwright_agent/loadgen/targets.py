@@ -0,0 +1,151 @@
+"""
+Load test targets.
+
+A target sends one request per call. Targets are plain dataclasses so
+they can be pickled into worker processes; connections and browsers are
+opened in ``setup()`` inside the worker.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import httpx
+
+from claude_playwright_agent.transport import TransportConfig, create_client
+
+
+@dataclass
+class HttpTarget:
+    """
+    HTTP request target.
+
+    Attributes:
+        url: Request URL
+        method: HTTP method
+        headers: Request headers
+        json_body: JSON request body
+        timeout: Request timeout in seconds
+    """
+
+    url: str
+    method: str = "GET"
+    headers: dict[str, str] = field(default_factory=dict)
+    json_body: Any = None
+    timeout: float = 30.0
+    _client: Optional[httpx.AsyncClient] = field(default=None, init=False, repr=False)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_client"] = None
+        return state
+
+    async def setup(self, max_in_flight: int) -> None:
+        """
+        Open a pooled HTTP client.
+
+        Args:
+            max_in_flight: Concurrent requests the pool must support
+        """
+        config = TransportConfig(
+            max_connections=max_in_flight,
+            max_keepalive_connections=max_in_flight,
+            timeout=self.timeout,
+        )
+        self._client = create_client(config)
+
+    async def send(self) -> int:
+        """
+        Send one request.
+
+        Returns:
+            HTTP status code
+        """
+        response = await self._client.request(
+            self.method,
+            self.url,
+            headers=self.headers,
+            json=self.json_body,
+        )
+        await response.aread()
+        return response.status_code
+
+    async def teardown(self) -> None:
+        """Close the client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+@dataclass
+class BrowserTarget:
+    """
+    Browser page load target.
+
+    Every request loads the page in a fresh browser context.
+
+    Attributes:
+        url: Page URL
+        wait_until: Load state that completes a request
+        timeout: Page load timeout in seconds
+        browser_type: Playwright browser (chromium, firefox, webkit)
+        headless: Run the browser headless
+        browser: Existing Playwright browser (in-process runs only; worker
+            processes launch their own)
+    """
+
+    url: str
+    wait_until: str = "domcontentloaded"
+    timeout: float = 30.0
+    browser_type: str = "chromium"
+    headless: bool = True
+    browser: Any = field(default=None, repr=False)
+    _playwright: Any = field(default=None, init=False, repr=False)
+    _owned_browser: Any = field(default=None, init=False, repr=False)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["browser"] = None
+        state["_playwright"] = None
+        state["_owned_browser"] = None
+        return state
+
+    async def setup(self, max_in_flight: int) -> None:
+        """
+        Launch a browser unless one was provided.
+
+        Args:
+            max_in_flight: Concurrent page loads (unused)
+        """
+        if self.browser is not None:
+            return
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        launcher = getattr(self._playwright, self.browser_type)
+        self._owned_browser = await launcher.launch(headless=self.headless)
+        self.browser = self._owned_browser
+
+    async def send(self) -> int:
+        """
+        Load the page once.
+
+        Returns:
+            HTTP status of the main document (0 if there was none)
+        """
+        context = await self.browser.new_context()
+        try:
+            page = await context.new_page()
+            response = await page.goto(self.url, wait_until=self.wait_until, timeout=self.timeout * 1000)
+            return response.status if response else 0
+        finally:
+            await context.close()
+
+    async def teardown(self) -> None:
+        """Close a browser launched by setup()."""
+        if self._owned_browser is not None:
+            await self._owned_browser.close()
+            self._owned_browser = None
+            self.browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
@@ -13,7 +13,9 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+
+from claude_playwright_agent.reporting.streaming import CHUNK_SIZE
 
 
 class MetricType(str, Enum):
@@ -376,15 +378,20 @@ class MetricsDashboard:
     def generate_html_dashboard(self, output_path: Path) -> None:
         """Generate HTML dashboard."""
         report = self.generate_report()
-        html = self._render_html_dashboard(report)
-        output_path.write_text(html, encoding="utf-8")
+        with open(output_path, "w", encoding="utf-8", buffering=CHUNK_SIZE) as f:
+            for chunk in self._iter_html_dashboard(report):
+                f.write(chunk)
 
     def _render_html_dashboard(self, report: dict[str, Any]) -> str:
         """Render HTML dashboard."""
+        return "".join(self._iter_html_dashboard(report))
+
+    def _iter_html_dashboard(self, report: dict[str, Any]) -> Iterator[str]:
+        """Render the HTML dashboard as a sequence of chunks."""
         summary = report["summary"]
         metrics = report["metrics"]
 
-        return f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -581,8 +588,12 @@ class MetricsDashboard:
             </div>
             {self._render_test_summary(summary.get('test_summary'))}
         </div>
+"""
 
-        {self._render_categories(metrics)}
+        for category_name, category_metrics in metrics.items():
+            yield self._render_category(category_name, category_metrics)
+
+        yield """
     </div>
 
     <script>
@@ -606,25 +617,26 @@ class MetricsDashboard:
 
     def _render_categories(self, metrics: dict[str, dict[str, Any]]) -> str:
         """Render metric categories."""
-        html = ""
+        return "".join(
+            self._render_category(category_name, category_metrics)
+            for category_name, category_metrics in metrics.items()
+        )
 
-        for category_name, category_metrics in metrics.items():
-            html += f"""
+    def _render_category(self, category_name: str, category_metrics: dict[str, Any]) -> str:
+        """Render one metric category."""
+        cards = "".join(
+            self._render_metric_card(metric_name, metric_data)
+            for metric_name, metric_data in category_metrics.items()
+        )
+        return f"""
         <div class="category">
             <h2>{category_name}</h2>
             <div class="metric-grid">
-"""
-
-            for metric_name, metric_data in category_metrics.items():
-                html += self._render_metric_card(metric_name, metric_data)
-
-            html += """
+{cards}
             </div>
         </div>
 """
 
-        return html
-
     def _render_metric_card(self, name: str, metric: dict[str, Any]) -> str:
         """Render a single metric card."""
         latest = metric.get("latest")
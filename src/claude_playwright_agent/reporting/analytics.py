@@ -0,0 +1,484 @@
+"""
+Vectorized Test History Analytics
+
+Loads the full test history from the history store as NumPy columns and
+computes per-test statistics in a handful of array passes:
+
+- pass rate, failure count and flip rate (pass <-> fail transitions)
+- duration mean, min, max and percentiles
+- mean gap between consecutive failures
+- per-commit flakiness (mixed results on the same commit)
+- change points in duration and failure rate (largest mean shift)
+
+History is loaded in fixed-size row-id segments. Sealed segments are
+immutable in the append-only store, so they are converted once and cached;
+only the open tail segment is re-read. Analysis results are cached until
+new rows are appended.
+
+Requires the optional ``numpy`` package (``pip install numpy``).
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from claude_playwright_agent.reporting.history_store import HistoryStore
+
+
+SEGMENT_SIZE = 50_000
+
+# Number of most recent runs counted in ``recent_failures``
+RECENT_WINDOW = 10
+
+# Statuses counted as failures by every flakiness analysis
+FAILED_STATUSES = ("failed", "error")
+
+
+def _require_numpy() -> Any:
+    """Import NumPy or raise a helpful error."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "History analytics requires the 'numpy' package. "
+            "Install it with: pip install numpy>=1.24.0"
+        )
+    return numpy
+
+
+def analytics_available() -> bool:
+    """Check whether the vectorized analytics engine can be used."""
+    try:
+        _require_numpy()
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass
+class TestStatistics:
+    """
+    Per-test statistics for one test.
+
+    Attributes:
+        test_name: Name of the test
+        runs: Number of recorded results
+        passes: Number of passed results
+        skips: Number of skipped results
+        failures: Number of failed or errored results
+        recent_failures: Failures among the last RECENT_WINDOW results
+        pass_rate: Passes divided by runs (0.0 to 1.0)
+        flips: Number of pass/fail transitions between consecutive runs
+        flip_rate: Flips divided by possible transitions (0.0 to 1.0)
+        duration_mean: Mean duration
+        duration_min: Minimum duration
+        duration_max: Maximum duration
+        duration_p50: Median duration
+        duration_p95: 95th percentile duration
+        mean_failure_gap: Mean number of runs between failures (0 if < 2)
+        total_commits: Number of distinct commits tested
+        flaky_commits: Commits with both passing and failing results
+        commit_flakiness: Flaky commits divided by commits
+        total_retries: Sum of retry counts
+        passed_on_retry: Results that passed after a retry
+        last_failure: Timestamp of the most recent failure
+        duration_change_index: Run index where the duration shifted most
+        duration_change_score: Variance explained by that shift (0.0 to 1.0)
+        duration_before: Mean duration before the change point
+        duration_after: Mean duration after the change point
+        failure_change_index: Run index where the failure rate shifted most
+        failure_change_score: Variance explained by that shift (0.0 to 1.0)
+    """
+
+    test_name: str
+    runs: int
+    passes: int
+    skips: int
+    failures: int
+    recent_failures: int
+    pass_rate: float
+    flips: int
+    flip_rate: float
+    duration_mean: float
+    duration_min: float
+    duration_max: float
+    duration_p50: float
+    duration_p95: float
+    mean_failure_gap: float
+    total_commits: int
+    flaky_commits: int
+    commit_flakiness: float
+    total_retries: int
+    passed_on_retry: int
+    last_failure: str
+    duration_change_index: int
+    duration_change_score: float
+    duration_before: float
+    duration_after: float
+    failure_change_index: int
+    failure_change_score: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return dict(self.__dict__)
+
+
+class HistoryStatistics:
+    """
+    Columnar per-test statistics for every test in the history.
+
+    Each attribute is a NumPy array aligned with ``test_names``.
+    """
+
+    def __init__(self, test_names: list[str], columns: dict[str, Any]) -> None:
+        self.test_names = test_names
+        self.columns = columns
+        self._index = {name: i for i, name in enumerate(test_names)}
+
+    def __len__(self) -> int:
+        return len(self.test_names)
+
+    def __contains__(self, test_name: str) -> bool:
+        return test_name in self._index
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__["columns"][name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def get(self, test_name: str) -> Optional[TestStatistics]:
+        """Get statistics for a single test."""
+        i = self._index.get(test_name)
+        if i is None:
+            return None
+        values = {
+            key: column[i].item() if hasattr(column[i], "item") else column[i]
+            for key, column in self.columns.items()
+        }
+        return TestStatistics(test_name=test_name, **values)
+
+    def __iter__(self):
+        for name in self.test_names:
+            yield self.get(name)
+
+
+class HistoryAnalytics:
+    """
+    Vectorized analytics over the whole history store.
+
+    Features:
+    - Segment-cached columnar loading (sealed segments are read once)
+    - Per-test statistics computed in vectorized passes
+    - Results cached until new history is appended
+    """
+
+    def __init__(self, store: HistoryStore, segment_size: int = SEGMENT_SIZE) -> None:
+        """
+        Initialize the analytics engine.
+
+        Args:
+            store: History store to analyze
+            segment_size: Result rows per cached segment
+        """
+        self._np = _require_numpy()
+        self._store_ref = weakref.ref(store)
+        self.segment_size = segment_size
+        self._segments: dict[int, dict[str, Any]] = {}
+        self._result: Optional[tuple[int, HistoryStatistics]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def store(self) -> HistoryStore:
+        """History store being analyzed (not kept alive by the engine)."""
+        store = self._store_ref()
+        if store is None:
+            raise RuntimeError("The analyzed history store no longer exists")
+        return store
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    def _load_segment(self, index: int, upto_id: int) -> dict[str, Any]:
+        """Load one segment as NumPy columns, caching it once sealed."""
+        np = self._np
+        start = index * self.segment_size
+        end = start + self.segment_size
+        sealed = upto_id >= end
+
+        cached = self._segments.get(index)
+        if cached is not None:
+            return cached
+
+        raw = self.store.get_result_columns(after_id=start, upto_id=min(end, upto_id))
+        status = np.asarray(raw["status"], dtype=str)
+        segment = {
+            "id": np.asarray(raw["id"], dtype=np.int64),
+            "test_name": np.asarray(raw["test_name"], dtype=str),
+            "failed": np.isin(status, FAILED_STATUSES),
+            "passed": status == "passed",
+            "skipped": status == "skipped",
+            "duration": np.asarray(raw["duration"], dtype=np.float64),
+            "timestamp": np.asarray(raw["timestamp"], dtype=str),
+            "commit_sha": np.asarray(raw["commit_sha"], dtype=str),
+            "retry_count": np.asarray(raw["retry_count"], dtype=np.int64),
+            "passed_on_retry": np.asarray(raw["passed_on_retry"], dtype=bool),
+        }
+        if sealed:
+            self._segments[index] = segment
+        return segment
+
+    def load_columns(self) -> tuple[int, dict[str, Any]]:
+        """
+        Load the full history as columns grouped by test.
+
+        Returns:
+            Tuple of (highest result id, columns sorted by test then time)
+        """
+        np = self._np
+        upto_id = self.store.max_result_id()
+        count = -(-upto_id // self.segment_size)
+        segments = [self._load_segment(i, upto_id) for i in range(count)]
+
+        if not segments:
+            empty = {
+                "id": np.zeros(0, dtype=np.int64),
+                "test_name": np.zeros(0, dtype=str),
+                "failed": np.zeros(0, dtype=bool),
+                "passed": np.zeros(0, dtype=bool),
+                "skipped": np.zeros(0, dtype=bool),
+                "duration": np.zeros(0, dtype=np.float64),
+                "timestamp": np.zeros(0, dtype=str),
+                "commit_sha": np.zeros(0, dtype=str),
+                "retry_count": np.zeros(0, dtype=np.int64),
+                "passed_on_retry": np.zeros(0, dtype=bool),
+            }
+            return upto_id, empty
+
+        columns = {
+            key: np.concatenate([segment[key] for segment in segments])
+            for key in segments[0]
+        }
+        names, codes = np.unique(columns["test_name"], return_inverse=True)
+        order = np.lexsort((columns["id"], columns["timestamp"], codes))
+        grouped = {key: value[order] for key, value in columns.items()}
+        grouped["code"] = codes[order]
+        grouped["names"] = names
+        return upto_id, grouped
+
+    # =========================================================================
+    # Analysis
+    # =========================================================================
+
+    def analyze(self) -> HistoryStatistics:
+        """
+        Compute statistics for every test over the full history.
+
+        Returns:
+            HistoryStatistics (cached until new results are appended)
+        """
+        with self._lock:
+            upto_id = self.store.max_result_id()
+            if self._result is not None and self._result[0] == upto_id:
+                return self._result[1]
+
+            _, columns = self.load_columns()
+            stats = self._compute(columns)
+            self._result = (upto_id, stats)
+            return stats
+
+    def get_test_statistics(self, test_name: str) -> Optional[TestStatistics]:
+        """Get statistics for a single test."""
+        return self.analyze().get(test_name)
+
+    def _compute(self, c: dict[str, Any]) -> HistoryStatistics:
+        """Compute all per-test statistics in vectorized passes."""
+        np = self._np
+        n = len(c["id"])
+        if n == 0:
+            return HistoryStatistics([], {})
+
+        code = c["code"]
+        passed = c["passed"]
+        failed = c["failed"]
+        duration = c["duration"]
+
+        # Group boundaries (rows are sorted by test, then time)
+        starts = np.flatnonzero(np.r_[True, code[1:] != code[:-1]])
+        groups = len(starts)
+        runs = np.diff(np.r_[starts, n])
+        gid = np.repeat(np.arange(groups), runs)
+        position = np.arange(n) - starts[gid]
+
+        passes = np.add.reduceat(passed.astype(np.int64), starts)
+        skips = np.add.reduceat(c["skipped"].astype(np.int64), starts)
+        failures = np.add.reduceat(failed.astype(np.int64), starts)
+        recent = failed & (position >= (runs - RECENT_WINDOW)[gid])
+        recent_failures = np.add.reduceat(recent.astype(np.int64), starts)
+
+        # Flips between consecutive results of the same test
+        same = gid[1:] == gid[:-1]
+        flip = (passed[1:] != passed[:-1]) & same
+        flips = np.bincount(gid[1:], weights=flip, minlength=groups).astype(np.int64)
+        flip_rate = flips / np.maximum(runs - 1, 1)
+
+        # Duration distribution
+        duration_sum = np.add.reduceat(duration, starts)
+        duration_mean = duration_sum / runs
+        sorted_duration = duration[np.lexsort((duration, gid))]
+        last = starts + runs - 1
+
+        def percentile(q: float) -> Any:
+            pos = q * (runs - 1)
+            lo = np.floor(pos).astype(np.int64)
+            hi = np.ceil(pos).astype(np.int64)
+            low = sorted_duration[starts + lo]
+            high = sorted_duration[starts + hi]
+            return low + (high - low) * (pos - lo)
+
+        # Gaps between consecutive failures
+        fail_idx = np.flatnonzero(failed)
+        fail_gid = gid[fail_idx]
+        same_fail = fail_gid[1:] == fail_gid[:-1]
+        gaps = np.diff(position[fail_idx])[same_fail]
+        gap_gid = fail_gid[1:][same_fail]
+        gap_count = np.bincount(gap_gid, minlength=groups)
+        gap_sum = np.bincount(gap_gid, weights=gaps, minlength=groups)
+        mean_failure_gap = np.where(gap_count > 0, gap_sum / np.maximum(gap_count, 1), 0.0)
+
+        # Most recent failure
+        last_fail_idx = np.maximum.reduceat(np.where(failed, np.arange(n), -1), starts)
+        last_failure = np.where(
+            last_fail_idx >= 0, c["timestamp"][np.maximum(last_fail_idx, 0)], ""
+        )
+
+        # Per-commit flakiness: commits with both passing and failing results
+        _, commit_code = np.unique(c["commit_sha"], return_inverse=True)
+        commit_count = int(commit_code.max()) + 1
+        pair = gid.astype(np.int64) * commit_count + commit_code
+        pairs, pair_inv = np.unique(pair, return_inverse=True)
+        pair_pass = np.bincount(pair_inv, weights=passed) > 0
+        pair_fail = np.bincount(pair_inv, weights=failed) > 0
+        pair_gid = pairs // commit_count
+        mixed = pair_pass & pair_fail
+        total_commits = np.bincount(pair_gid, minlength=groups)
+        flaky_commits = np.bincount(pair_gid, weights=mixed, minlength=groups).astype(np.int64)
+
+        # Retry behaviour
+        total_retries = np.add.reduceat(c["retry_count"], starts)
+        passed_on_retry = np.add.reduceat(c["passed_on_retry"].astype(np.int64), starts)
+
+        d_index, d_score, d_before, d_after = self._change_points(duration, gid, starts, runs, position)
+        f_index, f_score, _, _ = self._change_points(failed.astype(np.float64), gid, starts, runs, position)
+
+        names = [str(name) for name in c["names"][code[starts]]]
+        columns = {
+            "runs": runs,
+            "passes": passes,
+            "skips": skips,
+            "failures": failures,
+            "recent_failures": recent_failures,
+            "pass_rate": passes / runs,
+            "flips": flips,
+            "flip_rate": flip_rate,
+            "duration_mean": duration_mean,
+            "duration_min": sorted_duration[starts],
+            "duration_max": sorted_duration[last],
+            "duration_p50": percentile(0.5),
+            "duration_p95": percentile(0.95),
+            "mean_failure_gap": mean_failure_gap,
+            "total_commits": total_commits,
+            "flaky_commits": flaky_commits,
+            "commit_flakiness": flaky_commits / np.maximum(total_commits, 1),
+            "total_retries": total_retries,
+            "passed_on_retry": passed_on_retry,
+            "last_failure": last_failure,
+            "duration_change_index": d_index,
+            "duration_change_score": d_score,
+            "duration_before": d_before,
+            "duration_after": d_after,
+            "failure_change_index": f_index,
+            "failure_change_score": f_score,
+        }
+        return HistoryStatistics(names, columns)
+
+    def _change_points(
+        self,
+        values: Any,
+        gid: Any,
+        starts: Any,
+        runs: Any,
+        position: Any,
+    ) -> tuple[Any, Any, Any, Any]:
+        """
+        Find the single largest mean shift in each test's series.
+
+        For every split point the between-segment sum of squares is
+        computed from prefix sums; the score is the fraction of the test's
+        variance explained by the best split (0.0 to 1.0).
+
+        Returns:
+            Tuple of (split index, score, mean before, mean after) arrays
+        """
+        np = self._np
+
+        cumulative = np.cumsum(values)
+        base = np.where(starts > 0, cumulative[np.maximum(starts - 1, 0)], 0.0)
+        total = np.add.reduceat(values, starts)
+        total_sq = np.add.reduceat(values * values, starts)
+
+        left_n = position + 1
+        right_n = runs[gid] - left_n
+        left_sum = cumulative - base[gid]
+        right_sum = total[gid] - left_sum
+
+        valid = right_n > 0
+        safe_right = np.maximum(right_n, 1)
+        left_mean = left_sum / left_n
+        right_mean = right_sum / safe_right
+        between = left_n * right_n / runs[gid] * (left_mean - right_mean) ** 2
+        total_ss = total_sq - total * total / runs
+        explained = np.where(
+            valid & (total_ss[gid] > 1e-12), between / np.maximum(total_ss[gid], 1e-12), -1.0
+        )
+
+        # Best split per test: sort by test, then score descending
+        order = np.lexsort((-explained, gid))
+        best = order[starts]
+        score = np.maximum(explained[best], 0.0)
+        has_split = explained[best] >= 0
+
+        index = np.where(has_split, position[best] + 1, 0)
+        before = np.where(has_split, left_mean[best], total / runs)
+        after = np.where(has_split, right_mean[best], total / runs)
+        return index, score, before, after
+
+
+# =============================================================================
+# Shared Instances
+# =============================================================================
+
+
+# Engines live as long as their store
+_engines: "weakref.WeakKeyDictionary[HistoryStore, HistoryAnalytics]" = weakref.WeakKeyDictionary()
+_engines_lock = threading.Lock()
+
+
+def get_analytics(store: HistoryStore) -> HistoryAnalytics:
+    """
+    Get the shared analytics engine for a history store.
+
+    Args:
+        store: History store to analyze
+
+    Returns:
+        Shared HistoryAnalytics instance (keeps its segment cache warm)
+    """
+    with _engines_lock:
+        engine = _engines.get(store)
+        if engine is None:
+            engine = HistoryAnalytics(store)
+            _engines[store] = engine
+        return engine
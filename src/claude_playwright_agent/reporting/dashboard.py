@@ -5,14 +5,27 @@ Provides live test execution monitoring with WebSocket support.
 """
 
 import asyncio
+import contextlib
+import itertools
 import json
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
+from claude_playwright_agent.reporting.analytics import (
+    FAILED_STATUSES,
+    RECENT_WINDOW,
+    analytics_available,
+    get_analytics,
+)
+from claude_playwright_agent.reporting.history_store import HistoryStore
+from claude_playwright_agent.reporting.streaming import CHUNK_SIZE
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,30 +84,193 @@ class DashboardMetrics:
         }
 
 
+# Most recent events kept in the dashboard's ring buffer
+EVENT_LOG_SIZE = 1000
+
+# Maximum delta broadcasts per second
+BROADCAST_RATE_HZ = 10.0
+
+# Messages queued per client before it is resynced with a snapshot
+CLIENT_QUEUE_SIZE = 64
+
+# Events carried by one delta message (older ones are counted as dropped)
+MAX_DELTA_EVENTS = 200
+
+
+_LIVE_DASHBOARD_HTML = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Live Test Execution Dashboard</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .metrics { display: grid; grid-template-columns: repeat(5, 1fr); gap: 20px; margin-bottom: 20px; }
+        .metric-card { background: #f5f5f5; padding: 20px; border-radius: 8px; text-align: center; }
+        .metric-value { font-size: 32px; font-weight: bold; }
+        .metric-label { color: #666; }
+        .passed { color: #28a745; }
+        .failed { color: #dc3545; }
+        .skipped { color: #ffc107; }
+        .running { color: #007bff; }
+        .events { max-height: 600px; overflow-y: auto; background: #f9f9f9; padding: 15px; border-radius: 8px; }
+        .event { padding: 6px 10px; margin-bottom: 4px; border-left: 4px solid #ccc; background: white; }
+        .event.passed { border-left-color: #28a745; }
+        .event.failed { border-left-color: #dc3545; }
+        .event.running { border-left-color: #007bff; }
+    </style>
+</head>
+<body>
+    <h1>Live Test Execution Dashboard</h1>
+    <p id="status">Connecting...</p>
+    <div class="metrics" id="metrics"></div>
+    <h2>Test Events</h2>
+    <div class="events" id="events"></div>
+    <script>
+    (function () {
+        var MAX_EVENTS = 200;
+        var seq = 0;
+        var fields = [["passed", "Passed"], ["failed", "Failed"], ["skipped", "Skipped"],
+                      ["running", "Running"], ["tests_per_second", "Tests/s"]];
+        var list = document.getElementById("events");
+
+        function showMetrics(m) {
+            var box = document.getElementById("metrics");
+            box.textContent = "";
+            fields.forEach(function (f) {
+                var card = document.createElement("div");
+                card.className = "metric-card";
+                var value = document.createElement("div");
+                value.className = "metric-value " + f[0];
+                value.textContent = f[0] === "tests_per_second" ? m[f[0]].toFixed(1) : m[f[0]];
+                var label = document.createElement("div");
+                label.className = "metric-label";
+                label.textContent = f[1];
+                card.appendChild(value);
+                card.appendChild(label);
+                box.appendChild(card);
+            });
+        }
+        function addEvents(events) {
+            events.forEach(function (e) {
+                var row = document.createElement("div");
+                row.className = "event " + e.status;
+                row.textContent = e.test_name + " - " + e.status +
+                    (e.duration > 0 ? " (" + e.duration.toFixed(2) + "s)" : "") +
+                    (e.error_message ? " " + e.error_message : "");
+                list.insertBefore(row, list.firstChild);
+            });
+            while (list.childNodes.length > MAX_EVENTS) { list.removeChild(list.lastChild); }
+        }
+        function connect() {
+            var ws = new WebSocket((location.protocol === "https:" ? "wss://" : "ws://") + location.host + "/ws");
+            ws.onopen = function () { document.getElementById("status").textContent = "Live"; };
+            ws.onclose = function () {
+                document.getElementById("status").textContent = "Disconnected - retrying...";
+                setTimeout(connect, 2000);
+            };
+            ws.onmessage = function (msg) {
+                var data = JSON.parse(msg.data);
+                if (data.type === "snapshot") {
+                    list.textContent = "";
+                    addEvents(data.events);
+                    showMetrics(data.metrics);
+                    seq = data.seq;
+                    return;
+                }
+                if (data.seq !== seq + 1) { ws.send("resync"); }
+                seq = data.seq;
+                if (data.type === "delta") {
+                    addEvents(data.events);
+                    showMetrics(data.metrics);
+                } else if (data.data) {
+                    showMetrics(data.data);
+                }
+            };
+        }
+        connect();
+    })();
+    </script>
+</body>
+</html>
+"""
+
+
+class _DashboardClient:
+    """A connected WebSocket client with its own bounded send queue."""
+
+    def __init__(self, ws: Any, queue_size: int) -> None:
+        self.ws = ws
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.resyncs = 0
+
+    def offer(self, message: str, snapshot: Callable[[], str]) -> None:
+        """Queue a message; a client that fell behind gets a fresh snapshot."""
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(snapshot())
+            self.resyncs += 1
+
+    async def send_loop(self) -> None:
+        """Send queued messages until the connection closes."""
+        while True:
+            message = await self.queue.get()
+            await self.ws.send_str(message)
+
+
 class RealTimeDashboard:
     """
     Real-time test execution dashboard.
 
     Features:
-    - Live test execution updates
-    - WebSocket streaming
+    - Live test execution updates over a local WebSocket server
+    - Coalesced delta broadcasts (at most ``broadcast_rate`` per second)
+    - Per-client send queues; slow clients are resynced with a snapshot
+    - Snapshot-plus-delta sync for clients that join mid-run
+    - Ring-buffered event log
     - Historical trends
     - Flaky test detection
     """
 
-    def __init__(self, port: int = 8765):
+    def __init__(
+        self,
+        port: int = 8765,
+        host: str = "127.0.0.1",
+        max_events: int = EVENT_LOG_SIZE,
+        broadcast_rate: float = BROADCAST_RATE_HZ,
+        client_queue_size: int = CLIENT_QUEUE_SIZE,
+    ):
         """
         Initialize the dashboard.
 
         Args:
-            port: Port for WebSocket server
+            port: Port for WebSocket server (0 picks a free port)
+            host: Interface to bind the server to
+            max_events: Size of the event ring buffer
+            broadcast_rate: Maximum delta broadcasts per second
+            client_queue_size: Messages buffered per client
         """
         self.port = port
-        self.events: list[TestEvent] = []
+        self.host = host
+        self.events: deque[TestEvent] = deque(maxlen=max_events)
         self.metrics = DashboardMetrics()
-        self.clients = set()
+        self.clients: set[_DashboardClient] = set()
+        self.broadcast_interval = 1.0 / broadcast_rate
+        self.client_queue_size = client_queue_size
         self._running = False
         self._test_results: dict[str, dict] = {}
+        self._start_monotonic = time.monotonic()
+        self._seq = 0
+        self._pending: deque[dict] = deque(maxlen=MAX_DELTA_EVENTS)
+        self._pending_count = 0
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._runner: Any = None
+
+    # =========================================================================
+    # Test Run Updates
+    # =========================================================================
 
     async def start_test_run(self, total_tests: int):
         """Start a new test run."""
@@ -102,8 +278,12 @@ class RealTimeDashboard:
             total_tests=total_tests,
             start_time=datetime.now().isoformat(),
         )
-        self.events = []
+        self._start_monotonic = time.monotonic()
+        self.events.clear()
         self._test_results = {}
+        self._pending.clear()
+        self._pending_count = 0
+        self._dirty = False
 
         await self._broadcast({
             "type": "test_run_started",
@@ -120,7 +300,13 @@ class RealTimeDashboard:
         error_message: str = "",
         screenshot: Optional[str] = None,
     ):
-        """Update test status."""
+        """
+        Update test status.
+
+        Only counters are updated here; elapsed time and throughput are
+        derived when metrics are read or broadcast, and connected clients
+        receive the change in the next coalesced delta.
+        """
         event = TestEvent(
             timestamp=datetime.now().isoformat(),
             test_name=test_name,
@@ -144,31 +330,20 @@ class RealTimeDashboard:
         elif status == TestStatus.SKIPPED:
             self.metrics.skipped += 1
 
-        # Update duration
-        elapsed = datetime.now() - datetime.fromisoformat(self.metrics.start_time)
-        self.metrics.duration = elapsed.total_seconds()
-
-        # Calculate tests per second
-        if self.metrics.duration > 0:
-            completed = self.metrics.passed + self.metrics.failed + self.metrics.skipped
-            self.metrics.tests_per_second = completed / self.metrics.duration
-
         # Store result
-        self._test_results[test_name] = event.to_dict()
+        event_data = event.to_dict()
+        self._test_results[test_name] = event_data
 
-        # Broadcast update
-        await self._broadcast({
-            "type": "test_update",
-            "data": event.to_dict(),
-            "metrics": self.metrics.to_dict(),
-        })
+        # Queue for the next delta
+        self._dirty = True
+        if self.clients:
+            self._pending.append(event_data)
+            self._pending_count += 1
 
     async def finish_test_run(self):
         """Finish the test run."""
         self.metrics.running = 0
-
-        elapsed = datetime.now() - datetime.fromisoformat(self.metrics.start_time)
-        self.metrics.duration = elapsed.total_seconds()
+        self._refresh_metrics()
 
         await self._broadcast({
             "type": "test_run_finished",
@@ -177,24 +352,172 @@ class RealTimeDashboard:
 
         logger.info(f"Dashboard: Test run finished - {self.metrics.passed}/{self.metrics.total_tests} passed")
 
+    def _refresh_metrics(self) -> None:
+        """Derive elapsed time and throughput from the counters."""
+        if not self.metrics.start_time:
+            return
+        self.metrics.duration = time.monotonic() - self._start_monotonic
+        if self.metrics.duration > 0:
+            completed = self.metrics.passed + self.metrics.failed + self.metrics.skipped
+            self.metrics.tests_per_second = completed / self.metrics.duration
+
+    # =========================================================================
+    # Broadcasting
+    # =========================================================================
+
+    def _snapshot(self) -> str:
+        """Serialize the full dashboard state for a (re)joining client."""
+        self._refresh_metrics()
+        return json.dumps({
+            "type": "snapshot",
+            "seq": self._seq,
+            "metrics": self.metrics.to_dict(),
+            "events": [e.to_dict() for e in self.events],
+        })
+
+    def _send(self, message: dict) -> None:
+        """Serialize a message once and queue it for every client."""
+        self._seq += 1
+        message["seq"] = self._seq
+        message_json = json.dumps(message)
+        for client in self.clients:
+            client.offer(message_json, self._snapshot)
+
+    def _flush_delta(self) -> None:
+        """Broadcast the counters and events accumulated since the last delta."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._refresh_metrics()
+
+        events = list(self._pending)
+        dropped = self._pending_count - len(events)
+        self._pending.clear()
+        self._pending_count = 0
+
+        if self.clients:
+            self._send({
+                "type": "delta",
+                "metrics": self.metrics.to_dict(),
+                "events": events,
+                "dropped": dropped,
+            })
+
     async def _broadcast(self, message: dict):
         """Broadcast message to all connected clients."""
         if not self.clients:
             return
 
-        message_json = json.dumps(message)
+        # Keep ordering: anything pending goes out before this message
+        self._flush_delta()
+        self._send(message)
+
+    async def _flush_loop(self) -> None:
+        """Emit coalesced deltas at most ``broadcast_rate`` times per second."""
+        while self._running:
+            await asyncio.sleep(self.broadcast_interval)
+            self._flush_delta()
+
+    # =========================================================================
+    # Server
+    # =========================================================================
+
+    async def start_server(self) -> None:
+        """
+        Start the local HTTP/WebSocket server.
+
+        Serves the live dashboard page at ``/`` and the update stream at
+        ``/ws``. When started with port 0, ``port`` is updated to the port
+        actually bound.
+        """
+        try:
+            from aiohttp import web
+        except ImportError:
+            raise ImportError(
+                "The live dashboard requires the 'aiohttp' package. "
+                "Install it with: pip install aiohttp>=3.9.0"
+            )
+
+        if self._running:
+            return
+
+        app = web.Application()
+        app.router.add_get("/", self._handle_index)
+        app.router.add_get("/ws", self._handle_ws)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
 
-        # In a real implementation, this would use WebSockets
-        # For now, just log
-        logger.debug(f"Broadcast: {message_json}")
+        self._running = True
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(f"Dashboard: Serving on http://{self.host}:{self.port}")
+
+    async def stop_server(self) -> None:
+        """Flush pending updates, disconnect clients and stop the server."""
+        if not self._running:
+            return
+
+        self._flush_delta()
+        self._running = False
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+
+        for client in list(self.clients):
+            await client.ws.close()
+        await self._runner.cleanup()
+        self._runner = None
+
+    async def _handle_index(self, request: Any) -> Any:
+        """Serve the live dashboard page."""
+        from aiohttp import web
+
+        return web.Response(text=_LIVE_DASHBOARD_HTML, content_type="text/html")
+
+    async def _handle_ws(self, request: Any) -> Any:
+        """Stream a snapshot, then deltas, to one WebSocket client."""
+        from aiohttp import WSMsgType, web
+
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+
+        client = _DashboardClient(ws, self.client_queue_size)
+        client.offer(self._snapshot(), self._snapshot)
+        self.clients.add(client)
+        sender = asyncio.create_task(client.send_loop())
+
+        try:
+            async for msg in ws:
+                if msg.type == WSMsgType.TEXT and msg.data == "resync":
+                    client.offer(self._snapshot(), self._snapshot)
+                elif msg.type == WSMsgType.ERROR:
+                    break
+        finally:
+            self.clients.discard(client)
+            sender.cancel()
+            with contextlib.suppress(asyncio.CancelledError, ConnectionError):
+                await sender
+
+        return ws
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
 
     def get_metrics(self) -> DashboardMetrics:
         """Get current metrics."""
+        self._refresh_metrics()
         return self.metrics
 
     def get_events(self, limit: int = 100) -> list[dict]:
         """Get recent events."""
-        return [e.to_dict() for e in self.events[-limit:]]
+        start = max(len(self.events) - limit, 0)
+        return [e.to_dict() for e in itertools.islice(self.events, start, None)]
 
     def get_test_results(self) -> dict[str, dict]:
         """Get all test results."""
@@ -202,14 +525,20 @@ class RealTimeDashboard:
 
     def generate_html_report(self, output_path: Path):
         """Generate HTML dashboard report."""
-        html = self._generate_html()
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html, encoding="utf-8")
+        with open(output_path, "w", encoding="utf-8", buffering=CHUNK_SIZE) as f:
+            for chunk in self._iter_html():
+                f.write(chunk)
         logger.info(f"Dashboard report generated: {output_path}")
 
     def _generate_html(self) -> str:
         """Generate HTML dashboard."""
-        return f"""
+        return "".join(self._iter_html())
+
+    def _iter_html(self) -> Iterator[str]:
+        """Render the HTML dashboard as a sequence of chunks."""
+        self._refresh_metrics()
+        yield f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -256,7 +585,9 @@ class RealTimeDashboard:
 
     <h2>Test Events</h2>
     <div class="events">
-        {self._generate_events_html()}
+"""
+        yield from self._iter_events_html()
+        yield f"""
     </div>
 
     <h2>Progress Chart</h2>
@@ -287,19 +618,19 @@ class RealTimeDashboard:
 
     def _generate_events_html(self) -> str:
         """Generate events HTML."""
-        events_html = []
+        return "\n".join(self._iter_events_html())
 
-        for event in self.events[-50:]:  # Last 50 events
+    def _iter_events_html(self) -> Iterator[str]:
+        """Render recent events one chunk at a time."""
+        for event in itertools.islice(self.events, max(len(self.events) - 50, 0), None):  # Last 50 events
             status_class = event.status.value
-            events_html.append(f"""
+            yield f"""
             <div class="event {status_class}">
                 <strong>{event.test_name}</strong> - {event.status.value}
                 {f"({event.duration:.2f}s)" if event.duration > 0 else ""}
                 {f"<br><small>{event.error_message}</small>" if event.error_message else ""}
             </div>
-""")
-
-        return "\n".join(events_html)
+"""
 
 
 class FlakyTestDetector:
@@ -310,14 +641,16 @@ class FlakyTestDetector:
     on the same code version.
     """
 
-    def __init__(self, threshold: float = 0.5):
+    def __init__(self, threshold: float = 0.5, store: Optional[HistoryStore] = None):
         """
         Initialize the detector.
 
         Args:
             threshold: Flakiness threshold (0.0 to 1.0)
+            store: Optional shared history store to read and write through
         """
         self.threshold = threshold
+        self._store = store
         self._test_history: dict[str, list[dict]] = {}
 
     def record_execution(
@@ -328,6 +661,15 @@ class FlakyTestDetector:
         timestamp: str,
     ):
         """Record a test execution."""
+        if self._store is not None:
+            self._store.record_result(
+                test_name,
+                "passed" if passed else "failed",
+                timestamp=timestamp,
+                commit_sha=commit_sha,
+            )
+            return
+
         if test_name not in self._test_history:
             self._test_history[test_name] = []
 
@@ -337,12 +679,33 @@ class FlakyTestDetector:
             "timestamp": timestamp,
         })
 
+    def _get_history(self, test_name: str) -> list[dict]:
+        """Get the execution history of a test."""
+        if self._store is not None:
+            return self._store.get_test_history(test_name, limit=None)
+        return self._test_history.get(test_name, [])
+
+    @staticmethod
+    def _outcome(run: dict) -> Optional[bool]:
+        """Classify a run as passed (True), failed (False) or skipped (None)."""
+        status = run.get("status")
+        if status is None:
+            return run["passed"]
+        if status == "passed":
+            return True
+        if status in FAILED_STATUSES:
+            return False
+        return None
+
+    def _get_test_names(self) -> list[str]:
+        """Get the names of all recorded tests."""
+        if self._store is not None:
+            return self._store.get_test_names()
+        return list(self._test_history)
+
     def analyze_flakiness(self, test_name: str) -> Optional[dict]:
         """Analyze if a test is flaky."""
-        if test_name not in self._test_history:
-            return None
-
-        history = self._test_history[test_name]
+        history = self._get_history(test_name)
 
         if len(history) < 3:  # Need at least 3 runs
             return None
@@ -361,7 +724,8 @@ class FlakyTestDetector:
 
         for commit, runs in by_commit.items():
             if len(runs) > 1:
-                results = [r["passed"] for r in runs]
+                # Skipped runs are neither passes nor failures
+                results = [self._outcome(r) for r in runs]
                 if True in results and False in results:
                     flaky_commits += 1
 
@@ -375,28 +739,49 @@ class FlakyTestDetector:
                 "flakiness_score": flakiness_score,
                 "total_runs": len(history),
                 "flaky_commits": flaky_commits,
-                "recent_failures": sum(1 for r in history[-10:] if not r["passed"]),
+                "recent_failures": sum(1 for r in history[-RECENT_WINDOW:] if self._outcome(r) is False),
             }
 
         return None
 
     def get_all_flaky_tests(self) -> list[dict]:
         """Get all flaky tests."""
-        flaky_tests = []
-
-        for test_name in self._test_history:
-            analysis = self.analyze_flakiness(test_name)
-            if analysis and analysis["flaky"]:
-                flaky_tests.append(analysis)
+        if self._store is not None and analytics_available():
+            flaky_tests = self._get_flaky_tests_vectorized()
+        else:
+            flaky_tests = []
+            for test_name in self._get_test_names():
+                analysis = self.analyze_flakiness(test_name)
+                if analysis and analysis["flaky"]:
+                    flaky_tests.append(analysis)
 
         # Sort by flakiness score
         flaky_tests.sort(key=lambda x: x["flakiness_score"], reverse=True)
 
         return flaky_tests
 
+    def _get_flaky_tests_vectorized(self) -> list[dict]:
+        """Score every test in the store in one vectorized pass."""
+        stats = get_analytics(self._store).analyze()
+        if not len(stats):
+            return []
+
+        flaky = (stats.runs >= 3) & (stats.commit_flakiness >= self.threshold)
+        return [
+            {
+                "test_name": s.test_name,
+                "flaky": True,
+                "flakiness_score": s.commit_flakiness,
+                "total_runs": s.runs,
+                "flaky_commits": s.flaky_commits,
+                "recent_failures": s.recent_failures,
+            }
+            for s in (stats.get(stats.test_names[i]) for i in flaky.nonzero()[0])
+        ]
+
     def get_statistics(self) -> dict:
         """Get detector statistics."""
-        total_tests = len(self._test_history)
+        total_tests = len(self._get_test_names())
         flaky_tests = self.get_all_flaky_tests()
 
         return {
@@ -0,0 +1,594 @@
+"""
+Unified Test History Store
+
+Append-only SQLite store shared by every component that tracks test
+history (history tracker, trend analyzer, report agent, failure analyzer,
+flaky test detector). A run and all of its per-test results are written in
+a single transaction, and per-test queries are served from an index on
+(test_name, timestamp) instead of re-reading whole JSON files.
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+
+HISTORY_DB_NAME = "history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL DEFAULT '',
+    timestamp TEXT NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    passed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    skipped INTEGER NOT NULL DEFAULT 0,
+    duration REAL NOT NULL DEFAULT 0,
+    commit_sha TEXT NOT NULL DEFAULT '',
+    branch TEXT NOT NULL DEFAULT 'main',
+    metrics TEXT,
+    payload TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_source_ts ON runs(source, timestamp);
+
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER REFERENCES runs(id),
+    test_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration REAL NOT NULL DEFAULT 0,
+    timestamp TEXT NOT NULL,
+    commit_sha TEXT NOT NULL DEFAULT '',
+    branch TEXT NOT NULL DEFAULT 'main',
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    passed_on_retry INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_results_test_ts ON results(test_name, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_ts ON results(timestamp);
+"""
+
+_RESULT_COLUMNS = (
+    "run_id, test_name, status, duration, timestamp, "
+    "commit_sha, branch, retry_count, passed_on_retry"
+)
+
+
+class HistoryStore:
+    """
+    Append-only test history backed by SQLite.
+
+    Features:
+    - One transaction per run (run row plus all result rows)
+    - Per-test history served from a (test_name, timestamp) index
+    - Run-level queries filtered by source and time window
+    - Safe to share between threads
+    """
+
+    def __init__(
+        self,
+        project_path: Path | str | None = None,
+        db_path: Path | str | None = None,
+    ) -> None:
+        """
+        Initialize the history store.
+
+        Args:
+            project_path: Project root (store lives at .cpa/history.db)
+            db_path: Explicit database path (overrides project_path)
+        """
+        if db_path is None:
+            root = Path(project_path) if project_path else Path.cwd()
+            db_path = root / ".cpa" / HISTORY_DB_NAME
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    @contextmanager
+    def transaction(self) -> Iterator["HistoryStore"]:
+        """
+        Group several writes into one transaction.
+
+        Writes inside the block are committed together when it exits and
+        rolled back together if it raises.
+
+        Yields:
+            This store
+        """
+        with self._lock:
+            self._transaction_depth += 1
+            try:
+                yield self
+            except BaseException:
+                if self._transaction_depth == 1:
+                    self._conn.rollback()
+                raise
+            else:
+                if self._transaction_depth == 1:
+                    self._conn.commit()
+            finally:
+                self._transaction_depth -= 1
+
+    @contextmanager
+    def _write(self) -> Iterator[None]:
+        """Commit a write unless an enclosing transaction() will."""
+        with self._lock:
+            if self._transaction_depth:
+                yield
+            else:
+                with self._conn:
+                    yield
+
+    def record_run(
+        self,
+        results: Iterable[dict[str, Any]] = (),
+        *,
+        source: str = "",
+        timestamp: str | None = None,
+        commit_sha: str = "",
+        branch: str = "main",
+        total: int | None = None,
+        passed: int | None = None,
+        failed: int | None = None,
+        skipped: int | None = None,
+        duration: float | None = None,
+        metrics: dict[str, Any] | None = None,
+        payload: Any = None,
+    ) -> int:
+        """
+        Append a run and its per-test results in one transaction.
+
+        Each result needs ``name`` (or ``test_name``) and ``status``; optional
+        keys are ``duration``, ``timestamp``, ``commit_sha``, ``branch``,
+        ``retry_count`` and ``passed_on_retry``. Totals default to counts
+        derived from the results.
+
+        Args:
+            results: Per-test results for the run
+            source: Component that recorded the run
+            timestamp: Run timestamp (default: now)
+            commit_sha: Commit the run was executed against
+            branch: Branch the run was executed on
+            total: Total tests (default: number of results)
+            passed: Passed tests (default: derived from results)
+            failed: Failed tests (default: derived from results)
+            skipped: Skipped tests (default: derived from results)
+            duration: Run duration (default: sum of result durations)
+            metrics: Optional metrics dictionary
+            payload: Optional raw run data (stored as JSON)
+
+        Returns:
+            ID of the recorded run
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        rows = [
+            self._result_row(result, timestamp, commit_sha, branch)
+            for result in results
+        ]
+
+        counts = {"passed": 0, "failed": 0, "skipped": 0}
+        for row in rows:
+            status = row[2]
+            if status in ("failed", "error"):
+                counts["failed"] += 1
+            elif status in counts:
+                counts[status] += 1
+
+        with self._write():
+            cursor = self._conn.execute(
+                "INSERT INTO runs (source, timestamp, total, passed, failed, skipped, "
+                "duration, commit_sha, branch, metrics, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    source,
+                    timestamp,
+                    len(rows) if total is None else total,
+                    counts["passed"] if passed is None else passed,
+                    counts["failed"] if failed is None else failed,
+                    counts["skipped"] if skipped is None else skipped,
+                    sum(row[3] for row in rows) if duration is None else duration,
+                    commit_sha,
+                    branch,
+                    json.dumps(metrics) if metrics is not None else None,
+                    json.dumps(payload, default=str) if payload is not None else None,
+                ),
+            )
+            run_id = cursor.lastrowid
+            self._conn.executemany(
+                f"INSERT INTO results ({_RESULT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, *row[1:]) for row in rows],
+            )
+
+        return run_id
+
+    def record_result(
+        self,
+        test_name: str,
+        status: str,
+        duration: float = 0.0,
+        timestamp: str | None = None,
+        **fields: Any,
+    ) -> None:
+        """
+        Append a single test result that is not part of a run.
+
+        Args:
+            test_name: Name of the test
+            status: Test status
+            duration: Execution duration
+            timestamp: Optional timestamp (default: now)
+            **fields: commit_sha, branch, retry_count, passed_on_retry
+        """
+        self.record_results([{
+            "name": test_name,
+            "status": status,
+            "duration": duration,
+            "timestamp": timestamp,
+            **fields,
+        }])
+
+    def record_results(self, results: Iterable[dict[str, Any]]) -> None:
+        """
+        Append standalone test results in one transaction.
+
+        Args:
+            results: Result dictionaries (same keys as record_run)
+        """
+        now = datetime.now().isoformat()
+        rows = [self._result_row(result, now, "", "main") for result in results]
+        with self._write():
+            self._conn.executemany(
+                f"INSERT INTO results ({_RESULT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    @staticmethod
+    def _result_row(
+        result: dict[str, Any],
+        timestamp: str,
+        commit_sha: str,
+        branch: str,
+    ) -> tuple:
+        """Convert a result dictionary to a results table row."""
+        status = result.get("status", "unknown")
+        if hasattr(status, "value"):
+            status = status.value
+        return (
+            None,
+            result.get("test_name") or result.get("name", ""),
+            str(status),
+            float(result.get("duration") or 0.0),
+            result.get("timestamp") or timestamp,
+            result.get("commit_sha") or commit_sha,
+            result.get("branch") or branch,
+            int(result.get("retry_count") or 0),
+            int(bool(result.get("passed_on_retry", False))),
+        )
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def get_test_history(
+        self,
+        test_name: str,
+        limit: int | None = 100,
+        since: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get recent results for one test, oldest first.
+
+        Args:
+            test_name: Name of the test
+            limit: Maximum number of results (None for all)
+            since: Only results at or after this ISO timestamp
+
+        Returns:
+            List of result dictionaries
+        """
+        query = f"SELECT {_RESULT_COLUMNS} FROM results WHERE test_name = ?"
+        params: list[Any] = [test_name]
+        if since:
+            query += " AND timestamp >= ?"
+            params.append(since)
+        query += " ORDER BY timestamp DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._result_dict(row) for row in reversed(rows)]
+
+    def get_histories(
+        self,
+        test_names: Iterable[str] | None = None,
+        limit_per_test: int | None = None,
+        since: str | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get recent results for many tests in one query, oldest first.
+
+        Args:
+            test_names: Tests to include (None for all)
+            limit_per_test: Keep only the most recent N results per test
+            since: Only results at or after this ISO timestamp
+
+        Returns:
+            Dictionary mapping test name to its results
+        """
+        conditions = []
+        params: list[Any] = []
+        if test_names is not None:
+            names = list(test_names)
+            if not names:
+                return {}
+            conditions.append(f"test_name IN ({', '.join('?' * len(names))})")
+            params.extend(names)
+        if since:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        if limit_per_test is None:
+            query = (
+                f"SELECT {_RESULT_COLUMNS} FROM results {where} "
+                "ORDER BY test_name, timestamp, id"
+            )
+        else:
+            query = (
+                f"SELECT {_RESULT_COLUMNS} FROM ("
+                f"SELECT *, ROW_NUMBER() OVER ("
+                f"PARTITION BY test_name ORDER BY timestamp DESC, id DESC) AS rn "
+                f"FROM results {where}) WHERE rn <= ? "
+                "ORDER BY test_name, timestamp, id"
+            )
+            params.append(limit_per_test)
+
+        histories: dict[str, list[dict[str, Any]]] = {}
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        for row in rows:
+            histories.setdefault(row["test_name"], []).append(self._result_dict(row))
+        return histories
+
+    def get_runs(
+        self,
+        limit: int | None = None,
+        source: str | None = None,
+        since: str | None = None,
+        include_payload: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Get recorded runs, oldest first.
+
+        Args:
+            limit: Keep only the most recent N runs
+            source: Only runs recorded by this component
+            since: Only runs at or after this ISO timestamp
+            include_payload: Include the raw run payload
+
+        Returns:
+            List of run dictionaries
+        """
+        conditions = []
+        params: list[Any] = []
+        if source is not None:
+            conditions.append("source = ?")
+            params.append(source)
+        if since:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        query = f"SELECT * FROM runs {where} ORDER BY timestamp DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        runs = []
+        for row in reversed(rows):
+            run = {
+                "run_id": row["id"],
+                "source": row["source"],
+                "timestamp": row["timestamp"],
+                "total_tests": row["total"],
+                "passed": row["passed"],
+                "failed": row["failed"],
+                "skipped": row["skipped"],
+                "duration": row["duration"],
+                "commit_sha": row["commit_sha"],
+                "branch": row["branch"],
+                "metrics": json.loads(row["metrics"]) if row["metrics"] else {},
+            }
+            if include_payload:
+                run["payload"] = json.loads(row["payload"]) if row["payload"] else None
+            runs.append(run)
+        return runs
+
+    def get_result_columns(
+        self,
+        after_id: int = 0,
+        upto_id: int | None = None,
+    ) -> dict[str, list[Any]]:
+        """
+        Get raw results in a row-id range as columns.
+
+        Used by the analytics engine to load history in segments.
+
+        Args:
+            after_id: Exclusive lower bound on result id
+            upto_id: Inclusive upper bound on result id (None for all)
+
+        Returns:
+            Dictionary mapping column name to a list of values
+        """
+        query = (
+            "SELECT id, test_name, status, duration, timestamp, commit_sha, "
+            "retry_count, passed_on_retry FROM results WHERE id > ?"
+        )
+        params: list[Any] = [after_id]
+        if upto_id is not None:
+            query += " AND id <= ?"
+            params.append(upto_id)
+        query += " ORDER BY id"
+
+        with self._lock:
+            # Plain tuples are much cheaper than sqlite3.Row for bulk reads
+            cursor = self._conn.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute(query, params).fetchall()
+
+        names = (
+            "id", "test_name", "status", "duration", "timestamp",
+            "commit_sha", "retry_count", "passed_on_retry",
+        )
+        if not rows:
+            return {name: [] for name in names}
+        return {name: list(values) for name, values in zip(names, zip(*rows))}
+
+    def max_result_id(self) -> int:
+        """Get the highest result id (0 when empty)."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM results").fetchone()[0]
+
+    def get_test_names(self) -> list[str]:
+        """Get the names of all tests with recorded history."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT test_name FROM results ORDER BY test_name"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def count_runs(self, source: str | None = None) -> int:
+        """Count recorded runs, optionally for one source."""
+        query = "SELECT COUNT(*) FROM runs"
+        params: list[Any] = []
+        if source is not None:
+            query += " WHERE source = ?"
+            params.append(source)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            runs = self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+            results = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            tests = self._conn.execute(
+                "SELECT COUNT(DISTINCT test_name) FROM results"
+            ).fetchone()[0]
+        return {
+            "db_path": str(self.db_path),
+            "runs": runs,
+            "results": results,
+            "tests": tests,
+        }
+
+    @staticmethod
+    def _result_dict(row: sqlite3.Row) -> dict[str, Any]:
+        """Convert a results row to a dictionary."""
+        return {
+            "run_id": row["run_id"],
+            "status": row["status"],
+            "passed": row["status"] == "passed",
+            "duration": row["duration"],
+            "timestamp": row["timestamp"],
+            "commit_sha": row["commit_sha"],
+            "branch": row["branch"],
+            "retry_count": row["retry_count"],
+            "passed_on_retry": bool(row["passed_on_retry"]),
+        }
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def import_legacy_json(self, json_path: Path, loader: Any) -> bool:
+        """
+        Import a legacy JSON history file once, then rename it.
+
+        Everything the loader records is written in one transaction, and
+        the file is renamed only after it commits, so a failed import
+        leaves no rows behind and is retried in full next time.
+
+        Args:
+            json_path: Legacy history file
+            loader: Callable receiving (store, parsed JSON) that records it
+
+        Returns:
+            True if the file was imported
+        """
+        json_path = Path(json_path)
+        if not json_path.exists():
+            return False
+        try:
+            data = json.loads(json_path.read_text(encoding="utf-8"))
+            with self.transaction():
+                loader(self, data)
+            json_path.rename(json_path.with_suffix(json_path.suffix + ".migrated"))
+            return True
+        except Exception as e:
+            print(f"Warning: Failed to import legacy history {json_path}: {e}")
+            return False
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+        _stores.pop(str(self.db_path.resolve()), None)
+
+
+# =============================================================================
+# Shared Instances
+# =============================================================================
+
+
+_stores: dict[str, HistoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_history_store(
+    project_path: Path | str | None = None,
+    db_path: Path | str | None = None,
+) -> HistoryStore:
+    """
+    Get the shared history store for a project or database path.
+
+    Args:
+        project_path: Project root (store lives at .cpa/history.db)
+        db_path: Explicit database path (overrides project_path)
+
+    Returns:
+        Shared HistoryStore instance
+    """
+    if db_path is None:
+        root = Path(project_path) if project_path else Path.cwd()
+        db_path = root / ".cpa" / HISTORY_DB_NAME
+    key = str(Path(db_path).resolve())
+
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = HistoryStore(db_path=db_path)
+            _stores[key] = store
+        return store
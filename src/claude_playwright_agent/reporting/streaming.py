@@ -0,0 +1,565 @@
+"""
+Streaming Report Writers
+
+Write test reports incrementally so memory stays flat no matter how many
+results a run produces:
+
+- Results flow through a generator into buffered, chunked file writes
+- Only the current page of results is held in memory
+- HTML reports embed each page as a lazily parsed JSON block and render
+  a paginated table, so the browser only builds DOM for the visible page
+- JUnit XML totals are patched into a reserved header region at close
+- JSON Lines reports write one result per line
+
+Every report gets a sidecar index (``<report>.index.json``) with the run
+summary and the byte offset, size and status counts of each page.
+"""
+
+import json
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+
+# Results per page (HTML table page, index entry)
+PAGE_SIZE = 500
+
+# File buffer size for chunked writes
+CHUNK_SIZE = 256 * 1024
+
+# Bytes reserved in the JUnit header for the totals patched in at close
+_JUNIT_TOTALS_WIDTH = 160
+
+_FAILED_STATUSES = ("failed", "error")
+
+
+def index_path_for(output_path: Path) -> Path:
+    """Get the sidecar index path for a report file."""
+    return output_path.with_name(output_path.name + ".index.json")
+
+
+@dataclass
+class ReportSummary:
+    """
+    Running totals for a streamed report.
+
+    Duration statistics are accumulated with Welford's algorithm so no
+    per-result values are kept.
+    """
+
+    total: int = 0
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    duration: float = 0.0
+    duration_min: float = 0.0
+    duration_max: float = 0.0
+    _mean: float = field(default=0.0, repr=False)
+    _m2: float = field(default=0.0, repr=False)
+
+    def add(self, status: str, duration: float) -> None:
+        """Add one result to the totals."""
+        self.total += 1
+        if status == "passed":
+            self.passed += 1
+        elif status in _FAILED_STATUSES:
+            self.failed += 1
+        elif status == "skipped":
+            self.skipped += 1
+
+        self.duration += duration
+        if self.total == 1:
+            self.duration_min = self.duration_max = duration
+        else:
+            self.duration_min = min(self.duration_min, duration)
+            self.duration_max = max(self.duration_max, duration)
+
+        delta = duration - self._mean
+        self._mean += delta / self.total
+        self._m2 += delta * (duration - self._mean)
+
+    @property
+    def pass_rate(self) -> float:
+        """Pass rate percentage."""
+        return (self.passed / self.total) * 100 if self.total else 0.0
+
+    @property
+    def duration_mean(self) -> float:
+        """Mean result duration."""
+        return self._mean
+
+    @property
+    def duration_stddev(self) -> float:
+        """Sample standard deviation of result durations."""
+        return math.sqrt(self._m2 / (self.total - 1)) if self.total > 1 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "total_tests": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "duration": self.duration,
+            "pass_rate": round(self.pass_rate, 2),
+        }
+
+
+class StreamingReportWriter(ABC):
+    """
+    Base class for streaming report writers.
+
+    Results are buffered one page at a time and handed to ``_write_page``;
+    subclasses render the header, pages and footer. Use as a context
+    manager or call ``close()`` to finish the report.
+    """
+
+    format = ""
+
+    def __init__(
+        self,
+        output_path: Path | str,
+        title: str = "Test Execution Report",
+        framework: str = "",
+        page_size: int = PAGE_SIZE,
+        timestamp: str | None = None,
+    ) -> None:
+        """
+        Initialize the writer and write the report header.
+
+        Args:
+            output_path: Report file to write
+            title: Report title
+            framework: Test framework name
+            page_size: Results per page
+            timestamp: Report timestamp (default: now)
+        """
+        self.output_path = Path(output_path)
+        self.index_path = index_path_for(self.output_path)
+        self.title = title
+        self.framework = framework
+        self.page_size = max(1, page_size)
+        self.timestamp = timestamp or datetime.now().isoformat()
+        self.summary = ReportSummary()
+        # Metric dicts (name, value, unit) rendered at close; set before closing
+        self.metrics: list[dict[str, Any]] = []
+        self.bytes_written = 0
+        self._page: list[dict[str, Any]] = []
+        self._pages: list[dict[str, Any]] = []
+        self._closed = False
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._out: BinaryIO = open(self.output_path, "wb", buffering=CHUNK_SIZE)
+        self._write_header()
+
+    def __enter__(self) -> "StreamingReportWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _emit(self, text: str) -> None:
+        """Write a chunk of text to the report file."""
+        data = text.encode("utf-8")
+        self._out.write(data)
+        self.bytes_written += len(data)
+
+    def write(self, result: dict[str, Any]) -> None:
+        """
+        Add one test result to the report.
+
+        Args:
+            result: Result with name, status, duration and optional error
+        """
+        self.summary.add(result.get("status", "unknown"), result.get("duration", 0.0) or 0.0)
+        self._page.append(result)
+        if len(self._page) >= self.page_size:
+            self._flush_page()
+
+    def write_all(self, results: Iterable[dict[str, Any]]) -> ReportSummary:
+        """
+        Add every result from an iterable (consumed lazily).
+
+        Args:
+            results: Iterable of result dictionaries
+
+        Returns:
+            Running summary
+        """
+        for result in results:
+            self.write(result)
+        return self.summary
+
+    def _flush_page(self) -> None:
+        """Write the buffered page and record it in the index."""
+        if not self._page:
+            return
+
+        page = self._page
+        self._page = []
+        offset = self.bytes_written
+        self._write_page(len(self._pages), page)
+
+        statuses = [r.get("status", "unknown") for r in page]
+        self._pages.append({
+            "page": len(self._pages),
+            "offset": offset,
+            "length": self.bytes_written - offset,
+            "count": len(page),
+            "passed": statuses.count("passed"),
+            "failed": sum(statuses.count(s) for s in _FAILED_STATUSES),
+            "skipped": statuses.count("skipped"),
+            "first": page[0].get("name", ""),
+            "last": page[-1].get("name", ""),
+        })
+
+    def close(self) -> ReportSummary:
+        """
+        Finish the report and write its sidecar index.
+
+        Returns:
+            Final summary
+        """
+        if self._closed:
+            return self.summary
+        self._closed = True
+
+        self._flush_page()
+        self._write_footer()
+        self._out.close()
+        self._finalize()
+
+        index = {
+            "report": self.output_path.name,
+            "format": self.format,
+            "title": self.title,
+            "framework": self.framework,
+            "timestamp": self.timestamp,
+            "page_size": self.page_size,
+            "bytes": self.bytes_written,
+            "summary": self.summary.to_dict(),
+            "metrics": self.metrics,
+            "pages": self._pages,
+        }
+        self.index_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+        return self.summary
+
+    def _write_header(self) -> None:
+        """Write the start of the report."""
+
+    @abstractmethod
+    def _write_page(self, page_number: int, results: list[dict[str, Any]]) -> None:
+        """Write one page of results."""
+
+    def _write_footer(self) -> None:
+        """Write the end of the report."""
+
+    def _finalize(self) -> None:
+        """Post-process the closed report file."""
+
+
+def _result_record(result: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a result to the fields rendered in reports."""
+    return {
+        "name": result.get("name", "Unknown"),
+        "status": result.get("status", "unknown"),
+        "duration": result.get("duration", 0.0) or 0.0,
+        "error": result.get("error_message") or result.get("error") or "",
+        "file": result.get("file", ""),
+    }
+
+
+class JSONLReportWriter(StreamingReportWriter):
+    """Write results as JSON Lines, one result per line."""
+
+    format = "jsonl"
+
+    def _write_page(self, page_number: int, results: list[dict[str, Any]]) -> None:
+        self._emit("".join(json.dumps(r, default=str) + "\n" for r in results))
+
+
+class JUnitReportWriter(StreamingReportWriter):
+    """
+    Write results as JUnit XML.
+
+    The totals attributes of ``<testsuites>`` are not known until the end,
+    so the header reserves a run of whitespace (legal between attributes)
+    that is overwritten in place when the report is closed.
+    """
+
+    format = "junit"
+
+    def _write_header(self) -> None:
+        self._emit('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self._emit(f"<testsuites name={quoteattr(self.framework)}")
+        self._totals_offset = self.bytes_written
+        self._emit(" " * _JUNIT_TOTALS_WIDTH + ">\n")
+
+    def _write_page(self, page_number: int, results: list[dict[str, Any]]) -> None:
+        chunk = []
+        for result in results:
+            record = _result_record(result)
+            chunk.append(
+                f"  <testcase name={quoteattr(str(record['name']))} "
+                f'time="{record["duration"]:.3f}">\n'
+            )
+            if record["status"] in _FAILED_STATUSES:
+                message = record["error"] or "Test failed"
+                chunk.append(
+                    f"    <failure message={quoteattr(str(message).splitlines()[0] if message else '')}>"
+                    f"{escape(str(message))}</failure>\n"
+                )
+            elif record["status"] == "skipped":
+                chunk.append("    <skipped/>\n")
+            chunk.append("  </testcase>\n")
+        self._emit("".join(chunk))
+
+    def _write_footer(self) -> None:
+        self._emit("</testsuites>\n")
+
+    def _finalize(self) -> None:
+        s = self.summary
+        totals = (
+            f' tests="{s.total}" failures="{s.failed}" '
+            f'skipped="{s.skipped}" time="{s.duration:.3f}"'
+        ).encode("utf-8")
+        with open(self.output_path, "r+b") as f:
+            f.seek(self._totals_offset)
+            f.write(totals.ljust(_JUNIT_TOTALS_WIDTH)[:_JUNIT_TOTALS_WIDTH])
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title} - {timestamp}</title>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }}
+        .container {{ max-width: 1200px; margin: 0 auto; padding: 20px; }}
+        .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 30px; }}
+        .header h1 {{ font-size: 28px; margin-bottom: 10px; }}
+        .summary {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 20px; margin-bottom: 30px; }}
+        .summary-card {{ background: white; border-radius: 8px; padding: 20px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
+        .summary-card h3 {{ font-size: 14px; color: #6b7280; margin-bottom: 5px; }}
+        .summary-card .value {{ font-size: 32px; font-weight: bold; }}
+        .passed {{ color: #10b981; }}
+        .failed, .error {{ color: #ef4444; }}
+        .skipped {{ color: #f59e0b; }}
+        .test-results {{ background: white; border-radius: 8px; padding: 20px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
+        .toolbar {{ display: flex; gap: 10px; align-items: center; margin-bottom: 15px; }}
+        table {{ width: 100%; border-collapse: collapse; table-layout: fixed; }}
+        th, td {{ padding: 8px 10px; text-align: left; border-bottom: 1px solid #e5e7eb; overflow: hidden; text-overflow: ellipsis; }}
+        th {{ background: #f9fafb; }}
+        td.error-cell {{ white-space: pre-wrap; font-family: monospace; font-size: 12px; }}
+        .metrics {{ background: white; border-radius: 8px; padding: 20px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); margin-top: 30px; }}
+        .metrics h2 {{ margin-bottom: 20px; }}
+        .metric-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; }}
+        .metric {{ background: #f9fafb; padding: 15px; border-radius: 6px; }}
+        .metric-name {{ font-size: 12px; color: #6b7280; }}
+        .metric-value {{ font-size: 20px; font-weight: 600; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>{title}</h1>
+            <p>{timestamp}</p>
+            <p>{framework}</p>
+        </div>
+        <div class="summary" id="summary"></div>
+        <div class="test-results">
+            <h2>Test Results</h2>
+            <div class="toolbar">
+                <button id="prev">&laquo; Prev</button>
+                <span id="page-label"></span>
+                <button id="next">Next &raquo;</button>
+                <label><input type="checkbox" id="failed-only"> Failed only</label>
+            </div>
+            <table>
+                <thead><tr><th style="width:40%">Test</th><th style="width:10%">Status</th><th style="width:10%">Duration</th><th>Error</th></tr></thead>
+                <tbody id="results"></tbody>
+            </table>
+        </div>
+"""
+
+_HTML_VIEWER = """<script>
+(function () {
+    var report = JSON.parse(document.getElementById("cpa-report").textContent);
+    var blocks = document.querySelectorAll("script.cpa-page");
+    var cache = {};
+    var current = 0;
+    var s = report.summary;
+
+    function page(n) {
+        if (!(n in cache)) { cache = {}; cache[n] = JSON.parse(blocks[n].textContent); }
+        return cache[n];
+    }
+    function visible() {
+        var failedOnly = document.getElementById("failed-only").checked;
+        return report.pages.filter(function (p) { return !failedOnly || p.failed > 0; });
+    }
+    function text(tag, value, cls) {
+        var el = document.createElement(tag);
+        el.textContent = value;
+        if (cls) { el.className = cls; }
+        return el;
+    }
+    function render() {
+        var pages = visible();
+        current = Math.max(0, Math.min(current, pages.length - 1));
+        var body = document.getElementById("results");
+        body.textContent = "";
+        document.getElementById("page-label").textContent =
+            pages.length ? "Page " + (current + 1) + " of " + pages.length : "No results";
+        if (!pages.length) { return; }
+        var failedOnly = document.getElementById("failed-only").checked;
+        page(pages[current].page).forEach(function (r) {
+            if (failedOnly && r.status !== "failed" && r.status !== "error") { return; }
+            var row = document.createElement("tr");
+            row.appendChild(text("td", r.name));
+            row.appendChild(text("td", r.status, r.status));
+            row.appendChild(text("td", r.duration.toFixed(2) + "s"));
+            row.appendChild(text("td", r.error, "error-cell"));
+            body.appendChild(row);
+        });
+    }
+
+    var cards = [["Total", s.total_tests, ""], ["Passed", s.passed, "passed"],
+                 ["Failed", s.failed, "failed"], ["Skipped", s.skipped, "skipped"],
+                 ["Pass Rate", s.pass_rate.toFixed(1) + "%", ""],
+                 ["Duration", s.duration.toFixed(2) + "s", ""]];
+    var summary = document.getElementById("summary");
+    cards.forEach(function (c) {
+        var card = text("div", "", "summary-card");
+        card.appendChild(text("h3", c[0]));
+        card.appendChild(text("div", c[1], "value " + c[2]));
+        summary.appendChild(card);
+    });
+
+    document.getElementById("prev").onclick = function () { current -= 1; render(); };
+    document.getElementById("next").onclick = function () { current += 1; render(); };
+    document.getElementById("failed-only").onchange = function () { current = 0; render(); };
+    render();
+})();
+</script>
+</body>
+</html>
+"""
+
+
+def _script_json(data: Any) -> str:
+    """Serialize JSON for embedding in a <script> block."""
+    return json.dumps(data, default=str).replace("</", "<\\/")
+
+
+class HTMLReportWriter(StreamingReportWriter):
+    """
+    Write a paginated HTML report.
+
+    Each page of results is embedded as a ``<script type="application/json">``
+    block that the viewer parses only when the page is shown. The summary
+    and page index are written at the end, once totals are known.
+    """
+
+    format = "html"
+
+    def _write_header(self) -> None:
+        self._emit(_HTML_HEAD.format(
+            title=escape(self.title),
+            timestamp=escape(self.timestamp),
+            framework=escape(self.framework),
+        ))
+
+    def _write_page(self, page_number: int, results: list[dict[str, Any]]) -> None:
+        records = [_result_record(r) for r in results]
+        self._emit(
+            f'<script type="application/json" class="cpa-page" data-page="{page_number}">'
+            f"{_script_json(records)}</script>\n"
+        )
+
+    def _write_footer(self) -> None:
+        if self.metrics:
+            cards = "".join(
+                f'                <div class="metric">\n'
+                f'                    <div class="metric-name">{escape(m["name"].replace("_", " ").title())}</div>\n'
+                f'                    <div class="metric-value">{m["value"]:.2f} {escape(m.get("unit", ""))}</div>\n'
+                f"                </div>\n"
+                for m in self.metrics
+            )
+            self._emit(
+                '        <div class="metrics">\n'
+                "            <h2>Performance Metrics</h2>\n"
+                f'            <div class="metric-grid">\n{cards}            </div>\n'
+                "        </div>\n"
+            )
+        self._emit("    </div>\n")
+
+        report = {"summary": self.summary.to_dict(), "pages": self._pages}
+        self._emit(
+            f'<script type="application/json" id="cpa-report">{_script_json(report)}</script>\n'
+        )
+        self._emit(_HTML_VIEWER)
+
+
+REPORT_WRITERS: dict[str, type[StreamingReportWriter]] = {
+    "html": HTMLReportWriter,
+    "junit": JUnitReportWriter,
+    "jsonl": JSONLReportWriter,
+}
+
+
+def get_report_writer(
+    format: str,
+    output_path: Path | str,
+    **kwargs: Any,
+) -> StreamingReportWriter:
+    """
+    Create a streaming writer for a report format.
+
+    Args:
+        format: One of "html", "junit" or "jsonl"
+        output_path: Report file to write
+        **kwargs: Passed to the writer (title, framework, page_size)
+
+    Returns:
+        Open StreamingReportWriter
+
+    Raises:
+        ValueError: If the format has no streaming writer
+    """
+    writer_class: Optional[type[StreamingReportWriter]] = REPORT_WRITERS.get(format)
+    if writer_class is None:
+        raise ValueError(
+            f"No streaming writer for format '{format}'. "
+            f"Available: {', '.join(REPORT_WRITERS)}"
+        )
+    return writer_class(output_path, **kwargs)
+
+
+def write_report(
+    results: Iterable[dict[str, Any]],
+    output_path: Path | str,
+    format: str = "html",
+    **kwargs: Any,
+) -> ReportSummary:
+    """
+    Stream results into a report file.
+
+    Args:
+        results: Iterable of result dictionaries (consumed lazily)
+        output_path: Report file to write
+        format: One of "html", "junit" or "jsonl"
+        **kwargs: Passed to the writer (title, framework, page_size)
+
+    Returns:
+        Final report summary
+    """
+    with get_report_writer(format, output_path, **kwargs) as writer:
+        writer.write_all(results)
+    return writer.summary
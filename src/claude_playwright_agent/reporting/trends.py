@@ -5,14 +5,19 @@ Analyzes test execution data over time to identify trends,
 regressions, and improvements.
 """
 
-import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional, list
+from typing import Any, Optional
 from dataclasses import dataclass, field
 from collections import defaultdict
 import statistics
 
+from claude_playwright_agent.reporting.history_store import (
+    HISTORY_DB_NAME,
+    HistoryStore,
+    get_history_store,
+)
+
 
 @dataclass
 class TestRun:
@@ -66,18 +71,50 @@ class TrendAnalyzer:
     - Historical comparison
     """
 
-    def __init__(self, data_dir: str = ".cpa/trends"):
+    SOURCE = "trends"
+
+    def __init__(
+        self,
+        data_dir: str = ".cpa/trends",
+        store: Optional[HistoryStore] = None,
+        source: Optional[str] = SOURCE,
+    ):
         """
         Initialize the trend analyzer.
 
         Args:
-            data_dir: Directory to store trend data
+            data_dir: Trend data directory; the shared history store lives
+                next to it (``.cpa/history.db`` for the default)
+            store: History store to use instead of the shared one
+            source: Only analyze runs recorded by this source (None for all)
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self._history: list[TestRun] = []
+        self._store = store or get_history_store(db_path=self.data_dir.parent / HISTORY_DB_NAME)
+        self.source = source
         self._load_history()
 
+    @property
+    def _history(self) -> list[TestRun]:
+        """All recorded runs, oldest first."""
+        return self._get_runs()
+
+    def _get_runs(self, since: Optional[str] = None) -> list[TestRun]:
+        """Load runs from the history store."""
+        return [
+            TestRun(
+                timestamp=run["timestamp"],
+                total_tests=run["total_tests"],
+                passed=run["passed"],
+                failed=run["failed"],
+                skipped=run["skipped"],
+                duration=run["duration"],
+                commit_sha=run["commit_sha"],
+                branch=run["branch"],
+            )
+            for run in self._store.get_runs(source=self.source, since=since)
+        ]
+
     def record_run(
         self,
         total_tests: int,
@@ -89,9 +126,10 @@ class TrendAnalyzer:
         branch: str = "main",
     ):
         """Record a test run."""
-        run = TestRun(
+        self._store.record_run(
+            source=self.SOURCE,
             timestamp=datetime.now().isoformat(),
-            total_tests=total_tests,
+            total=total_tests,
             passed=passed,
             failed=failed,
             skipped=skipped,
@@ -100,26 +138,23 @@ class TrendAnalyzer:
             branch=branch,
         )
 
-        self._history.append(run)
-        self._save_history()
-
     def _load_history(self):
-        """Load historical data."""
-        history_file = self.data_dir / "history.json"
-
-        if history_file.exists():
-            try:
-                data = json.loads(history_file.read_text(encoding="utf-8"))
-                self._history = [TestRun(**run) for run in data]
-            except Exception as e:
-                print(f"Warning: Failed to load history: {e}")
-
-    def _save_history(self):
-        """Save historical data."""
-        history_file = self.data_dir / "history.json"
-
-        data = [run.to_dict() for run in self._history]
-        history_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        """Import a legacy history.json into the history store."""
+        def load(store: HistoryStore, data: list[dict]) -> None:
+            for run in data:
+                store.record_run(
+                    source=self.SOURCE,
+                    timestamp=run["timestamp"],
+                    total=run["total_tests"],
+                    passed=run["passed"],
+                    failed=run["failed"],
+                    skipped=run["skipped"],
+                    duration=run["duration"],
+                    commit_sha=run.get("commit_sha", ""),
+                    branch=run.get("branch", "main"),
+                )
+
+        self._store.import_legacy_json(self.data_dir / "history.json", load)
 
     def get_pass_rate_trend(self, days: int = 30) -> dict:
         """
@@ -132,10 +167,7 @@ class TrendAnalyzer:
             Dictionary with trend data
         """
         cutoff = datetime.now() - timedelta(days=days)
-        recent_runs = [
-            run for run in self._history
-            if datetime.fromisoformat(run.timestamp) > cutoff
-        ]
+        recent_runs = self._get_runs(since=cutoff.isoformat())
 
         if not recent_runs:
             return {"trend": "no_data", "pass_rates": []}
@@ -180,22 +212,25 @@ class TrendAnalyzer:
             List of detected regressions
         """
         regressions = []
+        history = self._history
 
-        if len(self._history) < window * 2:
+        if len(history) < window * 2:
             return regressions
 
-        for i in range(window, len(self._history)):
-            # Compare current window with previous window
-            current_window = self._history[i-window:i]
-            previous_window = self._history[i-window*2:i-window]
+        # Window sums from prefix sums: O(n) instead of O(n * window)
+        prefix = [0.0]
+        for run in history:
+            prefix.append(prefix[-1] + run.duration)
 
-            current_avg = statistics.mean([r.duration for r in current_window])
-            previous_avg = statistics.mean([r.duration for r in previous_window])
+        for i in range(window * 2, len(history) + 1):
+            # Compare current window with previous window
+            current_avg = (prefix[i] - prefix[i - window]) / window
+            previous_avg = (prefix[i - window] - prefix[i - window * 2]) / window
 
             # Detect if slowdown > 20%
-            if current_avg > previous_avg * 1.2:
+            if previous_avg > 0 and current_avg > previous_avg * 1.2:
                 regressions.append({
-                    "detected_at": self._history[i-1].timestamp,
+                    "detected_at": history[i-1].timestamp,
                     "severity": (current_avg - previous_avg) / previous_avg,
                     "previous_avg_duration": previous_avg,
                     "current_avg_duration": current_avg,
@@ -218,9 +253,8 @@ class TrendAnalyzer:
 
         # Group by branch
         by_branch: dict[str, list[TestRun]] = defaultdict(list)
-        for run in self._history:
-            if datetime.fromisoformat(run.timestamp) > cutoff:
-                by_branch[run.branch].append(run)
+        for run in self._get_runs(since=cutoff.isoformat()):
+            by_branch[run.branch].append(run)
 
         # Calculate stats per branch
         comparison = {}
@@ -249,10 +283,7 @@ class TrendAnalyzer:
             Summary dictionary
         """
         cutoff = datetime.now() - timedelta(days=days)
-        recent_runs = [
-            run for run in self._history
-            if datetime.fromisoformat(run.timestamp) > cutoff
-        ]
+        recent_runs = self._get_runs(since=cutoff.isoformat())
 
         if not recent_runs:
             return {
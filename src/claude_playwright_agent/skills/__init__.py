@@ -7,11 +7,14 @@ This module provides:
 - Custom skill loading from project directories
 - Skill lifecycle management (enable/disable)
 - Skill manifest parsing from YAML
+- Persistent skill index for fast startup
+- Bounded registries and memory budgets for skill agents
 """
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from claude_playwright_agent.agents.base import BaseAgent
+if TYPE_CHECKING:
+    from claude_playwright_agent.agents.base import BaseAgent
 
 # Import models to avoid circular imports
 from .models import (
@@ -29,12 +32,25 @@ from .models import (
 from .loader import (
     CircularDependencyError,
     DependencyError,
+    SkillInitResult,
     SkillLoader,
     SkillLoadError,
     SkillNotFoundError,
     discover_skills,
+    initialize_skills,
     load_skills,
 )
+from .cache import SkillIndexCache
+from .bounded import (
+    BoundedDict,
+    BoundedList,
+    MemoryBudget,
+    RegistryLimits,
+    bounded_dict,
+    bounded_list,
+    configure_registries,
+    get_memory_report,
+)
 
 # Import manifest functionality
 from .manifest import (
@@ -104,6 +120,18 @@ __all__ = [
     "CircularDependencyError",
     "discover_skills",
     "load_skills",
+    "SkillInitResult",
+    "initialize_skills",
+    "SkillIndexCache",
+    # Bounded registries
+    "BoundedDict",
+    "BoundedList",
+    "MemoryBudget",
+    "RegistryLimits",
+    "bounded_dict",
+    "bounded_list",
+    "configure_registries",
+    "get_memory_report",
     # Versioning (E7.1)
     "PreReleaseType",
     "Version",
@@ -132,3 +160,12 @@ __all__ = [
     "parse_dependency",
     "check_dependency_compatibility",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve BaseAgent lazily; it imports the Claude SDK."""
+    if name == "BaseAgent":
+        from claude_playwright_agent.agents.base import BaseAgent
+
+        return BaseAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,547 @@
+"""
+Bounded registries for skill agents.
+
+This module provides:
+- BoundedList and BoundedDict, drop-in list/dict subclasses that evict
+  their oldest entries by count, age or estimated size
+- Optional spill-to-disk of evicted entries as JSON lines
+- A memory budget per skill, shared by all of a skill agent's
+  registries, with usage reported per skill
+
+Skill agents record every operation in histories and registries; without
+bounds a long-running orchestrator's memory grows with all the work it
+has ever done.
+"""
+
+import dataclasses
+import itertools
+import json
+import sys
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+# Default memory budget per skill agent (estimated bytes)
+DEFAULT_SKILL_BUDGET = 32 * 1024 * 1024
+
+# Directory evicted entries are spilled to (None: discard them)
+_spill_dir: Path | None = None
+
+
+@dataclass
+class RegistryLimits:
+    """
+    Eviction limits of a bounded registry.
+
+    Attributes:
+        max_items: Maximum number of entries (None: unlimited)
+        max_age: Seconds an entry is kept after it was added (None: forever)
+        max_bytes: Maximum estimated size of all entries (None: unlimited)
+        spill: Write evicted entries to the spill directory
+    """
+    max_items: int | None = 1000
+    max_age: float | None = None
+    max_bytes: int | None = None
+    spill: bool = True
+
+
+HISTORY_LIMITS = RegistryLimits(max_items=1000)
+REGISTRY_LIMITS = RegistryLimits(max_items=1000, max_age=24 * 3600)
+CACHE_LIMITS = RegistryLimits(max_items=256, spill=False)
+
+
+def configure_registries(
+    spill_dir: Path | str | None = None,
+    skill_budget: int | None = DEFAULT_SKILL_BUDGET,
+) -> None:
+    """
+    Configure bounded registries created from now on.
+
+    Args:
+        spill_dir: Directory evicted entries are written to (None: discard)
+        skill_budget: Memory budget per skill agent in bytes (None: unlimited)
+    """
+    global _spill_dir, DEFAULT_SKILL_BUDGET
+    _spill_dir = Path(spill_dir) if spill_dir else None
+    DEFAULT_SKILL_BUDGET = skill_budget
+
+
+# =============================================================================
+# Size Estimation
+# =============================================================================
+
+
+def estimate_size(obj: Any, depth: int = 3, sample: int = 32) -> int:
+    """
+    Estimate the memory held by an object.
+
+    Containers are followed ``depth`` levels deep; for large containers
+    the first ``sample`` children are measured and extrapolated.
+
+    Args:
+        obj: Object to measure
+        depth: Container levels to follow
+        sample: Children measured per container
+
+    Returns:
+        Estimated size in bytes
+    """
+    size = sys.getsizeof(obj)
+    if depth <= 0:
+        return size
+
+    if isinstance(obj, dict):
+        count = len(obj)
+        measured = sum(
+            estimate_size(key, depth - 1, sample) + estimate_size(value, depth - 1, sample)
+            for key, value in itertools.islice(obj.items(), sample)
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        count = len(obj)
+        measured = sum(
+            estimate_size(item, depth - 1, sample) for item in itertools.islice(obj, sample)
+        )
+    elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+        return size + estimate_size(vars(obj), depth, sample)
+    else:
+        return size
+
+    if not count:
+        return size
+    return size + measured * count // min(count, sample)
+
+
+def _to_json(value: Any) -> Any:
+    """Convert an entry to a JSON-serializable value."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return value
+
+
+# =============================================================================
+# Memory Budgets
+# =============================================================================
+
+
+# Budgets of live skill agents, for reporting
+_budgets: "weakref.WeakSet[MemoryBudget]" = weakref.WeakSet()
+# Skill agent -> its budget
+_owner_budgets: "weakref.WeakKeyDictionary[Any, MemoryBudget]" = weakref.WeakKeyDictionary()
+
+
+class MemoryBudget:
+    """
+    Memory budget shared by the registries of one skill agent.
+
+    When the registries together exceed the budget, the oldest entries
+    of the largest registry are evicted until they fit.
+    """
+
+    def __init__(self, owner: str, max_bytes: int | None = None) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            owner: Skill name usage is reported under
+            max_bytes: Budget in estimated bytes (None: unlimited)
+        """
+        self.owner = owner
+        self.max_bytes = max_bytes
+        self._registries: list[weakref.ref] = []
+        _budgets.add(self)
+
+    @classmethod
+    def for_owner(cls, owner: Any) -> "MemoryBudget":
+        """Get the budget of a skill agent, creating it on first use."""
+        budget = _owner_budgets.get(owner)
+        if budget is None:
+            name = getattr(owner, "name", None) or type(owner).__name__
+            budget = cls(name, DEFAULT_SKILL_BUDGET)
+            _owner_budgets[owner] = budget
+        return budget
+
+    def add(self, registry: "_BoundedMixin") -> None:
+        """Attach a registry to the budget."""
+        self._registries.append(weakref.ref(registry))
+
+    @property
+    def registries(self) -> list["_BoundedMixin"]:
+        """Live registries counted against the budget."""
+        live = [r for ref in self._registries if (r := ref()) is not None]
+        if len(live) != len(self._registries):
+            self._registries = [weakref.ref(r) for r in live]
+        return live
+
+    @property
+    def used(self) -> int:
+        """Estimated bytes held by the live registries."""
+        return sum(r.nbytes for r in self.registries)
+
+    def enforce(self) -> None:
+        """Evict entries from the largest registries until within budget."""
+        if self.max_bytes is None:
+            return
+        while self.used > self.max_bytes:
+            largest = max(
+                (r for r in self.registries if len(r)),
+                key=lambda r: r.nbytes,
+                default=None,
+            )
+            if largest is None:
+                break
+            largest._evict_oldest()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        registries = self.registries
+        return {
+            "owner": self.owner,
+            "used_bytes": self.used,
+            "budget_bytes": self.max_bytes,
+            "entries": sum(len(r) for r in registries),
+            "evicted": sum(r.evicted for r in registries),
+            "registries": {r.name: len(r) for r in registries},
+        }
+
+
+def get_memory_report() -> dict[str, dict[str, Any]]:
+    """
+    Get registry memory usage per skill.
+
+    Returns:
+        Usage per skill name, summed over live agents of the skill
+    """
+    report: dict[str, dict[str, Any]] = {}
+    for budget in list(_budgets):
+        data = budget.to_dict()
+        entry = report.setdefault(budget.owner, {
+            "agents": 0,
+            "used_bytes": 0,
+            "budget_bytes": data["budget_bytes"],
+            "entries": 0,
+            "evicted": 0,
+        })
+        entry["agents"] += 1
+        for key in ("used_bytes", "entries", "evicted"):
+            entry[key] += data[key]
+    return report
+
+
+# =============================================================================
+# Bounded Registries
+# =============================================================================
+
+
+class _BoundedMixin:
+    """Shared eviction and accounting of BoundedList and BoundedDict."""
+
+    name: str
+    limits: RegistryLimits
+    budget: MemoryBudget | None
+    nbytes: int
+    evicted: int
+
+    def _init_bounds(
+        self,
+        name: str,
+        limits: RegistryLimits | None,
+        budget: MemoryBudget | None,
+    ) -> None:
+        self.name = name
+        self.limits = limits or RegistryLimits()
+        self.budget = budget
+        self.nbytes = 0
+        self.evicted = 0
+        self._measure = (
+            budget is not None and budget.max_bytes is not None
+        ) or self.limits.max_bytes is not None
+        if budget is not None:
+            budget.add(self)
+
+    def _size_of(self, value: Any) -> int:
+        """Estimate an entry's size, if any limit needs it."""
+        return estimate_size(value) if self._measure else 0
+
+    def _charge(self, delta: int) -> None:
+        """Account for a change in estimated size."""
+        self.nbytes += delta
+
+    def _enforce(self) -> None:
+        """Evict until every limit holds."""
+        limits = self.limits
+        if limits.max_items is not None:
+            while len(self) > limits.max_items:
+                self._evict_oldest()
+        if limits.max_age is not None:
+            cutoff = time.monotonic() - limits.max_age
+            while len(self) and self._oldest_time() < cutoff:
+                self._evict_oldest()
+        if limits.max_bytes is not None:
+            while len(self) and self.nbytes > limits.max_bytes:
+                self._evict_oldest()
+        if self.budget is not None:
+            self.budget.enforce()
+
+    def _spill(self, key: Any, value: Any) -> None:
+        """Append an evicted entry to this registry's spill file."""
+        if _spill_dir is None or not self.limits.spill:
+            return
+        owner = self.budget.owner if self.budget else "registries"
+        path = _spill_dir / owner / f"{self.name}.jsonl"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            line = json.dumps(
+                {"key": key, "evicted_at": time.time(), "value": _to_json(value)},
+                default=str,
+            )
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def expire(self) -> int:
+        """
+        Evict entries older than ``max_age`` without adding one.
+
+        Returns:
+            Number of entries evicted
+        """
+        before = self.evicted
+        self._enforce()
+        return self.evicted - before
+
+    def _oldest_time(self) -> float:
+        """Get the monotonic time the oldest entry was added."""
+        raise NotImplementedError
+
+    def _evict_oldest(self) -> None:
+        """Evict the oldest entry."""
+        raise NotImplementedError
+
+
+class BoundedList(_BoundedMixin, list):
+    """
+    List that evicts its oldest entries when a limit is exceeded.
+
+    Use it for append-only histories. Entries are timed and measured when
+    appended; other in-place mutations are tolerated but resynchronize
+    the metadata as if the remaining entries had just been added.
+    """
+
+    def __init__(
+        self,
+        iterable: Iterable[Any] = (),
+        *,
+        name: str = "history",
+        limits: RegistryLimits | None = None,
+        budget: MemoryBudget | None = None,
+    ) -> None:
+        """
+        Initialize the list.
+
+        Args:
+            iterable: Initial entries
+            name: Registry name (for reports and spill files)
+            limits: Eviction limits
+            budget: Memory budget the list counts against
+        """
+        list.__init__(self)
+        self._init_bounds(name, limits, budget)
+        self._times: deque[float] = deque()
+        self._sizes: deque[int] = deque()
+        self.extend(iterable)
+
+    def _resync(self) -> None:
+        """Rebuild entry metadata after a mutation other than append."""
+        if len(self._times) == len(self):
+            return
+        now = time.monotonic()
+        self._charge(-sum(self._sizes))
+        self._times = deque(now for _ in self)
+        self._sizes = deque(self._size_of(item) for item in self)
+        self._charge(sum(self._sizes))
+
+    def append(self, item: Any) -> None:
+        """Append an entry, evicting the oldest entries if needed."""
+        self._resync()
+        list.append(self, item)
+        size = self._size_of(item)
+        self._times.append(time.monotonic())
+        self._sizes.append(size)
+        self._charge(size)
+        self._enforce()
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every entry of an iterable."""
+        for item in iterable:
+            self.append(item)
+
+    def __iadd__(self, iterable: Iterable[Any]) -> "BoundedList":
+        self.extend(iterable)
+        return self
+
+    def _oldest_time(self) -> float:
+        self._resync()
+        return self._times[0]
+
+    def _evict_oldest(self) -> None:
+        self._resync()
+        item = list.pop(self, 0)
+        self._times.popleft()
+        self._charge(-self._sizes.popleft())
+        self.evicted += 1
+        self._spill(None, item)
+
+
+class BoundedDict(_BoundedMixin, dict):
+    """
+    Dict that evicts its least recently written entries when a limit is exceeded.
+
+    Writing an existing key moves it to the newest position.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        name: str = "registry",
+        limits: RegistryLimits | None = None,
+        budget: MemoryBudget | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize the dict.
+
+        Args:
+            *args: Initial entries, as for dict()
+            name: Registry name (for reports and spill files)
+            limits: Eviction limits
+            budget: Memory budget the dict counts against
+            **kwargs: Initial entries, as for dict()
+        """
+        dict.__init__(self)
+        self._init_bounds(name, limits, budget)
+        # key -> (time added, estimated size)
+        self._meta: dict[Any, tuple[float, int]] = {}
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if key in self:
+            self._forget(key)
+            dict.__delitem__(self, key)
+        dict.__setitem__(self, key, value)
+        size = self._size_of(value)
+        self._meta[key] = (time.monotonic(), size)
+        self._charge(size)
+        self._enforce()
+
+    def _forget(self, key: Any) -> None:
+        """Drop a key's metadata."""
+        _, size = self._meta.pop(key, (0.0, 0))
+        self._charge(-size)
+
+    def __delitem__(self, key: Any) -> None:
+        dict.__delitem__(self, key)
+        self._forget(key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Set every entry of a mapping or iterable of pairs."""
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        """Get an entry, setting it to ``default`` if missing."""
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        """Remove and return an entry."""
+        if key in self:
+            self._forget(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> tuple[Any, Any]:
+        """Remove and return the newest entry."""
+        key, value = dict.popitem(self)
+        self._forget(key)
+        return key, value
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        dict.clear(self)
+        self._charge(-sum(size for _, size in self._meta.values()))
+        self._meta.clear()
+
+    def copy(self) -> dict[Any, Any]:
+        """Get a plain dict copy."""
+        return dict(self)
+
+    def _oldest_time(self) -> float:
+        return self._meta[next(iter(self))][0]
+
+    def _evict_oldest(self) -> None:
+        key = next(iter(self))
+        value = dict.pop(self, key)
+        self._forget(key)
+        self.evicted += 1
+        self._spill(key, value)
+
+
+# =============================================================================
+# Skill Agent Helpers
+# =============================================================================
+
+
+def bounded_list(
+    owner: Any,
+    name: str,
+    limits: RegistryLimits | None = None,
+) -> BoundedList:
+    """
+    Create a bounded history counted against a skill agent's budget.
+
+    Args:
+        owner: Skill agent owning the history
+        name: History name
+        limits: Eviction limits (default: HISTORY_LIMITS)
+
+    Returns:
+        Empty bounded list
+    """
+    return BoundedList(
+        name=name,
+        limits=limits or HISTORY_LIMITS,
+        budget=MemoryBudget.for_owner(owner),
+    )
+
+
+def bounded_dict(
+    owner: Any,
+    name: str,
+    limits: RegistryLimits | None = None,
+) -> BoundedDict:
+    """
+    Create a bounded registry counted against a skill agent's budget.
+
+    Args:
+        owner: Skill agent owning the registry
+        name: Registry name
+        limits: Eviction limits (default: REGISTRY_LIMITS)
+
+    Returns:
+        Empty bounded dict
+    """
+    return BoundedDict(
+        name=name,
+        limits=limits or REGISTRY_LIMITS,
+        budget=MemoryBudget.for_owner(owner),
+    )
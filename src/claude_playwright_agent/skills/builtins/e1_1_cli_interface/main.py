@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class CLIInterfaceAgent(BaseAgent):
@@ -38,7 +39,7 @@ class CLIInterfaceAgent(BaseAgent):
             kwargs["system_prompt"] = "You are a agent for the Playwright test automation framework. You help users with tasks and operations."
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
         self._commands: dict[str, Any] = {}
         self._command_groups: dict[str, list[str]] = {}
 
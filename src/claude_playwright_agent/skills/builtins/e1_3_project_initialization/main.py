@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class ProjectInitializationAgent(BaseAgent):
@@ -38,7 +39,7 @@ class ProjectInitializationAgent(BaseAgent):
             kwargs["system_prompt"] = "You are a E1.3 - Project Initialization agent for the Playwright test automation framework. You help users with e1.3 - project initialization tasks and operations."
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
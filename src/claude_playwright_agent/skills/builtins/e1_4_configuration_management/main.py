@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class ConfigurationManagementAgent(BaseAgent):
@@ -38,7 +39,7 @@ class ConfigurationManagementAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E1.4 - Configuration Management agent for the Playwright test automation framework. You help users with e1.4 - configuration management tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
         self._config_manager = None
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
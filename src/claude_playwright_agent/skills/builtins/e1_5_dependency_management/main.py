@@ -15,6 +15,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class DependencyManagementAgent(BaseAgent):
@@ -54,7 +55,7 @@ class DependencyManagementAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E1.5 - Dependency Management agent for the Playwright test automation framework. You help users with e1.5 - dependency management tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
         self._installed_packages: dict[str, str] = {}
         self._installed_browsers: dict[str, bool] = {}
 
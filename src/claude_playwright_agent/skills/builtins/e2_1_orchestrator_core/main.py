@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any, Awaitable, Callable
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 @dataclass
@@ -140,8 +141,8 @@ class OrchestratorCoreAgent(BaseAgent):
             kwargs["system_prompt"] = "You are a E2.1 - Orchestrator Agent Core agent for the Playwright test automation framework. You help users with e2.1 - orchestrator agent core tasks and operations."
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._active_workflows: dict[str, WorkflowResult] = {}
+        self._context_history = bounded_list(self, "context_history")
+        self._active_workflows: dict[str, WorkflowResult] = bounded_dict(self, "active_workflows")
         self._agent_registry: dict[str, Callable[[], BaseAgent]] = {}
         self._message_queue: Any = None
 
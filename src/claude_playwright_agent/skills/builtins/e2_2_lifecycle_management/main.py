@@ -19,6 +19,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class LifecycleState(str, Enum):
@@ -120,7 +121,7 @@ class LifecycleManagementAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E2.2 - Agent Lifecycle Management agent for the Playwright test automation framework. You help users with e2.2 - agent lifecycle management tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
         self._lifecycle_contexts: dict[str, AgentLifecycleContext] = {}
         self._active_agents: dict[str, BaseAgent] = {}
         self._agent_tasks: dict[str, asyncio.Task] = {}
@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Any, Awaitable, Callable
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class MessageType(str, Enum):
@@ -185,10 +186,10 @@ class InterAgentCommunicationAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E2.3 - Inter-Agent Communication agent for the Playwright test automation framework. You help users with e2.3 - inter-agent communication tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
         self._message_queues: dict[str, asyncio.Queue] = {}
         self._message_handlers: dict[str, Callable[[AgentMessage], Awaitable[Any]]] = {}
-        self._conversation_history: dict[str, list[AgentMessage]] = {}
+        self._conversation_history: dict[str, list[AgentMessage]] = bounded_dict(self, "conversation_history")
         self._broadcast_subscribers: set[str] = set()
         self._lock = asyncio.Lock()
 
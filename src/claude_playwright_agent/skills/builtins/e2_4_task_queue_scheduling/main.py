@@ -19,6 +19,7 @@ from pathlib import Path
 from typing import Any, Awaitable, Callable
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class TaskPriority(str, Enum):
@@ -183,10 +184,11 @@ class TaskQueueSchedulingAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E2.4 - Task Queue & Scheduling agent for the Playwright test automation framework. You help users with e2.4 - task queue & scheduling tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
         self._task_queue: list[QueuedTask] = []
-        self._tasks: dict[str, QueuedTask] = {}
-        self._task_dependencies: dict[str, set[str]] = {}  # task_id -> dependents
+        self._tasks: dict[str, QueuedTask] = bounded_dict(self, "tasks")
+        # task_id -> dependents
+        self._task_dependencies: dict[str, set[str]] = bounded_dict(self, "task_dependencies")
         self._dispatch_queue: asyncio.Queue = asyncio.Queue()
         self._lock = asyncio.Lock()
         self._scheduler_running = False
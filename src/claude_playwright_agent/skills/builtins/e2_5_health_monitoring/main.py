@@ -3,7 +3,7 @@ E2.5 - Agent Health Monitoring Skill.
 
 This skill provides agent health monitoring:
 - Heartbeat monitoring with context tracking
-- Timeout detection and recovery
+- Timeout detection and recovery (one timer heap shared by all agents)
 - Health status tracking
 - Failure recovery with context preservation
 - Performance metrics collection
@@ -19,6 +19,8 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
+from claude_playwright_agent.agents.health_registry import HealthRegistry, HeartbeatRecord
 
 
 class HealthStatus(str, Enum):
@@ -136,15 +138,16 @@ class AgentHealthMonitoringAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E2.5 - Agent Health Monitoring agent for the Playwright test automation framework. You help users with e2.5 - agent health monitoring tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
         self._health_metrics: dict[str, HealthMetrics] = {}
         self._health_snapshots: dict[str, list[HealthSnapshot]] = {}
-        self._last_heartbeat: dict[str, float] = {}
-        self._agent_start_times: dict[str, float] = {}
-        self._monitoring_tasks: dict[str, asyncio.Task] = {}
         self._lock = asyncio.Lock()
         self._heartbeat_interval = 30.0
         self._agent_timeout = 300.0
+        # Heartbeats and timeouts for every agent; monitored agents get a
+        # timeout snapshot from the registry's single timer loop
+        self._registry = HealthRegistry(timeout=self._agent_timeout, on_timeout=self._on_timeout)
+        self._monitored: set[str] = set()
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -229,9 +232,12 @@ class AgentHealthMonitoringAgent(BaseAgent):
         async with self._lock:
             # Initialize health metrics
             self._health_metrics[agent_id] = HealthMetrics(agent_id=agent_id)
-            self._health_snapshots[agent_id] = []
-            self._last_heartbeat[agent_id] = time.time()
-            self._agent_start_times[agent_id] = time.time()
+            self._health_snapshots[agent_id] = bounded_list(self, "health_snapshots")
+            self._registry.register(
+                agent_id,
+                context.get("agent_type", ""),
+                task_id=context.get("task_id", ""),
+            )
 
         return f"Agent '{agent_id}' registered for health monitoring"
 
@@ -251,22 +257,21 @@ class AgentHealthMonitoringAgent(BaseAgent):
             metrics = self._health_metrics[agent_id]
 
             # Update heartbeat metrics
-            current_time = time.time()
-            if self._last_heartbeat[agent_id]:
-                interval = current_time - self._last_heartbeat[agent_id]
-                # Update average interval
-                if metrics.heartbeat_count == 0:
-                    metrics.heartbeat_interval = interval
-                else:
-                    metrics.heartbeat_interval = (
-                        metrics.heartbeat_interval * 0.9 + interval * 0.1
-                    )
-
-            self._last_heartbeat[agent_id] = current_time
+            interval = self._registry.seconds_since_heartbeat(agent_id) or 0.0
+            self._registry.heartbeat(agent_id)
+            # Update average interval
+            if metrics.heartbeat_count == 0:
+                metrics.heartbeat_interval = interval
+            else:
+                metrics.heartbeat_interval = (
+                    metrics.heartbeat_interval * 0.9 + interval * 0.1
+                )
+
+            record = self._registry.get(agent_id)
             metrics.last_heartbeat = datetime.now().isoformat()
             metrics.heartbeat_count += 1
             metrics.response_time = response_time
-            metrics.uptime_seconds = current_time - self._agent_start_times[agent_id]
+            metrics.uptime_seconds = time.time() - record.registered_at
 
             # Store context for recovery
             if agent_context:
@@ -285,8 +290,7 @@ class AgentHealthMonitoringAgent(BaseAgent):
             return f"Error: Agent '{agent_id}' not registered"
 
         metrics = self._health_metrics[agent_id]
-        current_time = time.time()
-        time_since_heartbeat = current_time - self._last_heartbeat.get(agent_id, current_time)
+        time_since_heartbeat = self._registry.seconds_since_heartbeat(agent_id) or 0.0
 
         # Determine health status
         status = HealthStatus.HEALTHY
@@ -312,8 +316,7 @@ class AgentHealthMonitoringAgent(BaseAgent):
             return f"Error: Agent '{agent_id}' not found"
 
         metrics = self._health_metrics[agent_id]
-        current_time = time.time()
-        time_since_heartbeat = current_time - self._last_heartbeat.get(agent_id, current_time)
+        time_since_heartbeat = self._registry.seconds_since_heartbeat(agent_id) or 0.0
 
         return (
             f"Agent '{agent_id}' status: "
@@ -334,27 +337,35 @@ class AgentHealthMonitoringAgent(BaseAgent):
             return f"Error: Agent '{agent_id}' not registered"
 
         metrics = self._health_metrics[agent_id]
-        current_time = time.time()
-        time_since_heartbeat = current_time - self._last_heartbeat.get(agent_id, current_time)
+        time_since_heartbeat = self._registry.seconds_since_heartbeat(agent_id) or 0.0
 
         if time_since_heartbeat > self._agent_timeout:
-            metrics.timeout_count += 1
-            metrics.context_preserved = False  # Context may be lost on timeout
-
-            # Create health snapshot
-            snapshot = HealthSnapshot(
-                agent_id=agent_id,
-                status=HealthStatus.TIMEOUT,
-                metrics=metrics,
-                context_snapshot=getattr(metrics, "context_snapshot", {}),
-                recovery_action="restart_agent_with_context_restore",
-            )
-            self._health_snapshots[agent_id].append(snapshot)
-
+            self._record_timeout(agent_id)
             return f"Timeout detected for agent '{agent_id}', context snapshot taken"
 
         return f"No timeout for agent '{agent_id}'"
 
+    def _record_timeout(self, agent_id: str) -> None:
+        """Count a timeout and take a timeout snapshot for an agent."""
+        metrics = self._health_metrics[agent_id]
+        metrics.timeout_count += 1
+        metrics.context_preserved = False  # Context may be lost on timeout
+
+        # Create health snapshot
+        snapshot = HealthSnapshot(
+            agent_id=agent_id,
+            status=HealthStatus.TIMEOUT,
+            metrics=metrics,
+            context_snapshot=getattr(metrics, "context_snapshot", {}),
+            recovery_action="restart_agent_with_context_restore",
+        )
+        self._health_snapshots[agent_id].append(snapshot)
+
+    def _on_timeout(self, record: HeartbeatRecord) -> None:
+        """Handle a timeout detected by the health registry."""
+        if record.agent_id in self._monitored and record.agent_id in self._health_metrics:
+            self._record_timeout(record.agent_id)
+
     async def _handle_failure(self, context: dict[str, Any], execution_context: Any) -> str:
         """Handle agent failure with context preservation."""
         agent_id = context.get("agent_id")
@@ -392,8 +403,7 @@ class AgentHealthMonitoringAgent(BaseAgent):
         metrics = self._health_metrics[agent_id]
 
         # Determine current status
-        current_time = time.time()
-        time_since_heartbeat = current_time - self._last_heartbeat.get(agent_id, current_time)
+        time_since_heartbeat = self._registry.seconds_since_heartbeat(agent_id) or 0.0
 
         status = HealthStatus.HEALTHY
         if time_since_heartbeat > self._agent_timeout:
@@ -433,25 +443,15 @@ class AgentHealthMonitoringAgent(BaseAgent):
         if not agent_id:
             return "Error: agent_id is required"
 
-        if agent_id in self._monitoring_tasks:
+        if agent_id in self._monitored:
             return f"Already monitoring agent '{agent_id}'"
 
-        # Start monitoring task
-        async def monitor_agent():
-            while True:
-                try:
-                    check_context = {
-                        "agent_id": agent_id,
-                        "execution_context": execution_context,
-                    }
-                    await self._check_health(check_context, execution_context)
-                    await asyncio.sleep(self._heartbeat_interval)
-                except asyncio.CancelledError:
-                    break
-                except Exception:
-                    await asyncio.sleep(self._heartbeat_interval)
-
-        self._monitoring_tasks[agent_id] = asyncio.create_task(monitor_agent())
+        if agent_id not in self._health_metrics:
+            await self._register_agent(context, execution_context)
+
+        # Timeouts of all monitored agents are detected by one registry loop
+        self._monitored.add(agent_id)
+        self._registry.start()
 
         return f"Started monitoring agent '{agent_id}'"
 
@@ -462,9 +462,10 @@ class AgentHealthMonitoringAgent(BaseAgent):
         if not agent_id:
             return "Error: agent_id is required"
 
-        if agent_id in self._monitoring_tasks:
-            self._monitoring_tasks[agent_id].cancel()
-            del self._monitoring_tasks[agent_id]
+        if agent_id in self._monitored:
+            self._monitored.discard(agent_id)
+            if not self._monitored:
+                await self._registry.stop()
             return f"Stopped monitoring agent '{agent_id}'"
 
         return f"Agent '{agent_id}' is not being monitored"
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 @dataclass
@@ -143,9 +144,9 @@ class IngestionAgent(BaseAgent):
             kwargs["system_prompt"] = "You are a E3.1 - Ingestion Agent agent for the Playwright test automation framework. You help users with e3.1 - ingestion agent tasks and operations."
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
         self._active_ingestions: dict[str, IngestionContext] = {}
-        self._ingestion_history: list[IngestionContext] = []
+        self._ingestion_history: list[IngestionContext] = bounded_list(self, "ingestion_history")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class SelectorType(str, Enum):
@@ -211,8 +212,8 @@ class PlaywrightParserAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E3.2 - Playwright Recording Parser agent for the Playwright test automation framework. You help users with e3.2 - playwright recording parser tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._parse_history: list[ParserContext] = []
+        self._context_history = bounded_list(self, "context_history")
+        self._parse_history: list[ParserContext] = bounded_list(self, "parse_history")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class ActionCategory(str, Enum):
@@ -210,8 +211,8 @@ class ActionExtractionAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E3.3 - Action Extraction & Classification agent for the Playwright test automation framework. You help users with e3.3 - action extraction & classification tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._extraction_history: list[ExtractionContext] = []
+        self._context_history = bounded_list(self, "context_history")
+        self._extraction_history: list[ExtractionContext] = bounded_list(self, "extraction_history")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
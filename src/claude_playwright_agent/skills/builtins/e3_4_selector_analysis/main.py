@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class SelectorStability(str, Enum):
@@ -182,8 +183,8 @@ class SelectorAnalysisAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E3.4 - Selector Analysis & Enhancement agent for the Playwright test automation framework. You help users with e3.4 - selector analysis & enhancement tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._analysis_history: list[SelectorAnalysisContext] = []
+        self._context_history = bounded_list(self, "context_history")
+        self._analysis_history: list[SelectorAnalysisContext] = bounded_list(self, "analysis_history")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class LogLevel(str, Enum):
@@ -250,10 +251,10 @@ class IngestionLoggingAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E3.5 - Ingestion Logging & Tracking agent for the Playwright test automation framework. You help users with e3.5 - ingestion logging & tracking tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
         self._active_logging: dict[str, LoggingContext] = {}
-        self._logging_history: list[LoggingContext] = []
-        self._global_log: list[PipelineLogEntry] = []
+        self._logging_history: list[LoggingContext] = bounded_list(self, "logging_history")
+        self._global_log: list[PipelineLogEntry] = bounded_list(self, "global_log")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
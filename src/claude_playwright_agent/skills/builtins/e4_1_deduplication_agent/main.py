@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class AnalysisStage(str, Enum):
@@ -173,11 +174,11 @@ class DeduplicationAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E4.1 - Deduplication Agent agent for the Playwright test automation framework. You help users with e4.1 - deduplication agent tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
         self._selector_counts: Counter = Counter()
         self._selector_sources: dict[str, set[str]] = defaultdict(set)
         self._selector_contexts: dict[str, list[dict[str, Any]]] = defaultdict(list)
-        self._analysis_history: list[DeduplicationAnalysisContext] = []
+        self._analysis_history: list[DeduplicationAnalysisContext] = bounded_list(self, "analysis_history")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
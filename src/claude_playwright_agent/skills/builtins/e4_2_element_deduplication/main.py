@@ -16,6 +16,7 @@ from enum import Enum
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import CACHE_LIMITS, bounded_dict, bounded_list
 
 
 class SimilarityMetric(str, Enum):
@@ -237,10 +238,10 @@ class ElementDeduplicationAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E4.2 - Element Deduplication Logic agent for the Playwright test automation framework. You help users with e4.2 - element deduplication logic tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._deduplication_history: list[DeduplicationContext] = []
-        self._element_registry: dict[str, dict[str, Any]] = {}
-        self._signature_cache: dict[str, ElementSignature] = {}
+        self._context_history = bounded_list(self, "context_history")
+        self._deduplication_history: list[DeduplicationContext] = bounded_list(self, "deduplication_history")
+        self._element_registry: dict[str, dict[str, Any]] = bounded_dict(self, "element_registry")
+        self._signature_cache: dict[str, ElementSignature] = bounded_dict(self, "signature_cache", CACHE_LIMITS)
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -15,6 +15,7 @@ from enum import Enum
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class ComponentType(str, Enum):
@@ -190,9 +191,9 @@ class ComponentExtractionAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E4.3 - Component Extraction agent for the Playwright test automation framework. You help users with e4.3 - component extraction tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._extraction_history: list[ExtractionContext] = []
-        self._component_registry: dict[str, ReusableComponent] = {}
+        self._context_history = bounded_list(self, "context_history")
+        self._extraction_history: list[ExtractionContext] = bounded_list(self, "extraction_history")
+        self._component_registry: dict[str, ReusableComponent] = bounded_dict(self, "component_registry")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
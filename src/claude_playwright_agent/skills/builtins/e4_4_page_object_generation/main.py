@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class GenerationFormat(str, Enum):
@@ -258,9 +259,9 @@ class PageObjectGenerationAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E4.4 - Page Object Generation agent for the Playwright test automation framework. You help users with e4.4 - page object generation tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._generation_history: list[GenerationContext] = []
-        self._page_object_registry: dict[str, GeneratedPageObject] = {}
+        self._context_history = bounded_list(self, "context_history")
+        self._generation_history: list[GenerationContext] = bounded_list(self, "generation_history")
+        self._page_object_registry: dict[str, GeneratedPageObject] = bounded_dict(self, "page_object_registry")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
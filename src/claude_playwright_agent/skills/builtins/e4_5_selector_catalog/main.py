@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class SelectorStatus(str, Enum):
@@ -195,10 +196,10 @@ class SelectorCatalogAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E4.5 - Selector Catalog Management agent for the Playwright test automation framework. You help users with e4.5 - selector catalog management tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
         self._current_version: CatalogVersion = CatalogVersion()
-        self._version_history: list[CatalogVersion] = []
-        self._operation_history: list[CatalogContext] = []
+        self._version_history: list[CatalogVersion] = bounded_list(self, "version_history")
+        self._operation_history: list[CatalogContext] = bounded_list(self, "operation_history")
         self._catalog_path: Path | None = None
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
@@ -432,7 +433,7 @@ class SelectorCatalogAgent(BaseAgent):
                 "version_history": [v.to_dict() for v in self._version_history],
                 "metadata": {
                     "saved_at": datetime.now().isoformat(),
-                    "total_versions": len(self._version_history) + 1,
+                    "total_versions": self._current_version.version_number,
                 },
             }
 
@@ -15,6 +15,7 @@ from enum import Enum
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class StepKeyword(str, Enum):
@@ -282,9 +283,9 @@ class BDDConversionAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E5.1 - BDD Conversion Agent agent for the Playwright test automation framework. You help users with e5.1 - bdd conversion agent tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._conversion_history: list[ConversionContext] = []
-        self._feature_registry: dict[str, GherkinFeature] = {}
+        self._context_history = bounded_list(self, "context_history")
+        self._conversion_history: list[ConversionContext] = bounded_list(self, "conversion_history")
+        self._feature_registry: dict[str, GherkinFeature] = bounded_dict(self, "feature_registry")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -15,6 +15,7 @@ from enum import Enum
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class ScenarioType(str, Enum):
@@ -175,9 +176,9 @@ class GherkinGenerationAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E5.2 - Gherkin Scenario Generation agent for the Playwright test automation framework. You help users with e5.2 - gherkin scenario generation tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._generation_history: list[GenerationContext] = []
-        self._scenario_registry: dict[str, GeneratedScenario] = {}
+        self._context_history = bounded_list(self, "context_history")
+        self._generation_history: list[GenerationContext] = bounded_list(self, "generation_history")
+        self._scenario_registry: dict[str, GeneratedScenario] = bounded_dict(self, "scenario_registry")
         self._template_registry: dict[str, ScenarioTemplate] = {}
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
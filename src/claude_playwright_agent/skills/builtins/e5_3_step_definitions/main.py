@@ -16,6 +16,7 @@ from typing import Any
 from pathlib import Path
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class StepFramework(str, Enum):
@@ -274,8 +275,8 @@ class StepDefinitionCreatorAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E5.3 - Step Definition Creator agent for the Playwright test automation framework. You help users with e5.3 - step definition creator tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._creation_history: list[CreationContext] = []
+        self._context_history = bounded_list(self, "context_history")
+        self._creation_history: list[CreationContext] = bounded_list(self, "creation_history")
         self._definition_registry: dict[str, StepDefinition] = {}
         self._file_registry: dict[str, DefinitionFile] = {}
 
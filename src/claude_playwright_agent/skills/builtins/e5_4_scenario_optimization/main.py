@@ -15,6 +15,7 @@ from enum import Enum
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class OptimizationType(str, Enum):
@@ -171,10 +172,10 @@ class ScenarioOptimizationAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E5.4 - Scenario Optimization agent for the Playwright test automation framework. You help users with e5.4 - scenario optimization tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._optimization_history: list[OptimizationContext] = []
-        self._scenario_registry: dict[str, OptimizedScenario] = {}
-        self._suggestions: list[OptimizationSuggestion] = []
+        self._context_history = bounded_list(self, "context_history")
+        self._optimization_history: list[OptimizationContext] = bounded_list(self, "optimization_history")
+        self._scenario_registry: dict[str, OptimizedScenario] = bounded_dict(self, "scenario_registry")
+        self._suggestions: list[OptimizationSuggestion] = bounded_list(self, "suggestions")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
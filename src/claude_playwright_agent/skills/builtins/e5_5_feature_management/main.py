@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class FileStatus(str, Enum):
@@ -209,11 +210,11 @@ class FeatureFileManagementAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E5.5 - Feature File Management agent for the Playwright test automation framework. You help users with e5.5 - feature file management tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history = bounded_list(self, "context_history")
         self._file_registry: dict[str, FeatureFileMetadata] = {}
-        self._content_registry: dict[str, FeatureFileContent] = {}
+        self._content_registry: dict[str, FeatureFileContent] = bounded_dict(self, "content_registry")
         self._version_history: dict[str, list[FileVersion]] = {}
-        self._operation_history: list[FileManagementContext] = []
+        self._operation_history: list[FileManagementContext] = bounded_list(self, "operation_history")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -342,7 +343,7 @@ class FeatureFileManagementAgent(BaseAgent):
         # Store registries
         self._file_registry[metadata.file_id] = metadata
         self._content_registry[content.content_id] = content
-        self._version_history[metadata.file_id] = []
+        self._version_history[metadata.file_id] = bounded_list(self, "version_history")
 
         return f"Created feature file: {metadata.file_name} ({metadata.scenario_count} scenario(s))"
 
@@ -451,8 +452,11 @@ class FeatureFileManagementAgent(BaseAgent):
             return "Error: file_id is required"
 
         # Get current version
-        versions = self._version_history.get(file_id, [])
-        current_version = len(versions) + 1
+        versions = self._version_history.get(file_id)
+        if versions is None:
+            versions = bounded_list(self, "version_history")
+        # Old versions may have been evicted, so number after the newest one
+        current_version = versions[-1].version_number + 1 if versions else 1
 
         # Find content
         content = None
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class RecordingType(str, Enum):
@@ -229,10 +230,9 @@ class AdvancedRecordingAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E6.1 - Advanced Recording Techniques agent for the Playwright test automation framework. You help users with e6.1 - advanced recording techniques tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[RecordingContext] = []
-        self._session_registry: dict[str, RecordingSession] = {}
-        self._artifact_registry: dict[str, RecordingArtifact] = {}
+        self._context_history: list[RecordingContext] = bounded_list(self, "context_history")
+        self._session_registry: dict[str, RecordingSession] = bounded_dict(self, "session_registry")
+        self._artifact_registry: dict[str, RecordingArtifact] = bounded_dict(self, "artifact_registry")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
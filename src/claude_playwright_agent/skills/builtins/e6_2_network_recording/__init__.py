@@ -2,6 +2,7 @@
 E6.2 - Network Recording Skill.
 """
 
+from .capture import BodyStore, CaptureIndexEntry, CaptureStore
 from .main import (
     MockRule,
     MockRuleType,
@@ -10,12 +11,22 @@ from .main import (
     NetworkRequest,
     NetworkResponse,
 )
+from .replay import HarReplayer, ReplayConfig, ReplayMissPolicy, ReplayResponse
+from .url_trie import UrlPatternTrie
 
 __all__ = [
+    "BodyStore",
+    "CaptureIndexEntry",
+    "CaptureStore",
+    "HarReplayer",
     "MockRule",
     "MockRuleType",
     "NetworkContext",
     "NetworkRecordingAgent",
     "NetworkRequest",
     "NetworkResponse",
+    "ReplayConfig",
+    "ReplayMissPolicy",
+    "ReplayResponse",
+    "UrlPatternTrie",
 ]
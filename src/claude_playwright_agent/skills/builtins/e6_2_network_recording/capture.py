@@ -0,0 +1,519 @@
+"""
+Network capture store for the network recording skill.
+
+This module provides:
+- Streaming capture: each completed request/response pair is written to
+  an on-disk JSON lines file as a HAR entry when it arrives
+- Content-addressed body storage: identical bodies are stored once,
+  large bodies are offloaded to gzip side files
+- A compact in-memory index of captured entries (no headers or bodies)
+- HAR 1.2 export streamed entry by entry from the capture file
+
+Layout of a capture directory::
+
+    entries.jsonl          one HAR entry per line
+    bodies/ab/abcd....gz   offloaded bodies, named by SHA-256
+"""
+
+import base64
+import copy
+import gzip
+import hashlib
+import itertools
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Bodies up to this size are stored inline in the HAR entry
+DEFAULT_INLINE_LIMIT = 4096
+
+ENTRIES_FILE = "entries.jsonl"
+BODIES_DIR = "bodies"
+
+HAR_CREATOR = {"name": "Claude Playwright Agent", "version": "1.0"}
+
+
+# =============================================================================
+# Body Storage
+# =============================================================================
+
+
+def _encode_text(data: bytes) -> tuple[str, str | None]:
+    """Get HAR text for a body: UTF-8 text as-is, anything else base64."""
+    try:
+        return data.decode("utf-8"), None
+    except UnicodeDecodeError:
+        return base64.b64encode(data).decode("ascii"), "base64"
+
+
+@dataclass(slots=True)
+class BodyRef:
+    """
+    Reference to a stored body.
+
+    Attributes:
+        sha256: Content hash
+        size: Size in bytes
+        text: Body text when stored inline
+        file: Side file relative to the capture directory when offloaded
+        encoding: ``"base64"`` when an inline body is not UTF-8 text
+    """
+    sha256: str
+    size: int
+    text: str | None = None
+    file: str | None = None
+    encoding: str | None = None
+
+
+class BodyStore:
+    """
+    Content-addressed body storage.
+
+    Small bodies stay inline in their HAR entry; large bodies are written
+    once per distinct content to a gzip side file.
+    """
+
+    def __init__(self, root: Path, inline_limit: int = DEFAULT_INLINE_LIMIT) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            root: Capture directory
+            inline_limit: Largest body (bytes) kept inline
+        """
+        self.root = Path(root)
+        self.inline_limit = inline_limit
+        # sha256 -> side file of bodies already offloaded
+        self._files: dict[str, str] = {}
+        self.stats = {"bodies": 0, "deduplicated": 0, "offloaded": 0, "bytes_offloaded": 0}
+
+    def put(self, body: str | bytes) -> BodyRef:
+        """
+        Store a body.
+
+        Args:
+            body: Body text or bytes
+
+        Returns:
+            Reference to the stored body
+        """
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        digest = hashlib.sha256(data).hexdigest()
+        self.stats["bodies"] += 1
+
+        if len(data) <= self.inline_limit:
+            if isinstance(body, str):
+                return BodyRef(digest, len(data), text=body)
+            text, encoding = _encode_text(data)
+            return BodyRef(digest, len(data), text=text, encoding=encoding)
+
+        file = self._files.get(digest)
+        if file is not None:
+            self.stats["deduplicated"] += 1
+            return BodyRef(digest, len(data), file=file)
+
+        file = f"{BODIES_DIR}/{digest[:2]}/{digest}.gz"
+        path = self.root / file
+        if path.exists():
+            self.stats["deduplicated"] += 1
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+                f.write(data)
+            tmp_path.replace(path)
+            self.stats["offloaded"] += 1
+            self.stats["bytes_offloaded"] += len(data)
+        self._files[digest] = file
+        return BodyRef(digest, len(data), file=file)
+
+    def read(self, content: dict[str, Any]) -> bytes:
+        """
+        Read a body from a HAR content or postData object.
+
+        Args:
+            content: HAR object with ``text`` or ``_file``
+
+        Returns:
+            Body bytes
+        """
+        if content.get("_file"):
+            with gzip.open(self.root / content["_file"], "rb") as f:
+                return f.read()
+        text = content.get("text", "")
+        if content.get("encoding") == "base64":
+            return base64.b64decode(text)
+        return text.encode("utf-8")
+
+
+# =============================================================================
+# Capture Store
+# =============================================================================
+
+
+@dataclass(slots=True)
+class CaptureIndexEntry:
+    """
+    In-memory index entry of a captured request.
+
+    Attributes:
+        request_id: Request identifier
+        method: HTTP method
+        url: Request URL
+        status: Response status (0 when no response was captured)
+        body_sha256: Hash of the response body
+        body_size: Size of the response body in bytes
+        offset: Byte offset of the HAR entry in the entries file
+    """
+    request_id: str
+    method: str
+    url: str
+    status: int
+    body_sha256: str
+    body_size: int
+    offset: int
+
+
+def _har_headers(headers: dict[str, str]) -> list[dict[str, str]]:
+    """Convert a header dict to HAR name/value pairs."""
+    return [{"name": name, "value": str(value)} for name, value in headers.items()]
+
+
+def _no_response() -> dict[str, Any]:
+    """Build the HAR response of a request that got no response."""
+    return {
+        "status": 0,
+        "statusText": "",
+        "httpVersion": "HTTP/1.1",
+        "headers": [],
+        "cookies": [],
+        "content": {"size": 0, "mimeType": ""},
+        "redirectURL": "",
+        "headersSize": -1,
+        "bodySize": -1,
+        "_error": "no response captured",
+    }
+
+
+def _content_type(headers: dict[str, str]) -> str:
+    """Get the content type from headers."""
+    for name, value in headers.items():
+        if name.lower() == "content-type":
+            return value
+    return ""
+
+
+class CaptureStore:
+    """
+    Streaming on-disk store of captured network traffic.
+
+    Requests wait in memory only until their response arrives; the
+    completed entry is then appended to the entries file and only its
+    index entry is kept.
+    """
+
+    def __init__(self, root: Path, inline_limit: int = DEFAULT_INLINE_LIMIT) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            root: Capture directory (created if missing)
+            inline_limit: Largest body (bytes) kept inline in entries
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.bodies = BodyStore(self.root, inline_limit)
+        self.index: dict[str, CaptureIndexEntry] = {}
+        # request_id -> HAR request object and entry fields, awaiting a response
+        self._pending: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
+        self._file = open(self.root / ENTRIES_FILE, "ab")
+        self._offset = self._file.tell()
+
+    @property
+    def entries_path(self) -> Path:
+        """Path of the entries file."""
+        return self.root / ENTRIES_FILE
+
+    def __len__(self) -> int:
+        return len(self.index) + len(self._pending)
+
+    # =========================================================================
+    # Capture
+    # =========================================================================
+
+    def add_request(
+        self,
+        request_id: str,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: str | bytes = "",
+        started: str = "",
+        resource_type: str = "",
+    ) -> None:
+        """
+        Record a request awaiting its response.
+
+        Args:
+            request_id: Request identifier
+            method: HTTP method
+            url: Request URL
+            headers: Request headers
+            body: Request body
+            started: ISO timestamp of the request
+            resource_type: Resource type (document, xhr, ...)
+        """
+        headers = headers or {}
+        request: dict[str, Any] = {
+            "method": method,
+            "url": url,
+            "httpVersion": "HTTP/1.1",
+            "headers": _har_headers(headers),
+            "queryString": [],
+            "cookies": [],
+            "headersSize": -1,
+            "bodySize": 0,
+        }
+        if body:
+            ref = self.bodies.put(body)
+            request["bodySize"] = ref.size
+            request["postData"] = self._content(ref, _content_type(headers))
+        fields = {"startedDateTime": started}
+        if resource_type:
+            fields["_resourceType"] = resource_type
+        self._pending[request_id] = (request, fields)
+
+    def add_response(
+        self,
+        request_id: str,
+        status: int,
+        headers: dict[str, str] | None = None,
+        body: str | bytes = "",
+        duration_ms: float = 0,
+        status_text: str = "",
+        response_id: str = "",
+        timestamp: str = "",
+    ) -> CaptureIndexEntry | None:
+        """
+        Complete a request with its response and write the entry.
+
+        Args:
+            request_id: Identifier of the captured request
+            status: HTTP status code
+            headers: Response headers
+            body: Response body
+            duration_ms: Response time in milliseconds
+            status_text: HTTP status text
+            response_id: Response identifier, kept as ``_responseId``
+            timestamp: ISO timestamp of the response, kept as ``_timestamp``
+
+        Returns:
+            Index entry, or None if the request was not captured
+        """
+        pending = self._pending.pop(request_id, None)
+        if pending is None:
+            return None
+        request, fields = pending
+        headers = headers or {}
+        ref = self.bodies.put(body)
+        content = self._content(ref, _content_type(headers))
+        content.setdefault("mimeType", "")
+        response = {
+            "status": status,
+            "statusText": status_text,
+            "httpVersion": "HTTP/1.1",
+            "headers": _har_headers(headers),
+            "cookies": [],
+            "content": content,
+            "redirectURL": "",
+            "headersSize": -1,
+            "bodySize": ref.size,
+        }
+        if response_id:
+            response["_responseId"] = response_id
+        if timestamp:
+            response["_timestamp"] = timestamp
+        return self._write(request_id, request, fields, response, duration_ms, ref)
+
+    def _content(self, ref: BodyRef, mime_type: str) -> dict[str, Any]:
+        """Build a HAR content object for a stored body."""
+        content: dict[str, Any] = {"size": ref.size, "mimeType": mime_type, "_sha256": ref.sha256}
+        if ref.file is not None:
+            content["_file"] = ref.file
+        else:
+            content["text"] = ref.text
+            if ref.encoding:
+                content["encoding"] = ref.encoding
+        return content
+
+    @staticmethod
+    def _entry(
+        request_id: str,
+        request: dict[str, Any],
+        fields: dict[str, Any],
+        response: dict[str, Any],
+        duration_ms: float,
+    ) -> dict[str, Any]:
+        """Build a HAR entry."""
+        return {
+            "_requestId": request_id,
+            **fields,
+            "time": duration_ms,
+            "request": request,
+            "response": response,
+            "cache": {},
+            "timings": {"send": 0, "wait": duration_ms, "receive": 0},
+        }
+
+    def _write(
+        self,
+        request_id: str,
+        request: dict[str, Any],
+        fields: dict[str, Any],
+        response: dict[str, Any],
+        duration_ms: float,
+        ref: BodyRef | None,
+    ) -> CaptureIndexEntry:
+        """Append a HAR entry and index it."""
+        entry = self._entry(request_id, request, fields, response, duration_ms)
+        line = (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+        offset = self._offset
+        self._file.write(line)
+        # Flush per entry so the capture survives a crash
+        self._file.flush()
+        self._offset += len(line)
+        index_entry = CaptureIndexEntry(
+            request_id=request_id,
+            method=request["method"],
+            url=request["url"],
+            status=response["status"],
+            body_sha256=ref.sha256 if ref else "",
+            body_size=ref.size if ref else 0,
+            offset=offset,
+        )
+        self.index[request_id] = index_entry
+        return index_entry
+
+    def flush_pending(self) -> int:
+        """
+        Write requests that never got a response (status 0).
+
+        Returns:
+            Number of entries written
+        """
+        pending, self._pending = self._pending, {}
+        for request_id, (request, fields) in pending.items():
+            self._write(request_id, request, fields, _no_response(), 0, None)
+        return len(pending)
+
+    def pending_entries(self) -> Iterator[dict[str, Any]]:
+        """
+        Build HAR entries (status 0) for requests still awaiting a response.
+
+        The requests stay pending, so a later response is still captured;
+        entries are copies that callers may modify.
+        """
+        for request_id, (request, fields) in list(self._pending.items()):
+            yield self._entry(
+                request_id, copy.deepcopy(request), dict(fields), _no_response(), 0
+            )
+
+    # =========================================================================
+    # Reading
+    # =========================================================================
+
+    def get_entry(self, request_id: str) -> dict[str, Any] | None:
+        """
+        Read one HAR entry from disk.
+
+        Args:
+            request_id: Request identifier
+
+        Returns:
+            HAR entry, or None if not captured
+        """
+        index_entry = self.index.get(request_id)
+        if index_entry is None:
+            return None
+        with open(self.entries_path, "rb") as f:
+            f.seek(index_entry.offset)
+            return json.loads(f.readline())
+
+    def entries(self) -> Iterator[dict[str, Any]]:
+        """Stream every written HAR entry from disk."""
+        with open(self.entries_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def read_body(self, content: dict[str, Any]) -> bytes:
+        """Read a body referenced by a HAR content or postData object."""
+        return self.bodies.read(content)
+
+    def write_har(self, path: Path, embed_bodies: bool = False) -> int:
+        """
+        Export the capture as a HAR 1.2 file, one entry at a time.
+
+        Requests still awaiting a response are exported with status 0 but
+        stay pending in the store.
+
+        Args:
+            path: Output file
+            embed_bodies: Inline offloaded bodies (otherwise they are
+                referenced through the ``_file`` extension field, relative
+                to the HAR file's directory)
+
+        Returns:
+            Number of entries written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        har_dir = path.parent.resolve()
+        count = 0
+        with open(path, "w", encoding="utf-8") as out:
+            out.write('{"log":{"version":"1.2","creator":')
+            out.write(json.dumps(HAR_CREATOR))
+            out.write(',"entries":[')
+            for entry in itertools.chain(self.entries(), self.pending_entries()):
+                if embed_bodies:
+                    self._embed(entry)
+                else:
+                    self._relocate(entry, har_dir)
+                if count:
+                    out.write(",")
+                out.write("\n")
+                out.write(json.dumps(entry, separators=(",", ":")))
+                count += 1
+            out.write("\n]}}\n")
+        return count
+
+    def _embed(self, entry: dict[str, Any]) -> None:
+        """Replace body file references of an entry with inline text."""
+        for content in (entry["request"].get("postData"), entry["response"]["content"]):
+            if content and content.get("_file"):
+                content["text"], encoding = _encode_text(self.read_body(content))
+                if encoding:
+                    content["encoding"] = encoding
+                del content["_file"]
+
+    def _relocate(self, entry: dict[str, Any], har_dir: Path) -> None:
+        """Make body file references of an entry relative to a HAR's directory."""
+        for content in (entry["request"].get("postData"), entry["response"]["content"]):
+            if content and content.get("_file"):
+                body_path = self.root.resolve() / content["_file"]
+                try:
+                    content["_file"] = Path(os.path.relpath(body_path, har_dir)).as_posix()
+                except ValueError:
+                    # No relative path across Windows drives
+                    content["_file"] = body_path.as_posix()
+
+    def close(self) -> None:
+        """Close the entries file."""
+        if not self._file.closed:
+            self._file.close()
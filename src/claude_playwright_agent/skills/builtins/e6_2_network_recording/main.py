@@ -8,6 +8,7 @@ This skill provides network recording capabilities:
 - Traffic analysis
 """
 
+import itertools
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -16,6 +17,22 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
+from claude_playwright_agent.skills.builtins.e6_2_network_recording.capture import (
+    DEFAULT_INLINE_LIMIT,
+    CaptureStore,
+)
+from claude_playwright_agent.skills.builtins.e6_2_network_recording.replay import (
+    HarReplayer,
+    ReplayConfig,
+    ReplayMissPolicy,
+)
+from claude_playwright_agent.skills.builtins.e6_2_network_recording.url_trie import (
+    UrlPatternTrie,
+)
+
+# Default root for capture directories (one subdirectory per agent session)
+DEFAULT_CAPTURE_DIR = Path(".cpa") / "network"
 
 
 class NetworkEventType(str, Enum):
@@ -201,6 +218,11 @@ class NetworkRecordingAgent(BaseAgent):
     2. Request/response tracking
     3. Network mocking
     4. Traffic analysis
+    5. Offline replay of captured traffic
+
+    Captured traffic is streamed to a capture directory as it arrives
+    (see :class:`CaptureStore`); only a compact index is kept in memory.
+    Mock rules are compiled into a URL pattern trie.
     """
 
     name = "e6_2_network_recording"
@@ -208,17 +230,38 @@ class NetworkRecordingAgent(BaseAgent):
     description = "E6.2 - Network Recording"
 
     def __init__(self, **kwargs) -> None:
-        """Initialize the network recording agent."""
+        """
+        Initialize the network recording agent.
+
+        Args:
+            capture_dir: Directory for captured traffic (default: a new
+                session directory under ``.cpa/network``)
+            inline_body_limit: Largest body (bytes) stored inline in
+                capture entries; larger bodies go to compressed side files
+            **kwargs: Arguments for BaseAgent
+        """
+        capture_dir = kwargs.pop("capture_dir", None)
+        self._inline_body_limit = kwargs.pop("inline_body_limit", DEFAULT_INLINE_LIMIT)
         # Set a default system prompt if not provided
         if "system_prompt" not in kwargs:
             kwargs["system_prompt"] = 'You are a E6.2 - Network Recording agent for the Playwright test automation framework. You help users with e6.2 - network recording tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[NetworkContext] = []
-        self._request_registry: dict[str, NetworkRequest] = {}
-        self._response_registry: dict[str, NetworkResponse] = {}
+        self._context_history: list[NetworkContext] = bounded_list(self, "context_history")
+        self._capture_dir = Path(capture_dir) if capture_dir else (
+            DEFAULT_CAPTURE_DIR / f"session_{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:6]}"
+        )
+        self._store: CaptureStore | None = None
         self._mock_rules: list[MockRule] = []
+        self._mock_trie: UrlPatternTrie[MockRule] = UrlPatternTrie()
+        self._replayer: HarReplayer | None = None
+
+    @property
+    def capture_store(self) -> CaptureStore:
+        """Capture store, created on first use."""
+        if self._store is None:
+            self._store = CaptureStore(self._capture_dir, inline_limit=self._inline_body_limit)
+        return self._store
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -267,16 +310,21 @@ class NetworkRecordingAgent(BaseAgent):
             return await self._generate_har(context, execution_context)
         elif task_type == "add_mock_rule":
             return await self._add_mock_rule(context, execution_context)
+        elif task_type == "match_mock_rule":
+            return await self._match_mock_rule(context, execution_context)
         elif task_type == "get_traffic":
             return await self._get_traffic(context, execution_context)
         elif task_type == "get_mock_rules":
             return await self._get_mock_rules(context, execution_context)
+        elif task_type == "start_replay":
+            return await self._start_replay(context, execution_context)
+        elif task_type == "stop_replay":
+            return await self._stop_replay(context, execution_context)
         else:
             return f"Unknown task type: {task_type}"
 
     async def _capture_request(self, context: dict[str, Any], execution_context: Any) -> str:
         """Capture a network request."""
-        workflow_id = context.get("workflow_id", getattr(execution_context, "workflow_id", execution_context.get("workflow_id", "")))
         url = context.get("url", "")
         method = context.get("method", "GET")
         headers = context.get("headers", {})
@@ -287,9 +335,20 @@ class NetworkRecordingAgent(BaseAgent):
             method=method,
             headers=headers,
             body=body,
+            resource_type=context.get("resource_type", ""),
         )
+        if context.get("request_id"):
+            request.request_id = context["request_id"]
 
-        self._request_registry[request.request_id] = request
+        self.capture_store.add_request(
+            request.request_id,
+            method,
+            url,
+            headers=headers,
+            body=body,
+            started=request.timestamp,
+            resource_type=request.resource_type,
+        )
 
         return f"Captured request: {method} {url} (ID: {request.request_id})"
 
@@ -309,45 +368,26 @@ class NetworkRecordingAgent(BaseAgent):
             duration_ms=duration_ms,
         )
 
-        self._response_registry[response.response_id] = response
+        entry = self.capture_store.add_response(
+            request_id,
+            status_code,
+            headers=headers,
+            body=body,
+            duration_ms=duration_ms,
+            response_id=response.response_id,
+            timestamp=response.timestamp,
+        )
+        if entry is None:
+            return f"Request '{request_id}' not captured"
 
         return f"Captured response: {status_code} for request '{request_id}'"
 
     async def _generate_har(self, context: dict[str, Any], execution_context: Any) -> str:
         """Generate HAR file from captured traffic."""
-        workflow_id = context.get("workflow_id", getattr(execution_context, "workflow_id", execution_context.get("workflow_id", "")))
         output_path = context.get("output_path", "network.har")
+        embed_bodies = context.get("embed_bodies", False)
 
-        # Simulate HAR generation
-        request_count = len(self._request_registry)
-        response_count = len(self._response_registry)
-
-        har_content = {
-            "log": {
-                "version": "1.2",
-                "creator": {"name": "Claude Playwright Agent"},
-                "entries": [],
-            }
-        }
-
-        # Add entries from requests/responses
-        for req in self._request_registry.values():
-            resp = self._response_registry.get(req.request_id)
-            entry = {
-                "request": {
-                    "method": req.method,
-                    "url": req.url,
-                    "headers": req.headers,
-                },
-                "response": {
-                    "status": resp.status_code if resp else 0,
-                    "headers": resp.headers if resp else {},
-                },
-                "timings": {
-                    "duration": resp.duration_ms if resp else 0,
-                },
-            }
-            har_content["log"]["entries"].append(entry)
+        request_count = self.capture_store.write_har(Path(output_path), embed_bodies=embed_bodies)
 
         return f"Generated HAR file: {output_path} with {request_count} request(s)"
 
@@ -372,23 +412,37 @@ class NetworkRecordingAgent(BaseAgent):
 
         self._mock_rules.append(rule)
         self._mock_rules.sort(key=lambda r: r.priority, reverse=True)
+        self._mock_trie.add(rule.rule_id, url_pattern, rule, priority=priority)
 
         return f"Added mock rule for pattern: {url_pattern}"
 
+    async def _match_mock_rule(self, context: dict[str, Any], execution_context: Any) -> str:
+        """Find the mock rule applying to a URL."""
+        url = context.get("url", "")
+
+        rule = self.match_mock_rule(url)
+        if rule is None:
+            return f"No mock rule matches: {url}"
+
+        return f"Mock rule '{rule.rule_id}' ({rule.rule_type.value}) matches: {url}"
+
     async def _get_traffic(self, context: dict[str, Any], execution_context: Any) -> str:
         """Get captured traffic."""
         url_pattern = context.get("url_pattern")
 
-        requests = list(self._request_registry.values())
+        # Written entries plus requests still awaiting their response
+        urls = [e.url for e in self.capture_store.index.values()]
+        urls.extend(e["request"]["url"] for e in self.capture_store.pending_entries())
 
         if url_pattern:
             import re
-            requests = [r for r in requests if re.search(url_pattern, r.url)]
+            pattern = re.compile(url_pattern)
+            urls = [url for url in urls if pattern.search(url)]
 
-        if not requests:
+        if not urls:
             return "No traffic captured"
 
-        return f"Traffic: {len(requests)} request(s) captured"
+        return f"Traffic: {len(urls)} request(s) captured"
 
     async def _get_mock_rules(self, context: dict[str, Any], execution_context: Any) -> str:
         """Get all mock rules."""
@@ -397,20 +451,134 @@ class NetworkRecordingAgent(BaseAgent):
 
         return f"Mock rules: {len(self._mock_rules)} rule(s)"
 
+    async def _start_replay(self, context: dict[str, Any], execution_context: Any) -> str:
+        """Start a local replay server for captured traffic."""
+        miss_policy = context.get("miss_policy", ReplayMissPolicy.NOT_FOUND)
+        if isinstance(miss_policy, str):
+            miss_policy = ReplayMissPolicy(miss_policy)
+
+        config = ReplayConfig(
+            latency_ms=context.get("latency_ms", 0),
+            recorded_latency=context.get("recorded_latency", False),
+            latency_scale=context.get("latency_scale", 1.0),
+            jitter_ms=context.get("jitter_ms", 0),
+            miss_policy=miss_policy,
+            match_body=context.get("match_body", True),
+            body_fallback=context.get("body_fallback", False),
+            ignore_query_params=tuple(context.get("ignore_query_params", ())),
+            seed=context.get("seed"),
+        )
+
+        await self._stop_replay(context, execution_context)
+        self._replayer = self.create_replayer(config, har_path=context.get("har_path"))
+        url = await self._replayer.start_server(
+            host=context.get("host", "127.0.0.1"),
+            port=context.get("port", 0),
+            origin=context.get("origin", ""),
+        )
+
+        return f"Replay server running at {url} with {len(self._replayer)} recorded response(s)"
+
+    async def _stop_replay(self, context: dict[str, Any], execution_context: Any) -> str:
+        """Stop the replay server."""
+        if self._replayer is None:
+            return "No replay server running"
+
+        replayer, self._replayer = self._replayer, None
+        await replayer.stop_server()
+        stats = replayer.stats
+
+        return f"Replay stopped: {stats.hits} hit(s), {stats.misses} miss(es)"
+
+    def create_replayer(
+        self,
+        config: ReplayConfig | None = None,
+        har_path: str | Path | None = None,
+    ) -> HarReplayer:
+        """
+        Create a replayer for captured traffic.
+
+        Install it on a Playwright page or context with
+        ``await replayer.install(page)``, or serve it with
+        ``await replayer.start_server()``.
+
+        Args:
+            config: Replay configuration
+            har_path: HAR file to replay instead of this agent's capture
+
+        Returns:
+            Replayer
+        """
+        if har_path:
+            return HarReplayer.from_har(Path(har_path), config)
+        return HarReplayer.from_capture(self.capture_store, config)
+
+    def match_mock_rule(self, url: str) -> MockRule | None:
+        """
+        Get the highest-priority enabled mock rule matching a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Matching rule, or None
+        """
+        for rule in self._mock_trie.match_all(url):
+            if rule.enabled:
+                return rule
+        return None
+
     def get_request_registry(self) -> dict[str, NetworkRequest]:
-        """Get request registry."""
-        return self._request_registry.copy()
+        """Get request registry (read back from the capture store)."""
+        store = self.capture_store
+        registry = {}
+        for entry in itertools.chain(store.entries(), store.pending_entries()):
+            request = entry["request"]
+            registry[entry["_requestId"]] = NetworkRequest(
+                request_id=entry["_requestId"],
+                url=request["url"],
+                method=request["method"],
+                headers={h["name"]: h["value"] for h in request["headers"]},
+                body=self.capture_store.read_body(request["postData"]).decode("utf-8", "replace")
+                if "postData" in request else "",
+                timestamp=entry["startedDateTime"],
+                resource_type=entry.get("_resourceType", ""),
+            )
+        return registry
 
     def get_response_registry(self) -> dict[str, NetworkResponse]:
-        """Get response registry."""
-        return self._response_registry.copy()
+        """Get response registry (read back from the capture store)."""
+        registry = {}
+        for entry in self.capture_store.entries():
+            response = entry["response"]
+            if "_responseId" not in response:
+                continue
+            registry[response["_responseId"]] = NetworkResponse(
+                response_id=response["_responseId"],
+                request_id=entry["_requestId"],
+                status_code=response["status"],
+                headers={h["name"]: h["value"] for h in response["headers"]},
+                body=self.capture_store.read_body(response["content"]).decode("utf-8", "replace"),
+                duration_ms=entry["time"],
+                size_bytes=response["bodySize"],
+                timestamp=response.get("_timestamp", ""),
+            )
+        return registry
 
     def get_context_history(self) -> list[NetworkContext]:
         """Get context history."""
         return self._context_history.copy()
 
+    async def cleanup(self) -> None:
+        """Stop replay, close the capture store and clean up the agent."""
+        if self._replayer is not None:
+            await self._replayer.stop_server()
+            self._replayer = None
+        if self._store is not None:
+            self._store.close()
+        await super().cleanup()
+
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
         from datetime import datetime
         return datetime.now().isoformat()
-
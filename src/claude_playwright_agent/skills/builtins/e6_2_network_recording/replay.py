@@ -0,0 +1,470 @@
+"""
+Offline replay of captured network traffic.
+
+This module provides:
+- An indexed matcher over recorded HAR entries keyed by method,
+  normalized URL and request body hash
+- Latency injection (fixed, recorded, scaled, with jitter)
+- A cache-miss policy for requests that were not recorded
+- A Playwright ``route`` handler and a local HTTP server serving the
+  recorded responses
+
+Example:
+    >>> replayer = HarReplayer.from_capture(agent.capture_store)
+    >>> await replayer.install(page)  # or: await replayer.start_server()
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import random
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Iterable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from claude_playwright_agent.skills.builtins.e6_2_network_recording.capture import CaptureStore
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+# Response headers that no longer describe a replayed body
+_HOP_HEADERS = frozenset({
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "connection",
+    "keep-alive",
+})
+
+
+# =============================================================================
+# Models
+# =============================================================================
+
+
+class ReplayMissPolicy(str, Enum):
+    """What to do with a request that has no recording."""
+
+    NOT_FOUND = "not_found"  # Respond 404
+    ABORT = "abort"  # Fail the request (route.abort / close connection)
+    PASSTHROUGH = "passthrough"  # Let the request reach the network (route handler only)
+
+
+@dataclass
+class ReplayConfig:
+    """
+    Replay configuration.
+
+    Attributes:
+        latency_ms: Fixed delay added to every replayed response
+        recorded_latency: Also wait for the recorded response time
+        latency_scale: Multiplier for the recorded response time
+        jitter_ms: Random extra delay, uniformly distributed in [0, jitter_ms]
+        miss_policy: Handling of unrecorded requests
+        match_body: Include the request body hash in the match key
+        body_fallback: On a body mismatch, fall back to method + URL
+        ignore_query_params: Query parameters dropped before matching
+            (cache busters, timestamps)
+        seed: Seed for jitter, for reproducible runs
+    """
+
+    latency_ms: float = 0
+    recorded_latency: bool = False
+    latency_scale: float = 1.0
+    jitter_ms: float = 0
+    miss_policy: ReplayMissPolicy = ReplayMissPolicy.NOT_FOUND
+    match_body: bool = True
+    body_fallback: bool = False
+    ignore_query_params: tuple[str, ...] = ()
+    seed: int | None = None
+
+
+@dataclass
+class ReplayResponse:
+    """
+    A recorded response ready to serve.
+
+    Attributes:
+        status: HTTP status code
+        headers: Response headers
+        body: Response body
+        recorded_ms: Recorded response time
+    """
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    recorded_ms: float = 0
+
+
+@dataclass
+class ReplayStats:
+    """Replay hit/miss counters."""
+
+    hits: int = 0
+    fallback_hits: int = 0
+    misses: int = 0
+    recent_misses: deque = field(default_factory=lambda: deque(maxlen=100))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "fallback_hits": self.fallback_hits,
+            "misses": self.misses,
+            "recent_misses": list(self.recent_misses),
+        }
+
+
+# =============================================================================
+# Matching
+# =============================================================================
+
+
+def normalize_url(url: str, ignore_params: tuple[str, ...] = ()) -> str:
+    """
+    Normalize a URL for matching.
+
+    Lowercases the scheme and host, drops default ports and the fragment,
+    and sorts query parameters.
+
+    Args:
+        url: Absolute URL or path
+        ignore_params: Query parameters to drop
+
+    Returns:
+        Normalized URL
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if ":" in netloc and netloc.rsplit(":", 1)[1] == _DEFAULT_PORTS.get(scheme):
+        netloc = netloc.rsplit(":", 1)[0]
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in ignore_params
+    )
+    return urlunsplit((scheme, netloc, parts.path or "/", urlencode(query), ""))
+
+
+def path_key(normalized_url: str) -> str:
+    """Get the path and query of a normalized URL."""
+    parts = urlsplit(normalized_url)
+    return urlunsplit(("", "", parts.path, parts.query, ""))
+
+
+def body_hash(body: bytes | str | None) -> str:
+    """Get the SHA-256 of a request body ("" for no body)."""
+    if not body:
+        return ""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return hashlib.sha256(body).hexdigest()
+
+
+class _Recording:
+    """Entries recorded for one key, served in recorded order."""
+
+    __slots__ = ("entries", "served")
+
+    def __init__(self) -> None:
+        self.entries: list[Any] = []
+        self.served = 0
+
+    def next(self) -> Any:
+        """Next entry; the last one repeats once all were served."""
+        entry = self.entries[min(self.served, len(self.entries) - 1)]
+        self.served += 1
+        return entry
+
+
+class HarReplayer:
+    """
+    Replays recorded HAR entries.
+
+    The index maps (method, normalized URL, body hash) to entry handles;
+    entries are loaded only when served. Repeated requests are answered
+    with the recorded responses in order.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[tuple[Any, dict[str, Any]]],
+        load_entry: Callable[[Any], dict[str, Any]],
+        read_body: Callable[[dict[str, Any]], bytes],
+        config: ReplayConfig | None = None,
+    ) -> None:
+        """
+        Initialize the replayer.
+
+        Args:
+            entries: (handle, HAR entry) pairs to index; the entry may be
+                dropped after indexing
+            load_entry: Load a HAR entry by handle
+            read_body: Read a body from a HAR content/postData object
+            config: Replay configuration
+        """
+        self.config = config or ReplayConfig()
+        self._load_entry = load_entry
+        self._read_body = read_body
+        self._random = random.Random(self.config.seed)
+        self.stats = ReplayStats()
+        self._runner: Any = None
+        self.port: int = 0
+
+        self._exact: dict[tuple[str, str, str], _Recording] = {}
+        self._by_url: dict[tuple[str, str], _Recording] = {}
+        self._by_path: dict[tuple[str, str, str], _Recording] = {}
+        self._by_path_url: dict[tuple[str, str], _Recording] = {}
+        for handle, entry in entries:
+            self._index(handle, entry)
+
+    @classmethod
+    def from_capture(cls, store: CaptureStore, config: ReplayConfig | None = None) -> "HarReplayer":
+        """
+        Create a replayer over a capture store.
+
+        Only the index is kept in memory; entries are read back from the
+        capture file when served. Requests still awaiting a response are
+        left pending and are not replayed.
+
+        Args:
+            store: Capture store
+            config: Replay configuration
+
+        Returns:
+            Replayer
+        """
+        handles = ((e["_requestId"], e) for e in store.entries() if e["response"]["status"])
+        return cls(handles, store.get_entry, store.read_body, config)
+
+    @classmethod
+    def from_har(
+        cls,
+        path: Path,
+        config: ReplayConfig | None = None,
+        body_root: Path | None = None,
+    ) -> "HarReplayer":
+        """
+        Create a replayer over a HAR file.
+
+        Args:
+            path: HAR file
+            config: Replay configuration
+            body_root: Directory of offloaded ``_file`` bodies (default:
+                the HAR file's directory)
+
+        Returns:
+            Replayer
+        """
+        path = Path(path)
+        har_entries = json.loads(path.read_text(encoding="utf-8"))["log"]["entries"]
+        root = Path(body_root) if body_root else path.parent
+
+        def read_body(content: dict[str, Any]) -> bytes:
+            if content.get("_file"):
+                with gzip.open(root / content["_file"], "rb") as f:
+                    return f.read()
+            text = content.get("text", "")
+            if content.get("encoding") == "base64":
+                return base64.b64decode(text)
+            return text.encode("utf-8")
+
+        handles = ((i, e) for i, e in enumerate(har_entries) if e["response"]["status"])
+        return cls(handles, har_entries.__getitem__, read_body, config)
+
+    def __len__(self) -> int:
+        return sum(len(r.entries) for r in self._exact.values())
+
+    def _index(self, handle: Any, entry: dict[str, Any]) -> None:
+        """Add one HAR entry to the index."""
+        request = entry["request"]
+        method = request["method"].upper()
+        url = normalize_url(request["url"], self.config.ignore_query_params)
+        post_data = request.get("postData")
+        digest = ""
+        if post_data:
+            digest = post_data.get("_sha256") or body_hash(self._read_body(post_data))
+        path = path_key(url)
+        for table, key in (
+            (self._exact, (method, url, digest)),
+            (self._by_url, (method, url)),
+            (self._by_path, (method, path, digest)),
+            (self._by_path_url, (method, path)),
+        ):
+            table.setdefault(key, _Recording()).entries.append(handle)
+
+    def lookup(self, method: str, url: str, body: bytes | str | None = None) -> ReplayResponse | None:
+        """
+        Find the recorded response for a request.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL, or a path to match on any host
+            body: Request body
+
+        Returns:
+            Recorded response, or None on a miss
+        """
+        method = method.upper()
+        url = normalize_url(url, self.config.ignore_query_params)
+        digest = body_hash(body) if self.config.match_body else None
+        if urlsplit(url).netloc:
+            exact, by_url, key = self._exact, self._by_url, url
+        else:
+            exact, by_url, key = self._by_path, self._by_path_url, path_key(url)
+
+        recording = None
+        if digest is not None:
+            recording = exact.get((method, key, digest))
+        if recording is None and (digest is None or self.config.body_fallback):
+            recording = by_url.get((method, key))
+            if recording is not None and digest is not None:
+                self.stats.fallback_hits += 1
+
+        if recording is None:
+            self.stats.misses += 1
+            self.stats.recent_misses.append(f"{method} {url}")
+            return None
+
+        self.stats.hits += 1
+        entry = self._load_entry(recording.next())
+        response = entry["response"]
+        headers = {
+            h["name"]: h["value"] for h in response["headers"]
+            if h["name"].lower() not in _HOP_HEADERS
+        }
+        return ReplayResponse(
+            status=response["status"],
+            headers=headers,
+            body=self._read_body(response["content"]),
+            recorded_ms=entry.get("time", 0) or 0,
+        )
+
+    def delay_for(self, response: ReplayResponse) -> float:
+        """
+        Get the injected latency for a response.
+
+        Args:
+            response: Response being replayed
+
+        Returns:
+            Delay in seconds
+        """
+        config = self.config
+        delay_ms = config.latency_ms
+        if config.recorded_latency:
+            delay_ms += response.recorded_ms * config.latency_scale
+        if config.jitter_ms:
+            delay_ms += self._random.uniform(0, config.jitter_ms)
+        return max(delay_ms, 0) / 1000
+
+    def reset(self) -> None:
+        """Restart every recorded sequence from its first response."""
+        for table in (self._exact, self._by_url, self._by_path, self._by_path_url):
+            for recording in table.values():
+                recording.served = 0
+
+    # =========================================================================
+    # Playwright Route Handler
+    # =========================================================================
+
+    async def handle_route(self, route: Any) -> None:
+        """
+        Playwright route handler serving recorded responses.
+
+        Args:
+            route: Playwright Route
+        """
+        request = route.request
+        response = self.lookup(request.method, request.url, request.post_data_buffer)
+        if response is None:
+            policy = self.config.miss_policy
+            if policy == ReplayMissPolicy.PASSTHROUGH:
+                await route.continue_()
+            elif policy == ReplayMissPolicy.ABORT:
+                await route.abort("internetdisconnected")
+            else:
+                await route.fulfill(status=404, body=b"", headers={"x-replay-miss": "1"})
+            return
+
+        delay = self.delay_for(response)
+        if delay:
+            await asyncio.sleep(delay)
+        await route.fulfill(status=response.status, headers=response.headers, body=response.body)
+
+    async def install(self, target: Any, url: str = "**/*") -> None:
+        """
+        Route a Playwright page or browser context through the replayer.
+
+        Args:
+            target: Playwright Page or BrowserContext
+            url: URL glob to replay
+        """
+        await target.route(url, self.handle_route)
+
+    # =========================================================================
+    # Local Server
+    # =========================================================================
+
+    async def start_server(self, host: str = "127.0.0.1", port: int = 0, origin: str = "") -> str:
+        """
+        Serve recorded responses from a local HTTP server.
+
+        Requests are matched by path and query on any recorded host, or
+        against ``origin`` when given (e.g. ``https://api.example.com``).
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 for any free port)
+            origin: Recorded origin the server stands in for
+
+        Returns:
+            Base URL of the server
+        """
+        try:
+            from aiohttp import web
+        except ImportError:
+            raise ImportError(
+                "The replay server requires the 'aiohttp' package. "
+                "Install it with: pip install aiohttp>=3.9.0"
+            )
+
+        if self._runner is not None:
+            return f"http://{host}:{self.port}"
+
+        async def handle(request: Any) -> Any:
+            body = await request.read()
+            response = self.lookup(request.method, origin + request.path_qs, body)
+            if response is None:
+                if self.config.miss_policy == ReplayMissPolicy.ABORT:
+                    request.transport.close()
+                return web.Response(status=404, headers={"x-replay-miss": "1"})
+            delay = self.delay_for(response)
+            if delay:
+                await asyncio.sleep(delay)
+            return web.Response(status=response.status, headers=response.headers, body=response.body)
+
+        app = web.Application(client_max_size=0)
+        app.router.add_route("*", "/{tail:.*}", handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        logger.info(f"Replay: Serving {len(self)} recorded response(s) on http://{host}:{self.port}")
+        return f"http://{host}:{self.port}"
+
+    async def stop_server(self) -> None:
+        """Stop the local server."""
+        if self._runner is None:
+            return
+        await self._runner.cleanup()
+        self._runner = None
@@ -0,0 +1,207 @@
+"""
+Compiled URL pattern matching for network mock rules.
+
+Mock rule patterns use Playwright-style globs and are compiled into a
+trie over URL segments (host, then path segments):
+
+- ``*`` matches exactly one segment
+- ``**`` matches any number of segments, including none
+- other segments containing glob characters are matched with fnmatch
+
+Patterns starting with ``/`` match the path on any host; patterns with a
+scheme or host are anchored to that host. Query strings and fragments
+are ignored. Matching a URL walks only the branches that can match, so
+its cost depends on the URL length rather than on the number of rules.
+"""
+
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def split_url(url: str) -> list[str]:
+    """
+    Split a URL into host and path segments.
+
+    Args:
+        url: Absolute URL, ``host/path`` or ``/path``
+
+    Returns:
+        Segments, starting with the host (empty for host-less paths)
+    """
+    url = url.split("#", 1)[0].split("?", 1)[0]
+    if "://" in url:
+        url = url.split("://", 1)[1]
+    elif url.startswith("/"):
+        url = url[1:]
+        return [""] + [s for s in url.split("/") if s]
+    return [s for s in url.split("/") if s]
+
+
+def split_pattern(pattern: str) -> list[str]:
+    """
+    Split a URL glob pattern into trie segments.
+
+    Args:
+        pattern: URL glob pattern
+
+    Returns:
+        Segments, starting with the host segment
+    """
+    if pattern.startswith("/"):
+        # Path pattern: any host
+        return ["*"] + split_url(pattern)[1:]
+    segments = split_url(pattern)
+    if not segments:
+        return ["**"]
+    return segments
+
+
+@dataclass
+class _Node(Generic[T]):
+    """Trie node."""
+
+    literal: dict[str, "_Node[T]"] = field(default_factory=dict)
+    star: "_Node[T] | None" = None
+    globstar: "_Node[T] | None" = None
+    globs: dict[str, "_Node[T]"] = field(default_factory=dict)
+    # (priority, sequence, rule_id, value) of patterns ending here
+    values: list[tuple[int, int, str, T]] = field(default_factory=list)
+
+    def child(self, segment: str) -> "_Node[T]":
+        """Get or create the child for a pattern segment."""
+        if segment == "**":
+            if self.globstar is None:
+                self.globstar = _Node()
+            return self.globstar
+        if segment == "*":
+            if self.star is None:
+                self.star = _Node()
+            return self.star
+        table = self.globs if _GLOB_CHARS.intersection(segment) else self.literal
+        node = table.get(segment)
+        if node is None:
+            node = table[segment] = _Node()
+        return node
+
+
+class UrlPatternTrie(Generic[T]):
+    """
+    Priority-aware URL pattern index.
+
+    The best match is the highest-priority entry; ties go to the entry
+    added first.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self._root: _Node[T] = _Node()
+        self._sequence = 0
+        # key -> terminal node, for removal
+        self._nodes: dict[str, _Node[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def add(self, key: str, pattern: str, value: T, priority: int = 0) -> None:
+        """
+        Add a pattern.
+
+        Args:
+            key: Unique key of the entry (replaces an existing entry)
+            pattern: URL glob pattern
+            value: Value returned on match
+            priority: Higher priorities win
+        """
+        self.remove(key)
+        node = self._root
+        for segment in split_pattern(pattern):
+            node = node.child(segment)
+        node.values.append((priority, self._sequence, key, value))
+        self._sequence += 1
+        self._nodes[key] = node
+
+    def remove(self, key: str) -> bool:
+        """
+        Remove an entry.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            True if the entry existed
+        """
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return False
+        node.values = [v for v in node.values if v[2] != key]
+        return True
+
+    def match_all(self, url: str) -> list[T]:
+        """
+        Get every matching value, best first.
+
+        Args:
+            url: URL to match
+
+        Returns:
+            Matching values ordered by priority, then insertion order
+        """
+        found: dict[int, tuple[int, int, str, T]] = {}
+        self._walk(self._root, split_url(url), 0, found, set())
+        ordered = sorted(found.values(), key=lambda v: (-v[0], v[1]))
+        return [v[3] for v in ordered]
+
+    def match(self, url: str) -> T | None:
+        """
+        Get the best matching value.
+
+        Args:
+            url: URL to match
+
+        Returns:
+            Best value, or None if no pattern matches
+        """
+        matches = self.match_all(url)
+        return matches[0] if matches else None
+
+    def _walk(
+        self,
+        node: _Node[T],
+        segments: list[str],
+        index: int,
+        found: dict[int, tuple[int, int, str, T]],
+        visited: set[tuple[int, int]],
+    ) -> None:
+        """Collect values of all patterns matching segments[index:]."""
+        state = (id(node), index)
+        if state in visited:
+            return
+        visited.add(state)
+
+        if node.globstar is not None:
+            for rest in range(index, len(segments) + 1):
+                self._walk(node.globstar, segments, rest, found, visited)
+
+        if index == len(segments):
+            for value in node.values:
+                found[value[1]] = value
+            return
+
+        segment = segments[index]
+        child = node.literal.get(segment)
+        if child is not None:
+            self._walk(child, segments, index + 1, found, visited)
+        if node.star is not None:
+            self._walk(node.star, segments, index + 1, found, visited)
+        for glob, child in node.globs.items():
+            if fnmatchcase(segment, glob):
+                self._walk(child, segments, index + 1, found, visited)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get trie statistics."""
+        return {"patterns": len(self._nodes)}
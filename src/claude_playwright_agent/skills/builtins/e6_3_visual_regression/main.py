@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class ComparisonStatus(str, Enum):
@@ -184,10 +185,9 @@ class VisualRegressionAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E6.3 - Visual Regression agent for the Playwright test automation framework. You help users with e6.3 - visual regression tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[VisualContext] = []
+        self._context_history: list[VisualContext] = bounded_list(self, "context_history")
         self._baseline_registry: dict[str, VisualBaseline] = {}
-        self._diff_history: list[VisualDiff] = []
+        self._diff_history: list[VisualDiff] = bounded_list(self, "diff_history")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
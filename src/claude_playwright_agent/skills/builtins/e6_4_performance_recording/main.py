@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class MetricCategory(str, Enum):
@@ -212,10 +213,9 @@ class PerformanceRecordingAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E6.4 - Performance Recording agent for the Playwright test automation framework. You help users with e6.4 - performance recording tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[RecordingContext] = []
-        self._recording_registry: dict[str, PerformanceRecording] = {}
-        self._metric_history: list[PerformanceMetric] = []
+        self._context_history: list[RecordingContext] = bounded_list(self, "context_history")
+        self._recording_registry: dict[str, PerformanceRecording] = bounded_dict(self, "recording_registry")
+        self._metric_history: list[PerformanceMetric] = bounded_list(self, "metric_history")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class SelectorStrategy(str, Enum):
@@ -184,10 +185,9 @@ class RecordingEnhancementAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E6.5 - Recording Enhancement agent for the Playwright test automation framework. You help users with e6.5 - recording enhancement tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[EnhancementContext] = []
+        self._context_history: list[EnhancementContext] = bounded_list(self, "context_history")
         self._selector_registry: dict[str, SmartSelector] = {}
-        self._optimization_history: list[RecordingOptimization] = []
+        self._optimization_history: list[RecordingOptimization] = bounded_list(self, "optimization_history")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
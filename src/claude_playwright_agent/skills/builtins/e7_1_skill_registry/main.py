@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import CACHE_LIMITS, bounded_dict, bounded_list
 from claude_playwright_agent.skills import Skill, get_registry
 
 
@@ -177,11 +178,10 @@ class SkillRegistryAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E7.1 - Skill Registry System agent for the Playwright test automation framework. You help users with e7.1 - skill registry system tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
+        self._context_history: list[RegistryContext] = bounded_list(self, "context_history")
         self._registry = get_registry()
-        self._context_history: list[RegistryContext] = []
-        self._entry_cache: dict[str, RegistryEntry] = {}
-        self._operation_history: list[RegistryOperation] = []
+        self._entry_cache: dict[str, RegistryEntry] = bounded_dict(self, "entry_cache", CACHE_LIMITS)
+        self._operation_history: list[RegistryOperation] = bounded_list(self, "operation_history")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
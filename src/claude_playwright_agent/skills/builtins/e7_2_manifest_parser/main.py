@@ -18,6 +18,7 @@ from typing import Any
 import yaml
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class ValidationSeverity(str, Enum):
@@ -181,8 +182,7 @@ class ManifestParserAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E7.2 - Skill Manifest Parser agent for the Playwright test automation framework. You help users with e7.2 - skill manifest parser tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[ParserContext] = []
+        self._context_history: list[ParserContext] = bounded_list(self, "context_history")
         self._parsed_manifests: dict[str, ParsedManifest] = {}
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
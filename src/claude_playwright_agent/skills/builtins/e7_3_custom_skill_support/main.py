@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import CACHE_LIMITS, bounded_dict, bounded_list
 
 
 class TemplateType(str, Enum):
@@ -162,9 +163,8 @@ class CustomSkillSupportAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E7.3 - Custom Skill Support agent for the Playwright test automation framework. You help users with e7.3 - custom skill support tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[ScaffoldContext] = []
-        self._scaffold_cache: dict[str, SkillScaffold] = {}
+        self._context_history: list[ScaffoldContext] = bounded_list(self, "context_history")
+        self._scaffold_cache: dict[str, SkillScaffold] = bounded_dict(self, "scaffold_cache", CACHE_LIMITS)
         self._template_registry: dict[str, SkillTemplate] = {}
         self._initialize_templates()
 
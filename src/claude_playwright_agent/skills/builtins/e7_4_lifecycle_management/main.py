@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 from claude_playwright_agent.skills import get_registry
 
 
@@ -194,10 +195,9 @@ class SkillLifecycleManagementAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E7.4 - Skill Lifecycle Management agent for the Playwright test automation framework. You help users with e7.4 - skill lifecycle management tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[LifecycleContext] = []
+        self._context_history: list[LifecycleContext] = bounded_list(self, "context_history")
         self._lifecycle_registry: dict[str, SkillLifecycle] = {}
-        self._event_history: list[LifecycleEventRecord] = []
+        self._event_history: list[LifecycleEventRecord] = bounded_list(self, "event_history")
         self._registry = get_registry()
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
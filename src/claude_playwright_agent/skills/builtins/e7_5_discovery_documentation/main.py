@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import CACHE_LIMITS, bounded_dict, bounded_list
 
 
 class DiscoveryScope(str, Enum):
@@ -183,10 +184,9 @@ class SkillDiscoveryAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E7.5 - Skill Discovery & Documentation agent for the Playwright test automation framework. You help users with e7.5 - skill discovery & documentation tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[DiscoveryContext] = []
-        self._metadata_cache: dict[str, SkillMetadata] = {}
-        self._documentation_cache: dict[str, SkillDocumentation] = {}
+        self._context_history: list[DiscoveryContext] = bounded_list(self, "context_history")
+        self._metadata_cache: dict[str, SkillMetadata] = bounded_dict(self, "metadata_cache", CACHE_LIMITS)
+        self._documentation_cache: dict[str, SkillDocumentation] = bounded_dict(self, "documentation_cache", CACHE_LIMITS)
         self._builtin_path = Path(__file__).parent.parent.parent / "builtins"
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
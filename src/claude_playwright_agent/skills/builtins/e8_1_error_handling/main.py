@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class ErrorSeverity(str, Enum):
@@ -256,10 +257,9 @@ class ErrorHandlingAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E8.1 - Comprehensive Error Handling agent for the Playwright test automation framework. You help users with e8.1 - comprehensive error handling tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[HandlingContext] = []
-        self._error_registry: dict[str, ErrorRecord] = {}
-        self._recovery_history: list[RecoveryResult] = []
+        self._context_history: list[HandlingContext] = bounded_list(self, "context_history")
+        self._error_registry: dict[str, ErrorRecord] = bounded_dict(self, "error_registry")
+        self._recovery_history: list[RecoveryResult] = bounded_list(self, "recovery_history")
         self._max_retry_attempts: int = 3
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
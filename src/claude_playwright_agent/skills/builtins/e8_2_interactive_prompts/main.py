@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class PromptType(str, Enum):
@@ -223,10 +224,9 @@ class InteractivePromptsAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E8.2 - Interactive Prompts & User Input agent for the Playwright test automation framework. You help users with e8.2 - interactive prompts & user input tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[WizardContext] = []
-        self._response_history: list[PromptResponse] = []
-        self._active_wizards: dict[str, dict[str, Any]] = {}
+        self._context_history: list[WizardContext] = bounded_list(self, "context_history")
+        self._response_history: list[PromptResponse] = bounded_list(self, "response_history")
+        self._active_wizards: dict[str, dict[str, Any]] = bounded_dict(self, "active_wizards")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
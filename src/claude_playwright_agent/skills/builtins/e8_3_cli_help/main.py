@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class HelpFormat(str, Enum):
@@ -226,8 +227,7 @@ class CLIHelpAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E8.3 - CLI Help & Documentation agent for the Playwright test automation framework. You help users with e8.3 - cli help & documentation tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[DocumentationContext] = []
+        self._context_history: list[DocumentationContext] = bounded_list(self, "context_history")
         self._topic_registry: dict[str, HelpTopic] = {}
         self._section_registry: dict[str, HelpSection] = {}
         self._example_registry: dict[str, Example] = {}
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class ProgressStatus(str, Enum):
@@ -282,11 +283,10 @@ class ProgressFeedbackAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E8.4 - Progress Indicators & Feedback agent for the Playwright test automation framework. You help users with e8.4 - progress indicators & feedback tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[FeedbackContext] = []
-        self._indicator_registry: dict[str, ProgressIndicator] = {}
-        self._message_history: list[FeedbackMessage] = []
-        self._milestone_registry: dict[str, ProgressMilestone] = {}
+        self._context_history: list[FeedbackContext] = bounded_list(self, "context_history")
+        self._indicator_registry: dict[str, ProgressIndicator] = bounded_dict(self, "indicator_registry")
+        self._message_history: list[FeedbackMessage] = bounded_list(self, "message_history")
+        self._milestone_registry: dict[str, ProgressMilestone] = bounded_dict(self, "milestone_registry")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class MigrationType(str, Enum):
@@ -210,10 +211,9 @@ class MigrationToolsAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E8.5 - Migration Tools agent for the Playwright test automation framework. You help users with e8.5 - migration tools tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[MigrationContext] = []
-        self._migration_registry: dict[str, MigrationRecord] = {}
-        self._backup_registry: dict[str, BackupRecord] = {}
+        self._context_history: list[MigrationContext] = bounded_list(self, "context_history")
+        self._migration_registry: dict[str, MigrationRecord] = bounded_dict(self, "migration_registry")
+        self._backup_registry: dict[str, BackupRecord] = bounded_dict(self, "backup_registry")
         self._project_path: Path = Path.cwd()
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
 
 
 class WorkerStatus(str, Enum):
@@ -243,11 +244,10 @@ class ParallelExecutionAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E9.1 - Parallel Test Execution agent for the Playwright test automation framework. You help users with e9.1 - parallel test execution tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[ParallelContext] = []
+        self._context_history: list[ParallelContext] = bounded_list(self, "context_history")
         self._worker_pool: dict[str, WorkerInfo] = {}
-        self._task_queue: list[ParallelTask] = []
-        self._execution_history: list[ExecutionResult] = []
+        self._task_queue: list[ParallelTask] = bounded_list(self, "task_queue")
+        self._execution_history: list[ExecutionResult] = bounded_list(self, "execution_history")
         self._max_workers: int = 4
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class Platform(str, Enum):
@@ -261,11 +262,10 @@ class CICDIntegrationAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E9.2 - CI/CD Integration agent for the Playwright test automation framework. You help users with e9.2 - ci/cd integration tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[IntegrationContext] = []
+        self._context_history: list[IntegrationContext] = bounded_list(self, "context_history")
         self._config_registry: dict[str, PipelineConfig] = {}
-        self._execution_history: list[PipelineExecution] = []
-        self._artifact_registry: dict[str, dict[str, str]] = {}
+        self._execution_history: list[PipelineExecution] = bounded_list(self, "execution_history")
+        self._artifact_registry: dict[str, dict[str, str]] = bounded_dict(self, "artifact_registry")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
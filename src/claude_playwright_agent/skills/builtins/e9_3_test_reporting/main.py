@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class ReportFormat(str, Enum):
@@ -269,11 +270,10 @@ class TestReportingAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E9.3 - Test Reporting & Analytics agent for the Playwright test automation framework. You help users with e9.3 - test reporting & analytics tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[ReportingContext] = []
-        self._report_registry: dict[str, TestReport] = {}
-        self._suite_registry: dict[str, TestSuite] = {}
-        self._trend_history: list[TrendData] = []
+        self._context_history: list[ReportingContext] = bounded_list(self, "context_history")
+        self._report_registry: dict[str, TestReport] = bounded_dict(self, "report_registry")
+        self._suite_registry: dict[str, TestSuite] = bounded_dict(self, "suite_registry")
+        self._trend_history: list[TrendData] = bounded_list(self, "trend_history")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
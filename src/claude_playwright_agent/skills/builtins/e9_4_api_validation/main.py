@@ -17,6 +17,8 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_list
+from claude_playwright_agent.transport import TransportConfig, create_client, run_bounded
 
 
 class ValidationType(str, Enum):
@@ -218,6 +220,7 @@ class APIValidationAgent(BaseAgent):
     2. Response validation
     3. Contract testing
     4. API mocking
+    5. Live endpoint validation over the shared HTTP transport
     """
 
     name = "e9_4_api_validation"
@@ -231,11 +234,10 @@ class APIValidationAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E9.4 - API Validation Integration agent for the Playwright test automation framework. You help users with e9.4 - api validation integration tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[ValidationContext] = []
+        self._context_history: list[ValidationContext] = bounded_list(self, "context_history")
         self._schema_registry: dict[str, APISchema] = {}
-        self._response_history: list[APIResponse] = []
-        self._validation_errors: list[ValidationError] = []
+        self._response_history: list[APIResponse] = bounded_list(self, "response_history")
+        self._validation_errors: list[ValidationError] = bounded_list(self, "validation_errors")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -300,6 +302,8 @@ class APIValidationAgent(BaseAgent):
             return await self._get_validation_context(context, execution_context)
         elif task_type == "list_schemas":
             return await self._list_schemas(context, execution_context)
+        elif task_type == "validate_endpoints":
+            return await self._validate_endpoints(context, execution_context)
         else:
             return f"Unknown task type: {task_type}"
 
@@ -486,6 +490,53 @@ class APIValidationAgent(BaseAgent):
 
         return f"Response validation passed: {status_code} OK, {len(body)} fields"
 
+    async def _validate_endpoints(self, context: dict[str, Any], execution_context: Any) -> str:
+        """Call registered endpoints concurrently and validate their responses."""
+        base_url = context.get("base_url", "").rstrip("/")
+        schema_ids = context.get("schema_ids") or list(self._schema_registry)
+        headers = context.get("headers", {})
+        bodies = context.get("bodies", {})
+        config = TransportConfig(timeout=float(context.get("timeout", 30.0)))
+        max_in_flight = context.get("max_in_flight", config.max_in_flight)
+
+        schemas = [self._schema_registry[sid] for sid in schema_ids if sid in self._schema_registry]
+        if not schemas:
+            return "Error: No schemas to validate"
+
+        async with create_client(config, headers=headers) as client:
+
+            async def check(schema: APISchema) -> bool:
+                url = schema.endpoint if schema.endpoint.startswith("http") else f"{base_url}{schema.endpoint}"
+                started = datetime.now()
+                try:
+                    response = await client.request(
+                        schema.method.value.upper(),
+                        url,
+                        json=bodies.get(schema.schema_id),
+                    )
+                except Exception:
+                    return False
+                try:
+                    body = response.json()
+                except ValueError:
+                    body = {}
+                result = await self._validate_response({
+                    "schema_id": schema.schema_id,
+                    "status_code": response.status_code,
+                    "headers": dict(response.headers),
+                    "body": body if isinstance(body, dict) else {},
+                    "duration_ms": int((datetime.now() - started).total_seconds() * 1000),
+                }, execution_context)
+                return result.startswith("Response validation passed")
+
+            results = await run_bounded(
+                [lambda schema=schema: check(schema) for schema in schemas],
+                max_in_flight,
+            )
+
+        passed = sum(results)
+        return f"Endpoint validation complete: {passed} passed, {len(results) - passed} failed"
+
     async def _get_schema(self, context: dict[str, Any], execution_context: Any) -> str:
         """Get schema by ID."""
         schema_id = context.get("schema_id")
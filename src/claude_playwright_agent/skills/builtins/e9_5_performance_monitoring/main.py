@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_playwright_agent.agents.base import BaseAgent
+from claude_playwright_agent.skills.bounded import bounded_dict, bounded_list
 
 
 class MetricType(str, Enum):
@@ -286,11 +287,10 @@ class PerformanceMonitoringAgent(BaseAgent):
             kwargs["system_prompt"] = 'You are a E9.5 - Performance Monitoring agent for the Playwright test automation framework. You help users with e9.5 - performance monitoring tasks and operations.'
         super().__init__(**kwargs)
         # Track context history
-        self._context_history = []
-        self._context_history: list[MonitoringContext] = []
-        self._report_registry: dict[str, PerformanceReport] = {}
-        self._snapshot_history: list[PerformanceSnapshot] = []
-        self._bottleneck_registry: dict[str, BottleneckInfo] = {}
+        self._context_history: list[MonitoringContext] = bounded_list(self, "context_history")
+        self._report_registry: dict[str, PerformanceReport] = bounded_dict(self, "report_registry")
+        self._snapshot_history: list[PerformanceSnapshot] = bounded_list(self, "snapshot_history")
+        self._bottleneck_registry: dict[str, BottleneckInfo] = bounded_dict(self, "bottleneck_registry")
 
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
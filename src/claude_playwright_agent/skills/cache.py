@@ -0,0 +1,300 @@
+"""
+Skill Index Cache - Persist skill discovery results between runs.
+
+This module provides:
+- Cached manifest lists per skills directory, keyed by directory mtimes
+- Cached parsed manifests, keyed by file mtime and size
+- Cached top-level names of skill entry points, keyed by file mtime and size
+- Cached dependency load waves, keyed by skill names and dependencies
+
+With a warm cache, loading skills reads one small JSON file and stats the
+skill directories and manifests; no YAML is parsed and no skill module is
+imported.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+from .manifest import SkillManifest
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Bump when the cache layout or manifest fields change
+INDEX_VERSION = 3
+
+# Default cache file (relative to project root)
+SKILL_INDEX_FILE = ".cpa/skill_index.json"
+
+# Dependency resolutions kept (one per distinct set of skills)
+MAX_ORDERS = 8
+
+
+# =============================================================================
+# Skill Index Cache
+# =============================================================================
+
+
+class SkillIndexCache:
+    """
+    Persistent index of discovered skills.
+
+    Entries are validated against the file system on every lookup, so a
+    stale entry is never returned: directories are checked by their own
+    mtime and the mtimes of their subdirectories (adding or removing a
+    skill changes one of them), manifests by mtime and size.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path: Cache file; None keeps the index in memory only
+        """
+        self.path = path
+        self._directories: dict[str, dict[str, Any]] = {}
+        self._manifests: dict[str, dict[str, Any]] = {}
+        self._modules: dict[str, dict[str, Any]] = {}
+        self._orders: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def load(self) -> None:
+        """Load the persisted index, ignoring missing or stale files."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") == INDEX_VERSION:
+            self._directories = data.get("directories", {})
+            self._manifests = data.get("manifests", {})
+            self._modules = data.get("modules", {})
+            self._orders = data.get("orders", {})
+
+    def save(self) -> None:
+        """Persist the index atomically if it changed."""
+        if self.path is None or not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({
+                    "version": INDEX_VERSION,
+                    "directories": self._directories,
+                    "manifests": self._manifests,
+                    "modules": self._modules,
+                    "orders": self._orders,
+                }),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: Failed to save skill index: {e}")
+
+    # =========================================================================
+    # Directories
+    # =========================================================================
+
+    @staticmethod
+    def _fingerprint(directory: Path) -> dict[str, int]:
+        """Get the mtimes of a directory and its subdirectories."""
+        fingerprint = {".": directory.stat().st_mtime_ns}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    fingerprint[entry.name] = entry.stat().st_mtime_ns
+        return fingerprint
+
+    def scan(
+        self,
+        directory: Path,
+        scanner: Callable[[Path], list[Path]],
+    ) -> list[Path]:
+        """
+        Get the manifests in a skills directory.
+
+        Args:
+            directory: Skills directory
+            scanner: Called to scan the directory on a cache miss
+
+        Returns:
+            List of manifest file paths
+        """
+        self.load()
+        key = str(directory.resolve())
+        fingerprint = self._fingerprint(directory)
+
+        entry = self._directories.get(key)
+        if entry is not None and entry["fingerprint"] == fingerprint:
+            return [Path(p) for p in entry["manifests"]]
+
+        manifests = scanner(directory)
+        self._directories[key] = {
+            "fingerprint": fingerprint,
+            "manifests": [str(p) for p in manifests],
+        }
+        self._dirty = True
+        return manifests
+
+    # =========================================================================
+    # Manifests
+    # =========================================================================
+
+    def get_manifest(self, path: Path) -> SkillManifest | None:
+        """
+        Get a cached manifest if the file is unchanged.
+
+        Args:
+            path: Manifest file
+
+        Returns:
+            Parsed manifest, or None on a cache miss
+        """
+        self.load()
+        entry = self._manifests.get(str(path))
+        if entry is None:
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            return None
+
+        data = dict(entry["manifest"])
+        data["path"] = Path(data["path"])
+        return SkillManifest(**data)
+
+    def put_manifest(self, path: Path, manifest: SkillManifest) -> None:
+        """
+        Cache a parsed manifest.
+
+        Args:
+            path: Manifest file
+            manifest: Parsed manifest
+        """
+        self.load()
+        stat = path.stat()
+        self._manifests[str(path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "manifest": manifest.to_dict(),
+        }
+        self._dirty = True
+
+    # =========================================================================
+    # Entry Points
+    # =========================================================================
+
+    def get_module_names(self, path: Path) -> tuple[bool, list[str] | None]:
+        """
+        Get the cached top-level names of a module if the file is unchanged.
+
+        Args:
+            path: Module file
+
+        Returns:
+            Tuple of (hit, names); names is None when the module's names
+            cannot be determined statically
+        """
+        self.load()
+        entry = self._modules.get(str(path))
+        if entry is None:
+            return False, None
+        try:
+            stat = path.stat()
+        except OSError:
+            return False, None
+        if entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            return False, None
+        return True, entry["names"]
+
+    def put_module_names(self, path: Path, names: list[str] | None) -> None:
+        """
+        Cache the top-level names of a module.
+
+        Args:
+            path: Module file
+            names: Names defined by the module (None if unknown)
+        """
+        self.load()
+        stat = path.stat()
+        self._modules[str(path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "names": names,
+        }
+        self._dirty = True
+
+    # =========================================================================
+    # Dependency Waves
+    # =========================================================================
+
+    @staticmethod
+    def order_key(manifests: dict[str, SkillManifest]) -> str:
+        """
+        Compute the cache key of a set of manifests.
+
+        Args:
+            manifests: Manifests by skill name, in load order
+
+        Returns:
+            Key that changes whenever a skill or its dependencies change
+        """
+        # Resolution order depends on load order, so the key does too
+        digest = hashlib.sha256()
+        for name, manifest in manifests.items():
+            digest.update(f"{name}\0{','.join(manifest.dependencies)}\n".encode())
+        return digest.hexdigest()
+
+    def get_order(self, key: str) -> dict[str, Any] | None:
+        """
+        Get a cached dependency resolution.
+
+        Args:
+            key: Key from order_key()
+
+        Returns:
+            ``{"waves": [[...], ...]}`` or ``{"cycle": [...]}``, or None on a miss
+        """
+        self.load()
+        return self._orders.get(key)
+
+    def put_order(
+        self,
+        key: str,
+        waves: list[list[str]] | None = None,
+        cycle: list[str] | None = None,
+    ) -> None:
+        """
+        Cache a dependency resolution.
+
+        Args:
+            key: Key from order_key()
+            waves: Skill names grouped into load waves
+            cycle: Skill names forming a dependency cycle
+        """
+        self.load()
+        self._orders.pop(key, None)
+        self._orders[key] = {"waves": waves} if cycle is None else {"cycle": cycle}
+        # Keep orders for the few most recent skill sets only
+        for stale in list(self._orders)[:-MAX_ORDERS]:
+            del self._orders[stale]
+        self._dirty = True
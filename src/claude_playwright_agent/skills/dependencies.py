@@ -630,6 +630,38 @@ class DependencyGraph:
 
         return result
 
+    def get_load_waves(self) -> list[list[str]]:
+        """
+        Group skills into waves that can be loaded concurrently.
+
+        Every skill depends only on skills in earlier waves. Dependencies
+        outside the graph are ignored; skills on a cycle are left out.
+
+        Returns:
+            List of waves, each a list of skill names
+        """
+        in_degree: dict[str, int] = {}
+        dependents: dict[str, list[str]] = {name: [] for name in self._nodes}
+        for name, node in self._nodes.items():
+            deps = [dep for dep in dict.fromkeys(node.dependencies) if dep in self._nodes]
+            in_degree[name] = len(deps)
+            for dep in deps:
+                dependents[dep].append(name)
+
+        waves: list[list[str]] = []
+        wave = [name for name, degree in in_degree.items() if degree == 0]
+        while wave:
+            waves.append(wave)
+            next_wave = []
+            for name in wave:
+                for dependent in dependents[name]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_wave.append(dependent)
+            wave = next_wave
+
+        return waves
+
     def to_dot(self) -> str:
         """
         Export graph to DOT format (Graphviz).
@@ -3,17 +3,26 @@ Skill Loader - Discover and load skills from various locations.
 
 This module provides:
 - Skill discovery from built-in and custom locations
-- Dynamic agent class loading
-- Dependency resolution
+- Dynamic agent class loading (deferred until first use)
+- Dependency resolution into load waves
 - Skill registration
+- Concurrent initialization of independent skills, wave by wave
+- A persistent skill index so warm starts skip YAML parsing
 """
 
+import ast
+import asyncio
 import importlib.util
+import inspect
 import sys
+import time
 from collections import defaultdict
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from .cache import SKILL_INDEX_FILE, SkillIndexCache
 from .manifest import SkillManifest, parse_manifest
 from .models import Skill, SkillRegistry, get_registry
 
@@ -61,6 +70,96 @@ class CircularDependencyError(SkillLoadError):
     pass
 
 
+# =============================================================================
+# Initialization Results
+# =============================================================================
+
+
+@dataclass
+class SkillInitResult:
+    """
+    Outcome of initializing one skill.
+
+    Attributes:
+        name: Skill name
+        wave: Index of the load wave the skill was initialized in
+        success: Whether the agent was created and initialized
+        skipped: Whether initialization was skipped (a dependency failed)
+        duration_ms: Time spent creating and initializing the agent
+        error: Error message on failure
+        agent: Initialized agent instance (None if the skill has no agent)
+    """
+
+    name: str
+    wave: int
+    success: bool = True
+    skipped: bool = False
+    duration_ms: float = 0.0
+    error: str | None = None
+    agent: Any = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "wave": self.wave,
+            "success": self.success,
+            "skipped": self.skipped,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
+
+
+def _module_names(path: Path) -> list[str] | None:
+    """
+    Get the names a module defines at top level, from its syntax tree.
+
+    Args:
+        path: Module file
+
+    Returns:
+        Sorted names, or None if they cannot be determined statically
+
+    Raises:
+        SkillLoadError: If the module cannot be read or parsed
+    """
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, SyntaxError, ValueError) as e:
+        raise SkillLoadError(f"Cannot parse {path}: {e}") from e
+
+    names: set[str] = set()
+    # Module-level statements, including those nested in if/try/with blocks;
+    # names bound inside functions and classes are not module attributes
+    statements = list(tree.body)
+    while statements:
+        node = statements.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == "*":
+                    return None
+                names.add(alias.asname or alias.name.split(".")[0])
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                names.update(n.id for n in ast.walk(target) if isinstance(n, ast.Name))
+        else:
+            for field in ("body", "orelse", "finalbody", "handlers"):
+                statements.extend(getattr(node, field, None) or [])
+
+    if "__getattr__" in names:
+        return None
+    return sorted(names)
+
+
+def _create_agent(skill: Skill) -> Any:
+    """Default agent factory: instantiate the skill's agent class."""
+    agent_class = skill.agent_class
+    return agent_class() if agent_class is not None else None
+
+
 # =============================================================================
 # Skill Loader
 # =============================================================================
@@ -73,15 +172,19 @@ class SkillLoader:
     Features:
     - Scan directories for skill manifests
     - Parse skill manifests
-    - Dynamically load agent classes
-    - Resolve dependencies
+    - Dynamically load agent classes on first use
+    - Resolve dependencies into waves of mutually independent skills
     - Register skills in global registry
+    - Initialize skill agents concurrently within each wave
+    - Cache manifests, directory listings and load order between runs
     """
 
     def __init__(
         self,
         project_path: Path | None = None,
         include_builtins: bool = True,
+        use_cache: bool = True,
+        cache_path: Path | None = None,
     ) -> None:
         """
         Initialize the skill loader.
@@ -89,11 +192,19 @@ class SkillLoader:
         Args:
             project_path: Path to project root for custom skills
             include_builtins: Whether to include built-in skills
+            use_cache: Persist the skill index between runs
+            cache_path: Index file (default: .cpa/skill_index.json, only
+                used when the project has a .cpa directory)
         """
         self._project_path = project_path or Path.cwd()
         self._include_builtins = include_builtins
         self._registry = get_registry()
 
+        # Without a persistent file the index still serves repeat lookups
+        if cache_path is None and use_cache and (self._project_path / ".cpa").is_dir():
+            cache_path = self._project_path / SKILL_INDEX_FILE
+        self._cache = SkillIndexCache(cache_path if use_cache else None)
+
         # Track loaded skills to prevent duplicates
         self._loaded_skills: dict[str, Skill] = {}
 
@@ -103,6 +214,10 @@ class SkillLoader:
         # Track dependencies for resolution
         self._dependency_graph: dict[str, list[str]] = defaultdict(list)
 
+        # Initialized agents and per-skill results from initialize_all()
+        self._agents: dict[str, Any] = {}
+        self._init_results: dict[str, SkillInitResult] = {}
+
     def discover_skills(self) -> list[Path]:
         """
         Discover all skill manifests in configured locations.
@@ -114,13 +229,13 @@ class SkillLoader:
 
         # Scan built-in skills directory
         if self._include_builtins and BUILTIN_SKILLS_DIR.exists():
-            manifests.extend(self._scan_directory(BUILTIN_SKILLS_DIR))
+            manifests.extend(self._cache.scan(BUILTIN_SKILLS_DIR, self._scan_directory))
 
         # Scan custom skills directories
         for skills_dir in CUSTOM_SKILLS_DIRS:
             custom_path = self._project_path / skills_dir
             if custom_path.exists():
-                manifests.extend(self._scan_directory(custom_path))
+                manifests.extend(self._cache.scan(custom_path, self._scan_directory))
 
         return manifests
 
@@ -134,21 +249,22 @@ class SkillLoader:
         Returns:
             List of manifest file paths
         """
-        manifests = []
-
+        # A manifest in the directory root makes it a single skill
         for manifest_name in MANIFEST_NAMES:
-            # Check for manifest in directory root
             manifest_path = directory / manifest_name
             if manifest_path.is_file():
-                manifests.append(manifest_path)
-                continue
+                return [manifest_path]
 
-            # Scan subdirectories
-            for item in directory.iterdir():
-                if item.is_dir():
-                    skill_manifest = item / manifest_name
-                    if skill_manifest.is_file():
-                        manifests.append(skill_manifest)
+        # Otherwise each subdirectory may hold one skill (first name wins)
+        manifests = []
+        for item in sorted(directory.iterdir()):
+            if not item.is_dir():
+                continue
+            for manifest_name in MANIFEST_NAMES:
+                skill_manifest = item / manifest_name
+                if skill_manifest.is_file():
+                    manifests.append(skill_manifest)
+                    break
 
         return manifests
 
@@ -156,6 +272,11 @@ class SkillLoader:
         """
         Load a skill from a manifest file.
 
+        The manifest comes from the skill index when the file is unchanged.
+        The agent class is validated here (the entry point must exist and
+        define the class) but the module is only imported when
+        ``skill.agent_class`` is first accessed.
+
         Args:
             manifest_path: Path to skill manifest file
 
@@ -165,27 +286,32 @@ class SkillLoader:
         Raises:
             SkillLoadError: If skill cannot be loaded
         """
-        # Parse manifest
-        try:
-            manifest = parse_manifest(manifest_path)
-        except Exception as e:
-            raise SkillLoadError(f"Failed to parse manifest: {e}") from e
+        # Parse manifest (or reuse the cached parse)
+        manifest = self._cache.get_manifest(manifest_path)
+        if manifest is None:
+            try:
+                manifest = parse_manifest(manifest_path)
+            except Exception as e:
+                raise SkillLoadError(f"Failed to parse manifest: {e}") from e
+            self._cache.put_manifest(manifest_path, manifest)
 
         # Check if already loaded
         if manifest.name in self._loaded_skills:
             return self._loaded_skills[manifest.name]
 
-        # Load agent class if specified
-        agent_class = None
+        # Validate the agent class now, import it on first use
+        agent_loader = None
         if manifest.agent_class:
-            agent_class = self._load_agent_class(manifest)
+            entry_point = self._resolve_entry_point(manifest)
+            self._check_agent_class_defined(manifest, entry_point)
+            agent_loader = partial(self._import_agent_class, manifest, entry_point)
 
         # Create skill
         skill = Skill(
             name=manifest.name,
             version=manifest.version,
             description=manifest.description,
-            agent_class=agent_class,
+            agent_loader=agent_loader,
             enabled=manifest.enabled,
             path=str(manifest_path.parent),
         )
@@ -216,6 +342,21 @@ class SkillLoader:
         if not manifest.agent_class:
             return None
 
+        return self._import_agent_class(manifest, self._resolve_entry_point(manifest))
+
+    def _resolve_entry_point(self, manifest: SkillManifest) -> Path:
+        """
+        Validate a skill's agent_class and locate its entry point.
+
+        Args:
+            manifest: Skill manifest
+
+        Returns:
+            Path to the module defining the agent class
+
+        Raises:
+            SkillLoadError: If agent_class is malformed or the file is missing
+        """
         # Parse module path: "my_module.MyAgent"
         if "." not in manifest.agent_class:
             raise SkillLoadError(
@@ -223,8 +364,6 @@ class SkillLoader:
                 "Expected 'module.ClassName'"
             )
 
-        module_path, class_name = manifest.agent_class.rsplit(".", 1)
-
         # Determine entry point
         if manifest.entry_point:
             entry_point = manifest.path / manifest.entry_point
@@ -239,6 +378,51 @@ class SkillLoader:
                 f"Entry point not found for skill '{manifest.name}': {entry_point}"
             )
 
+        return entry_point
+
+    def _check_agent_class_defined(self, manifest: SkillManifest, entry_point: Path) -> None:
+        """
+        Check that an entry point defines the agent class, without importing it.
+
+        The module's top-level names are read from its syntax tree (and
+        cached in the skill index). Modules using ``import *`` or a module
+        ``__getattr__`` cannot be checked statically and are accepted.
+
+        Args:
+            manifest: Skill manifest
+            entry_point: Module file from _resolve_entry_point()
+
+        Raises:
+            SkillLoadError: If the module does not parse or lacks the class
+        """
+        class_name = manifest.agent_class.rsplit(".", 1)[1]
+
+        hit, names = self._cache.get_module_names(entry_point)
+        if not hit:
+            names = _module_names(entry_point)
+            self._cache.put_module_names(entry_point, names)
+
+        if names is not None and class_name not in names:
+            raise SkillLoadError(
+                f"Agent class '{class_name}' not found in {entry_point}"
+            )
+
+    def _import_agent_class(self, manifest: SkillManifest, entry_point: Path) -> type[Any]:
+        """
+        Import a skill module and get its agent class.
+
+        Args:
+            manifest: Skill manifest
+            entry_point: Module file from _resolve_entry_point()
+
+        Returns:
+            Loaded agent class
+
+        Raises:
+            SkillLoadError: If the module or class cannot be loaded
+        """
+        module_path, class_name = manifest.agent_class.rsplit(".", 1)
+
         # Load module dynamically
         try:
             spec = importlib.util.spec_from_file_location(module_path, entry_point)
@@ -287,12 +471,15 @@ class SkillLoader:
                 # Log but continue loading other skills
                 print(f"Warning: Failed to load skill from {manifest_path}: {e}")
 
-        # Resolve load order based on dependencies
-        load_order = self._resolve_dependencies()
+        # Resolve load waves based on dependencies (cached per skill set)
+        try:
+            load_waves = self._cached_load_waves()
+        finally:
+            self._cache.save()
 
         # Register skills in dependency order
         registered = []
-        for skill_name in load_order:
+        for skill_name in (name for wave in load_waves for name in wave):
             if skill_name in self._loaded_skills:
                 skill = self._loaded_skills[skill_name]
                 if not self._registry.get(skill.name):
@@ -301,55 +488,116 @@ class SkillLoader:
 
         return registered
 
-    def _resolve_dependencies(self) -> list[str]:
+    def get_load_waves(self) -> list[list[str]]:
         """
-        Resolve dependency order using topological sort.
+        Get the load waves of the loaded skills.
+
+        Every skill in a wave depends only on skills in earlier waves, so
+        the skills of one wave can be initialized concurrently.
 
         Returns:
-            List of skill names in dependency order
+            Skill names grouped by wave
 
         Raises:
             CircularDependencyError: If circular dependencies are detected
         """
-        # Build full dependency graph
-        graph = self._dependency_graph.copy()
+        return [list(wave) for wave in self._cached_load_waves()]
+
+    def _cached_load_waves(self) -> list[list[str]]:
+        """
+        Resolve the load waves, reusing the cached result for the same skills.
+
+        Returns:
+            Skill names grouped by wave
 
-        # Add all loaded skills (even those without dependencies)
+        Raises:
+            CircularDependencyError: If circular dependencies are detected
+        """
+        key = self._cache.order_key(self._loaded_manifests)
+        cached = self._cache.get_order(key)
+        if cached is None:
+            try:
+                cached = {"waves": self._resolve_load_waves()}
+            except CircularDependencyError:
+                self._cache.put_order(key, cycle=self._find_cycle(self._full_graph()))
+                raise
+            self._cache.put_order(key, waves=cached["waves"])
+
+        if "cycle" in cached:
+            raise CircularDependencyError(
+                f"Circular dependency detected: {' -> '.join(cached['cycle'])}"
+            )
+        return cached["waves"]
+
+    def _full_graph(self) -> dict[str, list[str]]:
+        """Get the dependency graph including skills without dependencies."""
+        graph = self._dependency_graph.copy()
         for skill_name in self._loaded_manifests:
             if skill_name not in graph:
                 graph[skill_name] = []
+        return graph
 
-        # Topological sort using Kahn's algorithm
-        in_degree: dict[str, int] = {skill: 0 for skill in graph}
+    def _resolve_dependencies(self) -> list[str]:
+        """
+        Resolve dependency order using topological sort.
 
-        for skill in graph:
-            for dep in graph[skill]:
-                if dep in in_degree:
-                    in_degree[skill] += 1
+        Returns:
+            List of skill names in dependency order
+
+        Raises:
+            CircularDependencyError: If circular dependencies are detected
+        """
+        return [skill for wave in self._resolve_load_waves() for skill in wave]
 
-        # Start with skills that have no dependencies
-        queue = [skill for skill, degree in in_degree.items() if degree == 0]
-        result = []
+    def _resolve_load_waves(self) -> list[list[str]]:
+        """
+        Group skills into waves using a level-by-level topological sort.
+
+        Wave 0 holds the skills without dependencies; wave n holds the
+        skills whose last dependency is in wave n - 1. The number of waves
+        is the length of the longest dependency chain.
 
-        while queue:
-            skill = queue.pop(0)
-            result.append(skill)
+        Returns:
+            Skill names grouped by wave
+
+        Raises:
+            CircularDependencyError: If circular dependencies are detected
+        """
+        # Build full dependency graph (even skills without dependencies)
+        graph = self._full_graph()
 
-            # Reduce in-degree for dependent skills
-            for dependent, deps in graph.items():
-                if skill in deps:
+        # Kahn's algorithm, one level at a time; dependencies on skills
+        # that are not loaded are ignored here (see check_dependencies)
+        in_degree: dict[str, int] = {skill: 0 for skill in graph}
+        dependents: dict[str, list[str]] = defaultdict(list)
+        for skill, deps in graph.items():
+            for dep in dict.fromkeys(deps):
+                if dep in in_degree:
+                    in_degree[skill] += 1
+                    dependents[dep].append(skill)
+
+        waves: list[list[str]] = []
+        wave = [skill for skill, degree in in_degree.items() if degree == 0]
+        resolved = 0
+        while wave:
+            waves.append(wave)
+            resolved += len(wave)
+            next_wave = []
+            for skill in wave:
+                for dependent in dependents[skill]:
                     in_degree[dependent] -= 1
                     if in_degree[dependent] == 0:
-                        queue.append(dependent)
+                        next_wave.append(dependent)
+            wave = next_wave
 
         # Check for circular dependencies
-        if len(result) != len(graph):
+        if resolved != len(graph):
             cycle = self._find_cycle(graph)
             raise CircularDependencyError(
                 f"Circular dependency detected: {' -> '.join(cycle)}"
             )
 
-        return result
+        return waves
 
     def _find_cycle(self, graph: dict[str, list[str]]) -> list[str]:
         """
@@ -429,6 +677,126 @@ class SkillLoader:
         dependencies = self._loaded_manifests[skill_name].dependencies
         return [dep for dep in dependencies if dep not in self._loaded_manifests]
 
+    # =========================================================================
+    # Initialization
+    # =========================================================================
+
+    async def initialize_all(
+        self,
+        factory: Callable[[Skill], Any] | None = None,
+    ) -> list[SkillInitResult]:
+        """
+        Create and initialize the agents of all enabled skills.
+
+        Skills are initialized wave by wave; the skills of one wave run
+        concurrently, so the total time is bounded by the longest dependency
+        chain rather than the sum over all skills. Agent creation (module
+        import, constructor) runs in worker threads since it is typically
+        blocking I/O; ``initialize()`` is awaited if it is a coroutine and
+        run in a worker thread otherwise. Skills whose dependencies failed
+        are skipped.
+
+        Args:
+            factory: Creates the agent for a skill (default: instantiate
+                ``skill.agent_class`` without arguments)
+
+        Returns:
+            Per-skill results in wave order
+
+        Raises:
+            CircularDependencyError: If circular dependencies are detected
+        """
+        factory = factory or _create_agent
+        failed: set[str] = set()
+        results: list[SkillInitResult] = []
+
+        for index, wave in enumerate(self.get_load_waves()):
+            pending = []
+            for name in wave:
+                skill = self._loaded_skills.get(name)
+                if skill is None or not skill.enabled:
+                    continue
+                blocked = [
+                    dep for dep in self._loaded_manifests[name].dependencies
+                    if dep in failed
+                ]
+                if blocked:
+                    failed.add(name)
+                    results.append(SkillInitResult(
+                        name=name,
+                        wave=index,
+                        success=False,
+                        skipped=True,
+                        error=f"Dependency failed: {', '.join(blocked)}",
+                    ))
+                    continue
+                pending.append(self._initialize_skill(skill, index, factory))
+
+            for result in await asyncio.gather(*pending):
+                results.append(result)
+                if not result.success:
+                    failed.add(result.name)
+
+        for result in results:
+            self._init_results[result.name] = result
+            if result.success:
+                self._agents[result.name] = result.agent
+        return results
+
+    async def _initialize_skill(
+        self,
+        skill: Skill,
+        wave: int,
+        factory: Callable[[Skill], Any],
+    ) -> SkillInitResult:
+        """
+        Create and initialize the agent of one skill.
+
+        Args:
+            skill: Skill to initialize
+            wave: Index of the skill's load wave
+            factory: Creates the agent for the skill
+
+        Returns:
+            Initialization result with timing
+        """
+        result = SkillInitResult(name=skill.name, wave=wave)
+        started = time.perf_counter()
+        try:
+            agent = await asyncio.to_thread(factory, skill)
+            initialize = getattr(agent, "initialize", None)
+            if inspect.iscoroutinefunction(initialize):
+                await initialize()
+            elif callable(initialize):
+                await asyncio.to_thread(initialize)
+            result.agent = agent
+        except Exception as e:
+            result.success = False
+            result.error = str(e)
+        result.duration_ms = (time.perf_counter() - started) * 1000
+        return result
+
+    def get_agent(self, skill_name: str) -> Any:
+        """
+        Get the initialized agent of a skill.
+
+        Args:
+            skill_name: Name of the skill
+
+        Returns:
+            Agent instance, or None if not initialized
+        """
+        return self._agents.get(skill_name)
+
+    def get_init_results(self) -> dict[str, SkillInitResult]:
+        """
+        Get the initialization results by skill name.
+
+        Returns:
+            Results from initialize_all()
+        """
+        return dict(self._init_results)
+
 
 # =============================================================================
 # Convenience Functions
@@ -469,3 +837,24 @@ def discover_skills(
     """
     loader = SkillLoader(project_path=project_path, include_builtins=include_builtins)
     return loader.discover_skills()
+
+
+async def initialize_skills(
+    project_path: Path | None = None,
+    include_builtins: bool = True,
+    factory: Callable[[Skill], Any] | None = None,
+) -> list[SkillInitResult]:
+    """
+    Load all skills and initialize their agents wave by wave.
+
+    Args:
+        project_path: Path to project root for custom skills
+        include_builtins: Whether to include built-in skills
+        factory: Creates the agent for a skill (default: no-argument constructor)
+
+    Returns:
+        Per-skill initialization results
+    """
+    loader = SkillLoader(project_path=project_path, include_builtins=include_builtins)
+    loader.load_all()
+    return await loader.initialize_all(factory)
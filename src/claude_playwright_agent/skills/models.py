@@ -6,8 +6,9 @@ This module provides:
 - SkillRegistry for managing skills
 """
 
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 
 # =============================================================================
@@ -20,7 +21,8 @@ class Skill:
     Represents a loaded skill.
 
     A skill is a reusable unit of functionality that can be
-    dynamically loaded into the agent framework.
+    dynamically loaded into the agent framework. The agent class can be
+    given directly or as a loader that imports it on first access.
     """
 
     def __init__(
@@ -31,6 +33,7 @@ class Skill:
         agent_class: type[Any] | None = None,
         enabled: bool = True,
         path: Path | None = None,
+        agent_loader: Callable[[], type[Any] | None] | None = None,
     ) -> None:
         """
         Initialize a skill.
@@ -42,13 +45,38 @@ class Skill:
             agent_class: Optional agent class for this skill
             enabled: Whether the skill is enabled
             path: Path to skill directory
+            agent_loader: Imports the agent class on first access
         """
         self.name = name
         self.version = version
         self.description = description
-        self.agent_class = agent_class
+        self._agent_class = agent_class
+        self._agent_loader = agent_loader if agent_class is None else None
         self.enabled = enabled
         self.path = path
+        # Per skill, so independent skills can import concurrently
+        # (reentrant: a skill module may load another skill)
+        self._agent_lock = threading.RLock()
+
+    @property
+    def agent_class(self) -> type[Any] | None:
+        """Agent class, imported on first access if loaded lazily."""
+        if self._agent_loader is not None:
+            with self._agent_lock:
+                if self._agent_loader is not None:
+                    self._agent_class = self._agent_loader()
+                    self._agent_loader = None
+        return self._agent_class
+
+    @agent_class.setter
+    def agent_class(self, value: type[Any] | None) -> None:
+        self._agent_class = value
+        self._agent_loader = None
+
+    @property
+    def agent_loaded(self) -> bool:
+        """Whether the agent class has been imported (or there is none)."""
+        return self._agent_loader is None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
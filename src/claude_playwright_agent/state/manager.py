@@ -803,27 +803,70 @@ class StateManager:
         """
         for task in self._state.agent_status:
             if task.agent_id == agent_id:
-                task.status = status
+                self._apply_agent_update(task, status, result, error_message)
+                self.save()
+                return
 
-                if status in [AgentStatus.COMPLETED, AgentStatus.FAILED, AgentStatus.TIMEOUT]:
-                    task.end_time = datetime.now().isoformat()
+        raise StateError(f"Agent task not found: {agent_id}")
 
-                if result is not None:
-                    task.result = result
+    def update_agent_tasks(
+        self,
+        updates: dict[str, dict[str, Any]],
+        create_backup: bool = True,
+    ) -> int:
+        """
+        Update many agent tasks with a single save.
 
-                if error_message:
-                    task.error_message = error_message
+        Args:
+            updates: Agent ID -> ``{"status": AgentStatus, "result": ...,
+                "error_message": ...}`` (result and error_message optional)
+            create_backup: Whether to create a backup before saving
 
-                self._log_event(
-                    "update",
-                    "agent_task",
-                    agent_id,
-                    {"status": status.value, "has_error": bool(error_message)},
-                )
-                self.save()
-                return
+        Returns:
+            Number of agent tasks updated (unknown agent IDs are skipped)
+        """
+        updated = 0
+        for task in self._state.agent_status:
+            update = updates.get(task.agent_id)
+            if update is None:
+                continue
+            self._apply_agent_update(
+                task,
+                update["status"],
+                update.get("result"),
+                update.get("error_message", ""),
+            )
+            updated += 1
 
-        raise StateError(f"Agent task not found: {agent_id}")
+        if updated:
+            self.save(create_backup=create_backup)
+        return updated
+
+    def _apply_agent_update(
+        self,
+        task: AgentTask,
+        status: AgentStatus,
+        result: dict[str, Any] | None,
+        error_message: str,
+    ) -> None:
+        """Apply a status update to an agent task without saving."""
+        task.status = status
+
+        if status in [AgentStatus.COMPLETED, AgentStatus.FAILED, AgentStatus.TIMEOUT]:
+            task.end_time = datetime.now().isoformat()
+
+        if result is not None:
+            task.result = result
+
+        if error_message:
+            task.error_message = error_message
+
+        self._log_event(
+            "update",
+            "agent_task",
+            task.agent_id,
+            {"status": status.value, "has_error": bool(error_message)},
+        )
 
     def get_agent_task(self, agent_id: str) -> AgentTask | None:
         """
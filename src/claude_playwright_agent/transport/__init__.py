@@ -0,0 +1,29 @@
+"""
+Shared async HTTP transport for Claude Playwright Agent.
+
+This package provides:
+- Process-wide connection pools shared by every HTTP consumer
+- Pool limits, keep-alive tuning and optional HTTP/2
+- Cached TLS contexts (TLS session reuse across connections)
+- Bounded-concurrency batch execution
+"""
+
+from claude_playwright_agent.transport.http import (
+    SharedTransport,
+    TransportConfig,
+    close_transports,
+    create_client,
+    get_transport,
+    http2_available,
+    run_bounded,
+)
+
+__all__ = [
+    "SharedTransport",
+    "TransportConfig",
+    "close_transports",
+    "create_client",
+    "get_transport",
+    "http2_available",
+    "run_bounded",
+]
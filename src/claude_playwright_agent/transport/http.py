@@ -0,0 +1,337 @@
+"""
+Shared async HTTP transport.
+
+Every HTTP consumer (the API testing agent, the API validation skill and
+the OpenAI-compatible LLM providers) builds its own lightweight
+``httpx.AsyncClient`` on top of a shared, pooled transport:
+
+- Connections are kept alive and reused, so DNS resolution and the TLS
+  handshake happen once per connection rather than once per request
+- SSL contexts are created once per process and shared, so TLS sessions
+  can be resumed across connections
+- HTTP/2 multiplexes concurrent requests over a single connection when
+  the optional ``h2`` package is installed
+- Closing a client never closes the shared pool; call close_transports()
+  when the event loop is shutting down
+- Proxies from the environment (HTTP_PROXY, HTTPS_PROXY, ALL_PROXY,
+  NO_PROXY) are honoured with one shared pool per proxy
+
+Connection pools are bound to the event loop that created them, so one
+pool is kept per running loop and pool configuration.
+"""
+
+import asyncio
+import importlib.util
+import ipaddress
+import ssl
+import threading
+import urllib.request
+import weakref
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+import httpx
+
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """
+    HTTP transport configuration.
+
+    Pool settings (limits, keep-alive, HTTP/2, TLS verification, retries)
+    select the shared pool; timeouts and redirects apply per client.
+
+    Attributes:
+        max_connections: Maximum open connections in the pool
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection is kept open
+        timeout: Default request timeout in seconds
+        connect_timeout: Connection (DNS + TCP + TLS) timeout in seconds
+        http2: Use HTTP/2 (None: when the h2 package is installed)
+        verify: Verify TLS certificates
+        retries: Connection attempts retried on connect errors
+        follow_redirects: Follow redirects by default
+        max_in_flight: Default concurrency limit for batch requests
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 50
+    keepalive_expiry: float = 30.0
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+    http2: bool | None = None
+    verify: bool = True
+    retries: int = 0
+    follow_redirects: bool = True
+    max_in_flight: int = 32
+
+    def use_http2(self) -> bool:
+        """
+        Resolve whether HTTP/2 is used.
+
+        Returns:
+            True if HTTP/2 is enabled
+
+        Raises:
+            ImportError: If HTTP/2 is requested but h2 is not installed
+        """
+        if self.http2 is None:
+            return http2_available()
+        if self.http2 and not http2_available():
+            raise ImportError(
+                "HTTP/2 requires the 'h2' package. "
+                "Install it with: pip install 'httpx[http2]'"
+            )
+        return self.http2
+
+    def pool_key(self) -> tuple[Any, ...]:
+        """Get the settings that select the shared pool."""
+        return (
+            self.max_connections,
+            self.max_keepalive_connections,
+            self.keepalive_expiry,
+            self.use_http2(),
+            self.verify,
+            self.retries,
+        )
+
+
+def http2_available() -> bool:
+    """Check whether the optional HTTP/2 support (h2) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+# =============================================================================
+# Shared Transport
+# =============================================================================
+
+
+_ssl_contexts: dict[tuple[bool, bool], ssl.SSLContext] = {}
+_ssl_lock = threading.Lock()
+
+
+def _ssl_context(verify: bool, http2: bool) -> ssl.SSLContext:
+    """
+    Get the process-wide SSL context for a TLS configuration.
+
+    Loading the CA bundle is slow and a shared context keeps its TLS
+    session cache, so contexts are created once. HTTP/1.1 and HTTP/2
+    pools use separate contexts because ALPN is set on the context.
+    """
+    key = (verify, http2)
+    with _ssl_lock:
+        context = _ssl_contexts.get(key)
+        if context is None:
+            context = httpx.create_ssl_context(verify=verify)
+            _ssl_contexts[key] = context
+        return context
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """
+    A pooled transport shared by many clients.
+
+    ``aclose()`` is a no-op so that closing one client does not close
+    connections other clients are using; the pool itself is closed by
+    close_transports().
+    """
+
+    def __init__(self, config: TransportConfig, proxy: str | None = None) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            config: Pool configuration
+            proxy: Proxy URL all requests are sent through (None: direct)
+        """
+        self.config = config
+        self.proxy = proxy
+        http2 = config.use_http2()
+        self.http2 = http2
+        self.requests = 0
+        self._transport = httpx.AsyncHTTPTransport(
+            verify=_ssl_context(config.verify, http2),
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            retries=config.retries,
+            proxy=proxy,
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request over a pooled connection."""
+        self.requests += 1
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Keep the shared pool open when a client is closed."""
+
+    async def close_pool(self) -> None:
+        """Close every pooled connection."""
+        await self._transport.aclose()
+
+
+# Pools per event loop (a pool's connections belong to one loop)
+_transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[Any, ...], SharedTransport]]" = (
+    weakref.WeakKeyDictionary()
+)
+_transports_lock = threading.Lock()
+
+
+def get_transport(config: TransportConfig | None = None, proxy: str | None = None) -> SharedTransport:
+    """
+    Get the shared transport for the running event loop.
+
+    Must be called from a coroutine (or code running in the event loop).
+
+    Args:
+        config: Pool configuration (default: TransportConfig())
+        proxy: Proxy URL (None: direct connections)
+
+    Returns:
+        Shared transport for this loop, pool configuration and proxy
+    """
+    config = config or TransportConfig()
+    loop = asyncio.get_running_loop()
+    key = (*config.pool_key(), proxy)
+    with _transports_lock:
+        pools = _transports.setdefault(loop, {})
+        transport = pools.get(key)
+        if transport is None:
+            transport = SharedTransport(config, proxy)
+            pools[key] = transport
+        return transport
+
+
+def _proxy_mounts(
+    config: TransportConfig,
+    proxy: str | httpx.URL | httpx.Proxy | None,
+    trust_env: bool,
+) -> dict[str, SharedTransport | None]:
+    """
+    Build client mounts that route requests through proxies.
+
+    An explicit ``proxy`` applies to every request; otherwise the proxy
+    environment variables are used, as httpx itself does when no custom
+    transport is given. NO_PROXY patterns map to None (the direct pool).
+    """
+    if proxy is not None:
+        url = proxy.url if isinstance(proxy, httpx.Proxy) else proxy
+        return {"all://": get_transport(config, str(url))}
+    if not trust_env:
+        return {}
+    return {
+        pattern: get_transport(config, url) if url else None
+        for pattern, url in _environment_proxies().items()
+    }
+
+
+def _environment_proxies() -> dict[str, str | None]:
+    """
+    Read proxy mount patterns from the *_PROXY and NO_PROXY variables.
+
+    Returns:
+        Mount pattern -> proxy URL, or None for hosts that bypass proxies
+    """
+    proxies = urllib.request.getproxies()
+    mounts: dict[str, str | None] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxies.get(scheme)
+        if url:
+            mounts[f"{scheme}://"] = url if "://" in url else f"http://{url}"
+
+    for host in (h.strip() for h in proxies.get("no", "").split(",")):
+        if not host:
+            continue
+        if host == "*":
+            # Every host bypasses proxies
+            return {}
+        if "://" in host:
+            mounts[host] = None
+            continue
+        try:
+            address = ipaddress.ip_address(host.split("/")[0])
+        except ValueError:
+            pattern = "all://localhost" if host.lower() == "localhost" else f"all://*{host}"
+        else:
+            pattern = f"all://[{host}]" if address.version == 6 else f"all://{host}"
+        mounts[pattern] = None
+    return mounts
+
+
+def create_client(config: TransportConfig | None = None, **kwargs: Any) -> httpx.AsyncClient:
+    """
+    Create an HTTP client on the shared transport.
+
+    Clients are cheap; closing one leaves the shared pool open. Proxies
+    are honoured like in a plain ``httpx.AsyncClient``: an explicit
+    ``proxy`` argument, else HTTP(S)_PROXY / ALL_PROXY / NO_PROXY unless
+    ``trust_env=False``.
+
+    Args:
+        config: Transport configuration (default: TransportConfig())
+        **kwargs: Extra ``httpx.AsyncClient`` arguments (headers, base_url, ...)
+
+    Returns:
+        Async HTTP client
+    """
+    config = config or TransportConfig()
+    kwargs.setdefault("timeout", httpx.Timeout(config.timeout, connect=config.connect_timeout))
+    kwargs.setdefault("follow_redirects", config.follow_redirects)
+    mounts = _proxy_mounts(config, kwargs.pop("proxy", None), kwargs.get("trust_env", True))
+    mounts.update(kwargs.pop("mounts", None) or {})
+    return httpx.AsyncClient(transport=get_transport(config), mounts=mounts or None, **kwargs)
+
+
+async def close_transports() -> None:
+    """Close the shared pools of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _transports_lock:
+        pools = _transports.pop(loop, {})
+    for transport in pools.values():
+        await transport.close_pool()
+
+
+# =============================================================================
+# Batch Execution
+# =============================================================================
+
+
+async def run_bounded(
+    calls: Iterable[Callable[[], Awaitable[T]]],
+    limit: int = TransportConfig.max_in_flight,
+) -> list[T]:
+    """
+    Run many coroutines with a bounded number in flight.
+
+    A fixed set of workers pulls calls from a shared iterator that is
+    consumed lazily, so at most ``limit`` coroutines exist at once; only
+    the results are kept for every call.
+
+    Args:
+        calls: Zero-argument coroutine functions
+        limit: Maximum number of calls running at once
+
+    Returns:
+        Results in the order of ``calls``
+    """
+    results: dict[int, Any] = {}
+    pending = enumerate(calls)
+
+    async def worker() -> None:
+        for index, call in pending:
+            results[index] = await call()
+
+    await asyncio.gather(*(worker() for _ in range(max(limit, 1))))
+    return [results[index] for index in range(len(results))]
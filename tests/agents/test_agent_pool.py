@@ -0,0 +1,192 @@
+"""
+Tests for warm agent pools.
+
+Tests cover:
+- Checkout/checkin reuse and reset hooks
+- Pool size limits and waiting
+- Idle eviction and minimum warm agents
+- AgentLifecycleManager and OrchestratorAgent pool integration
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claude_playwright_agent.agents.agent_pool import AgentPool, PoolConfig
+from claude_playwright_agent.agents.orchestrator import AgentLifecycleManager, OrchestratorAgent
+
+
+class PooledAgent:
+    """Agent that counts lifecycle calls."""
+
+    def __init__(self, agent_type: str) -> None:
+        self.agent_type = agent_type
+        self.initialized = 0
+        self.resets = 0
+        self.cleaned_up = 0
+
+    async def initialize(self) -> None:
+        self.initialized += 1
+
+    async def reset(self) -> None:
+        self.resets += 1
+
+    async def cleanup(self) -> None:
+        self.cleaned_up += 1
+
+    async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(0)
+        return {"success": True, "agent": id(self)}
+
+
+class Factory:
+    """Creates PooledAgents and keeps them."""
+
+    def __init__(self) -> None:
+        self.created: list[PooledAgent] = []
+
+    def __call__(self, agent_type: str) -> PooledAgent:
+        agent = PooledAgent(agent_type)
+        self.created.append(agent)
+        return agent
+
+
+# =============================================================================
+# AgentPool Tests
+# =============================================================================
+
+
+class TestAgentPool:
+    """Tests for AgentPool."""
+
+    def test_invalid_config(self) -> None:
+        """Pool sizes are validated."""
+        with pytest.raises(ValueError):
+            PoolConfig(max_size=0)
+        with pytest.raises(ValueError):
+            PoolConfig(min_size=3, max_size=2)
+
+    async def test_checkin_resets_and_reuses(self) -> None:
+        """A returned agent is reset and served to the next checkout."""
+        factory = Factory()
+        pool = AgentPool("Worker", factory)
+
+        first = await pool.checkout()
+        await pool.checkin(first)
+        second = await pool.checkout()
+
+        assert second is first
+        assert first.initialized == 1
+        assert first.resets == 1
+        stats = pool.get_stats()
+        assert stats.created == 1
+        assert stats.warm_hits == 1
+        assert stats.in_use == 1
+
+    async def test_custom_reset_failure_discards(self) -> None:
+        """An agent whose reset fails is cleaned up instead of reused."""
+        factory = Factory()
+
+        def reset(agent: PooledAgent) -> None:
+            raise RuntimeError("dirty")
+
+        pool = AgentPool("Worker", factory, reset=reset)
+        agent = await pool.checkout()
+        await pool.checkin(agent)
+
+        assert agent.cleaned_up == 1
+        assert pool.get_stats().discarded == 1
+        assert await pool.checkout() is not agent
+
+    async def test_failed_task_discards_agent(self) -> None:
+        """An exception inside acquire() discards the agent."""
+        pool = AgentPool("Worker", Factory())
+
+        with pytest.raises(ValueError):
+            async with pool.acquire() as agent:
+                raise ValueError("task failed")
+
+        assert agent.cleaned_up == 1
+        assert pool.size == 0
+
+    async def test_max_size_waits(self) -> None:
+        """Checkouts beyond max_size wait for a checkin."""
+        factory = Factory()
+        pool = AgentPool("Worker", factory, PoolConfig(max_size=2))
+
+        async def use() -> None:
+            async with pool.acquire():
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(*(use() for _ in range(6)))
+
+        stats = pool.get_stats()
+        assert len(factory.created) == 2
+        assert stats.peak_in_use == 2
+        assert stats.waits > 0
+        assert stats.checkouts == 6
+
+    async def test_warm_and_evict_idle(self) -> None:
+        """Idle agents above min_size are evicted after the idle timeout."""
+        factory = Factory()
+        pool = AgentPool("Worker", factory, PoolConfig(min_size=1, max_size=3, idle_timeout=10))
+
+        assert await pool.warm() == 1
+        agents = [await pool.checkout() for _ in range(3)]
+        for agent in agents:
+            await pool.checkin(agent)
+
+        assert await pool.evict_idle() == 0
+        evicted = await pool.evict_idle(now=time.monotonic() + 3600)
+
+        assert evicted == 2
+        assert pool.size == 1
+        assert sum(a.cleaned_up for a in factory.created) == 2
+
+
+# =============================================================================
+# Lifecycle and Orchestrator Tests
+# =============================================================================
+
+
+class TestLifecyclePools:
+    """Tests for pools managed by AgentLifecycleManager."""
+
+    async def test_checkout_checkin_and_stats(self, tmp_path: Path) -> None:
+        """Pools are reachable by agent type and closed on shutdown."""
+        manager = AgentLifecycleManager(tmp_path, enable_resource_limits=False)
+        factory = Factory()
+        manager.configure_pool("Worker", factory, PoolConfig(max_size=2))
+
+        agent = await manager.checkout_agent("Worker")
+        await manager.checkin_agent("Worker", agent)
+        stats = manager.get_pool_stats()
+
+        assert stats["Worker"]["created"] == 1
+        assert stats["Worker"]["idle"] == 1
+        with pytest.raises(ValueError):
+            manager.configure_pool("Worker", factory)
+        with pytest.raises(KeyError):
+            await manager.checkout_agent("Missing")
+
+        await manager.shutdown_all()
+        assert agent.cleaned_up == 1
+        assert manager.get_pool_stats() == {}
+
+    async def test_back_to_back_workflows_reuse_agents(self, tmp_path: Path, monkeypatch) -> None:
+        """A second workflow run creates no new agents."""
+        monkeypatch.chdir(tmp_path)
+        factory = Factory()
+        orchestrator = OrchestratorAgent(tmp_path, agent_factory=factory)
+
+        first = await orchestrator.run_workflow("ingestion", {"recordings": ["a.js", "b.js"]})
+        created = len(factory.created)
+        second = await orchestrator.run_workflow("ingestion", {"recordings": ["c.js", "d.js"]})
+
+        assert first["status"] == second["status"] == "completed"
+        assert len(factory.created) == created
+        assert orchestrator.get_pool_stats()["IngestionAgent"]["warm_hits"] >= 2
+        await orchestrator._lifecycle.close_pools()
@@ -14,6 +14,7 @@ from pathlib import Path
 import pytest
 
 from claude_playwright_agent.agents.bdd_agent import BDDConversionAgent
+from claude_playwright_agent.llm.base import StreamChunk
 
 
 # =============================================================================
@@ -193,3 +194,53 @@ class TestBDDConversionAgent:
         assert "Given" in feature or "When" in feature or "Then" in feature
 
         await agent.cleanup()
+
+
+class FakeStreamingProvider:
+    """Provider stub that streams a fixed Gherkin document in small chunks."""
+
+    _initialized = True
+
+    def __init__(self, text: str, chunk_size: int = 7) -> None:
+        self._text = text
+        self._chunk_size = chunk_size
+
+    async def query_stream(self, messages, tools=None, **kwargs):
+        for i in range(0, len(self._text), self._chunk_size):
+            piece = self._text[i:i + self._chunk_size]
+            yield StreamChunk(content=piece, delta=piece)
+        yield StreamChunk(content="", delta="", finish_reason="stop")
+
+    async def cleanup(self) -> None:
+        pass
+
+
+class TestBDDConversionAgentStreaming:
+    """Tests for streamed feature generation."""
+
+    @pytest.mark.asyncio
+    async def test_stream_feature_emits_progress_events(self, tmp_path: Path) -> None:
+        """Test that scenarios are reported and written as they stream in."""
+        gherkin = (
+            "Feature: Login\n\n"
+            "  Scenario: Valid login\n"
+            "    Given the user is on the login page\n"
+            "    When the user submits valid credentials\n\n"
+            "  Scenario: Invalid login\n"
+            "    Then the user sees an error\n"
+        )
+        output_file = tmp_path / "login.feature"
+        agent = BDDConversionAgent(tmp_path, llm_provider=FakeStreamingProvider(gherkin))
+
+        events = [
+            event async for event in agent.stream_feature(SAMPLE_PARSED_RECORDING, output_file)
+        ]
+
+        assert events[0]["type"] == "first_token"
+        scenario_events = [e for e in events if e["type"] == "scenario"]
+        assert [e["name"] for e in scenario_events] == ["Valid login", "Invalid login"]
+        assert events[-1]["type"] == "complete"
+        assert events[-1]["scenario_count"] == 2
+        assert "Scenario: Invalid login" in output_file.read_text()
+
+        await agent.cleanup()
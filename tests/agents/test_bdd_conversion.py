@@ -17,6 +17,7 @@ from claude_playwright_agent.agents.bdd_conversion import (
     GherkinFeature,
     GherkinScenario,
     GherkinStep,
+    IncrementalFeatureWriter,
     StepDefinitionGenerator,
     StepKeyword,
     convert_to_gherkin,
@@ -482,3 +483,111 @@ class TestConvenienceFunctions:
 
         content = output_file.read_text()
         assert "Feature: User Login" in content
+
+
+# =============================================================================
+# Incremental Feature Writer Tests
+# =============================================================================
+
+
+STREAMED_FEATURE = """```gherkin
+@auth
+Feature: User Login
+
+  @smoke
+  Scenario: Successful login
+    Given the user navigates to "https://example.com"
+    When the user enters "user@example.com" into the email field
+    Then the user should see the dashboard
+
+  Scenario: Failed login
+    Given the user navigates to "https://example.com"
+    Then the user should see an error
+```"""
+
+
+class TestIncrementalFeatureWriter:
+    """Tests for IncrementalFeatureWriter class."""
+
+    def test_scenario_written_when_next_starts(self, tmp_path: Path) -> None:
+        """Test that a scenario is flushed to disk once the next one begins."""
+        output_file = tmp_path / "login.feature"
+        writer = IncrementalFeatureWriter(output_file)
+
+        first_part, second_part = STREAMED_FEATURE.split("  Scenario: Failed login")
+        completed = writer.feed(first_part)
+        assert completed == []
+
+        completed = writer.feed("  Scenario: Failed login" + second_part[:10])
+        assert [s.name for s in completed] == ["Successful login"]
+
+        content = output_file.read_text()
+        assert "Feature: User Login" in content
+        assert "Scenario: Successful login" in content
+        assert "Failed login" not in content
+
+        writer.close()
+
+    def test_close_flushes_last_scenario(self, tmp_path: Path) -> None:
+        """Test that closing the stream writes the final scenario."""
+        output_file = tmp_path / "login.feature"
+        writer = IncrementalFeatureWriter(output_file)
+
+        writer.feed(STREAMED_FEATURE)
+        completed = writer.close()
+
+        assert [s.name for s in completed] == ["Failed login"]
+        content = output_file.read_text()
+        assert "Scenario: Failed login" in content
+        assert "```" not in content
+        assert content.startswith("@auth\nFeature: User Login")
+
+    def test_character_by_character_stream(self, tmp_path: Path) -> None:
+        """Test parsing when text arrives one character at a time."""
+        writer = IncrementalFeatureWriter(tmp_path / "login.feature")
+
+        for char in STREAMED_FEATURE:
+            writer.feed(char)
+        writer.close()
+
+        assert writer.feature_name == "User Login"
+        assert [s.name for s in writer.scenarios] == ["Successful login", "Failed login"]
+        assert writer.scenarios[0].tags == ["@smoke"]
+        assert len(writer.scenarios[0].steps) == 3
+
+    def test_step_definitions_generated_incrementally(self) -> None:
+        """Test that step definitions are generated once per unique step."""
+        writer = IncrementalFeatureWriter(step_generator=StepDefinitionGenerator())
+
+        writer.feed(STREAMED_FEATURE)
+        writer.close()
+
+        step_defs = writer.get_step_definitions()
+        assert step_defs.count('navigates to "https://example.com"') == 2  # decorator + docstring
+        assert "the user should see an error" in step_defs
+
+    def test_tagged_examples_stay_in_outline(self, tmp_path: Path) -> None:
+        """Test that tags on an Examples block do not end the outline."""
+        output_file = tmp_path / "login.feature"
+        writer = IncrementalFeatureWriter(output_file)
+
+        completed = writer.feed(
+            "Feature: User Login\n\n"
+            "  Scenario Outline: Login as <role>\n"
+            "    Given the user logs in as <role>\n\n"
+            "    @admin\n"
+            "    Examples:\n"
+            "      | role  |\n"
+            "      | admin |\n\n"
+            "  @smoke\n"
+            "  Scenario: Logout\n"
+            "    When the user logs out\n"
+        )
+        completed += writer.close()
+
+        assert [s.name for s in completed] == ["Login as <role>", "Logout"]
+        assert writer.scenarios[0].tags == []
+        assert writer.scenarios[1].tags == ["@smoke"]
+        content = output_file.read_text()
+        assert "    @admin\n    Examples:" in content
+        assert content.index("| admin |") < content.index("Scenario: Logout")
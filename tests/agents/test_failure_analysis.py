@@ -25,6 +25,7 @@ from claude_playwright_agent.agents.failure_analysis import (
     FixSuggestion,
     Severity,
 )
+from claude_playwright_agent.reporting.history_store import HistoryStore
 
 
 # =============================================================================
@@ -432,6 +433,23 @@ class TestFailureAnalyzer:
         assert len(analyzer._history["test1"]) == 1
         assert analyzer._history["test1"][0]["status"] == "passed"
 
+    def test_update_history_persists_to_store(self, tmp_path: Path) -> None:
+        """Test that history survives across analyzers via the history store."""
+        store = HistoryStore(db_path=tmp_path / "history.db")
+
+        for status in ["passed", "failed", "passed", "failed"]:
+            FailureAnalyzer(history_store=store).update_history(
+                [{"name": "checkout", "status": status, "duration": 1.0}]
+            )
+
+        analyzer = FailureAnalyzer(history_store=store)
+        assert len(analyzer._history["checkout"]) == 4
+        assert store.count_runs(source=FailureAnalyzer.SOURCE) == 4
+        assert [f.test_name for f in analyzer.detect_flaky_tests(min_runs=3, flaky_threshold=0.3)] == [
+            "checkout"
+        ]
+        store.close()
+
     def test_detect_flaky_tests(self) -> None:
         """Test flaky test detection."""
         analyzer = FailureAnalyzer()
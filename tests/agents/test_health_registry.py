@@ -0,0 +1,204 @@
+"""
+Tests for the agent health registry.
+
+Tests cover:
+- In-memory heartbeats
+- Timeout detection on the timer heap
+- Batched state persistence
+- AgentLifecycleManager integration
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from claude_playwright_agent.agents.health_registry import HealthRegistry
+from claude_playwright_agent.agents.orchestrator import AgentLifecycleManager
+from claude_playwright_agent.state import AgentStatus, StateManager
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingState:
+    """State manager stand-in that records batched updates."""
+
+    def __init__(self) -> None:
+        self.batches: list[tuple[dict[str, Any], bool]] = []
+
+    def update_agent_tasks(self, updates: dict[str, Any], create_backup: bool = True) -> int:
+        self.batches.append((updates, create_backup))
+        return len(updates)
+
+
+# =============================================================================
+# Registry Tests
+# =============================================================================
+
+
+class TestHealthRegistry:
+    """Tests for HealthRegistry."""
+
+    def test_heartbeats_do_not_touch_timer_heap(self) -> None:
+        """Heartbeats only update the record."""
+        registry = HealthRegistry(timeout=10, clock=FakeClock())
+        registry.register("a1", "worker")
+        for _ in range(100):
+            assert registry.heartbeat("a1")
+
+        assert registry.get("a1").heartbeat_count == 100
+        assert registry.get_stats()["timers"] == 1
+        assert not registry.heartbeat("missing")
+
+    def test_timeouts_from_heap(self) -> None:
+        """Only agents not seen within the timeout time out."""
+        clock = FakeClock()
+        registry = HealthRegistry(timeout=10, clock=clock)
+        registry.register("idle", "worker")
+        registry.register("busy", "worker")
+
+        clock.now += 6
+        registry.heartbeat("busy")
+        clock.now += 6
+        timed_out = registry.check_timeouts()
+
+        assert [record.agent_id for record in timed_out] == ["idle"]
+        assert registry.get("idle").status == AgentStatus.TIMEOUT
+        assert registry.get("busy").status == AgentStatus.RUNNING
+        # The busy agent's entry moved to its new deadline
+        assert registry.check_timeouts(clock.now + 3) == []
+        assert [r.agent_id for r in registry.check_timeouts(clock.now + 5)] == ["busy"]
+
+    def test_heartbeat_revives_timed_out_agent(self) -> None:
+        """A heartbeat after a timeout reschedules the agent."""
+        clock = FakeClock()
+        registry = HealthRegistry(timeout=10, clock=clock)
+        registry.register("a1", "worker")
+        clock.now += 11
+        registry.check_timeouts()
+
+        registry.heartbeat("a1")
+        assert registry.get("a1").status == AgentStatus.RUNNING
+        clock.now += 11
+        assert len(registry.check_timeouts()) == 1
+
+    def test_unregistered_agents_never_time_out(self) -> None:
+        """Heap entries of unregistered agents are dropped."""
+        clock = FakeClock()
+        registry = HealthRegistry(timeout=10, clock=clock)
+        registry.register("a1", "worker")
+        registry.unregister("a1")
+        clock.now += 11
+
+        assert registry.check_timeouts() == []
+        assert registry.get_stats()["timers"] == 0
+
+    def test_flush_batches_dirty_agents(self) -> None:
+        """All pending changes are written in one update; backups only on status changes."""
+        state = RecordingState()
+        registry = HealthRegistry(state, timeout=10, clock=FakeClock())
+        registry.register("a1", "worker")
+        registry.register("a2", "worker")
+
+        assert registry.flush() == 2
+        assert registry.flush() == 0
+
+        registry.heartbeat("a1")
+        registry.heartbeat("a1")
+        assert registry.flush() == 1
+
+        assert len(state.batches) == 2
+        assert state.batches[0][1] is True
+        updates, backup = state.batches[1]
+        assert backup is False
+        assert updates["a1"]["result"]["heartbeat_count"] == 2
+
+    async def test_loop_flushes_status_changes_and_reports_timeouts(self, tmp_path: Path) -> None:
+        """The background loop flushes a status change without waiting for the interval."""
+        state = StateManager(tmp_path)
+        state.add_agent_task("a1", "worker")
+        timed_out: list[str] = []
+        registry = HealthRegistry(
+            state,
+            timeout=0.05,
+            flush_interval=60,
+            on_timeout=lambda record: timed_out.append(record.agent_id),
+        )
+        registry.register("a1", "worker")
+        registry.start()
+
+        await asyncio.sleep(0.2)
+        await registry.stop()
+
+        assert timed_out == ["a1"]
+        assert state.get_agent_task("a1").status == AgentStatus.TIMEOUT
+
+
+# =============================================================================
+# Lifecycle Integration Tests
+# =============================================================================
+
+
+class TestLifecycleHealth:
+    """Tests for AgentLifecycleManager health tracking."""
+
+    async def test_heartbeats_tracked_in_memory(self, tmp_path: Path) -> None:
+        """Heartbeats are visible immediately and persisted on shutdown."""
+        manager = AgentLifecycleManager(tmp_path, enable_resource_limits=False)
+        agent = MagicMock()
+        agent.initialize = AsyncMock()
+        agent.cleanup = AsyncMock()
+
+        await manager.spawn_agent("a1", "worker", agent, task_id="t1")
+        for _ in range(3):
+            assert manager.heartbeat("a1")
+
+        health = manager.get_agent_health("a1")
+        assert health["heartbeat_count"] == 3
+        assert health["task_id"] == "t1"
+        assert manager.get_agent_status("a1") == AgentStatus.RUNNING
+
+        await manager.shutdown_all()
+        assert manager.get_agent_health("a1") is None
+        assert manager.get_agent_status("a1") == AgentStatus.COMPLETED
+
+    async def test_process_calls_heartbeat(self, tmp_path: Path) -> None:
+        """An agent making progress stays running; a stalled call times out."""
+        manager = AgentLifecycleManager(tmp_path, agent_timeout=0.1, enable_resource_limits=False)
+        stall = asyncio.Event()
+
+        async def process(input_data: dict[str, Any]) -> dict[str, Any]:
+            if input_data.get("stall"):
+                await stall.wait()
+            return {"success": True}
+
+        agents = {}
+        for agent_id in ("busy", "stalled"):
+            agent = MagicMock()
+            agent.initialize = AsyncMock()
+            agent.cleanup = AsyncMock()
+            agent.process = process
+            await manager.spawn_agent(agent_id, "worker", agent)
+            agents[agent_id] = agent
+
+        stalled = asyncio.create_task(agents["stalled"].process({"stall": True}))
+        for _ in range(10):
+            await agents["busy"].process({})
+            await asyncio.sleep(0.03)
+
+        assert manager.get_agent_status("busy") == AgentStatus.RUNNING
+        assert manager.get_agent_health("busy")["heartbeat_count"] == 20
+        assert manager.get_agent_status("stalled") == AgentStatus.TIMEOUT
+
+        stall.set()
+        await stalled
+        assert manager.get_agent_status("stalled") == AgentStatus.RUNNING
+        await manager.shutdown_all()
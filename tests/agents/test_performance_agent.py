@@ -0,0 +1,94 @@
+"""
+Tests for PerformanceAgent browser metrics collection.
+
+Tests cover:
+- One init script, one navigation and one evaluate per measurement
+- Derivation of load, paint, LCP, CLS, TTI and blocking time
+- Resource profile and waterfall from the same snapshot
+"""
+
+from pathlib import Path
+
+import pytest
+
+from claude_playwright_agent.agents.performance_agent import PerformanceAgent
+
+
+SNAPSHOT = {
+    "navigation": {"loadEventEnd": 1200.0, "domContentLoadedEventEnd": 800.0, "domInteractive": 700.0},
+    "paint": {"first-paint": 400.0, "first-contentful-paint": 450.0},
+    "lcp": 900.0,
+    "cls": 0.12,
+    "long_tasks": [[100.0, 300.0], [1000.0, 120.0], [1500.0, 60.0]],
+    "resources": [
+        {"name": "https://cdn.example.com/app.js", "type": "script", "start": 50.0, "duration": 1100.0,
+         "size": 600 * 1024, "request_start": 60.0, "response_start": 1080.0, "response_end": 1150.0},
+        {"name": "https://example.com/site.css?v=2", "type": "link", "start": 40.0, "duration": 100.0,
+         "size": 20 * 1024, "request_start": 45.0, "response_start": 90.0, "response_end": 140.0},
+    ],
+    "collector": True,
+}
+
+
+class FakePage:
+    """Playwright Page stand-in that records calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def add_init_script(self, script: str) -> None:
+        self.calls.append("add_init_script")
+
+    async def goto(self, url: str, wait_until: str = "load") -> None:
+        self.calls.append(f"goto:{wait_until}")
+
+    async def evaluate(self, script: str) -> dict:
+        self.calls.append("evaluate")
+        return SNAPSHOT
+
+
+@pytest.fixture
+def agent(tmp_path: Path, monkeypatch) -> PerformanceAgent:
+    """Create a performance agent in a temporary project."""
+    monkeypatch.chdir(tmp_path)
+    return PerformanceAgent(project_path=tmp_path)
+
+
+class TestMetricsCollection:
+    """Tests for single-round-trip metrics collection."""
+
+    async def test_measure_uses_one_load_and_one_evaluate(self, agent: PerformanceAgent) -> None:
+        """The collector is installed once and metrics are fetched in one call."""
+        page = FakePage()
+        await agent.measure_page_performance(page, "https://example.com")
+        await agent.measure_page_performance(page, "https://example.com")
+
+        assert page.calls == ["add_init_script", "goto:load", "evaluate", "goto:load", "evaluate"]
+
+    async def test_metrics_derived_from_snapshot(self, agent: PerformanceAgent) -> None:
+        """Load, paint, layout shift and interactivity metrics are reported."""
+        result = await agent.measure_page_performance(FakePage(), "https://example.com")
+        metrics = result["metrics"]
+
+        assert result["success"]
+        assert metrics["page_load_time_ms"] == 1200.0
+        assert metrics["first_contentful_paint_ms"] == 450.0
+        assert metrics["largest_contentful_paint_ms"] == 900.0
+        assert metrics["cumulative_layout_shift"] == 0.12
+        # Long tasks after FCP: 1000+120 and 1500+60
+        assert metrics["long_task_count"] == 2
+        assert metrics["total_blocking_time_ms"] == 80.0
+        assert metrics["time_to_interactive_ms"] == 1560.0
+        assert metrics["js_heap_size"] == 600 * 1024
+
+    async def test_analyze_page_single_load(self, agent: PerformanceAgent) -> None:
+        """Combined analysis loads the page once."""
+        page = FakePage()
+        result = await agent.analyze_page(page, "https://example.com")
+
+        assert page.calls == ["add_init_script", "goto:load", "evaluate"]
+        assert result["resources"]["resource_count"] == 2
+        assert result["resources"]["by_domain"] == {"cdn.example.com": 600.0, "example.com": 20.0}
+        assert result["resources"]["slow_requests"][0]["url"] == "https://cdn.example.com/app.js"
+        assert result["waterfall"]["waterfall"][0]["url"] == "https://example.com/site.css?v=2"
+        assert result["waterfall"]["bottlenecks"][0]["issue"] == "High Time to First Byte"
@@ -0,0 +1,127 @@
+"""
+Tests for sampled resource accounting.
+
+Tests cover:
+- One process sample per tick shared by all agents
+- CPU attribution by time spent inside process()
+- Task-level tracking and agent instrumentation
+- Memory attribution with tracemalloc
+"""
+
+import asyncio
+import contextlib
+from types import SimpleNamespace
+
+from claude_playwright_agent.agents.resource_limits import (
+    ResourceLimit,
+    ResourceLimitManager,
+    ResourceType,
+    current_usage,
+)
+
+
+class FakeProcess:
+    """psutil.Process stand-in with settable counters."""
+
+    def __init__(self) -> None:
+        self.cpu = 0.0
+        self.rss = 100 * 1024 * 1024
+        self.reads = 0
+
+    def oneshot(self) -> contextlib.AbstractContextManager:
+        self.reads += 1
+        return contextlib.nullcontext()
+
+    def memory_info(self) -> SimpleNamespace:
+        return SimpleNamespace(rss=self.rss)
+
+    def cpu_times(self) -> SimpleNamespace:
+        return SimpleNamespace(user=self.cpu, system=0.0)
+
+    def io_counters(self) -> SimpleNamespace:
+        return SimpleNamespace(read_bytes=0, write_bytes=0)
+
+
+async def make_manager(*agent_ids: str, **kwargs) -> tuple[ResourceLimitManager, FakeProcess]:
+    """Create a manager sampling a fake process with registered agents."""
+    process = FakeProcess()
+    manager = ResourceLimitManager(**kwargs)
+    for agent_id in agent_ids:
+        await manager.register_agent(agent_id, process=process)
+    return manager, process
+
+
+class TestResourceSampling:
+    """Tests for ResourceLimitManager sampling."""
+
+    async def test_cpu_attributed_by_active_time(self) -> None:
+        """Only agents that ran during the interval are charged its CPU time."""
+        manager, process = await make_manager("busy", "idle")
+        manager.sample()
+
+        async with manager.track("busy"):
+            await asyncio.sleep(0.01)
+        process.cpu += 2.0
+        manager.sample()
+
+        assert manager.get_usage("busy").cpu_time == 2.0
+        assert manager.get_usage("idle").cpu_time == 0.0
+        assert manager.get_global_usage()[ResourceType.CPU_TIME] == 2.0
+
+    async def test_reads_between_samples_do_not_query_process(self) -> None:
+        """Usage and limit checks reuse the last sample."""
+        manager, process = await make_manager("a1")
+        for _ in range(5):
+            await manager.check_limits("a1")
+            manager.get_usage("a1").to_dict()
+
+        assert process.reads == 1
+
+    async def test_all_limits_evaluated_in_one_pass(self) -> None:
+        """sample() reports every agent over a limit."""
+        limit = ResourceLimit(ResourceType.OPERATIONS, max_value=1, action_on_exceed="warn")
+        manager, _ = await make_manager("a1", "a2", limits={ResourceType.OPERATIONS: limit})
+        for _ in range(2):
+            async with manager.track("a1"):
+                pass
+
+        assert list(manager.sample()) == ["a1"]
+        assert await manager.check_limits("a2") == []
+
+
+class TestTaskTracking:
+    """Tests for task-level instrumentation."""
+
+    async def test_nested_calls_counted_once(self) -> None:
+        """An agent calling its own process() is one operation."""
+        manager, _ = await make_manager("a1")
+
+        class Agent:
+            async def process(self, input_data: dict) -> dict:
+                if input_data.get("nested"):
+                    return await self.process({})
+                return {"usage": current_usage()}
+
+        agent = Agent()
+        manager.instrument("a1", agent)
+        result = await agent.process({"nested": True})
+
+        assert result["usage"] is manager.get_usage("a1")
+        assert manager.get_usage("a1").operations == 1
+        assert manager.get_usage("a1").active_time > 0
+        assert current_usage() is None
+
+    async def test_traced_memory_attributed(self) -> None:
+        """With memory tracing, retained allocations count against the agent."""
+        manager, _ = await make_manager("a1", "a2", trace_memory=True)
+        await manager.start()
+        retained = []
+        try:
+            async with manager.track("a1"):
+                retained.append(bytearray(1024 * 1024))
+            manager.sample()
+        finally:
+            await manager.stop()
+
+        assert manager.get_usage("a1").memory_usage >= 1024 * 1024
+        assert manager.get_usage("a2").memory_usage == 0
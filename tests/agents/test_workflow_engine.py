@@ -0,0 +1,267 @@
+"""
+Tests for the DAG workflow engine.
+
+Tests cover:
+- Workflow graph validation
+- Concurrent branches and per-item pipelining
+- Fan-in, failure propagation and per-agent-type concurrency caps
+- OrchestratorAgent.run_workflow on the built-in workflows
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claude_playwright_agent.agents.event_broadcasting import EventType
+from claude_playwright_agent.agents.orchestrator import OrchestratorAgent
+from claude_playwright_agent.agents.workflow_engine import (
+    Stage,
+    Workflow,
+    WorkflowEngine,
+    WorkflowStatus,
+)
+
+
+class FakeAgent:
+    """Agent that records its calls and sleeps per call."""
+
+    def __init__(self, agent_type: str, log: list[tuple], delay: float = 0.05) -> None:
+        self.agent_type = agent_type
+        self.log = log
+        self.delay = delay
+        self.active = 0
+        self.initialized = 0
+        self.cleaned_up = 0
+
+    async def initialize(self) -> None:
+        self.initialized += 1
+
+    async def cleanup(self) -> None:
+        self.cleaned_up += 1
+
+    async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        self.log.append(("start", self.agent_type, input_data.get("item"), asyncio.get_running_loop().time()))
+        await asyncio.sleep(self.delay)
+        if input_data.get("item") == "bad" or input_data.get("fail"):
+            return {"success": False, "error": "boom"}
+        self.log.append(("end", self.agent_type, input_data.get("item"), asyncio.get_running_loop().time()))
+        return {"success": True, "agent": self.agent_type, "item": input_data.get("item"), "input": input_data}
+
+
+class FakeFactory:
+    """Creates FakeAgents and tracks peak concurrency per type."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.log: list[tuple] = []
+        self.agents: list[FakeAgent] = []
+        self.delay = delay
+
+    def __call__(self, agent_type: str) -> FakeAgent:
+        agent = FakeAgent(agent_type, self.log, self.delay)
+        self.agents.append(agent)
+        return agent
+
+    def peak(self, agent_type: str) -> int:
+        running = peak = 0
+        for event, kind, *_ in self.log:
+            if kind != agent_type:
+                continue
+            running += 1 if event == "start" else -1
+            peak = max(peak, running)
+        return peak
+
+
+# =============================================================================
+# Validation Tests
+# =============================================================================
+
+
+class TestWorkflowValidation:
+    """Tests for workflow graph validation."""
+
+    def test_plain_stage_list_runs_in_sequence(self) -> None:
+        """Stages without dependencies depend on the previous stage."""
+        workflow = Workflow([Stage("a", "A"), Stage("b", "B"), Stage("c", "C")])
+
+        assert workflow.dependencies() == {"a": [], "b": ["a"], "c": ["b"]}
+        assert workflow.validate() == ["a", "b", "c"]
+
+    def test_cycle_is_rejected(self) -> None:
+        """Cyclic dependencies are reported."""
+        workflow = Workflow([
+            Stage("a", "A", depends_on=["b"]),
+            Stage("b", "B", depends_on=["a"]),
+        ])
+
+        with pytest.raises(ValueError, match="cycle"):
+            workflow.validate()
+
+    def test_unknown_dependency_is_rejected(self) -> None:
+        """Dependencies must name stages of the workflow."""
+        workflow = Workflow([Stage("a", "A", depends_on=["missing"])])
+
+        with pytest.raises(ValueError, match="unknown"):
+            workflow.validate()
+
+
+# =============================================================================
+# Engine Tests
+# =============================================================================
+
+
+class TestWorkflowEngine:
+    """Tests for WorkflowEngine execution."""
+
+    async def test_independent_branches_run_concurrently(self) -> None:
+        """Stages sharing only a dependency overlap."""
+        factory = FakeFactory(delay=0.1)
+        workflow = Workflow([
+            Stage("root", "Root", depends_on=[]),
+            Stage("left", "Left", depends_on=["root"]),
+            Stage("right", "Right", depends_on=["root"]),
+            Stage("join", "Join", depends_on=["left", "right"]),
+        ])
+
+        result = await WorkflowEngine(factory).run(workflow, {})
+
+        assert result.status == WorkflowStatus.COMPLETED
+        starts = {kind: t for event, kind, _, t in factory.log if event == "start"}
+        assert abs(starts["Left"] - starts["Right"]) < 0.05
+        assert set(result.results["join"]["input"]) == {"left", "right"}
+
+    async def test_per_item_stages_pipeline(self) -> None:
+        """Each item moves to the next stage without waiting for the others."""
+        factory = FakeFactory(delay=0.05)
+        workflow = Workflow(
+            [
+                Stage("parse", "Parser", depends_on=[], per_item=True),
+                Stage("convert", "Converter", depends_on=["parse"], per_item=True),
+                Stage("dedup", "Dedup", depends_on=["parse"]),
+            ],
+            max_concurrency={"Parser": 1},
+        )
+
+        result = await WorkflowEngine(factory).run(workflow, {"items": ["a", "b", "c"]})
+
+        assert result.status == WorkflowStatus.COMPLETED
+        # Converting "a" starts before the last item is parsed
+        convert_a = next(t for e, k, i, t in factory.log if e == "start" and k == "Converter")
+        parse_c = next(t for e, k, i, t in factory.log if e == "start" and k == "Parser" and i == "c")
+        assert convert_a < parse_c
+        # Fan-in receives every item in order
+        assert [r["item"] for r in result.results["dedup"]["input"]["results"]] == ["a", "b", "c"]
+        assert [r["item"] for r in result.results["convert"]] == ["a", "b", "c"]
+
+    async def test_concurrency_cap_reuses_agents(self) -> None:
+        """At most the capped number of agents run and they are reused."""
+        factory = FakeFactory(delay=0.02)
+        workflow = Workflow(
+            [Stage("parse", "Parser", depends_on=[], per_item=True)],
+            max_concurrency={"Parser": 2},
+        )
+
+        result = await WorkflowEngine(factory).run(workflow, {"items": list(range(8))})
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert factory.peak("Parser") == 2
+        assert len(factory.agents) == 2
+        assert all(a.initialized == 1 and a.cleaned_up == 1 for a in factory.agents)
+
+    async def test_failure_skips_dependents_only(self) -> None:
+        """A failed item skips its own downstream runs; other items continue."""
+        factory = FakeFactory(delay=0.01)
+        workflow = Workflow([
+            Stage("parse", "Parser", depends_on=[], per_item=True),
+            Stage("convert", "Converter", depends_on=["parse"], per_item=True),
+            Stage("strict", "Strict", depends_on=["parse"]),
+            Stage("partial", "Partial", depends_on=["parse"], allow_partial=True),
+        ])
+        events: list[EventType] = []
+
+        async def on_event(event_type: EventType, data: dict[str, Any]) -> None:
+            events.append(event_type)
+
+        result = await WorkflowEngine(factory, on_event=on_event).run(
+            workflow, {"items": ["a", "bad"]}
+        )
+
+        assert result.status == WorkflowStatus.FAILED
+        assert result.results["convert"][0]["item"] == "a"
+        assert result.results["convert"][1] is None
+        assert result.results["strict"] is None
+        assert [r and r["item"] for r in result.results["partial"]["input"]["results"]] == ["a", None]
+        assert set(result.errors) == {"parse[1]"}
+        skipped = {(r.stage, r.index) for r in result.runs if r.skipped}
+        assert skipped == {("convert", 1), ("strict", None)}
+        assert events[0] == EventType.WORKFLOW_STARTED
+        assert events[-1] == EventType.WORKFLOW_COMPLETED
+        assert EventType.WORKFLOW_STAGE_FAILED in events
+
+
+# =============================================================================
+# Orchestrator Tests
+# =============================================================================
+
+
+class TestOrchestratorWorkflows:
+    """Tests for OrchestratorAgent.run_workflow."""
+
+    async def test_full_workflow_graph(self, tmp_path: Path, monkeypatch) -> None:
+        """The full workflow fans out per recording and fans in for execution."""
+        monkeypatch.chdir(tmp_path)
+        factory = FakeFactory(delay=0.01)
+        orchestrator = OrchestratorAgent(tmp_path, agent_factory=factory)
+
+        result = await orchestrator.run_workflow("full", {
+            "recordings": ["rec/a.spec.js", "rec/b.spec.js"],
+            "features_dir": "features",
+        })
+
+        assert result["status"] == "completed"
+        assert len(result["results"]["ingestion"]) == 2
+        assert len(result["results"]["bdd_conversion"]) == 2
+        execution_input = result["results"]["execution"]["input"]
+        assert execution_input["feature_files"] == [
+            str(Path("features") / "a.feature"),
+            str(Path("features") / "b.feature"),
+        ]
+        assert result["final_data"]["agent"] == "ReportAgent"
+
+    async def test_concurrency_override_grows_shared_pool(self, tmp_path: Path, monkeypatch) -> None:
+        """A max_concurrency override above the pool's size is not capped by the pool."""
+        monkeypatch.chdir(tmp_path)
+        factory = FakeFactory(delay=0.05)
+        orchestrator = OrchestratorAgent(tmp_path, agent_factory=factory)
+
+        result = await orchestrator.run_workflow(
+            "ingestion",
+            {"recordings": [f"rec/{i}.spec.js" for i in range(8)]},
+            max_concurrency={"IngestionAgent": 8},
+            checkpoint=False,
+        )
+
+        assert result["status"] == "completed"
+        assert factory.peak("IngestionAgent") == 8
+        await orchestrator.cleanup()
+
+    async def test_single_recording_input(self, tmp_path: Path, monkeypatch) -> None:
+        """A single recording_path is treated as one recording."""
+        monkeypatch.chdir(tmp_path)
+        factory = FakeFactory(delay=0.01)
+        orchestrator = OrchestratorAgent(tmp_path, agent_factory=factory)
+
+        result = await orchestrator.run_workflow("ingestion", {"recording_path": "rec/a.spec.js"})
+
+        assert result["status"] == "completed"
+        assert result["results"]["ingestion"][0]["input"]["recording_path"] == "rec/a.spec.js"
+
+    async def test_unknown_workflow(self, tmp_path: Path, monkeypatch) -> None:
+        """Unknown workflow types are reported."""
+        monkeypatch.chdir(tmp_path)
+        orchestrator = OrchestratorAgent(tmp_path, agent_factory=FakeFactory())
+
+        result = await orchestrator.run_workflow("missing", {})
+
+        assert "Unknown workflow type" in result["error"]
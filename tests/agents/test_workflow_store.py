@@ -0,0 +1,159 @@
+"""
+Tests for workflow checkpointing.
+
+Tests cover:
+- StageResultStore keys, results and run records
+- Resuming orchestrator workflows from checkpoints
+"""
+
+from pathlib import Path
+from typing import Any
+
+from claude_playwright_agent.agents.orchestrator import OrchestratorAgent
+from claude_playwright_agent.agents.workflow_store import StageResultStore
+
+
+class CountingAgent:
+    """Agent that counts calls per agent type and can be made to fail."""
+
+    calls: dict[str, int] = {}
+    failing: set[str] = set()
+
+    def __init__(self, agent_type: str) -> None:
+        self.agent_type = agent_type
+
+    async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        CountingAgent.calls[self.agent_type] = CountingAgent.calls.get(self.agent_type, 0) + 1
+        if self.agent_type in CountingAgent.failing:
+            return {"success": False, "error": "boom"}
+        return {"success": True, "agent": self.agent_type, "path": input_data.get("recording_path")}
+
+
+# =============================================================================
+# StageResultStore Tests
+# =============================================================================
+
+
+class TestStageResultStore:
+    """Tests for StageResultStore."""
+
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        """Stored results are returned by key."""
+        store = StageResultStore(tmp_path)
+        key = store.key("parse", "1", {"a": 1})
+
+        assert store.get(key) == (False, None)
+        assert store.put(key, "parse", {"success": True})
+        assert store.get(key) == (True, {"success": True})
+
+    def test_key_depends_on_input_version_and_files(self, tmp_path: Path) -> None:
+        """Keys change with the input, the agent version and input file content."""
+        store = StageResultStore(tmp_path / "store")
+        recording = tmp_path / "a.spec.js"
+        recording.write_text("page.goto('a')")
+        stage_input = {"recording_path": str(recording)}
+
+        key = store.key("parse", "1", stage_input, ("recording_path",))
+        assert key == store.key("parse", "1", dict(stage_input), ("recording_path",))
+        assert key != store.key("parse", "2", stage_input, ("recording_path",))
+        assert key != store.key("parse", "1", {"recording_path": "other"}, ("recording_path",))
+
+        recording.write_text("page.goto('b') // changed")
+        assert key != store.key("parse", "1", stage_input, ("recording_path",))
+
+    def test_unserializable_result_is_not_stored(self, tmp_path: Path) -> None:
+        """Results that are not JSON serializable are skipped."""
+        store = StageResultStore(tmp_path)
+        key = store.key("parse", "1", {})
+
+        assert not store.put(key, "parse", {"value": object()})
+        assert store.get(key) == (False, None)
+
+    def test_runs(self, tmp_path: Path) -> None:
+        """The last run of each workflow is recorded."""
+        store = StageResultStore(tmp_path)
+        assert store.load_run() is None
+
+        store.save_run("ingestion", {"recordings": ["a"]}, "completed")
+        store.save_run("full", {"recordings": ["b"]}, "failed", {"execution": "boom"})
+
+        assert store.load_run("ingestion")["input_data"] == {"recordings": ["a"]}
+        assert store.load_run()["workflow"] == "full"
+        assert store.load_run()["errors"] == {"execution": "boom"}
+
+
+# =============================================================================
+# Resume Tests
+# =============================================================================
+
+
+class TestWorkflowResume:
+    """Tests for resuming orchestrator workflows."""
+
+    async def test_resume_skips_completed_stages(self, tmp_path: Path, monkeypatch) -> None:
+        """A resumed run only re-runs the failed stages."""
+        monkeypatch.chdir(tmp_path)
+        CountingAgent.calls = {}
+        CountingAgent.failing = {"ExecutionAgent"}
+        recordings = []
+        for name in ("a", "b"):
+            path = tmp_path / f"{name}.spec.js"
+            path.write_text(f"page.goto('{name}')")
+            recordings.append(str(path))
+        orchestrator = OrchestratorAgent(tmp_path, agent_factory=CountingAgent)
+
+        first = await orchestrator.run_workflow("full", {"recordings": recordings})
+        assert first["status"] == "failed"
+        assert CountingAgent.calls["IngestionAgent"] == 2
+
+        CountingAgent.failing = set()
+        resumed = await orchestrator.resume_workflow("full")
+
+        assert resumed["status"] == "completed"
+        assert CountingAgent.calls["IngestionAgent"] == 2
+        assert CountingAgent.calls["BDDConversionAgent"] == 2
+        assert CountingAgent.calls["ExecutionAgent"] == 2
+        cached = {run["stage"] for run in resumed["runs"] if run["cached"]}
+        assert cached == {"ingestion", "bdd_conversion", "deduplication"}
+
+        # A changed recording is ingested again; the other one is not
+        Path(recordings[0]).write_text("page.goto('a2') // changed")
+        await orchestrator.run_workflow("ingestion", {"recordings": recordings}, resume=True)
+        assert CountingAgent.calls["IngestionAgent"] == 3
+        await orchestrator.cleanup()
+
+    async def test_resume_reruns_execution_and_rewrites_outputs(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Tests always run again and restored conversions write their files."""
+        monkeypatch.chdir(tmp_path)
+        CountingAgent.calls = {}
+        CountingAgent.failing = set()
+        recording = tmp_path / "login.spec.js"
+        recording.write_text("page.goto('login')")
+        input_data = {"recordings": [str(recording)], "features_dir": str(tmp_path)}
+        orchestrator = OrchestratorAgent(tmp_path, agent_factory=CountingAgent)
+
+        first = await orchestrator.run_workflow("full", input_data)
+        assert first["status"] == "completed"
+        # The counting agent writes nothing, so only a restore creates the file
+        feature_file = tmp_path / "login.feature"
+        assert not feature_file.exists()
+
+        resumed = await orchestrator.resume_workflow("full")
+
+        assert resumed["status"] == "completed"
+        assert CountingAgent.calls["BDDConversionAgent"] == 1
+        assert CountingAgent.calls["ExecutionAgent"] == 2
+        assert CountingAgent.calls["ReportAgent"] == 2
+        assert feature_file.read_text(encoding="utf-8").startswith("Feature:")
+        await orchestrator.cleanup()
+
+    async def test_resume_without_run(self, tmp_path: Path, monkeypatch) -> None:
+        """Resuming with no recorded run reports an error."""
+        monkeypatch.chdir(tmp_path)
+        orchestrator = OrchestratorAgent(tmp_path, agent_factory=CountingAgent)
+
+        result = await orchestrator.resume_workflow("full")
+
+        assert "No workflow run to resume" in result["error"]
@@ -0,0 +1,130 @@
+"""
+Tests for the step-sequence indexes used by scenario optimization.
+"""
+
+import hashlib
+import random
+
+from claude_playwright_agent.ai.scenario_analyzer import ScenarioAnalyzer
+from claude_playwright_agent.bdd.gherkin import GherkinScenario, GherkinStep, StepKeyword
+from claude_playwright_agent.bdd.optimization import ScenarioOptimizer
+from claude_playwright_agent.bdd.step_index import (
+    MinHashLSH,
+    StepTrie,
+    group_similar,
+    jaccard,
+    normalize_step,
+)
+
+
+def _scenario(scenario_id: str, texts: list[str], feature: str = "") -> GherkinScenario:
+    scenario = GherkinScenario(name=scenario_id, scenario_id=scenario_id, feature_file=feature)
+    for text in texts:
+        scenario.add_step(GherkinStep(StepKeyword.GIVEN, text))
+    return scenario
+
+
+def _naive_backgrounds(scenarios, min_occurrence=2, max_steps=5):
+    """The original prefix-rehashing extraction, used as a reference."""
+    sequences = {}
+    for scenario in scenarios:
+        for n in range(1, min(max_steps + 1, len(scenario.steps) + 1)):
+            key = hashlib.sha256("|".join(s.text for s in scenario.steps[:n]).encode()).hexdigest()[:12]
+            sequences.setdefault(key, []).append(scenario.scenario_id)
+    found = [(k, len(v)) for k, v in sequences.items() if len(v) >= min_occurrence]
+    found.sort(key=lambda item: item[1], reverse=True)
+    return found
+
+
+class TestStepTrie:
+    """Tests for StepTrie."""
+
+    def test_prefix_counts(self):
+        trie = StepTrie(max_depth=3)
+        trie.insert(["a", "b", "c", "d"], 0)
+        trie.insert(["a", "b", "x"], 1)
+        trie.insert(["a", "y"], 2)
+
+        prefixes = {tuple(prefix): node.count for node, prefix in trie.iter_prefixes(2)}
+        assert prefixes == {("a",): 3, ("a", "b"): 2}
+        assert trie.common_prefix() == ["a"]
+
+    def test_backgrounds_match_reference(self):
+        rng = random.Random(11)
+        steps = ["open home", "log in", "open cart", "search", "pay", "log out"]
+        scenarios = [
+            _scenario(f"s{i}", [rng.choice(steps) for _ in range(rng.randint(1, 7))], f"f{i % 3}")
+            for i in range(300)
+        ]
+
+        backgrounds = ScenarioOptimizer().extract_common_backgrounds(scenarios)
+
+        assert [(b["hash"], b["usage_count"]) for b in backgrounds] == _naive_backgrounds(scenarios)
+
+
+class TestMinHashLSH:
+    """Tests for MinHash/LSH similarity search."""
+
+    def test_signatures_are_deterministic(self):
+        first, second = MinHashLSH(), MinHashLSH()
+        assert first.signature({"a", "b"}) == second.signature({"b", "a"})
+        assert len(first.signature({"a"})) == 64
+
+    def test_finds_near_duplicates_only(self):
+        rng = random.Random(5)
+        vocabulary = [f"step {i}" for i in range(500)]
+        sequences = [rng.sample(vocabulary, 10) for _ in range(400)]
+        near = list(sequences[7])
+        near[-1] = "a brand new step"
+        sequences.append(near)  # 9 of 11 distinct steps shared with #7
+        sequences.append(list(sequences[3]))  # exact copy of #3
+
+        groups = group_similar(sequences, threshold=0.8)
+
+        assert jaccard(set(sequences[7]), set(near)) == 9 / 11
+        assert sorted(groups) == [[3, 401], [7, 400]]
+        assert sorted(group_similar(sequences, threshold=0.9)) == [[3, 401]]
+
+    def test_normalize_step(self):
+        assert normalize_step('I search for "shoes"') == normalize_step('I search for "hats"')
+        assert normalize_step("I type 'x'") == "I type ''"
+
+
+class TestScenarioOptimizerSimilarity:
+    """Near-duplicate and outline detection on ScenarioOptimizer."""
+
+    def test_find_similar_and_outline_candidates(self):
+        common = ["the user is on the search page", "the user opens filters", "the user sorts by price"]
+        scenarios = [
+            _scenario("shoes", common + ['the user searches for "shoes"', "results are shown"]),
+            _scenario("hats", common + ['the user searches for "hats"', "results are shown"]),
+            _scenario("other", ["the user logs in", "the user logs out"]),
+        ]
+        optimizer = ScenarioOptimizer()
+
+        [group] = optimizer.find_similar_scenarios(scenarios)
+        assert [s.scenario_id for s in group] == ["shoes", "hats"]
+
+        [outline] = optimizer.find_outline_candidates(scenarios)
+        assert outline["parameter_positions"] == {3: "param_3"}
+        assert [e["param_3"] for e in outline["examples"]] == [
+            'the user searches for "shoes"',
+            'the user searches for "hats"',
+        ]
+
+
+class TestScenarioAnalyzerDuplicates:
+    """ScenarioAnalyzer duplicate search uses the LSH index."""
+
+    def test_find_duplicates(self):
+        analyzer = ScenarioAnalyzer()
+        base = [f"step {i}" for i in range(10)]
+        analyzer.add_scenario("a", {"steps": base})
+        analyzer.add_scenario("b", {"steps": base[:8] + ["something", "else"]})
+        analyzer.add_scenario("c", {"steps": list(base)})
+        analyzer.add_scenario("d", {"steps": ["unrelated"]})
+
+        assert analyzer._find_duplicates("a") == ["c"]
+        analyzer.add_scenario("e", {"steps": list(base)})
+        assert analyzer._find_duplicates("a") == ["c", "e"]
+        assert analyzer._find_duplicates("d") == []
@@ -0,0 +1,213 @@
+"""
+Tests for the compiled step-definition registry and `cpa validate steps`.
+"""
+
+import json
+import time
+from textwrap import dedent
+
+from click.testing import CliRunner
+
+from claude_playwright_agent.bdd.gherkin import GherkinScenario, GherkinStep, StepKeyword
+from claude_playwright_agent.bdd.step_registry import (
+    StepMatcher,
+    StepRegistry,
+    iter_feature_steps,
+    scan_step_file,
+    validate_features,
+)
+from claude_playwright_agent.bdd.steps import StepDefinitionGenerator, StepGenConfig
+from claude_playwright_agent.cli.commands.validation import validate
+
+
+BEHAVE_STEPS = dedent('''
+    from behave import given, then, use_step_matcher, when
+
+    @given("the user is on the {page} page")
+    def step_on_page(context, page):
+        pass
+
+    @when('the user enters "{value}" into {field}')
+    def step_enter(context, value, field):
+        pass
+
+    @then("the cart has {count:d} items")
+    def step_cart(context, count):
+        pass
+
+    use_step_matcher("re")
+
+    @when(r'^the user clicks the "(?P<name>[^"]*)" button$')
+    def step_click(context, name):
+        pass
+
+    @then(r"(\\d+) results? (?:are|is) shown")
+    def step_results(context, count):
+        pass
+''')
+
+PYTEST_BDD_STEPS = dedent('''
+    from pytest_bdd import given, parsers, step, when
+
+    @given("the user is logged in")
+    def logged_in():
+        pass
+
+    @when(parsers.parse("the user searches for {term}"))
+    def search(term):
+        pass
+
+    @step(parsers.re(r"the user clicks the \\"(?P<name>.*)\\" (?:button|link)"))
+    def click_any(name):
+        pass
+''')
+
+FEATURE = dedent('''
+    Feature: Shop
+
+      Background:
+        Given the user is on the home page
+
+      Scenario: Search
+        When the user searches for shoes
+        And the user clicks the "Go" button
+        Then 3 results are shown
+        And the cart has 2 items
+        But nothing else happens
+
+      Scenario Outline: Enter values
+        When the user enters "<value>" into <field>
+        Then the cart has <count> items
+
+        Examples:
+          | value | field | count |
+          | bob   | name  | 1     |
+          | 42    | age   | x     |
+''')
+
+
+def _project(tmp_path):
+    steps = tmp_path / "features" / "steps"
+    steps.mkdir(parents=True)
+    (steps / "shop_steps.py").write_text(BEHAVE_STEPS, encoding="utf-8")
+    (steps / "bdd_steps.py").write_text(PYTEST_BDD_STEPS, encoding="utf-8")
+    (tmp_path / "features" / "shop.feature").write_text(FEATURE, encoding="utf-8")
+    return tmp_path
+
+
+class TestStepRegistry:
+    """Tests for scanning and matching."""
+
+    def test_scan_detects_matchers(self, tmp_path):
+        _project(tmp_path)
+        behave = scan_step_file(tmp_path / "features" / "steps" / "shop_steps.py")
+        pytest_bdd = scan_step_file(tmp_path / "features" / "steps" / "bdd_steps.py")
+
+        assert [s.matcher for s in behave] == [StepMatcher.PARSE] * 3 + [StepMatcher.RE] * 2
+        assert [s.matcher for s in pytest_bdd] == [StepMatcher.STRING, StepMatcher.PARSE, StepMatcher.RE]
+        assert [s.keyword for s in pytest_bdd] == ["given", "when", "step"]
+        assert behave[0].function_name == "step_on_page"
+        assert behave[0].line_number == 5
+
+    def test_find_respects_keywords_and_types(self, tmp_path):
+        registry = StepRegistry.from_paths([_project(tmp_path) / "features" / "steps"])
+
+        assert registry.find("the user is on the login page", "given").function_name == "step_on_page"
+        assert registry.find("The User Is On The login page", "given") is not None  # parse ignores case
+        assert registry.find("the user is on the login page", "when") is None
+        assert registry.find("the cart has 2 items", "then").function_name == "step_cart"
+        assert registry.find("the cart has two items", "then") is None
+        assert registry.find("12 results are shown", "then").function_name == "step_results"
+        assert registry.find("the user is logged in").function_name == "logged_in"
+        assert registry.find("the user is logged in now") is None
+
+        clicks = registry.find_all('the user clicks the "Go" button', "when")
+        assert [s.function_name for s in clicks] == ["click_any", "step_click"]
+
+    def test_matches_linear_scan(self):
+        registry = StepRegistry()
+        nouns = ["button", "link", "tab", "menu"]
+        for i in range(400):
+            registry.add(f'the user opens the "{{name}}" {nouns[i % 4]} {i}', "when")
+        registry.add(r"(\d+) rows? in table (\w+)", "then", "re")
+        registry.add(r"(?i)^RESET the (\w+)$", "when", "re")
+        registry.add("{who} logs out", "when")
+
+        texts = [f'the user opens the "x" {nouns[i % 4]} {i}' for i in range(0, 400, 7)]
+        texts += ["3 rows in table users", "reset the form", "Bob logs out", "unknown step"]
+        for text in texts:
+            expected = [s for s in registry.definitions if s.regex.fullmatch(text)]
+            assert registry.find_all(text) == expected
+
+        started = time.perf_counter()
+        for _ in range(10):
+            for text in texts:
+                registry.find_all(text, "when")
+        assert time.perf_counter() - started < 0.5
+
+    def test_invalid_pattern_is_reported(self):
+        registry = StepRegistry()
+        assert registry.add("^broken (group$", matcher="re") is None
+        assert len(registry) == 0
+        assert "Invalid pattern" in registry.errors[0][1]
+
+
+class TestValidation:
+    """Tests for feature validation."""
+
+    def test_iter_feature_steps_expands_outlines(self, tmp_path):
+        _project(tmp_path)
+        steps = list(iter_feature_steps(tmp_path / "features" / "shop.feature"))
+
+        assert steps[0] == (5, "given", "the user is on the home page")
+        assert (10, "then", "3 results are shown") in steps
+        assert (12, "then", "nothing else happens") in steps  # "But" inherits Then
+        assert (15, "when", 'the user enters "bob" into name') in steps
+        assert (16, "then", "the cart has x items") in steps
+
+    def test_validate_features(self, tmp_path):
+        project = _project(tmp_path)
+        registry = StepRegistry.from_paths([project / "features" / "steps"])
+        report = validate_features([project / "features"], registry)
+
+        assert report.steps_checked == 10
+        assert [(i.line_number, i.text) for i in report.undefined] == [
+            (12, "nothing else happens"),
+            (16, "the cart has x items"),
+        ]
+        assert [i.line_number for i in report.ambiguous] == [9]
+        assert not report.valid
+
+    def test_cli_validate_steps(self, tmp_path):
+        project = _project(tmp_path)
+        export = tmp_path / "steps.json"
+
+        result = CliRunner().invoke(validate, ["steps", "-p", str(project), "-e", str(export)])
+
+        assert result.exit_code == 1
+        assert "undefined" in result.output
+        data = json.loads(export.read_text())
+        assert data["undefined"] == 2
+        assert data["ambiguous"] == 1
+
+        (project / "features" / "shop.feature").write_text(
+            "Feature: Ok\n  Scenario: Fine\n    Given the user is logged in\n", encoding="utf-8"
+        )
+        result = CliRunner().invoke(validate, ["steps", "-p", str(project)])
+        assert result.exit_code == 0
+
+
+class TestGeneratorReuse:
+    """StepDefinitionGenerator skips steps an existing definition matches."""
+
+    def test_generator_reuses_existing_definitions(self, tmp_path):
+        registry = StepRegistry.from_paths([_project(tmp_path) / "features" / "steps"])
+        scenario = GherkinScenario(name="s", scenario_id="s")
+        scenario.add_step(GherkinStep(StepKeyword.GIVEN, "the user is on the cart page", original_action="goto"))
+        scenario.add_step(GherkinStep(StepKeyword.WHEN, "the user presses Escape", original_action="press"))
+
+        generator = StepDefinitionGenerator(StepGenConfig(), registry=registry)
+        step_defs = generator.generate_from_scenario(scenario, tmp_path / "out_steps.py")
+
+        assert [d.function_name for d in step_defs] == ["press_the_user_presses_escape"]
+        assert generator.get_reused_steps()["the user is on the cart page"].function_name == "step_on_page"
@@ -0,0 +1,105 @@
+"""
+Import-time benchmark for the cpa CLI.
+
+Runs imports in a fresh interpreter so module caching in the test process
+does not hide regressions. Fails if the CLI starts importing heavy
+dependencies eagerly again or if its own import time grows past budget.
+"""
+
+import subprocess
+import sys
+
+import click
+import pytest
+
+from claude_playwright_agent.cli import LAZY_COMMANDS, cli
+from claude_playwright_agent.cli.lazy_group import LazyGroup
+
+
+# Cumulative import time budget for the CLI package itself, excluding
+# interpreter startup. Generous so slow CI machines do not flake.
+CLI_IMPORT_BUDGET_US = 500_000
+
+HEAVY_MODULES = [
+    "claude_agent_sdk",
+    "playwright",
+    "httpx",
+    "PIL",
+    "pydantic",
+    "claude_playwright_agent.agents.base",
+    "claude_playwright_agent.cli.commands.run",
+]
+
+
+def _run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def _cumulative_import_us(stderr: str, module: str) -> int:
+    """Parse the cumulative time of a module from -X importtime output."""
+    for line in stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+class TestCLIImportTime:
+    """Startup cost of the cpa entry point."""
+
+    def test_cli_import_does_not_load_heavy_modules(self) -> None:
+        code = (
+            "import sys, claude_playwright_agent.cli\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        )
+        result = _run_python(code)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "[]"
+
+    def test_help_does_not_load_commands(self) -> None:
+        code = (
+            "import sys\n"
+            "from claude_playwright_agent.cli import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print([m for m in sys.modules if m.startswith('claude_playwright_agent.cli.commands.')])"
+        )
+        result = _run_python(code)
+        assert result.returncode == 0, result.stderr
+        assert "Commands:" in result.stdout
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_cli_import_time_budget(self) -> None:
+        result = _run_python("import claude_playwright_agent.cli", "-X", "importtime")
+        assert result.returncode == 0, result.stderr
+        elapsed = _cumulative_import_us(result.stderr, "claude_playwright_agent.cli")
+        assert elapsed < CLI_IMPORT_BUDGET_US, f"cli import took {elapsed / 1000:.0f} ms"
+
+
+class TestLazyGroup:
+    """Lazy command resolution."""
+
+    def test_lazy_commands_resolve(self) -> None:
+        ctx = click.Context(cli)
+        for name in LAZY_COMMANDS:
+            command = cli.get_command(ctx, name)
+            assert isinstance(command, click.Command), name
+
+    def test_lazy_help_matches_command_help(self) -> None:
+        ctx = click.Context(cli)
+        for name, (_, short_help) in LAZY_COMMANDS.items():
+            assert cli.get_command(ctx, name).get_short_help_str(200) == short_help
+
+    def test_unknown_command(self) -> None:
+        group = LazyGroup(lazy_subcommands={"x": ("json:dumps", "Not a command.")})
+        ctx = click.Context(group)
+        assert group.get_command(ctx, "missing") is None
+        with pytest.raises(click.ClickException):
+            group.get_command(ctx, "x")
@@ -657,3 +657,65 @@ class TestConfigurationIntegration:
         yaml_str = manager.to_yaml()
         assert "advanced" in yaml_str
         assert "DEBUG" in yaml_str
+
+
+# =============================================================================
+# Snapshot Cache Tests
+# =============================================================================
+
+
+class TestConfigSnapshotCache:
+    """Tests for the process-wide configuration snapshot cache."""
+
+    def test_config_loaded_once(self, temp_project_dir: Path, config_file_content: str) -> None:
+        """Test that managers for the same project share one snapshot."""
+        config_file = temp_project_dir / "config" / "default" / "config.yaml"
+        config_file.parent.mkdir(parents=True)
+        config_file.write_text(config_file_content)
+
+        first = ConfigManager(temp_project_dir, profile="test")
+        with patch.object(ConfigManager, "_load_config") as load:
+            second = ConfigManager(temp_project_dir, profile="test")
+            load.assert_not_called()
+
+        assert second.config == first.config
+
+        second.update(browser_headless=False)
+        assert first.browser.headless is True
+
+        # Each manager owns a copy, so in-place edits do not reach the cache
+        assert second.config is not first.config
+        first.browser.headless = False
+        assert ConfigManager(temp_project_dir, profile="test").browser.headless is True
+
+    def test_inputs_invalidate_snapshot(self, temp_project_dir: Path, config_file_content: str) -> None:
+        """Test that file, profile and environment changes are picked up."""
+        first = ConfigManager(temp_project_dir)
+
+        config_file = temp_project_dir / "config" / "default" / "config.yaml"
+        config_file.parent.mkdir(parents=True)
+        config_file.write_text(config_file_content)
+        assert ConfigManager(temp_project_dir).execution.parallel_workers == 4
+
+        with patch.dict(os.environ, {"CPA_EXECUTION__PARALLEL_WORKERS": "6"}):
+            assert ConfigManager(temp_project_dir).execution.parallel_workers == 6
+        assert ConfigManager(temp_project_dir).execution.parallel_workers == 4
+
+        profiles_dir = temp_project_dir / "config" / "profiles"
+        profiles_dir.mkdir()
+        (profiles_dir / "staging.yaml").write_text("logging:\n  level: ERROR\n")
+        assert ConfigManager(temp_project_dir, profile="staging").get_profile() == "staging"
+        assert first.framework.template == "basic"
+
+    def test_cache_can_be_bypassed(self, temp_project_dir: Path) -> None:
+        """Test use_cache=False and clear_config_cache()."""
+        from claude_playwright_agent.config import clear_config_cache
+
+        ConfigManager(temp_project_dir)
+        with patch.object(ConfigManager, "_load_config", wraps=ConfigManager._load_config, autospec=True) as load:
+            ConfigManager(temp_project_dir, use_cache=False)
+            assert load.call_count == 1
+
+            clear_config_cache(temp_project_dir)
+            ConfigManager(temp_project_dir)
+            assert load.call_count == 2
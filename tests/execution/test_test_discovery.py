@@ -0,0 +1,149 @@
+"""
+Tests for the incremental test discovery index.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from claude_playwright_agent.execution.test_discovery import (
+    DiscoveredTest,
+    TestDiscovery,
+    TestType,
+)
+
+
+FEATURE = """Feature: {name}
+
+  @smoke
+  Scenario: {name} loads
+    Given I open the app
+    Then I see the home page
+"""
+
+
+def _write_feature(project: Path, name: str) -> Path:
+    features = project / "features"
+    features.mkdir(exist_ok=True)
+    path = features / f"{name.lower()}.feature"
+    path.write_text(FEATURE.format(name=name), encoding="utf-8")
+    return path
+
+
+class TestIncrementalDiscovery:
+    """Tests for the mtime-indexed discovery cache."""
+
+    def test_discovers_and_persists_index(self, tmp_path):
+        _write_feature(tmp_path, "Login")
+        _write_feature(tmp_path, "Search")
+
+        discovery = TestDiscovery(str(tmp_path))
+        tests = discovery.discover_all()
+
+        assert {t.name for t in tests} == {"Login", "Login loads", "Search", "Search loads"}
+        assert discovery.last_scan_stats["parsed"] == 2
+        assert len(discovery.get_tests_by_tag("smoke")) == 2
+
+        index = json.loads((tmp_path / ".cpa" / "discovery_index.json").read_text())
+        assert set(index["files"]) == {
+            os.path.join("features", "login.feature"),
+            os.path.join("features", "search.feature"),
+        }
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path):
+        _write_feature(tmp_path, "Login")
+        TestDiscovery(str(tmp_path)).discover_all()
+
+        discovery = TestDiscovery(str(tmp_path))
+        discovery._parse_feature_file = lambda path: pytest.fail("re-parsed")
+        tests = discovery.discover_all()
+
+        assert [t.name for t in tests] == ["Login", "Login loads"]
+        assert discovery.last_scan_stats["parsed"] == 0
+        assert discovery.get_tests_by_type(TestType.BDD_FEATURE)
+
+    def test_changed_and_removed_files(self, tmp_path):
+        login = _write_feature(tmp_path, "Login")
+        search = _write_feature(tmp_path, "Search")
+        TestDiscovery(str(tmp_path)).discover_all()
+
+        login.write_text(FEATURE.format(name="Login v2") + "\n", encoding="utf-8")
+        search.unlink()
+
+        discovery = TestDiscovery(str(tmp_path))
+        tests = discovery.discover_all()
+
+        assert [t.name for t in tests] == ["Login v2", "Login v2 loads"]
+        assert discovery.last_scan_stats == {"files": 1, "parsed": 1, "removed": 1}
+
+    def test_refresh_paths(self, tmp_path):
+        login = _write_feature(tmp_path, "Login")
+        discovery = TestDiscovery(str(tmp_path), use_cache=False)
+        discovery.discover_all()
+
+        checkout = _write_feature(tmp_path, "Checkout")
+        assert discovery.refresh_paths([checkout, tmp_path / "README.md"]) == [
+            os.path.join("features", "checkout.feature")
+        ]
+        assert len(discovery.discovered_tests) == 4
+
+        login.unlink()
+        assert discovery.refresh_paths([login]) == [os.path.join("features", "login.feature")]
+        assert [t.name for t in discovery.discovered_tests.values()] == [
+            "Checkout", "Checkout loads"
+        ]
+        assert not (tmp_path / ".cpa").exists()
+
+    def test_stale_index_version_is_ignored(self, tmp_path):
+        _write_feature(tmp_path, "Login")
+        cache = tmp_path / ".cpa" / "discovery_index.json"
+        cache.parent.mkdir()
+        cache.write_text(json.dumps({"version": 0, "files": {"x": {}}}))
+
+        discovery = TestDiscovery(str(tmp_path))
+        discovery.discover_all()
+
+        assert discovery.last_scan_stats["parsed"] == 1
+        assert json.loads(cache.read_text())["version"] > 0
+
+    def test_discovered_test_round_trip(self, tmp_path):
+        _write_feature(tmp_path, "Login")
+        test = TestDiscovery(str(tmp_path), use_cache=False).discover_all()[0]
+
+        assert DiscoveredTest.from_dict(test.to_dict()) == test
+
+    def test_watch_reindexes_new_files(self, tmp_path):
+        pytest.importorskip("watchdog")
+        import queue
+
+        (tmp_path / "features").mkdir()
+        discovery = TestDiscovery(str(tmp_path), use_cache=False)
+        changes: queue.Queue = queue.Queue()
+        observer = discovery.watch(changes.put)
+        try:
+            _write_feature(tmp_path, "Login")
+            assert changes.get(timeout=5) == [os.path.join("features", "login.feature")]
+        finally:
+            observer.stop()
+            observer.join()
+
+        assert "Login" in {t.name for t in discovery.discovered_tests.values()}
+
+    def test_watch_reindexes_nested_python_tests(self, tmp_path):
+        pytest.importorskip("watchdog")
+        import queue
+
+        (tmp_path / "tests").mkdir()
+        nested = tmp_path / "src" / "pkg"
+        nested.mkdir(parents=True)
+        discovery = TestDiscovery(str(tmp_path), use_cache=False)
+        changes: queue.Queue = queue.Queue()
+        observer = discovery.watch(changes.put)
+        try:
+            (nested / "test_nested.py").write_text("def test_nested():\n    pass\n")
+            assert changes.get(timeout=5) == [os.path.join("src", "pkg", "test_nested.py")]
+        finally:
+            observer.stop()
+            observer.join()
@@ -8,6 +8,8 @@ Tests for:
 - Fallback chain configuration
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 
@@ -488,3 +490,152 @@ class TestFallbackRetries:
         # Provider 1 should only be called once
         assert mock_provider1.query.call_count == 1
         assert mock_provider2.query.call_count == 1
+
+
+def _delayed_provider(config, delay, content="Success", error=None):
+    """Create a mock provider that answers (or fails) after a delay."""
+    mock_provider = Mock()
+    mock_provider.config = config
+    mock_provider._initialized = True
+    mock_provider.cancelled = False
+
+    async def query(messages, tools=None, **kwargs):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            mock_provider.cancelled = True
+            raise
+        if error is not None:
+            raise error
+        return LLMResponse(content=content)
+
+    mock_provider.query = AsyncMock(side_effect=query)
+    return mock_provider
+
+
+class TestLatencyRouting:
+    """Tests for latency-aware routing and hedged requests."""
+
+    @pytest.mark.asyncio
+    async def test_routes_to_fastest_provider(self):
+        """Test that the provider with the lowest average latency is used."""
+        slow = _delayed_provider(AnthropicConfig(api_key="key1", model="model1"), 0, "slow")
+        fast = _delayed_provider(OpenAIConfig(api_key="key2", model="model2"), 0, "fast")
+
+        router = FallbackProvider([slow, fast], routing="latency", hedge_delay=10)
+        router.record_probe(0, {"success": True, "latency_ms": 800})
+        router.record_probe(1, {"success": True, "latency_ms": 50})
+
+        response = await router.query([LLMMessage.user("Test")])
+
+        assert response.content == "fast"
+        assert response.extra["fallback_provider"] == "openai"
+        slow.query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hedges_slow_provider_and_cancels_loser(self):
+        """Test that a hung provider is hedged and the loser is cancelled."""
+        hung = _delayed_provider(AnthropicConfig(api_key="key1", model="model1"), 10, "hung")
+        backup = _delayed_provider(OpenAIConfig(api_key="key2", model="model2"), 0.01, "backup")
+
+        router = FallbackProvider([hung, backup], routing="latency", hedge_delay=0.05)
+
+        response = await asyncio.wait_for(router.query([LLMMessage.user("Test")]), timeout=2)
+        await asyncio.sleep(0)
+
+        assert response.content == "backup"
+        assert response.extra["hedged"] is True
+        assert hung.cancelled is True
+        # Cancelled loser is not counted as a failure
+        assert router.get_health()[0]["failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fails_over_immediately_on_error(self):
+        """Test that a failing provider does not wait for the hedge deadline."""
+        failing = _delayed_provider(
+            AnthropicConfig(api_key="key1", model="model1"),
+            0,
+            error=ProviderAPIError("Failed", provider="anthropic"),
+        )
+        backup = _delayed_provider(OpenAIConfig(api_key="key2", model="model2"), 0, "backup")
+
+        router = FallbackProvider([failing, backup], routing="latency", hedge_delay=10)
+
+        response = await asyncio.wait_for(router.query([LLMMessage.user("Test")]), timeout=2)
+
+        assert response.content == "backup"
+        assert response.extra["fallback_used"] is True
+        assert response.extra["hedged"] is False
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_skips_failing_provider(self):
+        """Test that repeated failures open the provider's circuit."""
+        failing = _delayed_provider(
+            AnthropicConfig(api_key="key1", model="model1"),
+            0,
+            error=ProviderTimeoutError("Timeout", provider="anthropic"),
+        )
+        backup = _delayed_provider(OpenAIConfig(api_key="key2", model="model2"), 0, "backup")
+
+        router = FallbackProvider(
+            [failing, backup], routing="latency", failure_threshold=2, hedge_delay=10
+        )
+
+        for _ in range(4):
+            await router.query([LLMMessage.user("Test")])
+
+        assert failing.query.call_count == 2
+        assert router.get_health()[0]["circuit_open"] is True
+
+    @pytest.mark.asyncio
+    async def test_all_providers_fail(self):
+        """Test that an error is raised when every provider fails."""
+        from claude_playwright_agent.llm.exceptions import LLMError
+
+        providers = [
+            _delayed_provider(
+                AnthropicConfig(api_key="key1", model="model1"),
+                0,
+                error=RateLimitError("Limited", provider="anthropic"),
+            ),
+            _delayed_provider(
+                OpenAIConfig(api_key="key2", model="model2"),
+                0,
+                error=ProviderAPIError("Failed", provider="openai"),
+            ),
+        ]
+
+        router = FallbackProvider(providers, routing="latency")
+
+        with pytest.raises(LLMError, match="All 2 providers"):
+            await router.query([LLMMessage.user("Test")])
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_records_live_stats(self):
+        """Test that the default mode still feeds the router statistics."""
+        provider = _delayed_provider(AnthropicConfig(api_key="key1", model="model1"), 0)
+
+        fallback = FallbackProvider([provider])
+        await fallback.query([LLMMessage.user("Test")])
+
+        health = fallback.get_health()[0]
+        assert health["successes"] == 1
+        assert health["ewma_latency_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_probe_keeps_providers_open(self):
+        """Test that probing does not clean up providers owned by the chain."""
+        provider = _delayed_provider(AnthropicConfig(api_key="key1", model="model1"), 0)
+        provider.is_initialized = Mock(return_value=True)
+        provider.initialize = AsyncMock()
+        provider.cleanup = AsyncMock()
+        provider.__aexit__ = AsyncMock()
+
+        fallback = FallbackProvider([provider])
+        results = await fallback.probe()
+
+        assert results[0]["success"] is True
+        provider.cleanup.assert_not_called()
+        provider.__aexit__.assert_not_called()
+        provider.initialize.assert_not_called()
+        assert fallback.get_health()[0]["successes"] == 1
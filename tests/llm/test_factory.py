@@ -11,9 +11,13 @@ Tests for:
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 
+import asyncio
+
 from claude_playwright_agent.llm.factory import (
     LLMProviderFactory,
     FallbackProvider,
+    CoalescingProvider,
+    MicroBatcher,
 )
 from claude_playwright_agent.llm.providers.registry import (
     ProviderRegistry,
@@ -446,6 +450,178 @@ class TestFallbackProvider:
         assert fallback.supports_streaming() is True
 
 
+class TestCoalescingProvider:
+    """Tests for CoalescingProvider class."""
+
+    @staticmethod
+    def _slow_provider(content="Shared"):
+        """Create a mock provider whose query takes a moment to finish."""
+        mock_provider = Mock()
+        mock_provider.config = AnthropicConfig(api_key="key1", model="model1")
+
+        async def slow_query(messages, tools=None, **kwargs):
+            await asyncio.sleep(0.01)
+            return LLMResponse(content=content)
+
+        mock_provider.query = AsyncMock(side_effect=slow_query)
+        return mock_provider
+
+    @pytest.mark.asyncio
+    async def test_identical_queries_share_one_request(self):
+        """Test that identical in-flight queries hit the provider once."""
+        mock_provider = self._slow_provider()
+        provider = CoalescingProvider(mock_provider)
+        messages = [LLMMessage.user("Test")]
+
+        responses = await asyncio.gather(*(provider.query(messages) for _ in range(5)))
+
+        assert all(r.content == "Shared" for r in responses)
+        assert mock_provider.query.call_count == 1
+        assert sum(r.extra["coalesced"] for r in responses) == 4
+        assert provider.get_stats() == {"requests": 1, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_different_queries_are_not_coalesced(self):
+        """Test that distinct queries are sent separately."""
+        mock_provider = self._slow_provider()
+        provider = CoalescingProvider(mock_provider)
+
+        await asyncio.gather(
+            provider.query([LLMMessage.user("A")]),
+            provider.query([LLMMessage.user("B")]),
+            provider.query([LLMMessage.user("A")], temperature=0.9),
+        )
+
+        assert mock_provider.query.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_sequential_queries_are_not_cached(self):
+        """Test that completed queries are not reused."""
+        mock_provider = self._slow_provider()
+        provider = CoalescingProvider(mock_provider)
+        messages = [LLMMessage.user("Test")]
+
+        await provider.query(messages)
+        await provider.query(messages)
+
+        assert mock_provider.query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_callers_get_independent_copies(self):
+        """Test that mutating one response does not affect the others."""
+        provider = CoalescingProvider(self._slow_provider())
+        messages = [LLMMessage.user("Test")]
+
+        r1, r2 = await asyncio.gather(provider.query(messages), provider.query(messages))
+        r1.extra["marker"] = True
+
+        assert "marker" not in r2.extra
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_waiters(self):
+        """Test that a failed shared request fails every waiter."""
+        mock_provider = Mock()
+        mock_provider.config = AnthropicConfig(api_key="key1", model="model1")
+
+        async def failing_query(messages, tools=None, **kwargs):
+            await asyncio.sleep(0.01)
+            raise ProviderAPIError("Failed", provider="anthropic")
+
+        mock_provider.query = AsyncMock(side_effect=failing_query)
+        provider = CoalescingProvider(mock_provider)
+        messages = [LLMMessage.user("Test")]
+
+        results = await asyncio.gather(
+            provider.query(messages), provider.query(messages), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ProviderAPIError) for r in results)
+        assert mock_provider.query.call_count == 1
+
+    def test_create_coalescing_from_config(self):
+        """Test creating a coalescing provider through the factory."""
+        config = AnthropicConfig(api_key="key1", model="model1")
+
+        provider = LLMProviderFactory.create_coalescing(config)
+
+        assert isinstance(provider, CoalescingProvider)
+        assert provider.get_provider_info()["type"] == "coalescing"
+
+
+class TestMicroBatcher:
+    """Tests for MicroBatcher class."""
+
+    @pytest.mark.asyncio
+    async def test_prompts_are_packed_into_one_request(self):
+        """Test that concurrent prompts share one request."""
+        mock_provider = Mock()
+        mock_provider.query = AsyncMock(
+            return_value=LLMResponse(content='["timeout", "selector", "assertion"]')
+        )
+        batcher = MicroBatcher(mock_provider, max_wait=0.01)
+
+        answers = await asyncio.gather(
+            batcher.submit("TimeoutError waiting for page"),
+            batcher.submit("Element #login not found"),
+            batcher.submit("Expected 2 but got 3"),
+        )
+
+        assert answers == ["timeout", "selector", "assertion"]
+        assert mock_provider.query.call_count == 1
+        prompt = mock_provider.query.call_args[0][0][-1].content
+        assert "[1] TimeoutError waiting for page" in prompt
+        assert "[3] Expected 2 but got 3" in prompt
+
+    @pytest.mark.asyncio
+    async def test_batch_flushes_at_max_size(self):
+        """Test that a full batch is sent without waiting."""
+        mock_provider = Mock()
+        mock_provider.query = AsyncMock(return_value=LLMResponse(content='["a", "b"]'))
+        batcher = MicroBatcher(mock_provider, max_batch_size=2, max_wait=60)
+
+        answers = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("1"), batcher.submit("2")), timeout=1
+        )
+
+        assert answers == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_falls_back_to_single_queries(self):
+        """Test that a malformed batch response is retried per prompt."""
+        mock_provider = Mock()
+        mock_provider.query = AsyncMock(
+            side_effect=[
+                LLMResponse(content="I cannot answer in JSON"),
+                LLMResponse(content="first"),
+                LLMResponse(content="second"),
+            ]
+        )
+        batcher = MicroBatcher(mock_provider, max_wait=0.01)
+
+        answers = await asyncio.gather(batcher.submit("1"), batcher.submit("2"))
+
+        assert answers == ["first", "second"]
+        assert batcher.get_stats()["fallbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_provider_error_propagates_to_callers(self):
+        """Test that a failed batch request fails all callers."""
+        mock_provider = Mock()
+        mock_provider.query = AsyncMock(side_effect=ProviderAPIError("Failed"))
+        batcher = MicroBatcher(mock_provider, max_wait=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit("1"), batcher.submit("2"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ProviderAPIError) for r in results)
+
+    def test_invalid_batch_size_raises_error(self):
+        """Test that a batch size below one is rejected."""
+        with pytest.raises(ValueError):
+            MicroBatcher(Mock(), max_batch_size=0)
+
+
 class TestFactoryIntegration:
     """Integration tests for factory patterns."""
 
@@ -293,3 +293,113 @@ class TestAnthropicConfig:
         assert data["provider"] == "anthropic"
         assert data["model"] == "claude-3-5-sonnet"
         assert data["api_key"] == "sk-ant-test"
+
+
+class TestAnthropicStreaming:
+    """Tests for real incremental streaming through the Claude SDK."""
+
+    @pytest.mark.asyncio
+    async def test_query_stream_yields_text_deltas(self):
+        """Test that partial message events become stream chunks."""
+        from claude_agent_sdk import ResultMessage, StreamEvent
+
+        def delta(text):
+            return StreamEvent(
+                uuid="u",
+                session_id="s",
+                event={"type": "content_block_delta", "delta": {"type": "text_delta", "text": text}},
+            )
+
+        class FakeClient:
+            def __init__(self, options):
+                self.options = options
+                self.prompt = None
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                return None
+
+            async def query(self, prompt):
+                self.prompt = prompt
+
+            async def receive_response(self):
+                yield StreamEvent(uuid="u", session_id="s", event={"type": "message_start"})
+                yield delta("Feature: ")
+                yield delta("Login")
+                yield ResultMessage(
+                    subtype="success",
+                    duration_ms=10,
+                    duration_api_ms=10,
+                    is_error=False,
+                    num_turns=1,
+                    session_id="s",
+                    usage={"input_tokens": 5, "output_tokens": 2},
+                )
+
+        provider = AnthropicProvider(AnthropicConfig(api_key="sk-ant-test"))
+
+        with patch("claude_agent_sdk.ClaudeSDKClient", FakeClient):
+            chunks = [c async for c in provider.query_stream([LLMMessage.user("Hello")])]
+
+        assert [c.delta for c in chunks[:2]] == ["Feature: ", "Login"]
+        assert chunks[-1].is_complete()
+        assert chunks[-1].extra["usage"]["completion_tokens"] == 2
+
+    @pytest.mark.asyncio
+    async def test_query_stream_forwards_options_and_rejects_tools(self):
+        """Test that streaming options reach the SDK and tools are refused."""
+        from claude_agent_sdk import ResultMessage
+
+        seen = {}
+
+        class FakeClient:
+            def __init__(self, options):
+                seen["options"] = options
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                return None
+
+            async def query(self, prompt):
+                pass
+
+            async def receive_response(self):
+                yield ResultMessage(
+                    subtype="success",
+                    duration_ms=1,
+                    duration_api_ms=1,
+                    is_error=False,
+                    num_turns=1,
+                    session_id="s",
+                )
+
+        provider = AnthropicProvider(AnthropicConfig(api_key="sk-ant-test"))
+        messages = [LLMMessage.user("Hello")]
+
+        with patch("claude_agent_sdk.ClaudeSDKClient", FakeClient):
+            [c async for c in provider.query_stream(messages, max_turns=3)]
+            with pytest.raises(ValueError, match="tool definitions"):
+                [c async for c in provider.query_stream(messages, tools=[{"name": "t"}])]
+            with pytest.raises(ValueError, match="temperature"):
+                [c async for c in provider.query_stream(messages, temperature=0.5)]
+
+        assert seen["options"].max_turns == 3
+        assert seen["options"].include_partial_messages is True
+
+    def test_split_messages_folds_history(self):
+        """Test that multi-turn conversations become one transcript prompt."""
+        provider = AnthropicProvider(AnthropicConfig(api_key="sk-ant-test"))
+
+        system_prompt, prompt = provider._split_messages([
+            LLMMessage.system("Be brief."),
+            LLMMessage.user("Hi"),
+            LLMMessage.assistant("Hello"),
+            LLMMessage.user("Bye"),
+        ])
+
+        assert system_prompt == "Be brief."
+        assert prompt == "User: Hi\n\nAssistant: Hello\n\nUser: Bye"
@@ -510,3 +510,29 @@ class TestGLMMessageConversion:
         assert llm_response.extra["tool_calls"][0]["id"] == "call_123"
         assert llm_response.extra["tool_calls"][0]["name"] == "test_function"
         assert llm_response.extra["tool_calls"][0]["arguments"] == '{"arg": "value"}'
+
+
+class TestGLMStreamBridge:
+    """Tests for draining the blocking zhipuai stream off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_iterate_in_thread_yields_items(self):
+        """Test that items from a blocking iterator arrive in order."""
+        from claude_playwright_agent.llm.providers.glm import _iterate_in_thread
+
+        items = [item async for item in _iterate_in_thread(iter(["a", "b", "c"]))]
+
+        assert items == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_iterate_in_thread_propagates_errors(self):
+        """Test that an error raised by the iterator reaches the consumer."""
+        from claude_playwright_agent.llm.providers.glm import _iterate_in_thread
+
+        def broken():
+            yield "a"
+            raise RuntimeError("stream broke")
+
+        with pytest.raises(RuntimeError, match="stream broke"):
+            async for _ in _iterate_in_thread(broken()):
+                pass
@@ -0,0 +1,217 @@
+"""
+Tests for the open-loop load generator.
+"""
+
+import asyncio
+import json
+
+from claude_playwright_agent.agents.api_agent import APITestingAgent, HTTPMethod
+from claude_playwright_agent.loadgen import (
+    ArrivalPattern,
+    ArrivalSchedule,
+    HttpTarget,
+    LatencyHistogram,
+    LoadGenerator,
+    LoadTestConfig,
+)
+from claude_playwright_agent.transport import close_transports
+
+
+async def _start_server(delay: float = 0.0):
+    """Start a keep-alive HTTP/1.1 stub server that counts requests."""
+    stats = {"requests": 0}
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = (await reader.readuntil(b"\r\n\r\n")).decode()
+                length = 0
+                for line in head.split("\r\n")[1:]:
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                stats["requests"] += 1
+                await asyncio.sleep(delay)
+                payload = json.dumps({"ok": True}).encode()
+                writer.write(
+                    f"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}", stats
+
+
+class StallTarget:
+    """Target whose first request stalls, like a server pause."""
+
+    def __init__(self, stall: float) -> None:
+        self.stall = stall
+        self.calls = 0
+
+    async def setup(self, max_in_flight: int) -> None:
+        pass
+
+    async def send(self) -> int:
+        self.calls += 1
+        await asyncio.sleep(self.stall if self.calls == 1 else 0)
+        return 200
+
+    async def teardown(self) -> None:
+        pass
+
+
+class SlowSetupTarget(StallTarget):
+    """Target that takes a while to set up, like a browser launch."""
+
+    async def setup(self, max_in_flight: int) -> None:
+        await asyncio.sleep(0.5)
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles_within_precision(self) -> None:
+        hist = LatencyHistogram(significant_figures=3)
+        for value in range(1, 100_001):
+            hist.record(value)
+
+        assert hist.total_count == 100_000
+        assert hist.min == 1 and hist.max == 100_000
+        for percentile in (50, 90, 99, 99.9):
+            expected = 100_000 * percentile / 100
+            assert abs(hist.value_at_percentile(percentile) - expected) <= expected * 0.001
+        assert hist.percentiles((50, 99))["p99"] == hist.value_at_percentile(99)
+
+    def test_merge_and_serialize(self) -> None:
+        a, b = LatencyHistogram(), LatencyHistogram()
+        for value in range(1000):
+            (a if value % 2 else b).record(value * 10)
+
+        merged = LatencyHistogram.from_dict(a.to_dict())
+        merged.merge(b)
+
+        assert merged.total_count == 1000
+        assert merged.min == 0 and merged.max == 9990
+        assert abs(merged.mean - 4995) < 1
+
+    def test_record_corrected_backfills(self) -> None:
+        hist = LatencyHistogram()
+        hist.record_corrected(1000, expected_interval=100)
+
+        assert hist.total_count == 10
+        assert hist.min == 100
+
+
+class TestArrivalSchedule:
+    """Tests for ArrivalSchedule."""
+
+    def test_constant_rate_split_across_workers(self) -> None:
+        schedule = ArrivalSchedule(ArrivalPattern.CONSTANT, rate=100, duration_seconds=1)
+        offsets = sorted(o for w in range(4) for o in schedule.offsets(w, 4))
+
+        assert len(offsets) == 100
+        assert offsets[:3] == [0.0, 0.01, 0.02]
+
+    def test_ramp_and_poisson_counts(self) -> None:
+        ramp = ArrivalSchedule(ArrivalPattern.RAMP, rate=10, end_rate=90, duration_seconds=10)
+        poisson = ArrivalSchedule(ArrivalPattern.POISSON, rate=500, duration_seconds=2, seed=7)
+
+        assert abs(len(list(ramp.offsets())) - 500) <= 1
+        assert 900 < sum(len(list(poisson.offsets(w, 2))) for w in range(2)) < 1100
+        assert list(poisson.offsets(0, 2)) == list(poisson.offsets(0, 2))
+
+
+class TestLoadGenerator:
+    """Tests for LoadGenerator against a local stub server."""
+
+    async def test_holds_target_rate(self) -> None:
+        server, url, stats = await _start_server(delay=0.01)
+        reports = []
+        try:
+            config = LoadTestConfig(
+                ArrivalSchedule(ArrivalPattern.CONSTANT, rate=200, duration_seconds=1),
+                report_interval=0.25,
+            )
+            summary = await LoadGenerator(HttpTarget(f"{url}/health"), config, reports.append).run()
+        finally:
+            await close_transports()
+            server.close()
+
+        assert summary.sent == 200 == stats["requests"]
+        assert summary.successful == 200
+        assert summary.status_codes == {200: 200}
+        assert summary.target_rate == 200
+        assert summary.requests_per_second > 50
+        assert summary.latency.value_at_percentile(50) >= 10_000
+        assert reports and reports[-1].completed > 0
+
+    async def test_setup_not_counted_in_duration(self) -> None:
+        config = LoadTestConfig(
+            ArrivalSchedule(ArrivalPattern.CONSTANT, rate=100, duration_seconds=0.1),
+        )
+        summary = await LoadGenerator(SlowSetupTarget(stall=0), config).run()
+
+        assert summary.sent == 10
+        assert summary.duration_seconds < 0.5
+
+    async def test_latency_corrected_for_coordinated_omission(self) -> None:
+        """Requests queued behind a stall are charged for the wait."""
+        config = LoadTestConfig(
+            ArrivalSchedule(ArrivalPattern.CONSTANT, rate=100, duration_seconds=0.5),
+            max_in_flight=1,
+        )
+        summary = await LoadGenerator(StallTarget(stall=0.2), config).run()
+
+        assert summary.sent == 50
+        assert summary.late_starts >= 15
+        assert summary.service_time.value_at_percentile(90) < 10_000
+        assert summary.latency.value_at_percentile(90) > 50_000
+
+    async def test_worker_processes_merge_results(self) -> None:
+        server, url, stats = await _start_server()
+        try:
+            config = LoadTestConfig(
+                ArrivalSchedule(ArrivalPattern.CONSTANT, rate=100, duration_seconds=0.5),
+                workers=2,
+            )
+            summary = await LoadGenerator(HttpTarget(f"{url}/health"), config).run()
+        finally:
+            server.close()
+
+        assert summary.workers == 2
+        assert summary.sent == 50 == stats["requests"]
+        assert summary.latency.total_count == 50
+        assert summary.errors == []
+
+
+class TestAPITestingAgentLoad:
+    """Tests for APITestingAgent.run_load_test."""
+
+    async def test_closed_and_open_loop(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.chdir(tmp_path)  # agents read config from the working directory
+        server, url, stats = await _start_server()
+        agent = APITestingAgent(base_url=url)
+        try:
+            closed = await agent.run_load_test("/items", HTTPMethod.POST, concurrent_users=5,
+                                               requests_per_user=4, body={"a": 1})
+            opened = await agent.run_load_test("/items", concurrent_users=5, rate=100,
+                                               duration_seconds=0.3)
+        finally:
+            await agent.cleanup()
+            await close_transports()
+            server.close()
+
+        assert closed["success"]
+        assert closed["load_test"]["total_requests"] == 20
+        assert closed["load_test"]["successful_requests"] == 20
+        assert opened["load_test"]["total_requests"] == 30
+        assert opened["load_test"]["target_rate"] == 100
+        assert stats["requests"] == 50
@@ -0,0 +1,179 @@
+"""
+Tests for the vectorized history analytics engine.
+"""
+
+import gc
+import random
+import statistics
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from claude_playwright_agent.agents.test_reporting import FlakinessDetector, TestHistoryTracker
+from claude_playwright_agent.reporting.analytics import HistoryAnalytics, _engines, get_analytics
+from claude_playwright_agent.reporting.dashboard import FlakyTestDetector
+from claude_playwright_agent.reporting.history_store import HistoryStore
+
+
+@pytest.fixture
+def store(tmp_path) -> HistoryStore:
+    store = HistoryStore(db_path=tmp_path / "history.db")
+    yield store
+    store.close()
+
+
+def _record_runs(store: HistoryStore, runs: int, tests: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    for run in range(runs):
+        store.record_run(
+            [
+                {
+                    "name": f"test_{i}",
+                    "status": rng.choice(["passed", "passed", "failed", "skipped"]),
+                    "duration": rng.random() * (i + 1),
+                    "retry_count": rng.randint(0, 2),
+                }
+                for i in range(tests)
+            ],
+            timestamp=f"2026-01-01T00:{run:02d}:00",
+            commit_sha=f"c{run // 3}",
+        )
+
+
+class TestHistoryAnalytics:
+    """Tests for HistoryAnalytics."""
+
+    def test_matches_naive_per_test_statistics(self, store):
+        _record_runs(store, runs=30, tests=5)
+        stats = HistoryAnalytics(store, segment_size=16).analyze()
+
+        assert sorted(stats.test_names) == [f"test_{i}" for i in range(5)]
+        for name in stats.test_names:
+            history = store.get_test_history(name, limit=None)
+            statuses = [h["status"] for h in history]
+            durations = [h["duration"] for h in history]
+            s = stats.get(name)
+
+            assert s.runs == len(history) == 30
+            assert s.passes == statuses.count("passed")
+            assert s.failures == statuses.count("failed")
+            assert s.recent_failures == statuses[-10:].count("failed")
+            assert s.flips == sum(
+                (a == "passed") != (b == "passed") for a, b in zip(statuses, statuses[1:])
+            )
+            assert s.duration_mean == pytest.approx(statistics.mean(durations))
+            assert s.duration_p50 == pytest.approx(statistics.median(durations))
+            assert s.duration_max == pytest.approx(max(durations))
+            assert s.total_retries == sum(h["retry_count"] for h in history)
+
+            by_commit: dict[str, set] = {}
+            for h in history:
+                by_commit.setdefault(h["commit_sha"], set()).add(h["status"])
+            assert s.total_commits == len(by_commit)
+            assert s.flaky_commits == sum(
+                {"passed", "failed"} <= seen for seen in by_commit.values()
+            )
+
+            failed_at = [h["timestamp"] for h in history if h["status"] == "failed"]
+            assert s.last_failure == (failed_at[-1] if failed_at else "")
+
+    def test_change_point_detects_duration_shift(self, store):
+        for run in range(40):
+            store.record_result(
+                "test_slow", "passed", 1.0 if run < 25 else 5.0,
+                timestamp=f"2026-01-01T00:{run:02d}:00",
+            )
+
+        s = HistoryAnalytics(store).get_test_statistics("test_slow")
+        assert s.duration_change_index == 25
+        assert s.duration_change_score == pytest.approx(1.0)
+        assert s.duration_before == pytest.approx(1.0)
+        assert s.duration_after == pytest.approx(5.0)
+
+    def test_result_cached_until_history_grows(self, store):
+        _record_runs(store, runs=5, tests=3)
+        engine = HistoryAnalytics(store, segment_size=4)
+
+        first = engine.analyze()
+        assert engine.analyze() is first
+        assert set(engine._segments) == {0, 1, 2}  # tail segment is not cached
+
+        store.record_result("test_0", "failed", 1.0, timestamp="2026-02-01T00:00:00")
+        second = engine.analyze()
+        assert second is not first
+        assert second.get("test_0").runs == 6
+
+    def test_empty_store(self, store):
+        stats = HistoryAnalytics(store).analyze()
+        assert len(stats) == 0
+        assert stats.get("missing") is None
+
+    def test_get_analytics_is_shared_per_store(self, store):
+        assert get_analytics(store) is get_analytics(store)
+
+    def test_engine_released_with_store(self, tmp_path):
+        other = HistoryStore(db_path=tmp_path / "other.db")
+        get_analytics(other)
+        assert other in _engines
+
+        other.close()
+        del other
+        gc.collect()
+        assert len(_engines) == 0
+
+
+class TestVectorizedConsumers:
+    """The vectorized path agrees with the per-test analysis."""
+
+    def test_flakiness_detector_matches_per_test_analysis(self, store):
+        _record_runs(store, runs=12, tests=6)
+        detector = FlakinessDetector(TestHistoryTracker(store=store))
+
+        vectorized = {r.test_name: r for r in detector.analyze_all(min_runs=5)}
+        for name, result in vectorized.items():
+            expected = detector.analyze_test(name, min_runs=5)
+            assert result.flaky_score == pytest.approx(expected.flaky_score)
+            assert result.failed_runs == expected.failed_runs
+            assert result.failure_patterns == expected.failure_patterns
+            assert result.recommendation == expected.recommendation
+
+    def test_flaky_test_detector_matches_per_test_analysis(self, store):
+        detector = FlakyTestDetector(threshold=0.3, store=store)
+        for run in range(6):
+            detector.record_execution("test_flaky", run % 2 == 0, "abc", f"2026-01-01T00:0{run}:00")
+            detector.record_execution("test_stable", True, "abc", f"2026-01-01T00:0{run}:00")
+
+        [flaky] = detector.get_all_flaky_tests()
+        assert flaky == detector.analyze_flakiness("test_flaky")
+
+    def test_flakiness_paths_agree_on_long_history_with_errors(self, store):
+        rng = random.Random(3)
+        for run in range(150):
+            store.record_run([
+                {"name": "test_a", "status": rng.choice(["passed", "failed", "error", "skipped"])},
+                {"name": "test_b", "status": "error" if run < 20 else "passed"},
+            ], timestamp=f"2026-01-01T{run // 60:02d}:{run % 60:02d}:00")
+        detector = FlakinessDetector(TestHistoryTracker(store=store))
+
+        vectorized = {r.test_name: r for r in detector.analyze_all(min_runs=5)}
+        for name in ("test_a", "test_b"):
+            expected = detector.analyze_test(name, min_runs=5)
+            assert expected.total_runs == 150
+            assert vectorized[name] == expected
+
+    def test_flaky_test_detector_ignores_skips_in_both_paths(self, store):
+        detector = FlakyTestDetector(threshold=0.5, store=store)
+        for run, status in enumerate(["passed", "skipped", "passed", "skipped", "failed", "passed"]):
+            store.record_result("test_mixed", status, timestamp=f"2026-01-01T00:0{run}:00", commit_sha="abc")
+        for run, status in enumerate(["passed", "skipped", "passed", "skipped"]):
+            store.record_result("test_skips", status, timestamp=f"2026-01-01T00:0{run}:00", commit_sha="abc")
+
+        scalar = [
+            analysis
+            for analysis in (detector.analyze_flakiness(name) for name in ("test_mixed", "test_skips"))
+            if analysis
+        ]
+        assert detector.get_all_flaky_tests() == scalar
+        assert [a["test_name"] for a in scalar] == ["test_mixed"]
+        assert scalar[0]["recent_failures"] == 1
@@ -0,0 +1,111 @@
+"""
+Tests for the live RealTimeDashboard server.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from claude_playwright_agent.reporting.dashboard import RealTimeDashboard, TestStatus
+
+
+@pytest.fixture
+async def dashboard():
+    dashboard = RealTimeDashboard(port=0, max_events=100, broadcast_rate=20)
+    await dashboard.start_server()
+    yield dashboard
+    await dashboard.stop_server()
+
+
+async def _receive(ws, until_type: str, timeout: float = 5.0) -> list[dict]:
+    """Collect messages until one of the given type arrives."""
+    messages = []
+    while True:
+        msg = await asyncio.wait_for(ws.receive(), timeout)
+        data = json.loads(msg.data)
+        messages.append(data)
+        if data["type"] == until_type:
+            return messages
+
+
+class TestRealTimeDashboard:
+    """Tests for RealTimeDashboard."""
+
+    async def test_updates_are_coalesced_into_deltas(self, dashboard):
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(f"http://127.0.0.1:{dashboard.port}/ws") as ws:
+                snapshot = json.loads((await ws.receive()).data)
+                assert snapshot["type"] == "snapshot"
+
+                await dashboard.start_test_run(2_000)
+                for i in range(2_000):
+                    await dashboard.update_test_status(
+                        f"test_{i}", TestStatus.PASSED if i % 4 else TestStatus.FAILED, 0.01
+                    )
+                await dashboard.finish_test_run()
+
+                messages = await _receive(ws, "test_run_finished")
+
+        deltas = [m for m in messages if m["type"] == "delta"]
+        assert len(deltas) < 10  # not one message per test
+        assert sum(len(d["events"]) + d["dropped"] for d in deltas) == 2_000
+        assert deltas[-1]["metrics"]["passed"] == 1_500
+        assert deltas[-1]["metrics"]["failed"] == 500
+        seqs = [m["seq"] for m in messages]
+        assert seqs == list(range(snapshot["seq"] + 1, snapshot["seq"] + 1 + len(seqs)))
+
+    async def test_late_joiner_gets_snapshot(self, dashboard):
+        await dashboard.start_test_run(500)
+        for i in range(500):
+            await dashboard.update_test_status(f"test_{i}", TestStatus.PASSED)
+
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(f"http://127.0.0.1:{dashboard.port}/ws") as ws:
+                snapshot = json.loads((await ws.receive()).data)
+
+                assert snapshot["type"] == "snapshot"
+                assert snapshot["metrics"]["passed"] == 500
+                # Event log is a ring buffer
+                assert len(snapshot["events"]) == 100
+                assert snapshot["events"][-1]["test_name"] == "test_499"
+
+                await ws.send_str("resync")
+                again = json.loads((await ws.receive()).data)
+                assert again["type"] == "snapshot"
+
+    async def test_slow_client_is_resynced(self, dashboard):
+        class _Stalled:
+            async def send_str(self, message):
+                await asyncio.Event().wait()
+
+        from claude_playwright_agent.reporting.dashboard import _DashboardClient
+
+        client = _DashboardClient(_Stalled(), queue_size=4)
+        dashboard.clients.add(client)
+        await dashboard.start_test_run(10)
+        for i in range(10):
+            await dashboard._broadcast({"type": "note", "data": {"i": i}})
+
+        assert client.resyncs > 0
+        assert client.queue.qsize() <= 4
+        dashboard.clients.discard(client)
+
+    async def test_serves_live_page(self, dashboard):
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"http://127.0.0.1:{dashboard.port}/") as response:
+                assert response.status == 200
+                assert "new WebSocket" in await response.text()
+
+    async def test_works_without_server(self, tmp_path):
+        dashboard = RealTimeDashboard(max_events=3)
+        await dashboard.start_test_run(5)
+        for i in range(5):
+            await dashboard.update_test_status(f"test_{i}", TestStatus.PASSED, 0.5)
+
+        assert [e["test_name"] for e in dashboard.get_events()] == ["test_2", "test_3", "test_4"]
+        assert dashboard.get_metrics().passed == 5
+        dashboard.generate_html_report(tmp_path / "dashboard.html")
+        assert "test_4" in (tmp_path / "dashboard.html").read_text()
@@ -0,0 +1,179 @@
+"""
+Tests for the unified test history store.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from claude_playwright_agent.agents.test_reporting import FlakinessDetector, TestHistoryTracker
+from claude_playwright_agent.reporting.dashboard import FlakyTestDetector
+from claude_playwright_agent.reporting.history_store import HistoryStore, get_history_store
+from claude_playwright_agent.reporting.trends import TrendAnalyzer
+
+
+@pytest.fixture
+def store(tmp_path) -> HistoryStore:
+    store = HistoryStore(db_path=tmp_path / "history.db")
+    yield store
+    store.close()
+
+
+class TestHistoryStore:
+    """Tests for HistoryStore."""
+
+    def test_record_run_is_one_bulk_append(self, store):
+        results = [
+            {"name": f"test_{i}", "status": "passed" if i % 4 else "failed", "duration": 0.5}
+            for i in range(10_000)
+        ]
+        run_id = store.record_run(results, source="ci", commit_sha="abc")
+
+        [run] = store.get_runs()
+        assert run["run_id"] == run_id
+        assert run["total_tests"] == 10_000
+        assert run["failed"] == 2_500
+        assert run["passed"] == 7_500
+        assert run["duration"] == pytest.approx(5_000)
+        assert store.get_statistics()["results"] == 10_000
+        assert store.get_test_history("test_0")[0]["commit_sha"] == "abc"
+
+    def test_test_history_is_chronological_and_limited(self, store):
+        base = datetime(2026, 1, 1)
+        for day in range(5):
+            store.record_result(
+                "login", "passed" if day % 2 else "failed", 1.0 + day,
+                timestamp=(base + timedelta(days=day)).isoformat(),
+            )
+
+        history = store.get_test_history("login", limit=3)
+        assert [h["duration"] for h in history] == [3.0, 4.0, 5.0]
+
+        since = store.get_test_history("login", since=(base + timedelta(days=3)).isoformat())
+        assert len(since) == 2
+
+    def test_get_histories_limit_per_test(self, store):
+        for i in range(3):
+            store.record_run([
+                {"name": "a", "status": "passed", "duration": i},
+                {"name": "b", "status": "failed", "duration": i},
+            ], timestamp=f"2026-01-0{i + 1}T00:00:00")
+
+        histories = store.get_histories(limit_per_test=2)
+        assert set(histories) == {"a", "b"}
+        assert [h["duration"] for h in histories["a"]] == [1, 2]
+        assert store.get_histories(test_names=["b"]).keys() == {"b"}
+        assert store.get_histories(test_names=[]) == {}
+
+    def test_runs_filtered_by_source_with_payload(self, store):
+        store.record_run(source="a", metrics={"pass_rate": 90}, payload={"x": 1})
+        store.record_run(source="b")
+
+        [run] = store.get_runs(source="a", include_payload=True)
+        assert run["metrics"] == {"pass_rate": 90}
+        assert run["payload"] == {"x": 1}
+        assert store.count_runs() == 2
+
+    def test_import_legacy_json_once(self, store, tmp_path):
+        legacy = tmp_path / "old.json"
+        legacy.write_text(json.dumps([{"name": "t", "status": "passed"}]))
+
+        loader = lambda s, data: s.record_results(data)
+        assert store.import_legacy_json(legacy, loader)
+        assert not store.import_legacy_json(legacy, loader)
+        assert (tmp_path / "old.json.migrated").exists()
+        assert len(store.get_test_history("t")) == 1
+
+    def test_failed_legacy_import_rolls_back(self, store, tmp_path):
+        legacy = tmp_path / "old.json"
+        legacy.write_text(json.dumps([{"name": "t", "status": "passed"}]))
+
+        def failing_loader(s, data):
+            s.record_run(data, source="legacy")
+            raise ValueError("bad entry")
+
+        assert not store.import_legacy_json(legacy, failing_loader)
+        assert legacy.exists()
+        assert store.count_runs() == 0
+        assert store.get_test_history("t") == []
+
+        assert store.import_legacy_json(legacy, lambda s, data: s.record_run(data))
+        assert len(store.get_test_history("t")) == 1
+
+    def test_get_history_store_is_shared(self, tmp_path):
+        first = get_history_store(tmp_path)
+        assert get_history_store(tmp_path) is first
+        assert first.db_path == tmp_path / ".cpa" / "history.db"
+        first.close()
+
+
+class TestHistoryConsumers:
+    """Components that read and write through the store."""
+
+    def test_history_tracker(self, tmp_path, store):
+        tracker = TestHistoryTracker(project_path=tmp_path, store=store)
+        tracker.record_run([
+            {"name": "checkout", "status": "passed", "duration": 1.0},
+            {"name": "search", "status": "failed", "duration": 2.0},
+        ])
+        tracker.record_execution("checkout", "failed", 1.5)
+
+        assert [h["status"] for h in tracker.get_history("checkout")] == ["passed", "failed"]
+        assert tracker.get_pass_rate("checkout") == 50.0
+        assert set(tracker.get_all_history()) == {"checkout", "search"}
+        assert len(FlakinessDetector(tracker).analyze_all(min_runs=1)) == 2
+
+    def test_history_tracker_migrates_legacy_json(self, tmp_path):
+        legacy = tmp_path / ".cpa" / "test_history.json"
+        legacy.parent.mkdir()
+        legacy.write_text(json.dumps({
+            "login": [{"status": "passed", "duration": 1.0, "timestamp": "2026-01-01T00:00:00"}],
+        }))
+
+        tracker = TestHistoryTracker(project_path=tmp_path)
+        assert tracker.get_history("login")[0]["timestamp"] == "2026-01-01T00:00:00"
+        assert not legacy.exists()
+        tracker._store.close()
+
+    def test_trend_analyzer(self, tmp_path, store):
+        analyzer = TrendAnalyzer(data_dir=str(tmp_path / "trends"), store=store)
+        for passed in (8, 9, 10, 10):
+            analyzer.record_run(total_tests=10, passed=passed, failed=10 - passed,
+                                skipped=0, duration=5.0, branch="main")
+
+        trend = analyzer.get_pass_rate_trend(days=1)
+        assert trend["trend"] == "improving"
+        assert trend["pass_rates"] == [0.8, 0.9, 1.0, 1.0]
+        assert analyzer.get_summary()["total_runs"] == 4
+        assert analyzer.compare_branches()["main"]["total_runs"] == 4
+
+    def test_trend_analyzer_defaults_to_shared_store(self, tmp_path):
+        analyzer = TrendAnalyzer(data_dir=str(tmp_path / ".cpa" / "trends"))
+        analyzer.record_run(10, 10, 0, 0, 1.0)
+
+        assert analyzer._store is get_history_store(tmp_path)
+        assert analyzer._store.count_runs(source=TrendAnalyzer.SOURCE) == 1
+        analyzer._store.close()
+
+    def test_flaky_detector_with_store(self, store):
+        detector = FlakyTestDetector(threshold=0.5, store=store)
+        for passed in (True, False, True):
+            detector.record_execution("checkout", passed, "abc", datetime.now().isoformat())
+        detector.record_execution("search", True, "abc", datetime.now().isoformat())
+
+        analysis = detector.analyze_flakiness("checkout")
+        assert analysis["flaky"] is True
+        assert analysis["total_runs"] == 3
+        assert detector.get_statistics()["total_tests"] == 2
+
+    def test_report_agent_opens_store_lazily(self, tmp_path, monkeypatch):
+        from claude_playwright_agent.agents.report_agent import ReportAgent
+
+        monkeypatch.chdir(tmp_path)
+        agent = ReportAgent()
+        assert not (tmp_path / ".cpa" / "history.db").exists()
+
+        assert agent.history_store is get_history_store(tmp_path)
+        assert (tmp_path / ".cpa" / "history.db").exists()
+        agent.history_store.close()
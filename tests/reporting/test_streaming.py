@@ -0,0 +1,156 @@
+"""
+Tests for the streaming report writers.
+"""
+
+import json
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from claude_playwright_agent.agents.test_reporting import ReportFormat, TestReportGenerator
+from claude_playwright_agent.reporting.streaming import (
+    HTMLReportWriter,
+    ReportSummary,
+    StreamingReportWriter,
+    get_report_writer,
+    index_path_for,
+    write_report,
+)
+
+
+def _results(count: int):
+    for i in range(count):
+        status = "failed" if i % 10 == 0 else "skipped" if i % 10 == 1 else "passed"
+        yield {
+            "name": f"test_{i} <&>",
+            "status": status,
+            "duration": 0.5,
+            "error_message": "Timeout </script> exceeded" if status == "failed" else "",
+        }
+
+
+class TestStreamingWriters:
+    """Tests for the HTML, JUnit and JSON Lines writers."""
+
+    def test_junit_totals_are_patched_into_header(self, tmp_path):
+        path = tmp_path / "report.xml"
+        summary = write_report(_results(1_000), path, "junit", framework="behave")
+
+        root = ET.parse(path).getroot()
+        assert root.get("name") == "behave"
+        assert root.get("tests") == "1000"
+        assert root.get("failures") == "100"
+        assert root.get("skipped") == "100"
+        assert float(root.get("time")) == pytest.approx(500.0)
+        assert len(root.findall("testcase")) == summary.total == 1_000
+        assert root.find("testcase").get("name") == "test_0 <&>"
+        assert root.find("testcase/failure").text == "Timeout </script> exceeded"
+
+    def test_jsonl_writes_one_result_per_line(self, tmp_path):
+        path = tmp_path / "report.jsonl"
+        write_report(_results(250), path, "jsonl", page_size=100)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 250
+        assert json.loads(lines[42])["name"] == "test_42 <&>"
+
+        index = json.loads(index_path_for(path).read_text())
+        assert [p["count"] for p in index["pages"]] == [100, 100, 50]
+        with open(path, "rb") as f:
+            f.seek(index["pages"][1]["offset"])
+            assert json.loads(f.readline())["name"] == "test_100 <&>"
+
+    def test_html_pages_and_sidecar_index(self, tmp_path):
+        path = tmp_path / "report.html"
+        with HTMLReportWriter(path, title="Nightly", page_size=100) as writer:
+            writer.write_all(_results(1_050))
+
+        html = path.read_text(encoding="utf-8")
+        assert html.startswith("<!DOCTYPE html>")
+        assert html.rstrip().endswith("</html>")
+        assert html.count('class="cpa-page"') == 11
+        assert "</script> exceeded" not in html  # escaped inside JSON blocks
+
+        index = json.loads(index_path_for(path).read_text())
+        assert index["summary"]["total_tests"] == 1_050
+        assert index["summary"]["failed"] == 105
+        assert len(index["pages"]) == 11
+        page = index["pages"][3]
+        assert page["first"] == "test_300 <&>"
+        assert page["failed"] == 10
+
+        with open(path, "rb") as f:
+            f.seek(page["offset"])
+            block = f.read(page["length"]).decode("utf-8")
+        records = json.loads(block[block.index(">") + 1:block.rindex("</script>")])
+        assert len(records) == 100
+        assert records[0]["error"] == "Timeout </script> exceeded"
+
+    def test_memory_stays_flat(self, tmp_path):
+        def peak(count: int) -> int:
+            tracemalloc.start()
+            write_report(_results(count), tmp_path / f"r{count}.html", page_size=200)
+            _, high = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return high
+
+        assert peak(50_000) < peak(5_000) * 2
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError, match="No streaming writer"):
+            get_report_writer("pdf", tmp_path / "report.pdf")
+
+    def test_base_writer_is_abstract(self, tmp_path):
+        with pytest.raises(TypeError):
+            StreamingReportWriter(tmp_path / "report.txt")
+        assert not (tmp_path / "report.txt").exists()
+
+    def test_summary_statistics(self):
+        summary = ReportSummary()
+        for status, duration in [("passed", 1.0), ("failed", 3.0), ("error", 2.0), ("skipped", 0.0)]:
+            summary.add(status, duration)
+
+        assert summary.failed == 2
+        assert summary.pass_rate == 25.0
+        assert summary.duration_mean == pytest.approx(1.5)
+        assert summary.duration_stddev == pytest.approx(1.2909944)
+        assert (summary.duration_min, summary.duration_max) == (0.0, 3.0)
+
+
+class TestReportGeneratorStreaming:
+    """TestReportGenerator streams HTML, JUnit and JSON Lines reports."""
+
+    @pytest.mark.parametrize("format", [ReportFormat.HTML, ReportFormat.JUNIT, ReportFormat.JSONL])
+    def test_generate_report_from_generator(self, tmp_path, format):
+        output = tmp_path / f"report.{format.value}"
+        report = TestReportGenerator(tmp_path).generate_report(
+            _results(300), format, output_path=output, keep_results=False
+        )
+
+        assert output.exists()
+        assert index_path_for(output).exists()
+        assert report.total_tests == 300
+        assert report.failed == 30
+        assert report.test_results == []
+        assert {m.name for m in report.metrics} >= {"avg_duration", "throughput"}
+
+    def test_keep_results_for_json(self, tmp_path):
+        report = TestReportGenerator(tmp_path).generate_report(
+            list(_results(20)), ReportFormat.JSON, output_path=tmp_path / "report.json"
+        )
+        assert len(report.test_results) == 20
+        data = json.loads((tmp_path / "report.json").read_text())
+        assert data["summary"]["total_tests"] == 20
+
+    def test_html_report_renders_timestamp_and_metrics(self, tmp_path):
+        output = tmp_path / "report.html"
+        report = TestReportGenerator(tmp_path).generate_report(
+            _results(10), ReportFormat.HTML, output_path=output
+        )
+
+        html = output.read_text()
+        assert f"<p>{report.timestamp}</p>" in html
+        assert "<h2>Performance Metrics</h2>" in html
+        assert '<div class="metric-name">Avg Duration</div>' in html
+        assert json.loads(index_path_for(output).read_text())["metrics"][0]["name"] == "avg_duration"
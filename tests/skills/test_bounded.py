@@ -0,0 +1,144 @@
+"""
+Tests for bounded skill registries.
+
+Tests cover:
+- Count, age and size eviction
+- Spill-to-disk of evicted entries
+- Per-skill memory budgets and reporting
+- Adoption by built-in skill agents
+"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from claude_playwright_agent.skills import bounded
+from claude_playwright_agent.skills.bounded import (
+    BoundedDict,
+    BoundedList,
+    MemoryBudget,
+    RegistryLimits,
+    bounded_dict,
+    bounded_list,
+    configure_registries,
+    get_memory_report,
+)
+
+
+class Owner:
+    """Stand-in skill agent."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    """Restore the module configuration after each test."""
+    yield
+    configure_registries()
+
+
+class TestBoundedList:
+    """Tests for BoundedList."""
+
+    def test_evicts_oldest_by_count(self) -> None:
+        """Only the newest max_items entries are kept."""
+        history = BoundedList(limits=RegistryLimits(max_items=3))
+        for i in range(10):
+            history.append(i)
+
+        assert history == [7, 8, 9]
+        assert history.evicted == 7
+        assert type(history.copy()) is list
+
+    def test_evicts_by_age(self, monkeypatch) -> None:
+        """Entries older than max_age are evicted on the next append."""
+        now = [100.0]
+        monkeypatch.setattr(bounded.time, "monotonic", lambda: now[0])
+        history = BoundedList(limits=RegistryLimits(max_items=None, max_age=10))
+        history.append("old")
+        now[0] += 11
+        history.append("new")
+
+        assert history == ["new"]
+
+    def test_evicts_by_bytes(self) -> None:
+        """Estimated size stays within max_bytes."""
+        history = BoundedList(limits=RegistryLimits(max_items=None, max_bytes=10_000))
+        for _ in range(20):
+            history.append("x" * 1000)
+
+        assert history.nbytes <= 10_000
+        assert 0 < len(history) < 20
+
+
+class TestBoundedDict:
+    """Tests for BoundedDict."""
+
+    def test_rewrite_refreshes_entry(self) -> None:
+        """Writing a key makes it the newest entry."""
+        registry = BoundedDict(limits=RegistryLimits(max_items=2))
+        registry["a"] = 1
+        registry["b"] = 2
+        registry["a"] = 3
+        registry["c"] = 4
+
+        assert registry == {"a": 3, "c": 4}
+        assert registry.pop("a") == 3
+        assert list(registry) == ["c"]
+
+    def test_spills_evicted_entries(self, tmp_path: Path) -> None:
+        """Evicted entries are appended to the spill file."""
+        configure_registries(spill_dir=tmp_path)
+        registry = bounded_dict(Owner("e6_2_network_recording"), "request_registry",
+                                RegistryLimits(max_items=1))
+        registry["r1"] = {"url": "https://example.com"}
+        registry["r2"] = {"url": "https://example.org"}
+
+        lines = (tmp_path / "e6_2_network_recording" / "request_registry.jsonl").read_text().splitlines()
+        assert [json.loads(line)["key"] for line in lines] == ["r1"]
+
+
+class TestMemoryBudget:
+    """Tests for per-skill budgets."""
+
+    def test_budget_evicts_from_largest_registry(self) -> None:
+        """A skill's registries together stay within its budget."""
+        configure_registries(skill_budget=50_000)
+        owner = Owner("budgeted_skill")
+        small = bounded_list(owner, "small")
+        large = bounded_list(owner, "large")
+        small.append("s")
+        for _ in range(100):
+            large.append("x" * 1000)
+
+        budget = MemoryBudget.for_owner(owner)
+        assert budget.used <= 50_000
+        assert small == ["s"]
+        assert large.evicted > 0
+
+    def test_report_per_skill(self) -> None:
+        """Usage is summed per skill name."""
+        owners = [Owner("reported_skill"), Owner("reported_skill")]
+        histories = [bounded_list(owner, "context_history") for owner in owners]
+        for history in histories:
+            history.append({"task": "run", "timestamp": time.time()})
+
+        report = get_memory_report()["reported_skill"]
+        assert report["agents"] == 2
+        assert report["entries"] == 2
+        assert report["used_bytes"] > 0
+
+
+def test_skill_agents_use_bounded_histories(tmp_path: Path, monkeypatch) -> None:
+    """Built-in skill agents keep their histories bounded."""
+    monkeypatch.chdir(tmp_path)
+    from claude_playwright_agent.skills.builtins.e6_2_network_recording.main import (
+        NetworkRecordingAgent,
+    )
+
+    agent = NetworkRecordingAgent()
+    assert isinstance(agent._context_history, BoundedList)
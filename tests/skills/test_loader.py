@@ -348,6 +348,22 @@ class TestAgentClassLoading:
         with pytest.raises(SkillLoadError, match="Entry point not found"):
             loader.load_skill(manifest_path)
 
+    def test_load_agent_class_missing_class(self, skill_with_agent: Path, clean_registry: None) -> None:
+        """Test that a missing agent class fails at load time, not on first use."""
+        import sys
+
+        sys.modules.pop("agent_skill", None)
+        manifest_path = skill_with_agent / "skill.yaml"
+        manifest_data = yaml.safe_load(manifest_path.read_text(encoding="utf-8"))
+        manifest_data["agent_class"] = manifest_data["agent_class"].rsplit(".", 1)[0] + ".MissingAgent"
+        manifest_path.write_text(yaml.dump(manifest_data), encoding="utf-8")
+
+        loader = SkillLoader(project_path=skill_with_agent.parent, include_builtins=False)
+
+        with pytest.raises(SkillLoadError, match="'MissingAgent' not found"):
+            loader.load_skill(manifest_path)
+        assert "agent_skill" not in sys.modules
+
 
 # =============================================================================
 # Dependency Resolution Tests
@@ -526,3 +542,218 @@ class TestLoadOrder:
 
         # All should be loaded
         assert len(all_skills) == 3
+
+
+# =============================================================================
+# Skill Index Cache Tests
+# =============================================================================
+
+
+class TestSkillIndexCache:
+    """Tests for the persistent skill index and lazy agent loading."""
+
+    def test_warm_load_skips_manifest_parsing(
+        self, skills_with_dependencies: dict[str, Path], tmp_path: Path, clean_registry: None
+    ) -> None:
+        """Test that a second loader reads manifests from the index."""
+        (tmp_path / ".cpa").mkdir()
+        first = SkillLoader(project_path=tmp_path, include_builtins=False)
+        first.load_all()
+        assert (tmp_path / ".cpa" / "skill_index.json").exists()
+
+        get_registry().clear()
+        with patch("claude_playwright_agent.skills.loader.parse_manifest") as parse:
+            second = SkillLoader(project_path=tmp_path, include_builtins=False)
+            with patch.object(second, "_resolve_dependencies") as resolve:
+                skills = second.load_all()
+
+        parse.assert_not_called()
+        resolve.assert_not_called()
+        assert [s.name for s in skills] == ["base-skill", "dependent-skill"]
+        assert second._loaded_manifests["dependent-skill"].dependencies == ["base-skill"]
+
+    def test_changes_invalidate_entries(
+        self, skills_with_dependencies: dict[str, Path], tmp_path: Path, clean_registry: None
+    ) -> None:
+        """Test that edited manifests and new skill directories are picked up."""
+        (tmp_path / ".cpa").mkdir()
+        SkillLoader(project_path=tmp_path, include_builtins=False).load_all()
+
+        manifest_path = skills_with_dependencies["base"] / "skill.yaml"
+        manifest = yaml.safe_load(manifest_path.read_text(encoding="utf-8"))
+        manifest["description"] = "Base skill, edited"
+        manifest_path.write_text(yaml.dump(manifest), encoding="utf-8")
+
+        new_dir = tmp_path / "skills" / "new-skill"
+        new_dir.mkdir()
+        (new_dir / "skill.yaml").write_text(
+            yaml.dump({"name": "new-skill", "version": "1.0.0", "description": "New"}),
+            encoding="utf-8",
+        )
+
+        get_registry().clear()
+        loader = SkillLoader(project_path=tmp_path, include_builtins=False)
+        names = [s.name for s in loader.load_all()]
+
+        assert sorted(names) == ["base-skill", "dependent-skill", "new-skill"]
+        assert names.index("base-skill") < names.index("dependent-skill")
+        assert get_registry().get("base-skill").description == "Base skill, edited"
+
+    def test_circular_dependency_is_cached(self, tmp_path: Path, clean_registry: None) -> None:
+        """Test that a cached cycle is still reported."""
+        (tmp_path / ".cpa").mkdir()
+        skills_dir = tmp_path / "skills"
+        for name, dep in [("skill-a", "skill-b"), ("skill-b", "skill-a")]:
+            (skills_dir / name).mkdir(parents=True)
+            (skills_dir / name / "skill.yaml").write_text(
+                yaml.dump({"name": name, "version": "1.0.0", "description": name, "dependencies": [dep]}),
+                encoding="utf-8",
+            )
+
+        for _ in range(2):
+            with pytest.raises(CircularDependencyError, match="skill-a"):
+                SkillLoader(project_path=tmp_path, include_builtins=False).load_all()
+
+    def test_agent_class_loads_on_first_use(self, skill_with_agent: Path, clean_registry: None) -> None:
+        """Test that the agent module is imported lazily."""
+        import sys
+
+        sys.modules.pop("agent_skill", None)
+        loader = SkillLoader(project_path=skill_with_agent.parent.parent, include_builtins=False)
+        skill = loader.load_skill(skill_with_agent / "skill.yaml")
+
+        assert not skill.agent_loaded
+        assert "agent_skill" not in sys.modules
+
+        assert skill.agent_class.__name__ == "MyAgent"
+        assert skill.agent_loaded
+        assert "agent_skill" in sys.modules
+
+    def test_no_cache_file_without_project_directory(
+        self, sample_skill_dir: Path, tmp_path: Path, clean_registry: None
+    ) -> None:
+        """Test that projects without .cpa keep the index in memory."""
+        SkillLoader(project_path=tmp_path, include_builtins=False).load_all()
+
+        assert not (tmp_path / ".cpa").exists()
+
+
+# =============================================================================
+# Wave Initialization Tests
+# =============================================================================
+
+
+def _write_graph(tmp_path: Path, graph: dict[str, list[str]]) -> None:
+    """Write one skill manifest per graph entry."""
+    for name, deps in graph.items():
+        skill_dir = tmp_path / "skills" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "skill.yaml").write_text(
+            yaml.dump({"name": name, "version": "1.0.0", "description": name, "dependencies": deps}),
+            encoding="utf-8",
+        )
+
+
+class TestWaveInitialization:
+    """Tests for load waves and concurrent initialization."""
+
+    GRAPH = {
+        "config": [],
+        "state": [],
+        "storage": [],
+        "memory": ["state", "storage"],
+        "orchestrator": ["config", "memory"],
+        "reporting": ["state"],
+    }
+
+    def test_load_waves(self, tmp_path: Path, clean_registry: None) -> None:
+        """Test that waves follow the longest dependency chain."""
+        _write_graph(tmp_path, self.GRAPH)
+        loader = SkillLoader(project_path=tmp_path, include_builtins=False)
+        names = [s.name for s in loader.load_all()]
+
+        waves = [sorted(wave) for wave in loader.get_load_waves()]
+        assert waves == [["config", "state", "storage"], ["memory", "reporting"], ["orchestrator"]]
+        assert names == [name for wave in loader.get_load_waves() for name in wave]
+
+    def test_dependency_graph_waves(self) -> None:
+        """Test DependencyGraph.get_load_waves independent of insertion order."""
+        from claude_playwright_agent.skills import DependencyGraph
+
+        graph = DependencyGraph()
+        for name, deps in reversed(list(self.GRAPH.items())):
+            graph.add_skill(name, "1.0.0", deps + ["missing"])
+
+        waves = [sorted(wave) for wave in graph.get_load_waves()]
+        assert waves == [["config", "state", "storage"], ["memory", "reporting"], ["orchestrator"]]
+
+    async def test_initialize_all_runs_waves_concurrently(
+        self, tmp_path: Path, clean_registry: None
+    ) -> None:
+        """Test that a wave takes as long as its slowest skill."""
+        import asyncio
+        import time
+
+        _write_graph(tmp_path, self.GRAPH)
+        loader = SkillLoader(project_path=tmp_path, include_builtins=False)
+        loader.load_all()
+        finished: dict[str, float] = {}
+        started: dict[str, float] = {}
+
+        class Agent:
+            def __init__(self, name: str) -> None:
+                self.name = name
+                started[name] = time.perf_counter()
+                time.sleep(0.1)  # Blocking setup runs in a worker thread
+
+            async def initialize(self) -> None:
+                await asyncio.sleep(0.1)
+                finished[self.name] = time.perf_counter()
+
+        begin = time.perf_counter()
+        results = await loader.initialize_all(lambda skill: Agent(skill.name))
+        elapsed = time.perf_counter() - begin
+
+        # Three waves of 0.2s each, not six skills of 0.2s
+        assert elapsed < 1.0
+        assert all(r.success and r.duration_ms >= 190 for r in results)
+        assert {r.name: r.wave for r in results}["orchestrator"] == 2
+        assert started["memory"] >= max(finished["state"], finished["storage"])
+        assert started["orchestrator"] >= finished["memory"]
+        assert loader.get_agent("orchestrator").name == "orchestrator"
+
+    async def test_failed_dependency_skips_dependents(
+        self, tmp_path: Path, clean_registry: None
+    ) -> None:
+        """Test that dependents of a failed skill are not initialized."""
+        _write_graph(tmp_path, self.GRAPH)
+        loader = SkillLoader(project_path=tmp_path, include_builtins=False)
+        loader.load_all()
+        created: list[str] = []
+
+        def factory(skill: Skill) -> object:
+            if skill.name == "storage":
+                raise RuntimeError("disk full")
+            created.append(skill.name)
+            return None
+
+        results = {r.name: r for r in await loader.initialize_all(factory)}
+
+        assert results["storage"].error == "disk full"
+        assert results["memory"].skipped and results["orchestrator"].skipped
+        assert "storage" in results["memory"].error
+        assert sorted(created) == ["config", "reporting", "state"]
+        assert loader.get_init_results()["reporting"].success
+        assert loader.get_agent("memory") is None
+
+    async def test_initialize_imports_agent_class(
+        self, skill_with_agent: Path, clean_registry: None
+    ) -> None:
+        """Test the default factory instantiates the lazily loaded agent class."""
+        loader = SkillLoader(project_path=skill_with_agent.parent.parent, include_builtins=False)
+        loader.load_all()
+
+        [result] = await loader.initialize_all()
+
+        assert result.success
+        assert type(result.agent).__name__ == "MyAgent"
@@ -0,0 +1,180 @@
+"""
+Tests for network capture storage and mock rule matching.
+
+Tests cover:
+- Streaming HAR entries to disk with an in-memory index
+- Body deduplication and compressed offloading
+- HAR export
+- URL pattern trie matching
+- NetworkRecordingAgent integration
+"""
+
+import json
+from pathlib import Path
+
+from claude_playwright_agent.skills.builtins.e6_2_network_recording import (
+    CaptureStore,
+    MockRuleType,
+    NetworkRecordingAgent,
+    UrlPatternTrie,
+)
+
+
+class TestCaptureStore:
+    """Tests for CaptureStore."""
+
+    def test_entries_streamed_when_response_arrives(self, tmp_path: Path) -> None:
+        """Completed entries are on disk; memory holds only the index."""
+        store = CaptureStore(tmp_path)
+        store.add_request("r1", "POST", "https://example.com/api", {"Content-Type": "application/json"}, '{"a": 1}')
+        assert store.entries_path.read_text() == ""
+
+        store.add_response("r1", 201, {"Content-Type": "application/json"}, '{"ok": true}', duration_ms=12)
+
+        lines = store.entries_path.read_text().splitlines()
+        assert len(lines) == 1
+        entry = store.get_entry("r1")
+        assert entry["request"]["postData"]["text"] == '{"a": 1}'
+        assert entry["response"]["content"]["text"] == '{"ok": true}'
+        assert store.index["r1"].status == 201
+        assert not hasattr(store.index["r1"], "__dict__")
+        store.close()
+
+    def test_large_bodies_deduplicated_and_compressed(self, tmp_path: Path) -> None:
+        """Identical large bodies are written once as gzip side files."""
+        store = CaptureStore(tmp_path, inline_limit=100)
+        body = "x" * 10_000
+        for i in range(3):
+            store.add_request(f"r{i}", "GET", f"https://example.com/{i}")
+            store.add_response(f"r{i}", 200, body=body)
+
+        files = list((tmp_path / "bodies").rglob("*.gz"))
+        assert len(files) == 1
+        assert files[0].stat().st_size < 1000
+        assert store.bodies.stats["deduplicated"] == 2
+        content = store.get_entry("r2")["response"]["content"]
+        assert "text" not in content
+        assert store.read_body(content) == body.encode()
+        store.close()
+
+    def test_write_har(self, tmp_path: Path) -> None:
+        """Exported HAR is valid and includes requests without responses."""
+        store = CaptureStore(tmp_path / "capture", inline_limit=100)
+        store.add_request("r1", "GET", "https://example.com/big")
+        store.add_response("r1", 200, body="y" * 500)
+        store.add_request("r2", "GET", "https://example.com/pending")
+
+        count = store.write_har(tmp_path / "out.har", embed_bodies=True)
+
+        har = json.loads((tmp_path / "out.har").read_text())
+        assert count == 2
+        assert har["log"]["version"] == "1.2"
+        entries = har["log"]["entries"]
+        assert entries[0]["response"]["content"]["text"] == "y" * 500
+        assert entries[1]["response"]["status"] == 0
+        store.close()
+
+    def test_write_har_keeps_pending_requests(self, tmp_path: Path) -> None:
+        """Exporting mid-session does not drop responses that arrive later."""
+        store = CaptureStore(tmp_path / "capture")
+        store.add_request("r1", "POST", "https://example.com/slow", body="payload")
+
+        store.write_har(tmp_path / "early.har", embed_bodies=True)
+        early = json.loads((tmp_path / "early.har").read_text())["log"]["entries"]
+        assert early[0]["response"]["status"] == 0
+        assert store.entries_path.read_text() == ""
+
+        assert store.add_response("r1", 200, body="done") is not None
+        store.write_har(tmp_path / "late.har")
+        late = json.loads((tmp_path / "late.har").read_text())["log"]["entries"]
+        assert [e["response"]["status"] for e in late] == [200]
+        store.close()
+
+    def test_binary_inline_bodies(self, tmp_path: Path) -> None:
+        """Small bodies that are not UTF-8 are kept intact as base64."""
+        store = CaptureStore(tmp_path)
+        png = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+        store.add_request("r1", "GET", "https://example.com/logo.png")
+        store.add_response("r1", 200, {"Content-Type": "image/png"}, png)
+
+        content = store.get_entry("r1")["response"]["content"]
+        assert content["encoding"] == "base64"
+        assert store.read_body(content) == png
+        store.close()
+
+
+class TestUrlPatternTrie:
+    """Tests for UrlPatternTrie."""
+
+    def test_glob_patterns(self) -> None:
+        """Single, multi-segment and in-segment globs match."""
+        trie: UrlPatternTrie[str] = UrlPatternTrie()
+        trie.add("users", "**/api/users/*", "users")
+        trie.add("path", "/static/**", "static")
+        trie.add("host", "https://cdn.example.com/*.js", "js")
+
+        assert trie.match("https://example.com/api/users/42?x=1") == "users"
+        assert trie.match("https://example.com/v1/api/users/42") == "users"
+        assert trie.match("https://example.com/api/users/42/posts") is None
+        assert trie.match("https://other.org/static/css/app.css") == "static"
+        assert trie.match("https://cdn.example.com/app.js") == "js"
+        assert trie.match("https://cdn.example.org/app.js") is None
+
+    def test_priority_then_insertion_order(self) -> None:
+        """Higher priority wins; ties go to the earlier pattern."""
+        trie: UrlPatternTrie[str] = UrlPatternTrie()
+        trie.add("a", "**", "catch-all")
+        trie.add("b", "**/api/**", "api")
+        trie.add("c", "**/api/*", "api-one", priority=5)
+
+        assert trie.match_all("https://example.com/api/items") == ["api-one", "catch-all", "api"]
+        trie.remove("c")
+        assert trie.match("https://example.com/api/items") == "catch-all"
+
+
+class TestNetworkRecordingAgentCapture:
+    """Tests for NetworkRecordingAgent capture integration."""
+
+    async def test_capture_and_generate_har(self, tmp_path: Path, monkeypatch) -> None:
+        """Captured traffic is written to the capture directory and exported."""
+        monkeypatch.chdir(tmp_path)
+        agent = NetworkRecordingAgent(capture_dir=tmp_path / "capture")
+
+        await agent.run("capture_request", {"request_id": "r1", "url": "https://example.com/api", "method": "GET"})
+        result = await agent.run("capture_response", {"request_id": "r1", "status_code": 200, "body": "ok"})
+        assert "200" in result
+
+        result = await agent.run("generate_har", {"output_path": str(tmp_path / "net.har")})
+        assert result.endswith("with 1 request(s)")
+        assert json.loads((tmp_path / "net.har").read_text())["log"]["entries"][0]["request"]["url"] == "https://example.com/api"
+        assert agent.get_request_registry()["r1"].method == "GET"
+        assert next(iter(agent.get_response_registry().values())).body == "ok"
+        assert await agent.run("get_traffic", {"url_pattern": "example"}) == "Traffic: 1 request(s) captured"
+        await agent.cleanup()
+
+    async def test_pending_requests_are_visible(self, tmp_path: Path, monkeypatch) -> None:
+        """Requests awaiting their response show up in the registry and traffic."""
+        monkeypatch.chdir(tmp_path)
+        agent = NetworkRecordingAgent(capture_dir=tmp_path / "capture")
+
+        await agent.run("capture_request", {"request_id": "r1", "url": "https://example.com/api", "method": "GET"})
+
+        assert agent.get_request_registry()["r1"].url == "https://example.com/api"
+        assert await agent.run("get_traffic", {}) == "Traffic: 1 request(s) captured"
+        await agent.run("generate_har", {"output_path": str(tmp_path / "net.har")})
+        result = await agent.run("capture_response", {"request_id": "r1", "status_code": 200})
+        assert result == "Captured response: 200 for request 'r1'"
+        await agent.cleanup()
+
+    async def test_mock_rule_matching(self, tmp_path: Path, monkeypatch) -> None:
+        """The highest-priority enabled rule applies."""
+        monkeypatch.chdir(tmp_path)
+        agent = NetworkRecordingAgent(capture_dir=tmp_path / "capture")
+        await agent.run("add_mock_rule", {"url_pattern": "**/api/**", "rule_type": "status", "value": 500})
+        await agent.run("add_mock_rule", {"url_pattern": "**/api/users/*", "rule_type": "delay", "priority": 10})
+
+        rule = agent.match_mock_rule("https://example.com/api/users/1")
+        assert rule.rule_type == MockRuleType.DELAY
+        rule.enabled = False
+        assert agent.match_mock_rule("https://example.com/api/users/1").rule_type == MockRuleType.STATUS
+        assert agent.match_mock_rule("https://example.com/home") is None
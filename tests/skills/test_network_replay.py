@@ -0,0 +1,196 @@
+"""
+Tests for offline replay of captured network traffic.
+
+Tests cover:
+- Indexed matching on method, normalized URL and body hash
+- Replay of repeated requests in recorded order
+- Latency injection and cache-miss policies
+- Playwright route handler and local replay server
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+
+from claude_playwright_agent.skills.builtins.e6_2_network_recording import (
+    CaptureStore,
+    HarReplayer,
+    NetworkRecordingAgent,
+    ReplayConfig,
+    ReplayMissPolicy,
+)
+from claude_playwright_agent.skills.builtins.e6_2_network_recording.replay import normalize_url
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    """Capture store with a small recorded session."""
+    store = CaptureStore(tmp_path / "capture", inline_limit=64)
+    recorded = [
+        ("r1", "GET", "https://API.example.com:443/items?b=2&a=1", "", 200, '{"page": 1}', 40),
+        ("r2", "GET", "https://api.example.com/items?a=1&b=2", "", 200, '{"page": 2}', 40),
+        ("r3", "POST", "https://api.example.com/login", '{"user": "a"}', 200, "a" * 200, 10),
+        ("r4", "POST", "https://api.example.com/login", '{"user": "b"}', 401, "denied", 10),
+    ]
+    for request_id, method, url, body, status, response_body, ms in recorded:
+        store.add_request(request_id, method, url, body=body)
+        store.add_response(request_id, status, {"Content-Type": "application/json"}, response_body, duration_ms=ms)
+    yield store
+    store.close()
+
+
+class FakeRoute:
+    """Playwright Route stand-in."""
+
+    def __init__(self, method: str, url: str, body: bytes | None = None) -> None:
+        self.request = SimpleNamespace(method=method, url=url, post_data_buffer=body)
+        self.calls: list[tuple[str, dict]] = []
+
+    async def fulfill(self, **kwargs) -> None:
+        self.calls.append(("fulfill", kwargs))
+
+    async def continue_(self, **kwargs) -> None:
+        self.calls.append(("continue", kwargs))
+
+    async def abort(self, error_code: str = "failed") -> None:
+        self.calls.append(("abort", {"error_code": error_code}))
+
+
+class TestMatching:
+    """Tests for HarReplayer matching."""
+
+    def test_normalize_url(self) -> None:
+        """Host case, default port, query order and fragment do not matter."""
+        assert normalize_url("HTTPS://Example.com:443/a?z=1&b=2#top") == "https://example.com/a?b=2&z=1"
+        assert normalize_url("http://example.com/a?ts=9&x=1", ("ts",)) == "http://example.com/a?x=1"
+
+    def test_repeated_requests_replay_in_order(self, store: CaptureStore) -> None:
+        """The same request gets the recorded responses in sequence."""
+        replayer = HarReplayer.from_capture(store)
+        bodies = [replayer.lookup("GET", "https://api.example.com/items?a=1&b=2").body for _ in range(3)]
+
+        assert bodies == [b'{"page": 1}', b'{"page": 2}', b'{"page": 2}']
+
+    def test_body_hash_selects_response(self, store: CaptureStore) -> None:
+        """POSTs to the same URL are told apart by body."""
+        replayer = HarReplayer.from_capture(store)
+
+        assert replayer.lookup("POST", "https://api.example.com/login", b'{"user": "b"}').status == 401
+        assert replayer.lookup("POST", "https://api.example.com/login", b'{"user": "a"}').body == b"a" * 200
+        assert replayer.lookup("POST", "https://api.example.com/login", b'{"user": "c"}') is None
+        assert replayer.stats.misses == 1
+
+        replayer.config.body_fallback = True
+        assert replayer.lookup("POST", "https://api.example.com/login", b'{"user": "c"}') is not None
+        assert replayer.stats.fallback_hits == 1
+
+    def test_replay_from_har_file(self, store: CaptureStore, tmp_path: Path) -> None:
+        """An exported HAR replays like the live capture."""
+        store.write_har(tmp_path / "capture" / "session.har")
+        replayer = HarReplayer.from_har(tmp_path / "capture" / "session.har")
+
+        assert replayer.lookup("POST", "https://api.example.com/login", '{"user": "a"}').body == b"a" * 200
+        assert len(replayer) == 4
+
+    def test_har_outside_capture_dir(self, store: CaptureStore, tmp_path: Path) -> None:
+        """Offloaded bodies resolve from a HAR written anywhere."""
+        store.write_har(tmp_path / "exports" / "session.har")
+        replayer = HarReplayer.from_har(tmp_path / "exports" / "session.har")
+
+        assert replayer.lookup("POST", "https://api.example.com/login", '{"user": "a"}').body == b"a" * 200
+
+    def test_capture_replay_keeps_pending_requests(self, store: CaptureStore) -> None:
+        """Replaying a live capture leaves in-flight requests pending."""
+        store.add_request("r5", "GET", "https://api.example.com/slow")
+
+        replayer = HarReplayer.from_capture(store)
+
+        assert replayer.lookup("GET", "https://api.example.com/slow") is None
+        assert store.add_response("r5", 200, body="late") is not None
+
+    def test_latency(self, store: CaptureStore) -> None:
+        """Fixed, recorded and jittered latency add up."""
+        config = ReplayConfig(latency_ms=5, recorded_latency=True, latency_scale=0.5, jitter_ms=10, seed=1)
+        replayer = HarReplayer.from_capture(store, config)
+        response = replayer.lookup("GET", "https://api.example.com/items?a=1&b=2")
+
+        assert 0.025 <= replayer.delay_for(response) <= 0.035
+
+
+class TestRouteHandler:
+    """Tests for the Playwright route handler."""
+
+    async def test_fulfills_recorded_response(self, store: CaptureStore) -> None:
+        """Hits are fulfilled with the recorded status, headers and body."""
+        replayer = HarReplayer.from_capture(store)
+        route = FakeRoute("GET", "https://api.example.com/items?a=1&b=2")
+        await replayer.handle_route(route)
+
+        action, kwargs = route.calls[0]
+        assert action == "fulfill"
+        assert kwargs["status"] == 200
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+
+    @pytest.mark.parametrize("policy, action", [
+        (ReplayMissPolicy.NOT_FOUND, "fulfill"),
+        (ReplayMissPolicy.ABORT, "abort"),
+        (ReplayMissPolicy.PASSTHROUGH, "continue"),
+    ])
+    async def test_miss_policy(self, store: CaptureStore, policy: ReplayMissPolicy, action: str) -> None:
+        """Unrecorded requests follow the miss policy."""
+        replayer = HarReplayer.from_capture(store, ReplayConfig(miss_policy=policy))
+        route = FakeRoute("GET", "https://api.example.com/unknown")
+        await replayer.handle_route(route)
+
+        assert route.calls[0][0] == action
+
+
+class TestReplayServer:
+    """Tests for the local replay server."""
+
+    async def test_agent_replay_server(self, tmp_path: Path, monkeypatch) -> None:
+        """The agent serves its capture from a local server by path."""
+        monkeypatch.chdir(tmp_path)
+        agent = NetworkRecordingAgent(capture_dir=tmp_path / "capture")
+        await agent.run("capture_request", {"request_id": "r1", "url": "https://api.example.com/items", "method": "GET"})
+        await agent.run("capture_response", {"request_id": "r1", "status_code": 200, "body": json.dumps([1, 2]),
+                                               "headers": {"Content-Type": "application/json"}})
+
+        result = await agent.run("start_replay", {})
+        base_url = result.split(" at ")[1].split(" ")[0]
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(f"{base_url}/items") as response:
+                    assert response.status == 200
+                    assert await response.json() == [1, 2]
+                async with session.get(f"{base_url}/missing") as response:
+                    assert response.status == 404
+                    assert response.headers["x-replay-miss"] == "1"
+        finally:
+            result = await agent.run("stop_replay", {})
+            await agent.cleanup()
+
+        assert result == "Replay stopped: 1 hit(s), 1 miss(es)"
+
+    async def test_agent_replays_generated_har(self, tmp_path: Path, monkeypatch) -> None:
+        """A HAR generated with the defaults replays its offloaded bodies."""
+        monkeypatch.chdir(tmp_path)
+        agent = NetworkRecordingAgent(capture_dir=tmp_path / ".cpa" / "capture")
+        body = "x" * 10_000
+        await agent.run("capture_request", {"request_id": "r1", "url": "https://api.example.com/big", "method": "GET"})
+        await agent.run("capture_response", {"request_id": "r1", "status_code": 200, "body": body})
+        await agent.run("generate_har", {})
+
+        result = await agent.run("start_replay", {"har_path": "network.har"})
+        base_url = result.split(" at ")[1].split(" ")[0]
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(f"{base_url}/big") as response:
+                    assert response.status == 200
+                    assert await response.text() == body
+        finally:
+            await agent.run("stop_replay", {})
+            await agent.cleanup()
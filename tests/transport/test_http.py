@@ -0,0 +1,226 @@
+"""
+Tests for the shared async HTTP transport.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from claude_playwright_agent.agents.api_agent import APIEndpoint, APITestingAgent, HTTPMethod
+from claude_playwright_agent.transport import (
+    TransportConfig,
+    close_transports,
+    create_client,
+    get_transport,
+    http2_available,
+    run_bounded,
+)
+from claude_playwright_agent.transport.http import _environment_proxies
+
+
+async def _start_server(delay: float = 0.0):
+    """Start a keep-alive HTTP/1.1 server that counts connections."""
+    stats = {"connections": 0, "requests": 0}
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        stats["connections"] += 1
+        try:
+            while True:
+                head = (await reader.readuntil(b"\r\n\r\n")).decode()
+                method, path, _ = head.split("\r\n", 1)[0].split(" ")
+                length = 0
+                for line in head.split("\r\n")[1:]:
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                stats["requests"] += 1
+                await asyncio.sleep(delay)
+
+                status = "404 Not Found" if path == "/missing" else "200 OK"
+                payload = json.dumps({"id": 1, "method": method, "path": path}).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}", stats
+
+
+class TestSharedTransport:
+    """Tests for pooling and batch execution."""
+
+    async def test_clients_share_connections(self) -> None:
+        server, url, stats = await _start_server()
+        try:
+            for _ in range(2):
+                async with create_client() as client:
+                    await run_bounded(
+                        [lambda i=i: client.get(f"{url}/items/{i}") for i in range(50)],
+                        limit=10,
+                    )
+
+            assert stats["requests"] == 100
+            assert stats["connections"] <= 10  # the second client reused the pool
+            assert get_transport().requests == 100
+        finally:
+            await close_transports()
+            server.close()
+
+    async def test_run_bounded_limits_in_flight(self) -> None:
+        active = peak = 0
+
+        async def call(value: int) -> int:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return value * 2
+
+        results = await run_bounded([lambda v=v: call(v) for v in range(100)], limit=7)
+
+        assert results == [v * 2 for v in range(100)]
+        assert peak == 7
+        assert await run_bounded([], limit=5) == []
+
+    async def test_run_bounded_consumes_calls_lazily(self) -> None:
+        created = finished = 0
+        ahead = 0
+
+        async def call(value: int) -> int:
+            nonlocal finished
+            await asyncio.sleep(0.001)
+            finished += 1
+            return value
+
+        def calls():
+            nonlocal created, ahead
+            for value in range(50):
+                created += 1
+                ahead = max(ahead, created - finished)
+                yield lambda v=value: call(v)
+
+        assert await run_bounded(calls(), limit=5) == list(range(50))
+        assert ahead <= 5
+
+    async def test_pool_key_ignores_client_settings(self) -> None:
+        try:
+            assert get_transport(TransportConfig(timeout=5)) is get_transport(TransportConfig(timeout=60))
+            assert get_transport(TransportConfig(max_connections=4)) is not get_transport()
+        finally:
+            await close_transports()
+
+    async def test_environment_proxy_is_honoured(self, monkeypatch) -> None:
+        for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+        server, url, stats = await _start_server()
+        monkeypatch.setenv("HTTP_PROXY", url)
+        try:
+            async with create_client() as client:
+                response = await client.get("http://service.invalid/items")
+            assert response.json()["path"] == "http://service.invalid/items"
+            assert stats["requests"] == 1
+            assert get_transport(proxy=url).requests == 1
+
+            monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+            async with create_client() as client:
+                response = await client.get(f"{url}/direct")
+            assert response.json()["path"] == "/direct"
+            assert get_transport().requests == 1
+
+            async with create_client(trust_env=False) as client:
+                assert not client._mounts
+        finally:
+            await close_transports()
+            server.close()
+
+    def test_no_proxy_patterns(self, monkeypatch) -> None:
+        for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+        monkeypatch.setenv("HTTPS_PROXY", "proxy.local:3128")
+        monkeypatch.setenv("NO_PROXY", "localhost, 10.0.0.1,::1,example.com,http://plain.test")
+
+        assert _environment_proxies() == {
+            "https://": "http://proxy.local:3128",
+            "all://localhost": None,
+            "all://10.0.0.1": None,
+            "all://[::1]": None,
+            "all://*example.com": None,
+            "http://plain.test": None,
+        }
+        monkeypatch.setenv("NO_PROXY", "*")
+        assert _environment_proxies() == {}
+
+    def test_http2_requires_h2(self) -> None:
+        assert TransportConfig().use_http2() is http2_available()
+        if not http2_available():
+            with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+                TransportConfig(http2=True).use_http2()
+
+
+class TestAPITestingAgentBatch:
+    """Tests for concurrent endpoint checks in APITestingAgent."""
+
+    async def test_test_endpoints_runs_concurrently(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.chdir(tmp_path)  # agents read config from the working directory
+        server, url, stats = await _start_server(delay=0.05)
+        agent = APITestingAgent(base_url=url, transport_config=TransportConfig(max_in_flight=25))
+        try:
+            endpoints = [APIEndpoint(HTTPMethod.GET, f"/items/{i}") for i in range(99)]
+            endpoints.append({"method": "POST", "path": "/missing", "body": {"a": 1}})
+
+            started = time.perf_counter()
+            result = await agent.test_endpoints(endpoints)
+            elapsed = time.perf_counter() - started
+
+            assert elapsed < 2.0  # 100 x 50ms serially would take 5s
+            assert result["summary"] == {
+                "total": 100,
+                "passed": 99,
+                "failed": 1,
+                "duration_seconds": result["summary"]["duration_seconds"],
+            }
+            assert result["results"][3]["response"]["body"]["path"] == "/items/3"
+            assert stats["connections"] <= 25
+        finally:
+            await agent.cleanup()
+            await close_transports()
+            server.close()
+
+
+class TestAPIValidationEndpoints:
+    """Tests for live endpoint validation in the e9_4 skill."""
+
+    async def test_validate_endpoints(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        from claude_playwright_agent.skills.builtins.e9_4_api_validation import APIValidationAgent
+
+        server, url, _ = await _start_server()
+        agent = APIValidationAgent()
+        try:
+            for endpoint in ("/users", "/orders", "/missing"):
+                await agent.run("register_schema", {
+                    "name": endpoint,
+                    "endpoint": endpoint,
+                    "response_schema": {"properties": {"id": {"type": "integer"}}},
+                })
+
+            result = await agent.run("validate_endpoints", {"base_url": url, "max_in_flight": 2})
+
+            assert result == "Endpoint validation complete: 2 passed, 1 failed"
+            assert len(agent.get_response_history()) == 3
+        finally:
+            await close_transports()
+            server.close()